@@ -14,13 +14,34 @@ class Settings(BaseSettings):
     season_start: date = Field(default=date(2025, 10, 22), alias="SEASON_START")
     cors_origins: str = Field(default="http://localhost:5173", alias="CORS_ORIGINS")
     database_url: Optional[str] = Field(default=None, alias="DATABASE_URL")
+    # Request reads and background batch work (schedulers, syncs) use separate
+    # pools so batch jobs can't take every connection. Both grow on demand and
+    # close connections idle longer than the timeout; the batch pool starts empty.
+    db_pool_min_size: int = Field(default=1, alias="DB_POOL_MIN_SIZE")
+    db_pool_max_size: int = Field(default=5, alias="DB_POOL_MAX_SIZE")
+    db_batch_pool_max_size: int = Field(default=2, alias="DB_BATCH_POOL_MAX_SIZE")
+    db_pool_idle_timeout_s: float = Field(default=300, alias="DB_POOL_IDLE_TIMEOUT_S")
+    # Keep an in-process Arrow copy of fs_player_games/fs_team_games and answer
+    # the player-window, shooting, usage and game-log reads from it (a few MB,
+    # refreshed on this interval and after each nightly ingest). Off: those
+    # reads go to Postgres.
+    fs_mirror_enabled: bool = Field(default=False, alias="FS_MIRROR_ENABLED")
+    fs_mirror_refresh_interval_s: float = Field(default=900, alias="FS_MIRROR_REFRESH_INTERVAL_S")
     injury_scheduler_enabled: bool = Field(default=True, alias="INJURY_SCHEDULER_ENABLED")
     model_nightly_enabled: bool = Field(default=False, alias="MODEL_NIGHTLY_ENABLED")
+    # Load + warm the projection models (and the resident store) during startup so
+    # the first prediction request doesn't pay the unpickle / first-call cost.
+    model_warmup_enabled: bool = Field(default=True, alias="MODEL_WARMUP_ENABLED")
     # When the deployed models need a feature the stored vectors lack, should the
     # nightly rebuild them itself? Detection is always on and costs three queries;
     # the rebuild is what needs memory (~380 MB), so it defaults to OFF and the
     # nightly just logs what to run. Turn on only where the container can afford it.
     model_feature_heal_auto: bool = Field(default=False, alias="MODEL_FEATURE_HEAL_AUTO")
+    # Worker processes for CPU-heavy batch jobs (estimator, nightly store build),
+    # kept off the API process's GIL. 0 runs them in a thread in-process instead.
+    batch_workers: int = Field(default=1, alias="BATCH_WORKERS")
+    estimator_job_timeout_s: float = Field(default=600, alias="ESTIMATOR_JOB_TIMEOUT_S")
+    model_nightly_job_timeout_s: float = Field(default=1800, alias="MODEL_NIGHTLY_JOB_TIMEOUT_S")
     model_config = SettingsConfigDict(
         env_file=".env",             # Loads .env if it exists
         env_file_encoding="utf-8",
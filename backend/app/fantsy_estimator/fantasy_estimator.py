@@ -13,6 +13,7 @@ from .columns import TeamDailySnapshotColumns
 from .output_tables.column_names import OutputColumnNames
 from .preprocess import PerTeamPreprocess, PreprocessColumns, SnapshotPreprocess
 from .estimation import WindowEstimator
+from .scenario import TeamFit
 
 # Map avg_*_in_period -> snapshot column name for current_state from last row
 _AVG_TO_SNAPSHOT = {v: k for k, v in PreprocessColumns.STAT_TO_AVG_COLUMN.items()}
@@ -32,6 +33,8 @@ class FantasyEstimator:
             window_size=self.fantasy_configuration.window_size,
             decay=self.fantasy_configuration.window_decay,
         )
+        # Per-team fits of the last estimate() run (ScenarioEngine input).
+        self.team_fits: list[TeamFit] = []
 
     def _validate_team_daily_snapshot_columns(self, df: pd.DataFrame) -> None:
         """
@@ -134,12 +137,13 @@ class FantasyEstimator:
         df_team: pd.DataFrame,
         nba_avg_pace: float,
         slot_proj_df: pd.DataFrame | None = None,
-    ) -> tuple[dict, np.ndarray, np.ndarray]:
+    ) -> tuple[dict, np.ndarray, np.ndarray, TeamFit]:
         """
         Run estimation for a single team: window mean/cov, then compute estimated_final and variance
-        per stat. Returns (row_dict, mean_10, cov_10) for the predictions table and Monte Carlo.
+        per stat. Returns (row_dict, mean_10, cov_10, fit) for the predictions table, the Monte Carlo
+        and what-if scenarios.
         """
-        from app.services.slot_games_estimator import SLOT_CAPS
+        from app.services.slot_games_estimator import SLOT_CAPS, SLOTS
         c = self.columns
         team_id = df_team[c.TEAM_ID].iloc[0]
         team_name = df_team[c.TEAM_NAME].iloc[0]
@@ -160,10 +164,12 @@ class FantasyEstimator:
         )
         mean_gp_per_period = float(df_team[PreprocessColumns.GP_IN_PERIOD].mean())
 
+        slot_projection = None
         if slot_proj_df is not None and not slot_proj_df.empty:
             team_row = slot_proj_df[slot_proj_df['team_id'] == team_id]
             if not team_row.empty:
                 projected_total_gp = float(team_row['proj_total'].iloc[0])
+                slot_projection = {s: float(team_row[f'proj_{s}'].iloc[0]) for s in SLOTS}
             else:
                 projected_total_gp = float(sum(SLOT_CAPS.values()) * (nba_avg_pace / 82))
         else:
@@ -177,7 +183,21 @@ class FantasyEstimator:
         row[c.TEAM_NAME] = team_name
         row[OutputColumnNames.Metadata.NBA_AVG_PACE] = nba_avg_pace
         row["as_of_date"] = last_row[c.DATE]
-        return row, mean_10, cov_10
+        fit = TeamFit(
+            team_id=int(team_id),
+            team_name=str(team_name),
+            current_totals=np.array([
+                float(last_row[_AVG_TO_SNAPSHOT[av]]) if _AVG_TO_SNAPSHOT[av] in last_row.index else 0.0
+                for av in stat_cols
+            ]),
+            mean_per_game=np.asarray(mean_arr, dtype=float),
+            cov_per_game=np.asarray(cov_arr, dtype=float),
+            games_played=float(last_row[c.GP]),
+            mean_gp_per_period=mean_gp_per_period,
+            projected_total_gp=projected_total_gp,
+            slot_projection=slot_projection,
+        )
+        return row, mean_10, cov_10, fit
 
     def _run_monte_carlo_ranking(
         self,
@@ -318,11 +338,46 @@ class FantasyEstimator:
         """
         self._validate_team_daily_snapshot_columns(df)
         self._log_input_stats(df)
+        results, mc_data, self.team_fits = self._estimate_teams(df, nba_avg_pace, slot_proj_df)
+        if not results:
+            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        c = self.columns
+        out_cols = (
+            [c.TEAM_ID, c.TEAM_NAME, "as_of_date", "projected_total_gp"]
+            + list(OutputColumnNames.EstimatedFinal.all())
+            + list(OutputColumnNames.Variance.all())
+            + [OutputColumnNames.Metadata.NBA_AVG_PACE]
+        )
+        predictions_df = pd.DataFrame(results, columns=out_cols)
+        ranking_df, rank_prob_df = self._run_monte_carlo_ranking(mc_data)
+        return predictions_df, ranking_df, rank_prob_df
+
+    def fit(
+        self,
+        df: pd.DataFrame,
+        nba_avg_pace: float,
+        slot_proj_df: pd.DataFrame | None = None,
+    ) -> list[TeamFit]:
+        """
+        Per-team window fits only (no Monte Carlo) — the inputs ScenarioEngine reuses.
+        Same eligibility rules and parameters as ``estimate``.
+        """
+        self._validate_team_daily_snapshot_columns(df)
+        return self._estimate_teams(df, nba_avg_pace, slot_proj_df)[2]
+
+    def _estimate_teams(
+        self,
+        df: pd.DataFrame,
+        nba_avg_pace: float,
+        slot_proj_df: pd.DataFrame | None,
+    ) -> tuple[list[dict], list[tuple[int, str, np.ndarray, np.ndarray, float]], list[TeamFit]]:
+        """Preprocess, then fit every eligible team: (prediction rows, Monte Carlo inputs, fits)."""
         preprocess_df = self.preprocess.transform(df)
         c = self.columns
         min_period_id = self.fantasy_configuration.minimum_period_id
         results: list[dict] = []
         mc_data: list[tuple[int, str, np.ndarray, np.ndarray, float]] = []
+        fits: list[TeamFit] = []
         for team_id in preprocess_df[c.TEAM_ID].unique():
             df_team = preprocess_df[preprocess_df[c.TEAM_ID] == team_id]
             df_team = self._preprocess_team(df_team)
@@ -337,18 +392,9 @@ class FantasyEstimator:
                     min_period_id,
                 )
                 continue
-            result, mean_10, cov_10 = self._estimate_per_team(df_team, nba_avg_pace, slot_proj_df)
+            result, mean_10, cov_10, fit = self._estimate_per_team(df_team, nba_avg_pace, slot_proj_df)
             self.logger.debug("team_id=%s estimated_final_pts=%s", team_id, result.get(OutputColumnNames.EstimatedFinal.PTS))
             results.append(result)
             mc_data.append((result[c.TEAM_ID], result[c.TEAM_NAME], mean_10, cov_10, result["projected_total_gp"]))
-        if not results:
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-        out_cols = (
-            [c.TEAM_ID, c.TEAM_NAME, "as_of_date", "projected_total_gp"]
-            + list(OutputColumnNames.EstimatedFinal.all())
-            + list(OutputColumnNames.Variance.all())
-            + [OutputColumnNames.Metadata.NBA_AVG_PACE]
-        )
-        predictions_df = pd.DataFrame(results, columns=out_cols)
-        ranking_df, rank_prob_df = self._run_monte_carlo_ranking(mc_data)
-        return predictions_df, ranking_df, rank_prob_df
\ No newline at end of file
+            fits.append(fit)
+        return results, mc_data, fits
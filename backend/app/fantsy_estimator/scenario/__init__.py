@@ -0,0 +1,6 @@
+"""Scenario package: batched what-if simulation over the baseline run's fitted team parameters."""
+
+from .scenario_engine import ScenarioEngine, ScenarioOutcome
+from .team_fit import Scenario, TeamFit, TeamPerturbation
+
+__all__ = ["Scenario", "ScenarioEngine", "ScenarioOutcome", "TeamFit", "TeamPerturbation"]
@@ -0,0 +1,175 @@
+"""Batched what-if Monte Carlo over the baseline run's team fits."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..output_tables.column_names import OutputColumnNames
+from .team_fit import Scenario, TeamFit
+
+BASELINE = "baseline"
+_JITTER = 1e-6  # same diagonal jitter the baseline Monte Carlo adds
+# Sample values (scenarios × runs × teams × 10) simulated per chunk: ~8 MB per
+# working array, so peak memory stays flat however many scenarios/runs are asked.
+_CHUNK_VALUES = 1 << 20
+
+
+@dataclass(frozen=True)
+class ScenarioOutcome:
+    """
+    One scenario's simulated standings.
+
+    ranking_df : team_id, team_name, projected_total_gp, expected_pts_* per stat,
+        total_expected_pts, delta_total_expected_pts (vs baseline), in fit order.
+    rank_prob_df : team_id, team_name, rank, prob, delta_prob (vs baseline).
+    """
+
+    name: str
+    ranking_df: pd.DataFrame
+    rank_prob_df: pd.DataFrame
+
+
+def _sqrt_cov(cov: np.ndarray) -> np.ndarray:
+    """Matrix square root L (L Lᵀ = cov): Cholesky, or clipped eigen-decomposition
+    when jitter is not enough to make the window covariance positive definite."""
+    cov = cov + _JITTER * np.eye(cov.shape[0])
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        vals, vecs = np.linalg.eigh((cov + cov.T) / 2)
+        return vecs * np.sqrt(np.clip(vals, 0.0, None))
+
+
+def _rank_desc(x: np.ndarray, axis: int, average: bool) -> np.ndarray:
+    """1-based ranks along ``axis``, largest first. Ties get their mean rank when
+    ``average`` (Series.rank(method="average")), else go to the earlier index
+    (method="first") -- the two rankings the baseline Monte Carlo uses."""
+    x = np.moveaxis(x, axis, -1)
+    order = np.argsort(-x, axis=-1, kind="stable")
+    pos = np.broadcast_to(np.arange(x.shape[-1]), x.shape)
+    if average:
+        s = np.take_along_axis(x, order, axis=-1)
+        starts = np.ones(x.shape, dtype=bool)
+        starts[..., 1:] = s[..., 1:] != s[..., :-1]
+        ends = np.ones(x.shape, dtype=bool)
+        ends[..., :-1] = starts[..., 1:]
+        first = np.maximum.accumulate(np.where(starts, pos, 0), axis=-1)
+        last = np.flip(np.minimum.accumulate(np.flip(np.where(ends, pos, x.shape[-1]), -1), axis=-1), -1)
+        sorted_ranks = (first + last) / 2 + 1
+    else:
+        sorted_ranks = pos + 1
+    ranks = np.empty(x.shape, dtype=float)
+    np.put_along_axis(ranks, order, sorted_ranks, axis=-1)
+    return np.moveaxis(ranks, -1, axis)
+
+
+class ScenarioEngine:
+    """
+    Evaluates what-if scenarios against the baseline with common random numbers.
+
+    One block of standard normals Z (runs × teams × 10) is drawn from the seeded
+    generator and shared by the baseline and every scenario: each draw is
+    mean + L·z for that scenario's mean/covariance. A scenario that leaves a team
+    untouched reproduces its baseline samples exactly, so rank-probability deltas
+    measure the perturbation rather than Monte Carlo noise. All scenarios are
+    simulated and ranked together, a chunk of runs at a time; Z is drawn per
+    chunk from the one generator, so the draws don't depend on the chunk size.
+    """
+
+    def __init__(self, fits: Sequence[TeamFit], num_runs: int = 1000, seed: Optional[int] = None) -> None:
+        if not fits:
+            raise ValueError("ScenarioEngine needs at least one team fit")
+        self.fits = list(fits)
+        self.num_runs = num_runs
+        self.seed = seed
+        self._index = {fit.team_id: i for i, fit in enumerate(self.fits)}
+
+    def _team_params(self, scenario: Optional[Scenario]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(means (T,10), sqrt-covs (T,10,10), projected_gp (T,)) under a scenario."""
+        perturbations = {}
+        for p in scenario.perturbations if scenario else ():
+            if p.team_id not in self._index:
+                raise ValueError(f"Scenario {scenario.name!r}: unknown team_id {p.team_id}")
+            perturbations[p.team_id] = p
+        means, roots, gps = [], [], []
+        for fit in self.fits:
+            p = perturbations.get(fit.team_id)
+            gp = fit.projected_gp_with(p.slot_games) if p else fit.projected_total_gp
+            mean, cov = fit.season_totals(p.mean_shift if p else None, gp)
+            means.append(mean)
+            roots.append(_sqrt_cov(cov))
+            gps.append(gp)
+        return np.array(means), np.array(roots), np.array(gps)
+
+    def run(self, scenarios: Sequence[Scenario]) -> list[ScenarioOutcome]:
+        """Simulate the baseline plus every scenario; baseline first."""
+        names = [BASELINE] + [s.name for s in scenarios]
+        params = [self._team_params(None)] + [self._team_params(s) for s in scenarios]
+        means = np.stack([m for m, _, _ in params])  # (S, T, 10)
+        roots = np.stack([r for _, r, _ in params])  # (S, T, 10, 10)
+        n_teams = len(self.fits)
+
+        rng = np.random.default_rng(self.seed)
+        chunk = max(1, _CHUNK_VALUES // (len(names) * n_teams * means.shape[-1]))
+        rank_count = np.zeros((len(names), n_teams, n_teams))  # (S, T, rank)
+        pts_sum = np.zeros((len(names), n_teams, len(OutputColumnNames.STAT_NAMES)))  # (S, T, 8)
+        for start in range(0, self.num_runs, chunk):
+            z = rng.standard_normal((min(chunk, self.num_runs - start), n_teams, means.shape[-1]))
+            run_pts, finish = self._simulate(means, roots, z)
+            rank_count += (finish[..., None] == np.arange(n_teams)).sum(axis=1)
+            pts_sum += run_pts.sum(axis=1)
+        rank_prob = rank_count / self.num_runs
+        expected_pts = pts_sum / self.num_runs
+
+        return [
+            self._outcome(names[s], expected_pts[s], rank_prob[s], params[s][2], expected_pts[0], rank_prob[0])
+            for s in range(len(names))
+        ]
+
+    @staticmethod
+    def _simulate(means: np.ndarray, roots: np.ndarray, z: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Per-run category points (S, R, T, 8) and 0-based finish ranks (S, R, T)
+        for one chunk of standard normals z (R, T, 10)."""
+        n_teams = z.shape[1]
+        samples = means[:, None] + np.einsum("stij,rtj->srti", roots, z)  # (S, R, T, 10)
+        fga = np.clip(samples[..., 1], 1e-10, None)
+        fta = np.clip(samples[..., 3], 1e-10, None)
+        stats_8 = np.concatenate(
+            [(samples[..., 0] / fga)[..., None], (samples[..., 2] / fta)[..., None], samples[..., 4:]],
+            axis=-1,
+        )  # (S, R, T, 8) in OutputColumnNames.STAT_NAMES order
+        run_pts = n_teams + 1 - _rank_desc(stats_8, axis=2, average=True)
+        # Total points -> finish rank; ties go to the earlier team, as in the baseline.
+        finish = _rank_desc(run_pts.sum(axis=-1), axis=2, average=False).astype(int) - 1
+        return run_pts, finish
+
+    def _outcome(
+        self,
+        name: str,
+        expected_pts: np.ndarray,
+        rank_prob: np.ndarray,
+        projected_gp: np.ndarray,
+        base_pts: np.ndarray,
+        base_prob: np.ndarray,
+    ) -> ScenarioOutcome:
+        ids = [fit.team_id for fit in self.fits]
+        team_names = [fit.team_name for fit in self.fits]
+        ranking_df = pd.DataFrame({"team_id": ids, "team_name": team_names, "projected_total_gp": projected_gp})
+        for j, stat in enumerate(OutputColumnNames.STAT_NAMES):
+            ranking_df[OutputColumnNames.RankingExpectedPts.for_stat(stat)] = expected_pts[:, j]
+        ranking_df[OutputColumnNames.RankingExpectedPts.TOTAL] = expected_pts.sum(axis=1)
+        ranking_df["delta_total_expected_pts"] = expected_pts.sum(axis=1) - base_pts.sum(axis=1)
+
+        n_teams = len(ids)
+        rank_prob_df = pd.DataFrame({
+            "team_id": np.repeat(ids, n_teams),
+            "team_name": np.repeat(team_names, n_teams),
+            "rank": np.tile(np.arange(1, n_teams + 1), n_teams),
+            "prob": rank_prob.ravel(),
+            "delta_prob": (rank_prob - base_prob).ravel(),
+        })
+        return ScenarioOutcome(name, ranking_df, rank_prob_df)
@@ -0,0 +1,93 @@
+"""Per-team fitted parameters and the perturbations a what-if scenario applies to them."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from ..preprocess.preprocess_columns import PreprocessColumns
+
+# Raw counting-stat names in the order of the 10-dim mean/cov vectors.
+STAT_ORDER: tuple[str, ...] = tuple(PreprocessColumns.SUM_STAT_COLUMNS)
+
+
+@dataclass(frozen=True)
+class TeamPerturbation:
+    """
+    What-if change for one team.
+
+    mean_shift : per-game change in a counting stat (fgm, fga, ftm, fta, three_pm,
+        reb, ast, stl, blk, pts), applied over the team's remaining games — e.g.
+        the difference in per-game production after a trade.
+    slot_games : change in projected season games per roster slot (PG..UTIL),
+        applied to the SlotGamesEstimator projection and capped per slot — e.g.
+        streaming pickups filling empty slots.
+    """
+
+    team_id: int
+    mean_shift: dict[str, float] = field(default_factory=dict)
+    slot_games: dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        from app.services.slot_games_estimator import SLOT_CAPS
+
+        unknown = set(self.mean_shift) - set(STAT_ORDER)
+        if unknown:
+            raise ValueError(f"Unknown stats in mean_shift: {sorted(unknown)}; expected {list(STAT_ORDER)}")
+        unknown = set(self.slot_games) - set(SLOT_CAPS)
+        if unknown:
+            raise ValueError(f"Unknown slots in slot_games: {sorted(unknown)}; expected {list(SLOT_CAPS)}")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named set of per-team perturbations evaluated together."""
+
+    name: str
+    perturbations: tuple[TeamPerturbation, ...] = ()
+
+
+@dataclass(frozen=True)
+class TeamFit:
+    """
+    Everything the Monte Carlo needs for one team, as fitted by the baseline run.
+
+    mean_per_game / cov_per_game are the WindowEstimator outputs (per player-game);
+    season totals follow FantasyEstimator._compute_final_and_variance:
+    mean = current + μ̂ · remaining, cov = Σ̂ · remaining · G̃.
+    """
+
+    team_id: int
+    team_name: str
+    current_totals: np.ndarray
+    mean_per_game: np.ndarray
+    cov_per_game: np.ndarray
+    games_played: float
+    mean_gp_per_period: float
+    projected_total_gp: float
+    slot_projection: Optional[dict[str, float]] = None
+
+    def projected_gp_with(self, slot_games: dict[str, float]) -> float:
+        """Projected season games after a per-slot change, through the slot caps."""
+        from app.services.slot_games_estimator import SlotGamesEstimator
+
+        if not slot_games:
+            return self.projected_total_gp
+        return SlotGamesEstimator.adjust_projection(self.slot_projection, slot_games, self.projected_total_gp)
+
+    def season_totals(
+        self,
+        mean_shift: Optional[dict[str, float]] = None,
+        projected_total_gp: Optional[float] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """10-dim mean and 10x10 covariance of season-end totals."""
+        total_gp = self.projected_total_gp if projected_total_gp is None else projected_total_gp
+        remaining = max(0.0, total_gp - self.games_played)
+        mean_per_game = self.mean_per_game
+        if mean_shift:
+            mean_per_game = mean_per_game + np.array([mean_shift.get(s, 0.0) for s in STAT_ORDER])
+        mean = self.current_totals + mean_per_game * remaining
+        cov = self.cov_per_game * remaining * self.mean_gp_per_period
+        return mean, cov
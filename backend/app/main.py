@@ -22,6 +22,7 @@ from app.routes.matchups import router as matchups_router
 from app.routes.projections import router as projections_router
 from app.routes.feature_store import router as feature_store_router
 from app.routes.trends import router as trends_router
+from app.routes.metrics import router as metrics_router
 from dotenv import load_dotenv
 from app.config import settings
 import logging
@@ -30,7 +31,13 @@ from app.services.data_provider import DataProvider
 from app.services.nba_stats_service import NBAStatsService
 from app.services import injury_service
 from app.services import estimator_scheduler
+from app.services.batch_pool import shutdown_batch_pool
+from app.services.db_pool import in_batch_lane
+from app.services.db_service import DBService
 from app.services import model_nightly_scheduler
+from app.services.live_projection_service import LiveProjectionService
+from app.services.league_history import LeagueHistory
+from app.utils.metrics import MetricsMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -51,14 +58,19 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Fantasy League Dashboard API")
     await injury_service.initialize()
     if settings.injury_scheduler_enabled:
-        asyncio.create_task(injury_service.start_scheduler())
+        asyncio.create_task(in_batch_lane(injury_service.start_scheduler()))
     else:
         logger.info("Injury scheduler disabled via INJURY_SCHEDULER_ENABLED=false")
-    asyncio.create_task(estimator_scheduler.start_scheduler())
+    asyncio.create_task(in_batch_lane(estimator_scheduler.start_scheduler()))
     if settings.model_nightly_enabled:
-        asyncio.create_task(model_nightly_scheduler.start_scheduler())
+        asyncio.create_task(in_batch_lane(model_nightly_scheduler.start_scheduler()))
     else:
         logger.info("Model nightly scheduler disabled via MODEL_NIGHTLY_ENABLED=false")
+    if settings.model_warmup_enabled:
+        asyncio.create_task(in_batch_lane(LiveProjectionService().warm_up()))
+    asyncio.create_task(in_batch_lane(LeagueHistory().load()))
+    if settings.fs_mirror_enabled:
+        asyncio.create_task(in_batch_lane(DBService().run_fs_mirror_refresher()))
     yield
     # Shutdown
     try:
@@ -66,6 +78,7 @@ async def lifespan(app: FastAPI):
         await data_provider.close()
         await NBAStatsService().close()
         logger.info("Closed httpx client connections")
+        shutdown_batch_pool()
     except Exception as e:
         logger.error(f"Error during shutdown cleanup: {e}")
 
@@ -98,6 +111,8 @@ app.add_middleware(
 )
 
 app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Outermost: times the whole stack and sees the bytes actually sent.
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(rankings_router, prefix="/api", tags=["Rankings"])
 app.include_router(teams_router, prefix="/api/teams", tags=["Teams"])
@@ -113,6 +128,7 @@ app.include_router(matchups_router, prefix='/api/matchups', tags=['Matchups'])
 app.include_router(projections_router, prefix='/api/projections', tags=['Projections'])
 app.include_router(feature_store_router, prefix='/api/feature-store', tags=['Feature Store'])
 app.include_router(trends_router, prefix='/api/trends', tags=['Trends'])
+app.include_router(metrics_router, tags=['Metrics'])
 
 
 
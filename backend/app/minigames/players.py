@@ -1,36 +1,85 @@
-"""Load NBA roster bundle and shared pick/filter helpers."""
+"""Load NBA roster bundle and shared pick/filter helpers.
+
+The bundle is indexed once per file version: the player tuple, an id -> player
+dict and the team options, so the minigame routes do a dict lookup instead of
+copying and scanning the list. ``load_bundle`` stats the file on each call and
+rebuilds only when its content hash changes.
+"""
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import random
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
 _JSON_PATH = Path(__file__).resolve().parents[2] / "data" / "nba-players-2025-26.json"
-_bundle: Optional[dict[str, Any]] = None
+_EMPTY_BUNDLE: dict[str, Any] = {"seasonLabel": "", "source": "", "updatedAt": "", "players": []}
+
+
+@dataclass
+class BundleIndex:
+    digest: str
+    bundle: dict[str, Any]
+    players: tuple[dict[str, Any], ...]
+    by_id: dict[str, dict[str, Any]]
+    team_options: list[dict[str, str]]
+
+    @classmethod
+    def build(cls, bundle: dict[str, Any], digest: str) -> "BundleIndex":
+        players = tuple(bundle.get("players") or ())
+        by_id: dict[str, dict[str, Any]] = {}
+        for p in players:
+            by_id.setdefault(p.get("id"), p)
+        return cls(digest, bundle, players, by_id, build_nba_team_options(players))
+
+
+_index: Optional[BundleIndex] = None
+_stat_key: Optional[tuple[int, int]] = None
+
+
+def get_index() -> BundleIndex:
+    """The current bundle index, rebuilt only if the JSON file's content changed."""
+    global _index, _stat_key
+    try:
+        st = _JSON_PATH.stat()
+    except FileNotFoundError:
+        if _index is None or _index.digest != "":
+            logger.error("NBA players JSON missing at %s", _JSON_PATH)
+            _index = BundleIndex.build(dict(_EMPTY_BUNDLE), "")
+            _stat_key = None
+        return _index
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _index is not None and key == _stat_key:
+        return _index
+    raw = _JSON_PATH.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if _index is None or digest != _index.digest:
+        _index = BundleIndex.build(json.loads(raw.decode("utf-8")), digest)
+        logger.info("Indexed NBA players bundle: %d players", len(_index.players))
+    _stat_key = key
+    return _index
 
 
 def load_bundle() -> dict[str, Any]:
-    global _bundle
-    if _bundle is not None:
-        return _bundle
-    if not _JSON_PATH.exists():
-        logger.error("NBA players JSON missing at %s", _JSON_PATH)
-        _bundle = {"seasonLabel": "", "source": "", "updatedAt": "", "players": []}
-        return _bundle
-    _bundle = json.loads(_JSON_PATH.read_text(encoding="utf-8"))
-    return _bundle
+    return get_index().bundle
 
 
-def get_players() -> list[dict[str, Any]]:
-    return list(load_bundle().get("players") or [])
+def get_players() -> tuple[dict[str, Any], ...]:
+    """The indexed players; a tuple, so callers can't reorder or resize the shared copy."""
+    return get_index().players
 
 
-def find_player_by_id(players: list[dict[str, Any]], player_id: str) -> Optional[dict[str, Any]]:
+def find_player_by_id(players: Sequence[dict[str, Any]], player_id: str) -> Optional[dict[str, Any]]:
+    index = get_index()
+    if players is index.players:
+        return index.by_id.get(player_id)
     for p in players:
         if p.get("id") == player_id:
             return p
@@ -38,7 +87,7 @@ def find_player_by_id(players: list[dict[str, Any]], player_id: str) -> Optional
 
 
 def pick_random_player(
-    players: list[dict[str, Any]], exclude_id: Optional[str] = None
+    players: Sequence[dict[str, Any]], exclude_id: Optional[str] = None
 ) -> Optional[dict[str, Any]]:
     if not players:
         return None
@@ -51,7 +100,9 @@ def pick_random_player(
     return random.choice(use)
 
 
-def build_nba_team_options(players: list[dict[str, Any]]) -> list[dict[str, str]]:
+def build_nba_team_options(players: Sequence[dict[str, Any]]) -> list[dict[str, str]]:
+    if _index is not None and players is _index.players:
+        return _index.team_options
     mapping: dict[str, str] = {}
     for p in players:
         abbr = p.get("teamAbbr")
@@ -64,7 +115,7 @@ def build_nba_team_options(players: list[dict[str, Any]]) -> list[dict[str, str]
     )
 
 
-def players_with_photos(players: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def players_with_photos(players: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
     return [
         p
         for p in players
@@ -73,7 +124,7 @@ def players_with_photos(players: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
 
 def pick_random_player_with_photo(
-    players: list[dict[str, Any]], exclude_id: Optional[str] = None
+    players: Sequence[dict[str, Any]], exclude_id: Optional[str] = None
 ) -> Optional[dict[str, Any]]:
     with_photos = players_with_photos(players)
     if not with_photos:
@@ -24,6 +24,8 @@ __all__ = [
     "HeatmapData",
     "TeamTimeSeriesPoint",
     "RankingsOverTimeResponse",
+    "TeamTimeSeries",
+    "RankingsOverTimeColumnar",
     "DraftPick",
     "DraftReport",
 
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date
+from typing import Optional
 
 
 class TeamPrediction(BaseModel):
@@ -55,3 +56,44 @@ class EstimatorResults(BaseModel):
     rank_probabilities: list[TeamRankProbability]
     as_of_date: str
     elapsed_ms: float
+
+
+class TeamPerturbationRequest(BaseModel):
+    team_id: int
+    # Per-game change in counting stats (fgm, fga, ftm, fta, three_pm, reb, ast, stl, blk, pts).
+    mean_shift: dict[str, float] = Field(default_factory=dict)
+    # Change in projected season games per roster slot (PG..UTIL), capped per slot.
+    slot_games: dict[str, float] = Field(default_factory=dict)
+
+
+class ScenarioRequest(BaseModel):
+    name: str
+    perturbations: list[TeamPerturbationRequest] = Field(default_factory=list)
+
+
+class ScenariosRequest(BaseModel):
+    scenarios: list[ScenarioRequest] = Field(min_length=1, max_length=20)
+    seed: Optional[int] = Field(default=None, ge=0)
+    num_runs: int = Field(default=1000, ge=100, le=5000)
+
+
+class ScenarioTeamResult(BaseModel):
+    team_id: int
+    team_name: str
+    projected_total_gp: float
+    expected_pts: dict[str, float]
+    total_expected_pts: float
+    delta_total_expected_pts: float
+    rank_probabilities: list[float]  # index r-1 -> P(finish rank r)
+    delta_rank_probabilities: list[float]
+
+
+class ScenarioResult(BaseModel):
+    name: str
+    teams: list[ScenarioTeamResult]
+
+
+class ScenarioResults(BaseModel):
+    seed: int
+    num_runs: int
+    scenarios: list[ScenarioResult]  # baseline first
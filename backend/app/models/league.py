@@ -69,6 +69,16 @@ class TeamTimeSeriesPoint(BaseModel):
 class RankingsOverTimeResponse(BaseModel):
     data: List[TeamTimeSeriesPoint]
 
+class TeamTimeSeries(BaseModel):
+    team_id: int
+    team_name: str
+    values: Dict[str, List[Optional[float]]]
+
+class RankingsOverTimeColumnar(BaseModel):
+    source: str
+    dates: List[date]
+    teams: List[TeamTimeSeries]
+
 class DraftPick(BaseModel):
     pick: int
     round: int
@@ -101,3 +101,5 @@ class PaginatedPlayers(BaseModel):
     has_more: bool
     actual_start: Optional[date] = None
     actual_end: Optional[date] = None
+    # Opaque keyset cursor for the page after this one (same sort_by/order).
+    next_cursor: Optional[str] = None
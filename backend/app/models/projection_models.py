@@ -49,3 +49,45 @@ class PredictProjectionRequest(BaseModel):
 
 class PredictProjectionResponse(BaseModel):
     stats: ProjectionStats
+
+
+class ModelLoadTiming(BaseModel):
+    target: str
+    seconds: float
+    bytes: int
+    compiled: bool
+
+
+class ModelRegistryStatus(BaseModel):
+    loaded: bool
+    inference_ready: bool = False
+    load_seconds: Optional[float] = None
+    warmup_seconds: Optional[float] = None
+    models: list[ModelLoadTiming] = []
+
+
+class WeekPlayerProjection(BaseModel):
+    player_name: str
+    pro_team: str
+    fantasy_team_id: int = 0  # 0 = not on a fantasy roster
+    fantasy_team_name: str = ''
+    games: int
+    default_minutes: float
+    status: ProjectionStatus
+    reason: str = ''
+    stats: Optional[ProjectionStats] = None  # summed over the window's games
+
+
+class WeekTeamProjection(BaseModel):
+    team_id: int
+    team_name: str
+    games: int
+    players: int
+    stats: ProjectionStats
+
+
+class WeekProjectionResponse(BaseModel):
+    start_date: str
+    end_date: str
+    players: list[WeekPlayerProjection] = []
+    teams: list[WeekTeamProjection] = []
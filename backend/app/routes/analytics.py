@@ -1,11 +1,12 @@
 import logging
-from fastapi import APIRouter, HTTPException, Depends, Query
-from app.models import HeatmapData, RankingsOverTimeResponse, TeamTimeSeriesPoint
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from app.models import HeatmapData, RankingsOverTimeColumnar, RankingsOverTimeResponse
 from app.services.league_service import LeagueService
 from app.services.db_service import DBService
-from typing import Annotated, Optional
+from app.services.over_time_service import OverTimeService
+from typing import Annotated, Optional, Union
 from app.exceptions import ResourceNotFoundError
-from datetime import date, date as date_type
+from datetime import date
 from app.config import settings
 
 router = APIRouter()
@@ -14,11 +15,6 @@ logger = logging.getLogger(__name__)
 LeagueServiceDep = Annotated[LeagueService, Depends(LeagueService)]
 DBServiceDep = Annotated[DBService, Depends(DBService)]
 
-_SOURCE_TO_TABLE = {
-    "rankings_avg": "team_rankings_averages",
-    "rankings_totals": "team_rankings_totals",
-}
-
 @router.get("/heatmap", response_model=HeatmapData)
 async def get_heatmap(
     league_service: LeagueServiceDep,
@@ -47,11 +43,27 @@ async def get_heatmap(
         logger.error(f"Error getting heatmap data: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve heatmap data")
 
-@router.get("/over-time", response_model=RankingsOverTimeResponse)
+# The body is pre-encoded bytes (cached with its ETag), so there is no
+# response_model to validate against; the two shapes are documented here.
+@router.get(
+    "/over-time",
+    response_model=None,
+    responses={
+        200: {
+            "model": Union[RankingsOverTimeResponse, RankingsOverTimeColumnar],
+            "description": "format=rows: {data: [point, ...]}; "
+                           "format=columnar: {source, dates: [...], teams: [{team_id, team_name, values}]}",
+        },
+        304: {"description": "Unchanged since the ETag in If-None-Match"},
+    },
+)
 async def get_over_time(
+    request: Request,
     db_service: DBServiceDep,
     source: str = Query(default="rankings_avg", pattern="^(rankings_avg|rankings_totals|snapshot|averages)$"),
     team_ids: Optional[str] = Query(default=None, description="Comma-separated team IDs"),
+    category: Optional[str] = Query(default=None, description="Single column to return, e.g. rk_pts"),
+    fmt: str = Query(default="rows", alias="format", pattern="^(rows|columnar)$", description="rows, or columnar (dates + per-team arrays)"),
 ):
     """Get team stats/rankings over time for time-series chart"""
     try:
@@ -62,18 +74,19 @@ async def get_over_time(
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid team_ids format")
 
-        if source == "snapshot":
-            rows = await db_service.get_snapshot_over_time(parsed_team_ids)
-        elif source == "averages":
-            rows = await db_service.get_averages_over_time(parsed_team_ids)
-        else:
-            table = _SOURCE_TO_TABLE[source]
-            rows = await db_service.get_rankings_over_time(table, parsed_team_ids)
+        try:
+            body, etag = await OverTimeService(db_service).get_over_time(
+                source, parsed_team_ids, category=category, fmt=fmt
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
 
-        points = [TeamTimeSeriesPoint(**{k: (v.isoformat() if isinstance(v, date_type) else v) for k, v in row.items()}) for row in rows]
-        return RankingsOverTimeResponse(data=points)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error getting over-time data: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve over-time data")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to retrieve over-time data")
@@ -1,66 +1,121 @@
-import asyncio
 import logging
 import time
-from fastapi import APIRouter, HTTPException
-from app.models.estimator import EstimatorResults, TeamPrediction, TeamRanking, TeamRankProbability
+from fastapi import APIRouter, HTTPException, Request
+from app.fantsy_estimator.output_tables.column_names import OutputColumnNames
+from app.fantsy_estimator.scenario import Scenario, ScenarioOutcome, TeamPerturbation
+from app.models.estimator import (
+    EstimatorResults, ScenarioResult, ScenarioResults, ScenarioTeamResult, ScenariosRequest,
+)
 from app.services.estimator_service import EstimatorService
 from app.services.data_provider import DataProvider
+from app.services.db_pool import batch_lane
+from app.services.refresh_coordinator import RefreshCoordinator
+from app.utils.http_cache import encoded_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Minimum gap between background syncs triggered by page views. The scheduler
+# covers the steady state; this only keeps results fresh between its ticks.
+_SYNC_MIN_INTERVAL_S = 300
 
-def _build_results(data: dict, elapsed_ms: float) -> EstimatorResults:
-    predictions = [TeamPrediction(**r) for r in data.get("predictions", [])]
-    as_of_date = predictions[0].as_of_date.isoformat() if predictions else ""
-    return EstimatorResults(
-        as_of_date=as_of_date,
-        elapsed_ms=elapsed_ms,
-        predictions=predictions,
-        rankings=[TeamRanking(**r) for r in data.get("rankings", [])],
-        rank_probabilities=[TeamRankProbability(**r) for r in data.get("rank_probabilities", [])],
-    )
+
+async def _sync_and_run(service: EstimatorService, provider: DataProvider) -> bool:
+    with batch_lane():
+        synced = await provider.sync_db_now()
+        if synced:
+            logger.info("Estimator background sync: new ESPN data found, running estimator")
+        else:
+            logger.info("Estimator background sync: snapshot already current, checking if estimator is behind snapshot")
+        return await service.run_and_store()
 
 
-async def _sync_and_run(service: EstimatorService, provider: DataProvider) -> None:
-    synced = await provider.sync_db_now()
-    if synced:
-        logger.info("Estimator background sync: new ESPN data found, running estimator")
-    else:
-        logger.info("Estimator background sync: snapshot already current, checking if estimator is behind snapshot")
-    await service.run_and_store()
+_refresh = RefreshCoordinator(_sync_and_run, _SYNC_MIN_INTERVAL_S, name="Estimator background sync")
 
 
 @router.get("/results", response_model=EstimatorResults)
-async def get_estimator_results():
+async def get_estimator_results(request: Request):
+    """Serves the payload encoded by the last estimator run as-is: a byte copy
+    (pre-gzipped when the client accepts it), or 304 when the ETag matches."""
     start = time.perf_counter()
     try:
         service = EstimatorService()
         provider = DataProvider()
 
-        data = await service.get_latest()
-        if data is None:
-            synced = await provider.sync_db_now()
-            if synced:
-                ran = await service.run_and_store()
-                if ran:
-                    data = await service.get_latest()
+        payload = await service.get_payload()
+        if payload is None:
+            # Join the in-flight sync (or start one) rather than racing it.
+            await _refresh.run_now(service, provider)
+            payload = await service.get_payload()
         else:
-            asyncio.create_task(_sync_and_run(service, provider))
+            _refresh.trigger(service, provider)
 
         elapsed_ms = (time.perf_counter() - start) * 1000
         logger.info(f"Estimator endpoint completed in {elapsed_ms:.1f}ms")
 
-        if not data or not data.get("rankings"):
+        if payload is None:
             raise HTTPException(
                 status_code=404,
                 detail="No estimator data available yet. The estimator runs daily after NBA games are completed."
             )
 
-        return _build_results(data, elapsed_ms)
+        return encoded_response(request, payload)
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error getting estimator results: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve estimator results")
+
+
+def _scenario_result(outcome: ScenarioOutcome) -> ScenarioResult:
+    probs = outcome.rank_prob_df.sort_values(["team_id", "rank"]).groupby("team_id", sort=False)
+    prob_by_team = {tid: (g["prob"].tolist(), g["delta_prob"].tolist()) for tid, g in probs}
+    teams = []
+    for row in outcome.ranking_df.to_dict(orient="records"):
+        prob, delta_prob = prob_by_team[row["team_id"]]
+        teams.append(ScenarioTeamResult(
+            team_id=row["team_id"],
+            team_name=row["team_name"],
+            projected_total_gp=row["projected_total_gp"],
+            expected_pts={
+                stat: row[OutputColumnNames.RankingExpectedPts.for_stat(stat)]
+                for stat in OutputColumnNames.STAT_NAMES
+            },
+            total_expected_pts=row[OutputColumnNames.RankingExpectedPts.TOTAL],
+            delta_total_expected_pts=row["delta_total_expected_pts"],
+            rank_probabilities=prob,
+            delta_rank_probabilities=delta_prob,
+        ))
+    return ScenarioResult(name=outcome.name, teams=teams)
+
+
+@router.post("/scenarios", response_model=ScenarioResults)
+async def run_estimator_scenarios(body: ScenariosRequest):
+    """What-if standings: every scenario is simulated alongside the baseline
+    with common random numbers, so the deltas reflect the perturbation rather
+    than Monte Carlo noise. Pass ``seed`` back to reproduce a response."""
+    try:
+        scenarios = [
+            Scenario(s.name, tuple(
+                TeamPerturbation(p.team_id, mean_shift=p.mean_shift, slot_games=p.slot_games)
+                for p in s.perturbations
+            ))
+            for s in body.scenarios
+        ]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        outcomes, seed = await EstimatorService().run_scenarios(scenarios, body.num_runs, body.seed)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error running estimator scenarios: {e}")
+        raise HTTPException(status_code=500, detail="Failed to run estimator scenarios")
+
+    if not outcomes:
+        raise HTTPException(status_code=404, detail="No estimator data available yet.")
+    return ScenarioResults(
+        seed=seed, num_runs=body.num_runs, scenarios=[_scenario_result(o) for o in outcomes]
+    )
@@ -1,7 +1,6 @@
-import asyncio
 import logging
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Header
 from fastapi.responses import StreamingResponse
 
 from app.models.injury_models import InjuryRecord, InjuryNotification
@@ -60,34 +59,15 @@ async def get_injury_status():
 
 
 @router.get("/stream")
-async def injury_stream(request: Request):
-    """SSE endpoint — pushes InjuryNotification events to connected clients."""
-    queue: asyncio.Queue = asyncio.Queue()
-    injury_service.sse_subscribers.append(queue)
-    logger.info(
-        f"SSE client connected. Subscribers: {len(injury_service.sse_subscribers)}"
-    )
-
-    async def event_generator():
-        try:
-            while True:
-                try:
-                    item = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    if isinstance(item, dict) and "_event" in item:
-                        yield f"event: {item['_event']}\ndata: {item['data']}\n\n"
-                    else:
-                        yield f"data: {item.model_dump_json()}\n\n"
-                except asyncio.TimeoutError:
-                    yield ": ping\n\n"
-        finally:
-            if queue in injury_service.sse_subscribers:
-                injury_service.sse_subscribers.remove(queue)
-            logger.info(
-                f"SSE client disconnected. Subscribers: {len(injury_service.sse_subscribers)}"
-            )
+async def injury_stream(last_event_id: str | None = Header(default=None)):
+    """SSE endpoint — pushes InjuryNotification events to connected clients.
 
+    Browsers reconnect with a ``Last-Event-ID`` header; events still in the
+    broadcaster's ring buffer after that id are replayed first.
+    """
+    resume = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
     return StreamingResponse(
-        event_generator(),
+        injury_service.injury_events.stream(resume),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from app.models import LeagueSummary, LeagueShotsData, DraftReport
 from app.services.league_service import LeagueService
 from app.services.draft_report_service import DraftReportService
 from app.exceptions import ResourceNotFoundError
+from app.utils.http_cache import encoded_response
 from typing import Annotated
 import logging
 
@@ -43,11 +44,16 @@ async def get_league_shots(
 
 @router.get("/draft-report", response_model=DraftReport)
 async def get_draft_report(
+    request: Request,
     draft_report_service: DraftReportServiceDep
 ):
-    """Get draft picks joined to player and team names for the draft report card"""
+    """Get draft picks joined to player and team names for the draft report card.
+    Served as the stored encoded report (304 on a matching ETag); a finished
+    draft's ETag only changes if a team is renamed."""
     try:
-        return await draft_report_service.get_draft_report()
+        payload = await draft_report_service.get_payload()
+        cache_control = "public, max-age=3600" if payload.complete else "no-cache"
+        return encoded_response(request, payload, cache_control)
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
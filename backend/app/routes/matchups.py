@@ -12,7 +12,8 @@ from app.services.db_service import DBService
 from app.services.depth_chart_service import DepthChartService
 from app.services.live_projection_service import LiveProjectionService
 from app.services.nba_matchup_service import NbaMatchupService
-from app.utils.name_matching import normalize_player_name
+from app.utils.metrics import record_cache
+from app.utils.name_matching import name_keys, normalize_player_name
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -87,7 +88,9 @@ async def get_matchups_today(
 
     cache_key = date or 'today'
     hit = _response_cache.get(cache_key)
-    if hit is not None and time.monotonic() - hit[0] < _RESPONSE_CACHE_TTL_S:
+    fresh = hit is not None and time.monotonic() - hit[0] < _RESPONSE_CACHE_TTL_S
+    record_cache('matchup_response', hit=fresh)
+    if fresh:
         return hit[1]
     try:
         games_today = await _matchup_service.get_games_today(date=date)
@@ -138,7 +141,7 @@ async def get_matchups_today(
         projections = {}
 
     results: list[PlayerMatchupResponse] = []
-    for _, row in players_df.iterrows():
+    for (_, row), name_key in zip(players_df.iterrows(), name_keys(players_df)):
         pro_team: str = str(row.get('Pro Team', ''))
         game = games_today.get(pro_team)
         if game is None or game.opponent not in def_ranks:
@@ -190,8 +193,8 @@ async def get_matchups_today(
             league_avg_def_values=league_avg_def,
             projection=projection,
             game_date=resolved_date,
-            on_depth_chart=normalize_player_name(row['Name']) in depth_chart_names.get(pro_team, set()),
-            injury_status=injury_lookup.get(normalize_player_name(row['Name'])),
+            on_depth_chart=name_key in depth_chart_names.get(pro_team, set()),
+            injury_status=injury_lookup.get(name_key),
         ))
 
     if results:
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from app.models import PaginatedPlayers, StatTimePeriod
-from app.exceptions import ResourceNotFoundError
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from app.models import PaginatedPlayers, Player, StatTimePeriod
+from app.models.requests import SortOrder
+from app.exceptions import InvalidParameterError, ResourceNotFoundError
 from app.services.player_service import PlayerService
 from typing import Annotated, Optional
 from datetime import date
@@ -13,6 +14,20 @@ logger = logging.getLogger(__name__)
 PlayerServiceDep = Annotated[PlayerService, Depends(PlayerService)]
 
 
+def _parse_fields(fields: Optional[str]) -> Optional[set[str]]:
+    """Comma-separated Player field names -> set, validated."""
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - Player.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Valid options: {', '.join(Player.model_fields)}",
+        )
+    return requested
+
+
 @router.get("/", response_model=PaginatedPlayers)
 async def get_all_players(
     player_service: PlayerServiceDep,
@@ -24,9 +39,15 @@ async def get_all_players(
     ),
     start: Optional[date] = Query(None, description="Start date, required when time_period=custom"),
     end: Optional[date] = Query(None, description="End date, required when time_period=custom"),
+    sort_by: Optional[str] = Query(None, description="Player or stats field to sort by, e.g. pts, fg_percentage, player_name"),
+    order: SortOrder = Query(SortOrder.DESC, description="Sort order: asc or desc"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; overrides page"),
+    fields: Optional[str] = Query(None, description="Comma-separated player fields to return, e.g. player_name,stats"),
 ):
-    """Get all players including free agents and waivers with pagination"""
+    """Get all players including free agents and waivers, sorted and paginated
+    by page number or keyset cursor, optionally projected to a subset of fields"""
     try:
+        projection = _parse_fields(fields)
         if time_period == StatTimePeriod.CUSTOM:
             if start is None or end is None:
                 raise HTTPException(status_code=422, detail="custom time_period requires both start and end")
@@ -37,9 +58,19 @@ async def get_all_players(
             if end > date.today():
                 raise HTTPException(status_code=422, detail="end cannot be in the future")
 
-        return await player_service.get_all_players(page, limit, time_period, start, end)
+        result = await player_service.get_all_players(
+            page, limit, time_period, start, end,
+            sort_by=sort_by, descending=order == SortOrder.DESC, cursor=cursor,
+        )
+        if projection is None:
+            return result
+        include = {name: True for name in PaginatedPlayers.model_fields if name != "players"}
+        include["players"] = {"__all__": projection}
+        return Response(result.model_dump_json(include=include), media_type="application/json")
     except HTTPException:
         raise
+    except InvalidParameterError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -1,13 +1,21 @@
 import logging
+from datetime import date, datetime, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
 from app.models.projection_models import (
+    ModelLoadTiming,
+    ModelRegistryStatus,
     PlayerNextGameProjection,
     PredictProjectionRequest,
     PredictProjectionResponse,
+    WeekProjectionResponse,
 )
+from app.services.data_provider import DataProvider
 from app.services.live_projection_service import LiveProjectionService
+from app.services.nba_matchup_service import NbaMatchupService
 from app.services.player_next_game_service import PlayerNextGameService
 
 router = APIRouter()
@@ -15,6 +23,7 @@ logger = logging.getLogger(__name__)
 
 _projection_service = LiveProjectionService()
 _next_game_service = PlayerNextGameService()
+_matchup_service = NbaMatchupService()
 
 
 @router.get('/player/{player_id}', response_model=PlayerNextGameProjection)
@@ -33,3 +42,46 @@ async def predict_projection(body: PredictProjectionRequest) -> PredictProjectio
     if result is None:
         raise HTTPException(status_code=404, detail='no projection available for this player')
     return PredictProjectionResponse(stats=result['stats'])
+
+
+@router.get('/week', response_model=WeekProjectionResponse)
+async def week_projection(
+    start: Optional[date] = Query(default=None, description='First day (default: today, US/Eastern)'),
+    days: int = Query(default=7, ge=1, le=14),
+    fantasy_team_id: Optional[int] = Query(default=None, description='One fantasy roster (0 = free agents)'),
+) -> WeekProjectionResponse:
+    """Projected totals over a window of the NBA schedule for every pool player
+    (or one fantasy roster), plus per-fantasy-team sums."""
+    start = start or datetime.now(ZoneInfo('America/New_York')).date()
+    end = start + timedelta(days=days - 1)
+    try:
+        schedule = await _matchup_service.get_schedule(start, days)
+        players_df = await DataProvider().get_players_df(stat_split_type_id=0)
+    except Exception as e:
+        logger.error(f'Week projection inputs failed: {e}')
+        raise HTTPException(status_code=503, detail='schedule or player pool unavailable')
+    if fantasy_team_id is not None:
+        players_df = players_df[players_df['team_id'] == fantasy_team_id]
+
+    result = await _projection_service.project_week(players_df, schedule)
+    if result is None:
+        raise HTTPException(status_code=503, detail='projection models are not ready')
+    return WeekProjectionResponse(start_date=start.isoformat(), end_date=end.isoformat(), **result)
+
+
+@router.get('/models/status', response_model=ModelRegistryStatus)
+async def model_load_status() -> ModelRegistryStatus:
+    """Startup model-load timings (per model) and whether the warm path is ready."""
+    registry = _projection_service.load_status()
+    if registry is None:
+        return ModelRegistryStatus(loaded=False)
+    return ModelRegistryStatus(
+        loaded=True,
+        inference_ready=_projection_service.inference_ready(),
+        load_seconds=round(registry.load_seconds, 4),
+        warmup_seconds=None if registry.warmup_seconds is None else round(registry.warmup_seconds, 4),
+        models=[
+            ModelLoadTiming(target=m.target, seconds=round(m.seconds, 4), bytes=m.bytes, compiled=m.compiled)
+            for m in registry.loads
+        ],
+    )
@@ -0,0 +1,173 @@
+"""Worker processes for CPU-heavy batch jobs (estimator, nightly model build).
+
+pandas/numpy work run in a thread of the API process holds the GIL for seconds
+at a time and stalls every request the event loop is serving. Jobs submitted
+here run in a separate spawned process instead:
+
+  - DataFrame arguments and results (top level, or inside a returned tuple)
+    cross the process boundary as Arrow IPC buffers; a frame Arrow can't
+    represent falls back to pickle.
+  - Each job gets its own process, at most BATCH_WORKERS at a time; later jobs
+    wait for a slot, and their timeout starts when they do.
+  - A timeout or a cancelled caller kills that job's process (a running job
+    can't be interrupted any other way). Jobs queued behind it or running
+    beside it are untouched.
+  - A process that dies (OOM kill, segfault) surfaces as BatchJobError to its
+    caller; the API process is unaffected.
+  - A process exits after its one job, so the few hundred MB a feature-store
+    build peaks at goes back to the OS instead of staying resident.
+
+BATCH_WORKERS=0 runs jobs in a thread in-process instead (tests, tiny hosts);
+there a timeout stops the wait but not the work.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from app.config import settings
+from app.utils.metrics import BATCH_JOB_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class BatchJobError(RuntimeError):
+    """A batch job timed out or its worker process died."""
+
+
+@dataclass(frozen=True)
+class _ArrowFrame:
+    buf: bytes
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, pd.DataFrame):
+        try:
+            table = pa.Table.from_pandas(value)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return _ArrowFrame(sink.getvalue().to_pybytes())
+        except (pa.ArrowException, TypeError, ValueError):
+            return value
+    if isinstance(value, tuple):
+        return tuple(_encode(v) for v in value)
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, _ArrowFrame):
+        return pa.ipc.open_stream(value.buf).read_all().to_pandas()
+    if isinstance(value, tuple):
+        return tuple(_decode(v) for v in value)
+    return value
+
+
+def _worker_main(conn: Connection, fn: Callable, args: tuple) -> None:
+    """Worker-side entry point: send back (True, result) or (False, exception)."""
+    try:
+        reply = (True, _encode(fn(*_decode(args))))
+    except BaseException as e:
+        reply = (False, e)
+    try:
+        conn.send(reply)
+    except Exception as e:  # unpicklable result or exception
+        conn.send((False, RuntimeError(f"{type(e).__name__} sending the job's outcome: {e}")))
+    finally:
+        conn.close()
+
+
+def _receive(conn: Connection) -> tuple:
+    """Block until the worker replies; EOFError if it exits (or is killed) first."""
+    return conn.recv()
+
+
+class BatchJobPool:
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+        self._slots: Optional[asyncio.Semaphore] = None
+        # pid -> (job name, process) for every job currently running.
+        self._running: dict[int, tuple[str, BaseProcess]] = {}
+
+    async def _run_in_process(self, name: str, fn: Callable, args: tuple, timeout: Optional[float]) -> Any:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        async with self._slots:
+            # spawn, not fork: the parent holds asyncpg/httpx sockets and
+            # threads that a forked child must not inherit.
+            ctx = multiprocessing.get_context("spawn")
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            proc = ctx.Process(target=_worker_main, args=(send_conn, fn, _encode(args)), daemon=True)
+            proc.start()
+            send_conn.close()  # the child's copy is the only writer left
+            self._running[proc.pid] = (name, proc)
+            try:
+                ok, payload = await asyncio.wait_for(asyncio.to_thread(_receive, recv_conn), timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                proc.kill()
+                raise
+            except EOFError as e:
+                raise BatchJobError(f"{name}: worker process died (exit code {proc.exitcode})") from e
+            finally:
+                await asyncio.to_thread(proc.join)
+                recv_conn.close()
+                self._running.pop(proc.pid, None)
+        if not ok:
+            raise payload
+        return _decode(payload)
+
+    async def run(self, name: str, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """Run ``fn(*args)`` in a worker and return its result. ``fn`` must be
+        importable by qualified name (a module-level function or staticmethod)."""
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            if self.workers <= 0:
+                return await asyncio.wait_for(asyncio.to_thread(fn, *args), timeout)
+            return await self._run_in_process(name, fn, args, timeout)
+        except asyncio.TimeoutError as e:
+            status = "timeout"
+            raise BatchJobError(f"{name}: timed out after {timeout:.0f}s") from e
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        except BatchJobError:
+            status = "crashed"
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            BATCH_JOB_SECONDS.observe(elapsed, job=name, status=status)
+            if status != "ok":
+                logger.warning(f"Batch job {name} {status} after {elapsed:.1f}s")
+
+    def shutdown(self) -> None:
+        """Kill every running job's process."""
+        for name, proc in list(self._running.values()):
+            logger.info(f"Killing batch job {name} (pid {proc.pid}) on shutdown")
+            proc.kill()
+
+
+_pool: Optional[BatchJobPool] = None
+
+
+def get_batch_pool() -> BatchJobPool:
+    global _pool
+    if _pool is None:
+        _pool = BatchJobPool(settings.batch_workers)
+    return _pool
+
+
+def shutdown_batch_pool() -> None:
+    if _pool is not None:
+        _pool.shutdown()
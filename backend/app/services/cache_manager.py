@@ -23,6 +23,10 @@ class CacheManager:
             self.players_cache: Dict = {'etag': None, 'data': None}
             self.draft_detail_cache: Optional[Dict] = None
             self.players_directory_cache: Optional[Dict[int, str]] = None
+            # Pre-encoded /api/analytics/over-time bodies, keyed by request shape
+            # plus the snapshot period they were read at; see OverTimeService.
+            self.history_period: int = 0
+            self.over_time_cache: Dict[tuple, Dict] = {}
             self._initialized = True
     
     def invalidate_cache(self):
@@ -30,6 +34,12 @@ class CacheManager:
         self.totals_cache = {'etag': None, 'data': None}
         self.players_cache = {'etag': None, 'data': None}
 
+    def set_history_period(self, period: int):
+        """Record the latest synced snapshot period; older over-time bodies are dropped"""
+        if period != self.history_period:
+            self.history_period = period
+            self.over_time_cache = {}
+
     def get_cache_info(self) -> dict:
         """Get cache status information"""
         return {
@@ -2,15 +2,20 @@ import asyncio
 import logging
 import httpx
 import json
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import pandas as pd
 from app.services.cache_manager import CacheManager
 from app.services.data_transformer import DataTransformer
+from app.services.db_pool import in_batch_lane
 from app.services.db_service import DBService
+from app.services.league_history import LeagueHistory
 from app.config import settings
 from app.exceptions import DataSourceError
 from app.utils.constants import RANKING_CATEGORIES
+from app.utils.metrics import ESPN_FETCH_SECONDS
+from app.utils.name_matching import add_name_keys
 
 class DataProvider:
     """Centralized data provider with caching for all ESPN data operations"""
@@ -46,6 +51,17 @@ class DataProvider:
             self.espn_draft_detail_url = f'https://lm-api-reads.fantasy.espn.com/apis/v3/games/fba/seasons/{settings.season_id}/segments/0/leagues/{settings.league_id}?view=mDraftDetail'
             self.espn_players_directory_url = f'https://lm-api-reads.fantasy.espn.com/apis/v3/games/fba/seasons/{settings.season_id}/players?view=players_wl'
     
+    async def _espn_get(self, view: str, url: str, **kwargs) -> httpx.Response:
+        """GET against the ESPN fantasy API, timed per view for /metrics."""
+        start = time.perf_counter()
+        status = 'error'
+        try:
+            response = await self._client.get(url, **kwargs)
+            status = str(response.status_code)
+            return response
+        finally:
+            ESPN_FETCH_SECONDS.observe(time.perf_counter() - start, view=view, status=status)
+
     async def get_totals_df(self) -> pd.DataFrame:
         """Get totals DataFrame with caching. Falls back to DB snapshot on ESPN failure."""
         async with self._fetch_lock:
@@ -54,7 +70,7 @@ class DataProvider:
                 if self.cache_manager.totals_cache['etag']:
                     headers['If-None-Match'] = self.cache_manager.totals_cache['etag']
 
-                response = await self._client.get(self.espn_standings_url, headers=headers)
+                response = await self._espn_get('standings', self.espn_standings_url, headers=headers)
 
                 if response.status_code == 304:
                     return self.cache_manager.totals_cache['data']
@@ -71,7 +87,7 @@ class DataProvider:
                 self.cache_manager.totals_cache['scoring_period_id'] = scoring_period_id
                 self.cache_manager.totals_cache['data_date'] = None
 
-                asyncio.create_task(self._sync_db_if_needed(scoring_period_id, totals_df))
+                asyncio.create_task(in_batch_lane(self._sync_db_if_needed(scoring_period_id, totals_df)))
 
                 return totals_df
 
@@ -86,7 +102,7 @@ class DataProvider:
         """Fetch from ESPN and synchronously await the DB sync. Returns True if new data was written."""
         async with self._fetch_lock:
             try:
-                response = await self._client.get(self.espn_standings_url)
+                response = await self._espn_get('standings', self.espn_standings_url)
                 response.raise_for_status()
                 api_data = response.json()
                 totals_df = self.data_transformer.raw_standings_to_totals_df(api_data)
@@ -166,7 +182,7 @@ class DataProvider:
                 if cache.get('etag'):
                     headers['If-None-Match'] = cache['etag']
 
-                response = await self._client.get(self.espn_players_url, headers=headers)
+                response = await self._espn_get('players', self.espn_players_url, headers=headers)
 
                 if response.status_code == 304:
                     cache['timestamp'] = datetime.now()
@@ -184,6 +200,8 @@ class DataProvider:
                     fantasy_team_map = dict(zip(totals_data['team_id'], totals_data['team_name']))
 
                 players_df = self.data_transformer.raw_all_players_to_df(api_data, stat_split_type_id, fantasy_team_map)
+                # Normalize names once per fetch; every name join downstream reads these columns.
+                add_name_keys(players_df)
 
                 cache['etag'] = response.headers.get('ETag')
                 cache['timestamp'] = datetime.now()
@@ -233,13 +251,17 @@ class DataProvider:
         """Returns the data_date from cache if serving DB fallback, else None."""
         return self.cache_manager.totals_cache.get('data_date')
 
+    def get_scoring_period_id(self) -> Optional[int]:
+        """ESPN scoring period of the last successful totals fetch (None before one)."""
+        return self.cache_manager.totals_cache.get('scoring_period_id')
+
     async def get_draft_detail_raw(self) -> Dict:
         """Get raw ESPN draft picks. Draft is immutable after draft night, cached for process lifetime."""
         if self.cache_manager.draft_detail_cache is not None:
             return self.cache_manager.draft_detail_cache
 
         try:
-            response = await self._client.get(self.espn_draft_detail_url)
+            response = await self._espn_get('draft_detail', self.espn_draft_detail_url)
             response.raise_for_status()
             api_data = response.json()
             self.cache_manager.draft_detail_cache = api_data
@@ -255,7 +277,7 @@ class DataProvider:
 
         try:
             headers = {'X-Fantasy-Filter': json.dumps({"players": {"limit": 3000}})}
-            response = await self._client.get(self.espn_players_directory_url, headers=headers)
+            response = await self._espn_get('players_directory', self.espn_players_directory_url, headers=headers)
             response.raise_for_status()
             api_data = response.json()
             directory = {p['id']: p['fullName'] for p in api_data}
@@ -311,20 +333,34 @@ class DataProvider:
                     self.db_service.get_db_max_scoring_period('team_daily_snapshot'),
                 )
 
-                tasks = []
+                tasks = [self._sync_snapshot(completed_period, totals_df, write=max_snap < completed_period)]
                 if max_avg < completed_period:
                     tasks.append(self.db_service.upsert_rankings_averages(completed_period, rankings_avg_df))
                 if max_tot < completed_period:
                     tasks.append(self.db_service.upsert_rankings_totals(completed_period, rankings_totals_df))
-                if max_snap < completed_period:
-                    tasks.append(self.db_service.upsert_daily_snapshot(completed_period, totals_df))
 
-                if tasks:
-                    await asyncio.gather(*tasks)
+                snapshot_synced, *_ = await asyncio.gather(*tasks)
+                if not snapshot_synced:
+                    # Leave _last_synced_period behind so the next fetch retries the snapshot.
+                    return
                 self._last_synced_period = completed_period
+                self.cache_manager.set_history_period(completed_period)
             except Exception as e:
                 self.logger.error(f"DB sync failed for scoring_period_id={scoring_period_id}: {e}")
 
+    async def _sync_snapshot(self, completed_period: int, totals_df: pd.DataFrame, write: bool) -> bool:
+        """Upsert the completed period's snapshot (if ``write``), then bring
+        LeagueHistory up to that date. Returns False if the upsert failed."""
+        snap_date = settings.season_start + timedelta(days=completed_period - 1)
+        history = LeagueHistory()
+        if not write:
+            await history.catch_up(snap_date, self.db_service)
+            return True
+        if not await self.db_service.upsert_daily_snapshot(completed_period, totals_df):
+            return False
+        await history.extend(snap_date, totals_df)
+        return True
+
     async def close(self):
         """Close the httpx client and DB pool to clean up connections"""
         if hasattr(self, '_client'):
@@ -0,0 +1,120 @@
+"""asyncpg pools for DBService: an interactive lane and a batch lane.
+
+The schedulers (estimator sync, nightly model build, injury poller) and API
+requests used to share one five-connection pool, so a morning sync holding
+every connection queued request reads behind it with nothing to show for it.
+Work now runs in one of two lanes, each its own pool:
+
+  - ``interactive`` (default): request-path reads.
+  - ``batch``: anything run under ``batch_lane()`` -- scheduler loops and
+    background syncs. Its pool is smaller and starts empty, so batch work can
+    never hold more than ``DB_BATCH_POOL_MAX_SIZE`` connections and costs
+    none while idle.
+
+The lane is a context variable, so tasks spawned inside ``batch_lane()``
+(gather, create_task, to_thread) inherit it without threading a flag through
+DBService's signatures. Both pools grow on demand up to their max size and
+close connections idle for ``DB_POOL_IDLE_TIMEOUT_S`` back down to their min.
+
+Hot read queries are kept as fixed text in one dict and run by name through
+``fetch_hot`` / ``fetchrow_hot``. asyncpg prepares each one on its first use on
+a connection and reuses the cached statement after that, so a connection only
+pays the Parse/plan round trip once per query, and only for queries it runs.
+Acquire wait, queue depth and per-query time go to /metrics.
+"""
+
+import asyncio
+import contextlib
+import logging
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+import asyncpg
+
+from app.config import settings
+from app.utils.metrics import DB_HOT_QUERY_SECONDS, TimedPool
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = 'interactive'
+BATCH = 'batch'
+
+_lane: ContextVar[str] = ContextVar('db_pool_lane', default=INTERACTIVE)
+
+T = TypeVar('T')
+
+
+def current_lane() -> str:
+    return _lane.get()
+
+
+@contextlib.contextmanager
+def batch_lane() -> Iterator[None]:
+    """Run the enclosed DB work (and tasks spawned from it) on the batch pool."""
+    token = _lane.set(BATCH)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+async def in_batch_lane(coro: Awaitable[T]) -> T:
+    """Await ``coro`` on the batch lane, e.g. ``create_task(in_batch_lane(job()))``."""
+    with batch_lane():
+        return await coro
+
+
+async def fetch_hot(conn, queries: Dict[str, str], name: str, *args):
+    with DB_HOT_QUERY_SECONDS.time(query=name):
+        return await conn.fetch(queries[name], *args)
+
+
+async def fetchrow_hot(conn, queries: Dict[str, str], name: str, *args):
+    with DB_HOT_QUERY_SECONDS.time(query=name):
+        return await conn.fetchrow(queries[name], *args)
+
+
+class DBPoolManager:
+    """Lazily creates one TimedPool per lane from the DB_POOL_* settings."""
+
+    def __init__(self, init: Optional[Callable[[asyncpg.Connection], Awaitable[None]]] = None):
+        self._init = init
+        self._pools: Dict[str, TimedPool] = {}
+        self._lock = asyncio.Lock()
+
+    def _sizing(self, lane: str) -> tuple[int, int]:
+        if lane == BATCH:
+            return 0, max(1, settings.db_batch_pool_max_size)
+        max_size = max(1, settings.db_pool_max_size)
+        return min(settings.db_pool_min_size, max_size), max_size
+
+    async def get(self, lane: Optional[str] = None) -> Optional[TimedPool]:
+        if not settings.database_url:
+            return None
+        lane = lane or current_lane()
+        pool = self._pools.get(lane)
+        if pool is not None:
+            return pool
+        async with self._lock:
+            pool = self._pools.get(lane)
+            if pool is None:
+                min_size, max_size = self._sizing(lane)
+                try:
+                    pool = TimedPool(await asyncpg.create_pool(
+                        settings.database_url,
+                        min_size=min_size,
+                        max_size=max_size,
+                        max_inactive_connection_lifetime=settings.db_pool_idle_timeout_s,
+                        init=self._init,
+                    ), lane=lane)
+                except Exception as e:
+                    logger.error(f"Failed to create {lane} DB connection pool: {e}")
+                    return None
+                self._pools[lane] = pool
+                logger.info(f"Created {lane} DB pool (min={min_size}, max={max_size})")
+            return pool
+
+    async def close(self) -> None:
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            await pool.close()
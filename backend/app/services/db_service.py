@@ -1,3 +1,5 @@
+import asyncio
+import json
 import logging
 from datetime import date, timedelta
 from typing import Optional
@@ -5,6 +7,9 @@ import asyncpg
 import pandas as pd
 from app.config import settings
 from app.models.injury_models import InjuryRecord
+from app.services.db_pool import DBPoolManager, fetch_hot, fetchrow_hot
+from app.services.fs_mirror import PLAYER_COLUMNS, TEAM_COLUMNS, FSMirror
+from app.utils.metrics import record_query
 from model_stats_inference.research import config as rconfig
 
 logger = logging.getLogger(__name__)
@@ -39,29 +44,130 @@ def fs_records_to_frame(records) -> pd.DataFrame:
     return df
 
 
+_PLAYER_WINDOW_TOTALS = """
+    SELECT
+        player_id,
+        (array_agg(player_name ORDER BY game_date DESC))[1] AS player_name,
+        COUNT(*) AS gp,
+        SUM(pts) AS pts,
+        SUM(reb) AS reb,
+        SUM(ast) AS ast,
+        SUM(stl) AS stl,
+        SUM(blk) AS blk,
+        SUM(fgm) AS fgm,
+        SUM(fga) AS fga,
+        SUM(ftm) AS ftm,
+        SUM(fta) AS fta,
+        SUM(fg3m) AS three_pm,
+        SUM(min) AS min,
+        COALESCE(SUM(fgm) / NULLIF(SUM(fga), 0), 0.0) AS fg_pct,
+        COALESCE(SUM(ftm) / NULLIF(SUM(fta), 0), 0.0) AS ft_pct
+    FROM fs_player_games
+    WHERE season = $1 AND game_date BETWEEN $2 AND $3 AND min > 0
+    {player_filter}
+    GROUP BY player_id
+"""
+
+# Request-path reads that run on every cache miss. Run by name through
+# fetch_hot so the text stays identical and asyncpg's per-connection
+# statement cache prepares each one once (see db_pool).
+HOT_QUERIES = {
+    'player_window_coverage': """
+        SELECT MIN(game_date) AS start_date, MAX(game_date) AS end_date
+        FROM fs_player_games
+        WHERE season = $1 AND game_date BETWEEN $2 AND $3 AND min > 0
+    """,
+    'player_window_totals': _PLAYER_WINDOW_TOTALS.format(player_filter=""),
+    'player_window_totals_for_ids': _PLAYER_WINDOW_TOTALS.format(
+        player_filter="AND player_id = ANY($4::bigint[])"
+    ),
+    'usage_components': """
+        SELECT
+            p.player_id,
+            p.player_name,
+            p.game_id,
+            p.game_date,
+            p.min AS p_min,
+            p.fga AS p_fga,
+            p.fta AS p_fta,
+            p.tov AS p_tov,
+            t.fga AS t_fga,
+            t.fta AS t_fta,
+            t.tov AS t_tov,
+            tm.team_min AS t_min
+        FROM fs_player_games p
+        JOIN fs_team_games t
+            ON t.team_id = p.team_id AND t.game_id = p.game_id
+        JOIN (
+            SELECT team_id, game_id, SUM(min) AS team_min
+            FROM fs_player_games
+            WHERE season = $1 AND game_date BETWEEN $2 AND $3
+            GROUP BY team_id, game_id
+        ) tm ON tm.team_id = p.team_id AND tm.game_id = p.game_id
+        WHERE p.season = $1 AND p.game_date BETWEEN $2 AND $3 AND p.min > 0
+    """,
+    'player_game_log': """
+        SELECT
+            p.player_name,
+            p.game_date,
+            p.matchup,
+            p.min AS p_min,
+            p.fgm, p.fga, p.ftm, p.fta, p.fg3m, p.fg3a,
+            p.fga AS p_fga,
+            p.fta AS p_fta,
+            p.tov AS p_tov,
+            t.fga AS t_fga,
+            t.fta AS t_fta,
+            t.tov AS t_tov,
+            tm.team_min AS t_min
+        FROM fs_player_games p
+        JOIN fs_team_games t
+            ON t.team_id = p.team_id AND t.game_id = p.game_id
+        JOIN (
+            SELECT team_id, game_id, SUM(min) AS team_min
+            FROM fs_player_games
+            WHERE season = $2 AND game_date BETWEEN $3 AND $4
+            GROUP BY team_id, game_id
+        ) tm ON tm.team_id = p.team_id AND tm.game_id = p.game_id
+        WHERE p.player_id = $1 AND p.season = $2
+          AND p.game_date BETWEEN $3 AND $4 AND p.min > 0
+        ORDER BY p.game_date
+    """,
+    'all_injury_statuses': "SELECT team, player, status, injury_reason, last_updated FROM player_injury_status",
+}
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Pool ``init`` hook: feed every statement's elapsed time to /metrics."""
+    conn.add_query_logger(record_query)
+
+
 class DBService:
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._pool: Optional[asyncpg.Pool] = None
+            cls._instance._pools = DBPoolManager(init=_init_connection)
+            cls._instance._fs_mirror = FSMirror()
         return cls._instance
 
-    async def _get_pool(self) -> Optional[asyncpg.Pool]:
-        if not settings.database_url:
+    async def _get_pool(self):
+        """Pool for the current lane (interactive unless inside ``batch_lane()``)."""
+        return await self._pools.get()
+
+    async def _query_fs_mirror(self, method: str, *args):
+        """Answer an analytical read from the columnar fs mirror, in a worker
+        thread (Arrow's kernels release the GIL; the event loop keeps serving).
+        None when the mirror is off, not loaded yet or fails -- the caller
+        queries Postgres."""
+        if not settings.fs_mirror_enabled or not self._fs_mirror.ready:
+            return None
+        try:
+            return await asyncio.to_thread(getattr(self._fs_mirror, method), *args)
+        except Exception as e:
+            logger.error(f"FS mirror {method} failed, falling back to Postgres: {e}")
             return None
-        if self._pool is None:
-            try:
-                self._pool = await asyncpg.create_pool(
-                    settings.database_url,
-                    min_size=1,
-                    max_size=5,
-                )
-            except Exception as e:
-                logger.error(f"Failed to create DB connection pool: {e}")
-                return None
-        return self._pool
 
     async def get_db_max_scoring_period(self, table: str) -> int:
         pool = await self._get_pool()
@@ -157,10 +263,11 @@ class DBService:
         except Exception as e:
             logger.error(f"Failed to upsert team_rankings_totals: {e}")
 
-    async def upsert_daily_snapshot(self, scoring_period_id: int, totals_df: pd.DataFrame) -> None:
+    async def upsert_daily_snapshot(self, scoring_period_id: int, totals_df: pd.DataFrame) -> bool:
+        """Returns True once the rows are written."""
         pool = await self._get_pool()
         if pool is None:
-            return
+            return False
         snap_date = _SEASON_START + timedelta(days=scoring_period_id - 1)
         try:
             async with pool.acquire() as conn:
@@ -205,8 +312,10 @@ class DBService:
                     rows,
                 )
             logger.info(f"Upserted team_daily_snapshot for scoring_period_id={scoring_period_id}")
+            return True
         except Exception as e:
             logger.error(f"Failed to upsert team_daily_snapshot: {e}")
+            return False
 
     async def get_latest_snapshot(self):
         """
@@ -393,6 +502,26 @@ class DBService:
             logger.error(f"Failed to fetch snapshots for date range: {e}")
             return None, None, [], []
 
+    async def get_snapshot_history(self) -> list[dict]:
+        """Every team_daily_snapshot row (cumulative counting stats), ordered by date."""
+        pool = await self._get_pool()
+        if pool is None:
+            return []
+        try:
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT date, team_id, team_name, gp, fgm, fga, ftm, fta,
+                           three_pm, reb, ast, stl, blk, pts
+                    FROM team_daily_snapshot
+                    ORDER BY date, team_id
+                    """
+                )
+                return [dict(r) for r in rows]
+        except Exception as e:
+            logger.error(f"Failed to fetch snapshot history: {e}")
+            return []
+
     async def upsert_estimator_prediction(self, df: pd.DataFrame) -> None:
         pool = await self._get_pool()
         if pool is None:
@@ -556,6 +685,101 @@ class DBService:
             logger.error(f"Failed to fetch estimator latest: {e}")
             return {}
 
+    async def upsert_estimator_payload(self, as_of_date: Optional[date], etag: str, body: bytes) -> None:
+        pool = await self._get_pool()
+        if pool is None:
+            return
+        try:
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO estimator_payload (id, as_of_date, etag, body, created_at)
+                    VALUES (1, $1, $2, $3, NOW())
+                    ON CONFLICT (id) DO UPDATE SET
+                        as_of_date = EXCLUDED.as_of_date,
+                        etag       = EXCLUDED.etag,
+                        body       = EXCLUDED.body,
+                        created_at = NOW()
+                    """,
+                    as_of_date, etag, body,
+                )
+        except Exception as e:
+            logger.error(f"Failed to upsert estimator payload: {e}")
+
+    async def get_estimator_payload_etag(self) -> Optional[str]:
+        pool = await self._get_pool()
+        if pool is None:
+            return None
+        try:
+            async with pool.acquire() as conn:
+                return await conn.fetchval("SELECT etag FROM estimator_payload WHERE id = 1")
+        except Exception as e:
+            logger.error(f"Failed to fetch estimator payload etag: {e}")
+            return None
+
+    async def get_estimator_payload(self) -> Optional[dict]:
+        pool = await self._get_pool()
+        if pool is None:
+            return None
+        try:
+            async with pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    "SELECT as_of_date, etag, body FROM estimator_payload WHERE id = 1"
+                )
+                return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"Failed to fetch estimator payload: {e}")
+            return None
+
+    async def upsert_draft_report(
+        self, season_id: int, etag: str, body: bytes, picks: list[dict], team_names: dict[int, str]
+    ) -> None:
+        pool = await self._get_pool()
+        if pool is None:
+            return
+        try:
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    INSERT INTO draft_report (season_id, etag, body, picks, team_names, created_at, updated_at)
+                    VALUES ($1, $2, $3, $4::jsonb, $5::jsonb, NOW(), NOW())
+                    ON CONFLICT (season_id) DO UPDATE SET
+                        etag       = EXCLUDED.etag,
+                        body       = EXCLUDED.body,
+                        picks      = EXCLUDED.picks,
+                        team_names = EXCLUDED.team_names,
+                        updated_at = NOW()
+                    """,
+                    season_id, etag, body, json.dumps(picks),
+                    json.dumps({str(k): v for k, v in team_names.items()}),
+                )
+        except Exception as e:
+            logger.error(f"Failed to upsert draft report: {e}")
+
+    async def get_draft_report(self, season_id: int) -> Optional[dict]:
+        """Stored draft report for the season: etag, body, picks, team_names
+        (int team_id keys), or None."""
+        pool = await self._get_pool()
+        if pool is None:
+            return None
+        try:
+            async with pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    "SELECT etag, body, picks, team_names FROM draft_report WHERE season_id = $1",
+                    season_id,
+                )
+            if not row:
+                return None
+            return {
+                'etag': row['etag'],
+                'body': bytes(row['body']),
+                'picks': json.loads(row['picks']),
+                'team_names': {int(k): v for k, v in json.loads(row['team_names']).items()},
+            }
+        except Exception as e:
+            logger.error(f"Failed to fetch draft report: {e}")
+            return None
+
     async def estimator_has_data(self) -> bool:
         pool = await self._get_pool()
         if pool is None:
@@ -603,6 +827,55 @@ class DBService:
         except Exception as e:
             logger.error(f"Failed to delete injury status for {team}|{player}: {e}")
 
+    async def apply_injury_changes(
+        self, upserts: list[InjuryRecord], deletes: list[tuple[str, str]]
+    ) -> bool:
+        """Apply one poll's whole diff in a single transaction: one unnest-based
+        upsert (same change-only semantics as upsert_injury_status) and one
+        composite-key DELETE. Callers pass disjoint keys; the end state matches
+        calling upsert_injury_status / delete_injury_status once per row."""
+        if not upserts and not deletes:
+            return True
+        pool = await self._get_pool()
+        if pool is None:
+            return False
+        try:
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    if deletes:
+                        await conn.execute(
+                            """
+                            DELETE FROM player_injury_status
+                            WHERE (team, player) IN (
+                                SELECT * FROM unnest($1::text[], $2::text[])
+                            )
+                            """,
+                            [team for team, _ in deletes], [player for _, player in deletes],
+                        )
+                    if upserts:
+                        await conn.execute(
+                            """
+                            INSERT INTO player_injury_status (team, player, status, injury_reason, last_updated)
+                            SELECT team, player, status, injury_reason, NOW()
+                            FROM unnest($1::text[], $2::text[], $3::text[], $4::text[])
+                                AS t(team, player, status, injury_reason)
+                            ON CONFLICT (team, player) DO UPDATE SET
+                                status        = EXCLUDED.status,
+                                injury_reason = EXCLUDED.injury_reason,
+                                last_updated  = NOW()
+                            WHERE player_injury_status.status IS DISTINCT FROM EXCLUDED.status
+                               OR player_injury_status.injury_reason IS DISTINCT FROM EXCLUDED.injury_reason
+                            """,
+                            [r.team for r in upserts], [r.player for r in upserts],
+                            [r.status for r in upserts], [r.injury for r in upserts],
+                        )
+            return True
+        except Exception as e:
+            logger.error(
+                f"Failed to apply injury changes ({len(upserts)} upserts, {len(deletes)} deletes): {e}"
+            )
+            return False
+
     async def get_injury_statuses_for_teams(self, teams: list[str]) -> list[dict]:
         pool = await self._get_pool()
         if pool is None:
@@ -624,9 +897,7 @@ class DBService:
             return []
         try:
             async with pool.acquire() as conn:
-                rows = await conn.fetch(
-                    "SELECT team, player, status, injury_reason, last_updated FROM player_injury_status"
-                )
+                rows = await fetch_hot(conn, HOT_QUERIES, 'all_injury_statuses')
                 return [dict(r) for r in rows]
         except Exception as e:
             logger.error(f"Failed to load all injury statuses: {e}")
@@ -777,54 +1048,36 @@ class DBService:
             return pd.DataFrame(), pd.DataFrame()
 
     async def aggregate_player_games(
-        self, start: date, end: date, season: str
+        self, start: date, end: date, season: str, player_ids: Optional[list[int]] = None
     ) -> tuple[pd.DataFrame, Optional[date], Optional[date]]:
         """Per-player totals over [start, end] inclusive, for the dynamic
         time-range player stats feature. Returns (df, actual_start, actual_end)
         where the actual dates are the real game_date coverage found in the
         window (None if no rows at all). Percentages are SUM(makes)/SUM(attempts),
-        never a mean of per-game ratios; gp is COUNT(*)."""
+        never a mean of per-game ratios; gp is COUNT(*).
+
+        ``player_ids`` restricts the aggregation to those fs_player_games
+        (nba_api) player ids -- not ESPN athlete ids, see
+        get_season_player_names; coverage stays league-wide so a team page
+        reports the same window as /players."""
+        mirrored = await self._query_fs_mirror('aggregate_player_games', start, end, season, player_ids)
+        if mirrored is not None:
+            return mirrored
         pool = await self._get_pool()
         if pool is None:
             return pd.DataFrame(), None, None
         try:
             async with pool.acquire() as conn:
-                coverage = await conn.fetchrow(
-                    """
-                    SELECT MIN(game_date) AS start_date, MAX(game_date) AS end_date
-                    FROM fs_player_games
-                    WHERE season = $1 AND game_date BETWEEN $2 AND $3 AND min > 0
-                    """,
-                    season, start, end,
-                )
+                coverage = await fetchrow_hot(conn, HOT_QUERIES, 'player_window_coverage', season, start, end)
                 actual_start = coverage['start_date'] if coverage else None
                 actual_end = coverage['end_date'] if coverage else None
 
-                rows = await conn.fetch(
-                    """
-                    SELECT
-                        player_id,
-                        (array_agg(player_name ORDER BY game_date DESC))[1] AS player_name,
-                        COUNT(*) AS gp,
-                        SUM(pts) AS pts,
-                        SUM(reb) AS reb,
-                        SUM(ast) AS ast,
-                        SUM(stl) AS stl,
-                        SUM(blk) AS blk,
-                        SUM(fgm) AS fgm,
-                        SUM(fga) AS fga,
-                        SUM(ftm) AS ftm,
-                        SUM(fta) AS fta,
-                        SUM(fg3m) AS three_pm,
-                        SUM(min) AS min,
-                        COALESCE(SUM(fgm) / NULLIF(SUM(fga), 0), 0.0) AS fg_pct,
-                        COALESCE(SUM(ftm) / NULLIF(SUM(fta), 0), 0.0) AS ft_pct
-                    FROM fs_player_games
-                    WHERE season = $1 AND game_date BETWEEN $2 AND $3 AND min > 0
-                    GROUP BY player_id
-                    """,
-                    season, start, end,
-                )
+                if player_ids is None:
+                    rows = await fetch_hot(conn, HOT_QUERIES, 'player_window_totals', season, start, end)
+                else:
+                    rows = await fetch_hot(
+                        conn, HOT_QUERIES, 'player_window_totals_for_ids', season, start, end, list(player_ids),
+                    )
                 return pd.DataFrame([dict(r) for r in rows]), actual_start, actual_end
         except Exception as e:
             logger.error(f"Failed to aggregate player games for {start}..{end} ({season}): {e}")
@@ -883,6 +1136,24 @@ class DBService:
             )
             return None, None, None
 
+    async def get_season_player_names(self, season: str) -> list[dict]:
+        """Every distinct (player_id, player_name) in fs_player_games for a
+        season. The ids are nba_api PLAYER_IDs, so callers holding ESPN rows
+        resolve them by name through this list. [] on failure."""
+        pool = await self._get_pool()
+        if pool is None:
+            return []
+        try:
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(
+                    "SELECT DISTINCT player_id, player_name FROM fs_player_games WHERE season = $1",
+                    season,
+                )
+                return [dict(r) for r in rows]
+        except Exception as e:
+            logger.error(f"Failed to fetch player names for season {season}: {e}")
+            return []
+
     async def get_latest_game_date(self, season: str) -> Optional[date]:
         """Most recent game_date with real box scores this season, or None if
         none exist yet. Used as the anchor for last_7/15/30 instead of real
@@ -909,6 +1180,9 @@ class DBService:
         season for a current-season aggregate, two prior seasons for a
         regression baseline), optionally bounded to [start, end]. Percentages
         are SUM(makes)/SUM(attempts), never a mean of per-game ratios."""
+        mirrored = await self._query_fs_mirror('aggregate_shooting_by_player', seasons, start, end)
+        if mirrored is not None:
+            return mirrored
         pool = await self._get_pool()
         if pool is None:
             return pd.DataFrame()
@@ -950,39 +1224,15 @@ class DBService:
         grouped by team_id+game_id). USG% itself is computed per game in Python
         (never from summed totals) then averaged over whatever window the
         caller wants (season, last-5, etc) from this same row set."""
+        mirrored = await self._query_fs_mirror('get_usage_components', season, start, end)
+        if mirrored is not None:
+            return mirrored
         pool = await self._get_pool()
         if pool is None:
             return pd.DataFrame()
         try:
             async with pool.acquire() as conn:
-                rows = await conn.fetch(
-                    """
-                    SELECT
-                        p.player_id,
-                        p.player_name,
-                        p.game_id,
-                        p.game_date,
-                        p.min AS p_min,
-                        p.fga AS p_fga,
-                        p.fta AS p_fta,
-                        p.tov AS p_tov,
-                        t.fga AS t_fga,
-                        t.fta AS t_fta,
-                        t.tov AS t_tov,
-                        tm.team_min AS t_min
-                    FROM fs_player_games p
-                    JOIN fs_team_games t
-                        ON t.team_id = p.team_id AND t.game_id = p.game_id
-                    JOIN (
-                        SELECT team_id, game_id, SUM(min) AS team_min
-                        FROM fs_player_games
-                        WHERE season = $1 AND game_date BETWEEN $2 AND $3
-                        GROUP BY team_id, game_id
-                    ) tm ON tm.team_id = p.team_id AND tm.game_id = p.game_id
-                    WHERE p.season = $1 AND p.game_date BETWEEN $2 AND $3 AND p.min > 0
-                    """,
-                    season, start, end,
-                )
+                rows = await fetch_hot(conn, HOT_QUERIES, 'usage_components', season, start, end)
                 return pd.DataFrame([dict(r) for r in rows])
         except Exception as e:
             logger.error(f"Failed to fetch usage components for {start}..{end} ({season}): {e}")
@@ -992,41 +1242,15 @@ class DBService:
         """Single player's per-game rows with the same team components
         get_usage_components returns, so USG% per game can be computed with the
         identical formula and the chart agrees with the table by construction."""
+        mirrored = await self._query_fs_mirror('get_player_game_log', player_id, season, start, end)
+        if mirrored is not None:
+            return mirrored
         pool = await self._get_pool()
         if pool is None:
             return pd.DataFrame()
         try:
             async with pool.acquire() as conn:
-                rows = await conn.fetch(
-                    """
-                    SELECT
-                        p.player_name,
-                        p.game_date,
-                        p.matchup,
-                        p.min AS p_min,
-                        p.fgm, p.fga, p.ftm, p.fta, p.fg3m, p.fg3a,
-                        p.fga AS p_fga,
-                        p.fta AS p_fta,
-                        p.tov AS p_tov,
-                        t.fga AS t_fga,
-                        t.fta AS t_fta,
-                        t.tov AS t_tov,
-                        tm.team_min AS t_min
-                    FROM fs_player_games p
-                    JOIN fs_team_games t
-                        ON t.team_id = p.team_id AND t.game_id = p.game_id
-                    JOIN (
-                        SELECT team_id, game_id, SUM(min) AS team_min
-                        FROM fs_player_games
-                        WHERE season = $2 AND game_date BETWEEN $3 AND $4
-                        GROUP BY team_id, game_id
-                    ) tm ON tm.team_id = p.team_id AND tm.game_id = p.game_id
-                    WHERE p.player_id = $1 AND p.season = $2
-                      AND p.game_date BETWEEN $3 AND $4 AND p.min > 0
-                    ORDER BY p.game_date
-                    """,
-                    player_id, season, start, end,
-                )
+                rows = await fetch_hot(conn, HOT_QUERIES, 'player_game_log', player_id, season, start, end)
                 return pd.DataFrame([dict(r) for r in rows])
         except Exception as e:
             logger.error(f"Failed to fetch game log for player {player_id} ({season}): {e}")
@@ -1093,6 +1317,71 @@ class DBService:
             logger.error(f"Failed to insert fs rows: {e}")
             return False
 
+    async def refresh_fs_mirror(self) -> bool:
+        """Bring the columnar fs mirror up to date: everything on the first
+        call, then only rows dated on/after the latest mirrored game_date.
+
+        An incremental merge can't see rows deleted or re-ingested behind that
+        date (e.g. a re-bootstrap run from another process), so the merged row
+        counts are checked against the tables' and a mismatch reloads in full."""
+        if not settings.fs_mirror_enabled:
+            return False
+        pool = await self._get_pool()
+        if pool is None:
+            return False
+        mirror = self._fs_mirror
+        try:
+            async with mirror.refresh_lock:
+                player_since, team_since = mirror.high_water()
+                players, teams, counts = await self._read_fs_rows(pool, player_since, team_since)
+                await asyncio.to_thread(mirror.merge, players, teams, player_since, team_since)
+                if mirror.num_rows != counts:
+                    logger.warning(
+                        f"FS mirror has {mirror.num_rows} rows after merging, tables have {counts}; "
+                        "reloading in full"
+                    )
+                    players, teams, counts = await self._read_fs_rows(pool, None, None)
+                    await asyncio.to_thread(mirror.merge, players, teams)
+            logger.info(
+                f"FS mirror refreshed: +{len(players)} player / +{len(teams)} team rows "
+                f"({counts[0]} / {counts[1]} total)"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to refresh FS mirror: {e}")
+            return False
+
+    @staticmethod
+    async def _read_fs_rows(pool, player_since: Optional[date], team_since: Optional[date]):
+        """(player rows, team rows, (player count, team count)): the rows dated
+        on/after each ``*_since`` (all when None) and both tables' total sizes,
+        read from one snapshot so the counts describe the same data."""
+        async with pool.acquire() as conn:
+            async with conn.transaction(isolation='repeatable_read', readonly=True):
+                players = await conn.fetch(
+                    f"SELECT {', '.join(PLAYER_COLUMNS)} FROM fs_player_games "
+                    "WHERE $1::date IS NULL OR game_date >= $1",
+                    player_since,
+                )
+                teams = await conn.fetch(
+                    f"SELECT {', '.join(TEAM_COLUMNS)} FROM fs_team_games "
+                    "WHERE $1::date IS NULL OR game_date >= $1",
+                    team_since,
+                )
+                counts = await conn.fetchrow(
+                    "SELECT (SELECT COUNT(*) FROM fs_player_games) AS players, "
+                    "(SELECT COUNT(*) FROM fs_team_games) AS teams"
+                )
+        return players, teams, (counts['players'], counts['teams'])
+
+    async def run_fs_mirror_refresher(self) -> None:
+        """Refresh the fs mirror now and then every FS_MIRROR_REFRESH_INTERVAL_S,
+        whichever process (or scheduler) wrote the tables."""
+        logger.info(f"FS mirror refresher started (every {settings.fs_mirror_refresh_interval_s:.0f}s)")
+        while True:
+            await self.refresh_fs_mirror()
+            await asyncio.sleep(settings.fs_mirror_refresh_interval_s)
+
     async def truncate_fs_tables(self) -> bool:
         """Wipe the raw-row store AND derived vectors (forced re-bootstrap starts clean)."""
         pool = await self._get_pool()
@@ -1104,6 +1393,7 @@ class DBService:
                     "TRUNCATE fs_player_games, fs_team_games, "
                     "fs_player_vectors, fs_team_allowed_vectors, fs_team_own_vectors"
                 )
+            self._fs_mirror.reset()
             logger.info("Truncated feature-store + vector tables")
             return True
         except Exception as e:
@@ -1296,9 +1586,7 @@ class DBService:
             return []
 
     async def close(self) -> None:
-        if self._pool is not None:
-            await self._pool.close()
-            self._pool = None
+        await self._pools.close()
 
 
 def get_db_service() -> DBService:
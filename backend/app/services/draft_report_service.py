@@ -1,24 +1,129 @@
+import gzip
+import hashlib
 import logging
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Optional
+
+from app.config import settings
 from app.models import DraftReport, DraftPick
 from app.services.data_provider import DataProvider
+from app.services.db_service import DBService
+from app.services.schedule_context import ScheduleContextProvider
 from app.exceptions import ResourceNotFoundError
 
 
+@dataclass(frozen=True)
+class DraftReportPayload:
+    """The /api/league/draft-report response, encoded once.
+
+    ``picks`` are the resolved pick rows without team names (team_id, player
+    name and the pick/round numbers), so a rename re-encodes from them alone.
+    """
+    etag: str
+    body: bytes
+    picks: List[dict]
+    team_names: Dict[int, str]
+    complete: bool = True
+
+    @cached_property
+    def gzip_body(self) -> bytes:
+        return gzip.compress(self.body)
+
+
+def encode_draft_report(picks: List[dict], team_names: Dict[int, str], complete: bool = True) -> DraftReportPayload:
+    """Resolved pick rows + team-name map -> encoded DraftReport (sorted by pick)."""
+    report = DraftReport(picks=[
+        DraftPick(
+            pick=p['pick'],
+            round=p['round'],
+            team_id=p['team_id'],
+            team_name=team_names.get(p['team_id'], 'Unknown Team'),
+            player_name=p['player_name'],
+        )
+        for p in sorted(picks, key=lambda p: p['pick'])
+    ])
+    body = report.model_dump_json().encode()
+    used_names = {p['team_id']: team_names[p['team_id']] for p in picks if p['team_id'] in team_names}
+    return DraftReportPayload(
+        f'"{hashlib.sha256(body).hexdigest()[:32]}"', body, picks, used_names, complete,
+    )
+
+
 class DraftReportService:
-    """Service for the live draft report card (picks joined to player/team names)"""
+    """Service for the draft report card (picks joined to player/team names).
+
+    A finished draft never changes, so once ESPN reports it complete the
+    encoded report is stored in Postgres and every later request -- in this
+    process or after a restart -- is served from memory/one row with no ESPN
+    calls. Only team renames (seen via the schedule context's team names,
+    already in memory) re-encode it. A draft still in progress is rebuilt from
+    ESPN per request and never stored.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     def __init__(self):
+        if DraftReportService._initialized:
+            return
         self.data_provider = DataProvider()
+        self.db_service = DBService()
+        self.schedule_context = ScheduleContextProvider()
         self.logger = logging.getLogger(__name__)
+        self._payload: Optional[DraftReportPayload] = None
+        DraftReportService._initialized = True
+
+    async def get_payload(self) -> DraftReportPayload:
+        payload = self._payload
+        if payload is None:
+            row = await self.db_service.get_draft_report(settings.season_id)
+            if row:
+                payload = DraftReportPayload(row['etag'], row['body'], row['picks'], row['team_names'])
+        if payload is None:
+            payload = await self._build_from_espn()
+            if payload.complete:
+                await self._store(payload)
+            return payload
+        self._payload = await self._reconcile_team_names(payload)
+        return self._payload
 
-    async def get_draft_report(self) -> DraftReport:
+    async def _reconcile_team_names(self, payload: DraftReportPayload) -> DraftReportPayload:
+        context = self.schedule_context.current
+        if context is None or not context.team_names:
+            return payload
+        current = {
+            team_id: context.team_names[team_id]
+            for team_id in {p['team_id'] for p in payload.picks}
+            if team_id in context.team_names
+        }
+        if all(payload.team_names.get(team_id) == name for team_id, name in current.items()):
+            return payload
+        self.logger.info("Draft report: team names changed, re-encoding stored report")
+        updated = encode_draft_report(payload.picks, {**payload.team_names, **current})
+        await self._store(updated)
+        return updated
+
+    async def _store(self, payload: DraftReportPayload) -> None:
+        await self.db_service.upsert_draft_report(
+            settings.season_id, payload.etag, payload.body, payload.picks, payload.team_names,
+        )
+        self._payload = payload
+
+    async def _build_from_espn(self) -> DraftReportPayload:
         draft_data, players_directory, totals_df = await self._fetch_dependencies()
 
-        picks_raw = draft_data.get('draftDetail', {}).get('picks', [])
+        draft_detail = draft_data.get('draftDetail', {})
+        picks_raw = draft_detail.get('picks', [])
         if not picks_raw:
             raise ResourceNotFoundError("No draft picks found for this league")
 
-        team_names = dict(zip(totals_df['team_id'], totals_df['team_name']))
+        team_names = {int(k): str(v) for k, v in zip(totals_df['team_id'], totals_df['team_name'])}
 
         picks = []
         for pick in picks_raw:
@@ -26,16 +131,15 @@ class DraftReportService:
             if player_name is None:
                 self.logger.warning(f"Draft report: no player name for playerId={pick['playerId']}")
                 continue
-            picks.append(DraftPick(
-                pick=pick['overallPickNumber'],
-                round=pick['roundId'],
-                team_id=pick['teamId'],
-                team_name=team_names.get(pick['teamId'], 'Unknown Team'),
-                player_name=player_name,
-            ))
-
-        picks.sort(key=lambda p: p.pick)
-        return DraftReport(picks=picks)
+            picks.append({
+                'pick': pick['overallPickNumber'],
+                'round': pick['roundId'],
+                'team_id': int(pick['teamId']),
+                'player_name': player_name,
+            })
+
+        complete = bool(draft_detail.get('drafted')) and not draft_detail.get('inProgress', False)
+        return encode_draft_report(picks, team_names, complete)
 
     async def _fetch_dependencies(self):
         draft_data = await self.data_provider.get_draft_detail_raw()
@@ -5,6 +5,7 @@ from zoneinfo import ZoneInfo
 
 from app.services.estimator_service import EstimatorService
 from app.services.data_provider import DataProvider
+from app.services.schedule_context import ScheduleContextProvider
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,7 @@ def _compute_next_trigger() -> datetime:
 async def start_scheduler():
     service = EstimatorService()
     provider = DataProvider()
+    schedule_context = ScheduleContextProvider()
     logger.info("Estimator scheduler started")
     while True:
         next_trigger = _compute_next_trigger()
@@ -36,6 +38,9 @@ async def start_scheduler():
         await asyncio.sleep(sleep_seconds)
         logger.info("Estimator scheduler triggered - syncing snapshot tables")
         synced = await provider.sync_db_now()
+        # New scoring period (or a late one): recompute pace/days left/slot usage
+        # here so page views and the estimator below read them from memory.
+        await schedule_context.refresh(force=True)
         if not synced:
             logger.info("Snapshot already current or ESPN unavailable, skipping estimator run")
             continue
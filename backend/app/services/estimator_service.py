@@ -1,17 +1,73 @@
 import asyncio
+import gzip
+import hashlib
 import logging
+import random
+import time
 import pandas as pd
+from dataclasses import dataclass
 from datetime import date, datetime
+from functools import cached_property
+from typing import Optional
 
 from app.config import settings
+from app.fantsy_estimator.scenario import Scenario, ScenarioEngine, ScenarioOutcome, TeamFit
+from app.models.estimator import EstimatorResults, TeamPrediction, TeamRanking, TeamRankProbability
+from app.services.batch_pool import get_batch_pool
 from app.services.db_service import DBService
-from app.services.nba_stats_service import NBAStatsService
-from app.services.team_slot_pace import get_team_slot_pace_df
+from app.services.schedule_context import ScheduleContextProvider
 from app.services.slot_games_estimator import SlotGamesEstimator
+from app.utils.metrics import ESTIMATOR_SECONDS
 
 logger = logging.getLogger(__name__)
 
-_NBA_AVG_PACE_FALLBACK = 65.9
+
+def _estimate(df: pd.DataFrame, nba_avg_pace: float, slot_proj_df: pd.DataFrame):
+    """Batch-pool entry point (runs in a worker process): the three result
+    tables plus the per-team fits, kept for what-if scenarios."""
+    from app.fantsy_estimator import FantasyEstimator
+    estimator = FantasyEstimator()
+    prediction_df, ranking_df, rank_prob_df = estimator.estimate(df, nba_avg_pace, slot_proj_df)
+    return prediction_df, ranking_df, rank_prob_df, estimator.team_fits
+
+
+def _fit(df: pd.DataFrame, nba_avg_pace: float, slot_proj_df: pd.DataFrame) -> list[TeamFit]:
+    from app.fantsy_estimator import FantasyEstimator
+    return FantasyEstimator().fit(df, nba_avg_pace, slot_proj_df)
+
+
+def _run_scenarios(fits: list[TeamFit], scenarios: list[Scenario], num_runs: int, seed: int) -> list[ScenarioOutcome]:
+    return ScenarioEngine(fits, num_runs=num_runs, seed=seed).run(scenarios)
+
+
+@dataclass(frozen=True)
+class EstimatorPayload:
+    """The /api/estimator/results response, encoded once per estimator run."""
+    as_of_date: Optional[date]
+    etag: str
+    body: bytes
+
+    @cached_property
+    def gzip_body(self) -> bytes:
+        return gzip.compress(self.body)
+
+
+def build_payload(data: dict, elapsed_ms: float = 0.0) -> Optional[EstimatorPayload]:
+    """predictions/rankings/rank_probabilities records -> encoded response.
+    ``elapsed_ms`` is the run time of the estimator run that produced them."""
+    if not data or not data.get("rankings"):
+        return None
+    predictions = [TeamPrediction(**r) for r in data.get("predictions", [])]
+    as_of_date = predictions[0].as_of_date if predictions else None
+    results = EstimatorResults(
+        as_of_date=as_of_date.isoformat() if as_of_date else "",
+        elapsed_ms=elapsed_ms,
+        predictions=predictions,
+        rankings=[TeamRanking(**r) for r in data.get("rankings", [])],
+        rank_probabilities=[TeamRankProbability(**r) for r in data.get("rank_probabilities", [])],
+    )
+    body = results.model_dump_json().encode()
+    return EstimatorPayload(as_of_date, f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
 
 
 class EstimatorService:
@@ -26,8 +82,10 @@ class EstimatorService:
     def __init__(self):
         if not EstimatorService._initialized:
             self.db_service = DBService()
-            self._cache: dict | None = None
+            self._payload: EstimatorPayload | None = None
             self._cache_date: date | None = None
+            self._fits: list[TeamFit] | None = None
+            self._fits_date: date | None = None
             EstimatorService._initialized = True
 
     async def _get_snapshot_df(self) -> pd.DataFrame:
@@ -51,17 +109,6 @@ class EstimatorService:
         df['created_at'] = datetime.now()
         return df
 
-    async def _get_nba_avg_pace(self) -> float:
-        try:
-            nba_service = NBAStatsService()
-            pace = await nba_service.get_nba_average_pace(settings.season_id)
-            await nba_service.close()
-            if pace is not None:
-                return pace
-        except Exception as e:
-            logger.warning(f"Failed to fetch NBA avg pace, using fallback: {e}")
-        return _NBA_AVG_PACE_FALLBACK
-
     async def run_and_store(self) -> bool:
         today = date.today()
 
@@ -81,31 +128,34 @@ class EstimatorService:
                     return False
 
         try:
-            df, nba_avg_pace, slot_pace_df = await asyncio.gather(
-                self._get_snapshot_df(),
-                self._get_nba_avg_pace(),
-                get_team_slot_pace_df(),
-            )
-            slot_proj_df = SlotGamesEstimator().estimate(slot_pace_df)
-
-            from app.fantsy_estimator import FantasyEstimator
-            loop = asyncio.get_event_loop()
-            prediction_df, ranking_df, rank_prob_df = await loop.run_in_executor(
-                None, lambda: FantasyEstimator().estimate(df, nba_avg_pace, slot_proj_df)
-            )
+            df, nba_avg_pace, slot_proj_df = await self._load_inputs()
+
+            start = time.perf_counter()
+            with ESTIMATOR_SECONDS.time():
+                prediction_df, ranking_df, rank_prob_df, fits = await get_batch_pool().run(
+                    "estimator", _estimate, df, nba_avg_pace, slot_proj_df,
+                    timeout=settings.estimator_job_timeout_s,
+                )
+            payload = build_payload({
+                "predictions": prediction_df.to_dict(orient='records'),
+                "rankings": ranking_df.to_dict(orient='records'),
+                "rank_probabilities": rank_prob_df.to_dict(orient='records'),
+            }, elapsed_ms=(time.perf_counter() - start) * 1000)
 
-            await asyncio.gather(
+            writes = [
                 self.db_service.upsert_estimator_prediction(prediction_df),
                 self.db_service.upsert_estimator_ranking(ranking_df),
                 self.db_service.upsert_estimator_rank_probability(rank_prob_df),
-            )
-
-            self._cache = {
-                "predictions": prediction_df.to_dict(orient='records'),
-                "rankings": ranking_df.to_dict(orient='records'),
-                "rank_probabilities": rank_prob_df.to_dict(orient='records'),
-            }
+            ]
+            if payload is not None:
+                writes.append(
+                    self.db_service.upsert_estimator_payload(payload.as_of_date, payload.etag, payload.body)
+                )
+            await asyncio.gather(*writes)
+
+            self._payload = payload
             self._cache_date = today
+            self._fits, self._fits_date = fits, today
             logger.info("Estimator run complete")
             return True
 
@@ -113,21 +163,70 @@ class EstimatorService:
             logger.error(f"Estimator run failed: {e}")
             return False
 
-    async def get_latest(self) -> dict | None:
-        today = date.today()
-        if self._cache and self._cache_date == today:
-            return self._cache
-
-        result = await self.db_service.get_estimator_latest()
-        if result.get("rankings"):
-            self._cache = result
-            predictions = result.get("predictions", [])
-            as_of = predictions[0].get("as_of_date") if predictions else None
-            if isinstance(as_of, date) and as_of == today:
-                self._cache_date = today
-            return result
+    async def _load_inputs(self) -> tuple[pd.DataFrame, float, pd.DataFrame]:
+        df, context = await asyncio.gather(
+            self._get_snapshot_df(),
+            ScheduleContextProvider().get(),
+        )
+        return df, context.resolved_pace, SlotGamesEstimator().estimate(context.slot_pace_df())
 
-        return None
+    async def get_fits(self) -> list[TeamFit]:
+        """Per-team fits of today's run; refitted from the snapshot tables (no
+        Monte Carlo) when this process hasn't run the estimator today."""
+        today = date.today()
+        if self._fits is not None and self._fits_date == today:
+            return self._fits
+        df, nba_avg_pace, slot_proj_df = await self._load_inputs()
+        self._fits = await asyncio.to_thread(_fit, df, nba_avg_pace, slot_proj_df)
+        self._fits_date = today
+        return self._fits
+
+    async def run_scenarios(
+        self, scenarios: list[Scenario], num_runs: int, seed: int | None = None
+    ) -> tuple[list[ScenarioOutcome], int]:
+        """Baseline plus every scenario in one common-random-numbers simulation.
+        Returns (outcomes, seed); pass the seed back to reproduce a run.
+
+        Request-path work, so it runs in a thread rather than on the batch pool,
+        where it would queue behind the nightly jobs; the fit is a few closed-form
+        per-team estimates and the simulation is vectorized numpy."""
+        fits = await self.get_fits()
+        if not fits:
+            return [], 0
+        seed = random.randrange(2**32) if seed is None else seed
+        outcomes = await asyncio.to_thread(_run_scenarios, fits, scenarios, num_runs, seed)
+        return outcomes, seed
+
+    async def get_payload(self) -> EstimatorPayload | None:
+        """Latest encoded results. Today's payload is served from memory;
+        otherwise one etag probe decides whether the stored blob moved (another
+        process ran the estimator) before the body is re-read."""
+        today = date.today()
+        payload = self._payload
+        if payload is not None and payload.as_of_date == today:
+            return payload
+
+        stored_etag = await self.db_service.get_estimator_payload_etag()
+        if payload is not None and stored_etag in (None, payload.etag):
+            return payload
+        if stored_etag is not None:
+            row = await self.db_service.get_estimator_payload()
+            if row:
+                self._set_payload(EstimatorPayload(row["as_of_date"], row["etag"], bytes(row["body"])))
+                return self._payload
+
+        # Results stored before the payload blob existed: encode them once.
+        payload = build_payload(await self.db_service.get_estimator_latest())
+        if payload is None:
+            return None
+        await self.db_service.upsert_estimator_payload(payload.as_of_date, payload.etag, payload.body)
+        self._set_payload(payload)
+        return payload
+
+    def _set_payload(self, payload: EstimatorPayload) -> None:
+        self._payload = payload
+        if payload.as_of_date == date.today():
+            self._cache_date = payload.as_of_date
 
 
 def get_estimator_service() -> EstimatorService:
@@ -0,0 +1,259 @@
+"""In-process columnar mirror of fs_player_games / fs_team_games.
+
+The player-window, shooting, usage and game-log reads are analytical scans
+(filter a season window, group by player, join team totals) that Postgres runs
+row by row on every cache miss. With FS_MIRROR_ENABLED the API process keeps
+the columns those reads need as Arrow tables (~100k rows, a few MB) and
+answers them with Arrow's vectorized filter / group_by / join instead. The
+primary DB only sees the refresh queries.
+
+DBService owns the refresh: a full load on startup, then every
+FS_MIRROR_REFRESH_INTERVAL_S (and after each nightly ingest) only rows on/after
+the latest game_date already mirrored (that date is replaced, so a partially
+ingested night is picked up in full). If the merged row counts then disagree
+with the tables' -- rows deleted or re-ingested further back -- it reloads in
+full. Until the first load lands -- or if a mirror query raises -- DBService
+answers from Postgres, and each method here returns exactly what its DBService
+counterpart's SQL does (tests/services/test_fs_mirror_parity.py checks that
+against Postgres).
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+_STATS = ('min', 'pts', 'reb', 'ast', 'stl', 'blk', 'fgm', 'fga', 'ftm', 'fta', 'fg3m', 'fg3a', 'tov')
+
+PLAYER_SCHEMA = pa.schema([
+    ('player_id', pa.int64()),
+    ('game_id', pa.string()),
+    ('season', pa.string()),
+    ('game_date', pa.date32()),
+    ('player_name', pa.string()),
+    ('team_id', pa.int64()),
+    ('matchup', pa.string()),
+    *[(c, pa.float64()) for c in _STATS],
+])
+TEAM_SCHEMA = pa.schema([
+    ('team_id', pa.int64()),
+    ('game_id', pa.string()),
+    ('season', pa.string()),
+    ('game_date', pa.date32()),
+    ('fga', pa.float64()),
+    ('fta', pa.float64()),
+    ('tov', pa.float64()),
+])
+
+# Column lists for the refresh SELECTs, in schema order.
+PLAYER_COLUMNS = PLAYER_SCHEMA.names
+TEAM_COLUMNS = TEAM_SCHEMA.names
+
+
+def records_to_table(records: Sequence, schema: pa.Schema) -> pa.Table:
+    """asyncpg rows selected in ``schema`` column order -> Arrow table, built
+    column by column (no per-row dicts)."""
+    return pa.table(
+        [pa.array([r[i] for r in records], type=field.type) for i, field in enumerate(schema)],
+        schema=schema,
+    )
+
+
+def _pct(makes: pd.Series, attempts: pd.Series) -> pd.Series:
+    """SUM(makes) / NULLIF(SUM(attempts), 0), COALESCEd to 0.0."""
+    return (makes / attempts.where(attempts != 0)).fillna(0.0)
+
+
+def _date_mask(start: Optional[date], end: Optional[date]) -> Optional[pc.Expression]:
+    mask = None
+    if start is not None:
+        mask = pc.field('game_date') >= pa.scalar(start, pa.date32())
+    if end is not None:
+        upper = pc.field('game_date') <= pa.scalar(end, pa.date32())
+        mask = upper if mask is None else mask & upper
+    return mask
+
+
+def _window(table: pa.Table, season, start: Optional[date], end: Optional[date], played: bool) -> pa.Table:
+    """Rows of ``season`` (a name or a list of names) in [start, end]; with
+    ``played`` only rows with minutes (``min > 0``)."""
+    if isinstance(season, str):
+        mask = pc.field('season') == season
+    else:
+        mask = pc.field('season').isin(pa.array(list(season), pa.string()))
+    dates = _date_mask(start, end)
+    if dates is not None:
+        mask = mask & dates
+    if played:
+        mask = mask & (pc.field('min') > 0)
+    return table.filter(mask)
+
+
+def _latest_name_totals(played: pa.Table, sums: Sequence[str]) -> pd.DataFrame:
+    """Per player: name as of their latest game, game count and column sums."""
+    grouped = (
+        played.sort_by([('game_date', 'descending')])
+        .group_by('player_id', use_threads=False)  # ordered, so 'first' = latest game
+        .aggregate([('player_name', 'first'), ('player_id', 'count'), *[(c, 'sum') for c in sums]])
+        .to_pandas()
+    )
+    return grouped.rename(columns={
+        'player_name_first': 'player_name',
+        'player_id_count': 'gp',
+        **{f'{c}_sum': c for c in sums},
+    })
+
+
+def _with_team_components(played: pa.Table, window: pa.Table, teams: pa.Table) -> pa.Table:
+    """Join each played row to its team's FGA/FTA/TOV and the team's total
+    minutes that game (summed over ``window``, which includes DNPs)."""
+    team_min = (
+        window.filter(pc.field('game_id').isin(pc.unique(played['game_id'])))
+        .group_by(['team_id', 'game_id'])
+        .aggregate([('min', 'sum')])
+        .rename_columns(['team_id', 'game_id', 't_min'])
+    )
+    team_stats = teams.select(['team_id', 'game_id', 'fga', 'fta', 'tov']).rename_columns(
+        ['team_id', 'game_id', 't_fga', 't_fta', 't_tov']
+    )
+    return (
+        played.join(team_stats, ['team_id', 'game_id'], join_type='inner')
+        .join(team_min, ['team_id', 'game_id'], join_type='inner')
+    )
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    players: pa.Table
+    teams: pa.Table
+
+
+class FSMirror:
+    """Arrow copy of the fs game tables. Readers take one snapshot reference per
+    query, so a refresh swapping it in never shows them half-merged tables."""
+
+    def __init__(self):
+        self._snapshot: Optional[_Snapshot] = None
+        # Held by DBService.refresh_fs_mirror across read + merge, so two
+        # refreshes can't merge from the same high-water mark twice.
+        self.refresh_lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def num_rows(self) -> tuple[int, int]:
+        snapshot = self._snapshot
+        return (snapshot.players.num_rows, snapshot.teams.num_rows) if snapshot else (0, 0)
+
+    def high_water(self) -> tuple[Optional[date], Optional[date]]:
+        """Latest mirrored game_date per table (None before the first load);
+        the next refresh re-reads from these dates on."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None, None
+        return (
+            pc.max(snapshot.players['game_date']).as_py(),
+            pc.max(snapshot.teams['game_date']).as_py(),
+        )
+
+    def merge(
+        self,
+        player_records: Sequence,
+        team_records: Sequence,
+        player_since: Optional[date] = None,
+        team_since: Optional[date] = None,
+    ) -> None:
+        """Replace mirrored rows dated on/after ``*_since`` (everything when
+        None) with the given records."""
+        players = records_to_table(player_records, PLAYER_SCHEMA)
+        teams = records_to_table(team_records, TEAM_SCHEMA)
+        snapshot = self._snapshot
+        if snapshot is not None:
+            players = self._replace_since(snapshot.players, players, player_since)
+            teams = self._replace_since(snapshot.teams, teams, team_since)
+        self._snapshot = _Snapshot(players.combine_chunks(), teams.combine_chunks())
+
+    @staticmethod
+    def _replace_since(current: pa.Table, new: pa.Table, since: Optional[date]) -> pa.Table:
+        if since is None:
+            return new
+        return pa.concat_tables([current.filter(pc.field('game_date') < pa.scalar(since, pa.date32())), new])
+
+    def reset(self) -> None:
+        self._snapshot = None
+
+    # --- reads (same results as the DBService methods of the same name) -----
+
+    def aggregate_player_games(
+        self, start: date, end: date, season: str, player_ids: Optional[list[int]] = None
+    ) -> tuple[pd.DataFrame, Optional[date], Optional[date]]:
+        played = _window(self._snapshot.players, season, start, end, played=True)
+        if played.num_rows == 0:
+            return pd.DataFrame(), None, None
+        coverage = pc.min_max(played['game_date']).as_py()
+        if player_ids is not None:
+            played = played.filter(pc.field('player_id').isin(pa.array(list(player_ids), pa.int64())))
+            if played.num_rows == 0:
+                return pd.DataFrame(), coverage['min'], coverage['max']
+
+        sums = ('pts', 'reb', 'ast', 'stl', 'blk', 'fgm', 'fga', 'ftm', 'fta', 'fg3m', 'min')
+        df = _latest_name_totals(played, sums).rename(columns={'fg3m': 'three_pm'})
+        df['fg_pct'] = _pct(df['fgm'], df['fga'])
+        df['ft_pct'] = _pct(df['ftm'], df['fta'])
+        df = df[[
+            'player_id', 'player_name', 'gp', 'pts', 'reb', 'ast', 'stl', 'blk',
+            'fgm', 'fga', 'ftm', 'fta', 'three_pm', 'min', 'fg_pct', 'ft_pct',
+        ]]
+        return df, coverage['min'], coverage['max']
+
+    def aggregate_shooting_by_player(
+        self, seasons: list[str], start: Optional[date] = None, end: Optional[date] = None
+    ) -> pd.DataFrame:
+        played = _window(self._snapshot.players, seasons, start, end, played=True)
+        if played.num_rows == 0:
+            return pd.DataFrame()
+        df = _latest_name_totals(played, ('fgm', 'fga', 'ftm', 'fta', 'fg3m', 'fg3a', 'min'))
+        df['fg_pct'] = _pct(df['fgm'], df['fga'])
+        df['ft_pct'] = _pct(df['ftm'], df['fta'])
+        df['fg3_pct'] = _pct(df['fg3m'], df['fg3a'])
+        return df[[
+            'player_id', 'player_name', 'gp', 'fgm', 'fga', 'fg_pct', 'ftm', 'fta', 'ft_pct',
+            'fg3m', 'fg3a', 'fg3_pct', 'min',
+        ]]
+
+    def get_usage_components(self, season: str, start: date, end: date) -> pd.DataFrame:
+        snapshot = self._snapshot
+        window = _window(snapshot.players, season, start, end, played=False)
+        played = window.filter(pc.field('min') > 0)
+        if played.num_rows == 0:
+            return pd.DataFrame()
+        joined = _with_team_components(played, window, snapshot.teams)
+        if joined.num_rows == 0:
+            return pd.DataFrame()
+        df = joined.to_pandas().rename(columns={'min': 'p_min', 'fga': 'p_fga', 'fta': 'p_fta', 'tov': 'p_tov'})
+        return df[[
+            'player_id', 'player_name', 'game_id', 'game_date', 'p_min', 'p_fga', 'p_fta', 'p_tov',
+            't_fga', 't_fta', 't_tov', 't_min',
+        ]]
+
+    def get_player_game_log(self, player_id: int, season: str, start: date, end: date) -> pd.DataFrame:
+        snapshot = self._snapshot
+        window = _window(snapshot.players, season, start, end, played=False)
+        played = window.filter((pc.field('player_id') == player_id) & (pc.field('min') > 0))
+        if played.num_rows == 0:
+            return pd.DataFrame()
+        joined = _with_team_components(played, window, snapshot.teams)
+        if joined.num_rows == 0:
+            return pd.DataFrame()
+        df = joined.sort_by('game_date').to_pandas()
+        df = df.assign(p_min=df['min'], p_fga=df['fga'], p_fta=df['fta'], p_tov=df['tov'])
+        return df[[
+            'player_name', 'game_date', 'matchup', 'p_min', 'fgm', 'fga', 'ftm', 'fta', 'fg3m', 'fg3a',
+            'p_fga', 'p_fta', 'p_tov', 't_fga', 't_fta', 't_tov', 't_min',
+        ]].reset_index(drop=True)
@@ -1,16 +1,20 @@
 import asyncio
+import hashlib
 import io
 import json
 import logging
 import re
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 import httpx
 import pdfplumber
+from pdfminer.pdftypes import PDFObjRef, PDFStream, resolve1
 
 from app.models.injury_models import InjuryRecord, InjuryNotification
 from app.services.db_service import get_db_service
+from app.services.sse_broadcaster import SSEBroadcaster
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +22,11 @@ NY_TZ = ZoneInfo("America/New_York")
 
 # In-memory state
 injury_store: dict[str, InjuryRecord] = {}
-sse_subscribers: list[asyncio.Queue] = []
 notification_history: list[InjuryNotification] = []
 MAX_NOTIFICATION_HISTORY = 150
 last_report_time: str | None = None
+# Live /api/injuries/stream events, encoded once and shared by every client
+injury_events = SSEBroadcaster(capacity=512, max_lag=256)
 
 
 def get_utc_now_str() -> str:
@@ -86,6 +91,18 @@ def parse_game_time_utc(game: str, game_date: date) -> str | None:
 
 def parse_injury_pdf(pdf_bytes: bytes) -> list[InjuryRecord]:
     """Extract injury records from NBA injury report PDF using word positions."""
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        pages = [page.extract_words() for page in pdf.pages]
+    return _records_from_page_words(pages)
+
+
+def _records_from_page_words(pages: list[list[dict]]) -> list[InjuryRecord]:
+    """Assemble records from each page's extracted words (pdfplumber word dicts).
+
+    Rows are stitched across pages — game/team context and wrapped reasons carry
+    over page breaks — so this always runs over the whole report; only the word
+    extraction feeding it is per page.
+    """
     COL_GAME_DATE = (10, 110)
     COL_GAME_TIME = (110, 190)
     COL_MATCHUP   = (190, 255)
@@ -159,13 +176,12 @@ def parse_injury_pdf(pdf_bytes: bytes) -> list[InjuryRecord]:
         return None
 
     all_words: list[dict] = []
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        for page_idx, page in enumerate(pdf.pages):
-            page_offset = page_idx * 10000
-            for word in page.extract_words():
-                word = dict(word)
-                word["top"] = word["top"] + page_offset
-                all_words.append(word)
+    for page_idx, words in enumerate(pages):
+        page_offset = page_idx * 10000
+        for word in words:
+            word = dict(word)
+            word["top"] = word["top"] + page_offset
+            all_words.append(word)
 
     rows: dict[float, dict[str, list[str]]] = {}
     for word in all_words:
@@ -295,12 +311,127 @@ def parse_injury_pdf(pdf_bytes: bytes) -> list[InjuryRecord]:
     return records
 
 
+def _record_key(record: InjuryRecord) -> str:
+    return f"{record.team}|{record.player}"
+
+
+def _object_digest(obj, memo: dict[int, bytes]) -> bytes:
+    """Hash of a PDF object with every indirect reference resolved: dictionaries,
+    arrays and (decoded) streams all the way down. ``memo`` maps object ids to
+    digests, so a font or XObject shared by many pages is hashed once per document
+    (and a reference cycle terminates)."""
+    if isinstance(obj, PDFObjRef):
+        if obj.objid not in memo:
+            memo[obj.objid] = b"cycle"
+            memo[obj.objid] = _object_digest(obj.resolve(), memo)
+        return memo[obj.objid]
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(obj, PDFStream):
+        h.update(b"stream")
+        h.update(_object_digest(obj.attrs, memo))
+        h.update(obj.get_data())
+    elif isinstance(obj, dict):
+        h.update(b"dict")
+        for key in sorted(obj, key=str):
+            h.update(repr(key).encode())
+            h.update(_object_digest(obj[key], memo))
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"list")
+        for item in obj:
+            h.update(_object_digest(item, memo))
+    else:
+        h.update(repr(obj).encode())
+    return h.digest()
+
+
+def _page_fingerprint(page, memo: dict[int, bytes]) -> bytes:
+    """Hash of everything a page's word layout is computed from — geometry, decoded
+    content stream(s), and the resources they draw with (fonts with their
+    /ToUnicode and /Encoding, Form XObjects and their own resources) — without
+    running the layout pass itself."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((page.page_obj.mediabox, page.page_obj.rotate)).encode())
+    for stream in page.page_obj.contents:
+        h.update(resolve1(stream).get_data())
+    h.update(_object_digest(page.page_obj.resources, memo))
+    return h.digest()
+
+
+@dataclass
+class ParsedReport:
+    records: list[InjuryRecord]
+    digest: bytes
+    unchanged: bool = False             # byte-identical to the committed report
+    changed_keys: set[str] | None = None  # keys that differ from the committed records
+    pages: int = 0
+    pages_extracted: int = 0            # pages that needed a word-extraction pass
+    page_words: dict[bytes, list[dict]] = field(default_factory=dict, repr=False)
+
+
+class InjuryReportParser:
+    """Incremental ``parse_injury_pdf``.
+
+    Keeps the committed report's byte hash, its records, and each page's extracted
+    words keyed by the page fingerprint. A byte-identical report costs one hash; a
+    changed one re-extracts words only for pages whose content stream changed and
+    re-stitches rows from cached + fresh words (cheap, pure Python). ``changed_keys``
+    lets ``compute_diff`` look only at the records that actually moved.
+
+    ``parse`` never mutates state; ``commit`` does, once the caller has applied the
+    report, so a poll that fails half-way diffs against what the store really holds.
+    """
+
+    def __init__(self) -> None:
+        self._digest: bytes | None = None
+        self._records: dict[str, InjuryRecord] = {}
+        self._page_words: dict[bytes, list[dict]] = {}
+
+    def parse(self, pdf_bytes: bytes) -> ParsedReport:
+        digest = hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+        if digest == self._digest:
+            return ParsedReport(list(self._records.values()), digest, unchanged=True, changed_keys=set())
+
+        pages: list[list[dict]] = []
+        page_words: dict[bytes, list[dict]] = {}
+        extracted = 0
+        memo: dict[int, bytes] = {}
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            for page in pdf.pages:
+                fp = _page_fingerprint(page, memo)
+                words = page_words.get(fp, self._page_words.get(fp))
+                if words is None:
+                    words = page.extract_words()
+                    extracted += 1
+                page_words[fp] = words
+                pages.append(words)
+        records = _records_from_page_words(pages)
+
+        new_by_key = {_record_key(r): r for r in records}
+        changed = {k for k, r in new_by_key.items() if self._records.get(k) != r}
+        changed |= self._records.keys() - new_by_key.keys()
+        return ParsedReport(records, digest, changed_keys=changed, pages=len(pages),
+                            pages_extracted=extracted, page_words=page_words)
+
+    def commit(self, report: ParsedReport) -> None:
+        self._digest = report.digest
+        self._records = {_record_key(r): r for r in report.records}
+        # Only the committed report's pages are kept, so the cache stays one report big.
+        if not report.unchanged:
+            self._page_words = report.page_words
+
+
 def compute_diff(
     old_store: dict[str, InjuryRecord],
     new_records: list[InjuryRecord],
     now_il: str,
+    keys: set[str] | None = None,
 ) -> list[InjuryNotification]:
-    """Detect status changes, additions, and removals between old store and new records."""
+    """Detect status changes, additions, and removals between old store and new records.
+
+    ``keys`` (from ``InjuryReportParser``) limits the comparison to records that
+    changed since the report ``old_store`` was built from; every other key is
+    known to be identical on both sides and cannot produce a notification.
+    """
     notifications: list[InjuryNotification] = []
 
     new_by_key: dict[str, InjuryRecord] = {}
@@ -312,6 +443,8 @@ def compute_diff(
 
     # Added or status-changed players
     for key, new_rec in new_by_key.items():
+        if keys is not None and key not in keys:
+            continue
         if key not in old_store:
             notifications.append(InjuryNotification(
                 type="added",
@@ -332,6 +465,8 @@ def compute_diff(
 
     # Removed players — only if their team is still represented in the new report
     for key, old_rec in old_store.items():
+        if keys is not None and key not in keys:
+            continue
         if key not in new_by_key and old_rec.team in teams_in_new:
             notifications.append(InjuryNotification(
                 type="removed",
@@ -364,6 +499,9 @@ def build_updated_store(
 
 TTL_HOURS = 48
 
+# Parser state for the 15-minute poll (last committed report + per-page words).
+_report_parser = InjuryReportParser()
+
 
 def _parse_timestamp(ts: str) -> datetime | None:
     try:
@@ -384,17 +522,21 @@ async def broadcast_notifications(notifications: list[InjuryNotification]) -> No
         notification_history.insert(0, notif)
     del notification_history[MAX_NOTIFICATION_HISTORY:]
     _prune_notification_history()
-    for queue in list(sse_subscribers):
-        for notif in notifications:
-            await queue.put(notif)
+    for notif in notifications:
+        injury_events.publish(notif.model_dump_json())
 
 
 async def broadcast_fetch_update(report_time: str) -> None:
     global last_report_time
     last_report_time = report_time
-    payload = json.dumps({"report_time": report_time})
-    for queue in list(sse_subscribers):
-        await queue.put({"_event": "fetch_update", "data": payload})
+    injury_events.publish(json.dumps({"report_time": report_time}), event="fetch_update")
+
+
+def _current_report_time_utc() -> str:
+    now_ny = datetime.now(NY_TZ)
+    floored_minute = (now_ny.minute // 15) * 15
+    report_dt = now_ny.replace(minute=floored_minute, second=0, microsecond=0)
+    return report_dt.astimezone(timezone.utc).isoformat(timespec="minutes")
 
 
 async def _try_update_injury_data() -> bool:
@@ -408,27 +550,36 @@ async def _try_update_injury_data() -> bool:
         return False
 
     now_il = get_utc_now_str()
-    new_records = parse_injury_pdf(pdf_bytes)
-    notifications = compute_diff(injury_store, new_records, now_il)
+    report = await asyncio.to_thread(_report_parser.parse, pdf_bytes)
+    if report.unchanged:
+        logger.info("Injury report unchanged since last fetch — skipping diff")
+        await broadcast_fetch_update(_current_report_time_utc())
+        return True
+    logger.info(
+        f"Injury report parsed: {report.pages_extracted}/{report.pages} page(s) re-extracted, "
+        f"{len(report.changed_keys or ())} record(s) changed"
+    )
+    new_records = report.records
+    notifications = compute_diff(injury_store, new_records, now_il, keys=report.changed_keys)
     new_store = build_updated_store(injury_store, new_records, notifications, now_il)
 
     old_store = dict(injury_store)
     injury_store.clear()
     injury_store.update(new_store)
+    _report_parser.commit(report)
 
-    db_service = get_db_service()
+    # Final DB state per key (record to upsert, or None to delete), written in
+    # one transaction below instead of one round-trip per changed player.
+    changes: dict[tuple[str, str], InjuryRecord | None] = {}
     for notif in notifications:
-        key = f"{notif.team}|{notif.player}"
         if notif.type in ("added", "status_change"):
-            record = new_store.get(key)
+            record = new_store.get(f"{notif.team}|{notif.player}")
             if record:
-                if record.status == "Available":
-                    await db_service.delete_injury_status(record.team, record.player)
-                else:
-                    await db_service.upsert_injury_status(record)
+                changes[(record.team, record.player)] = None if record.status == "Available" else record
         elif notif.type == "removed":
-            await db_service.delete_injury_status(notif.team, notif.player)
+            changes[(notif.team, notif.player)] = None
 
+    db_service = get_db_service()
     teams_in_new = {r.team for r in new_records}
     teams_in_memory = {rec.team for rec in old_store.values()}
     teams_only_in_pdf = teams_in_new - teams_in_memory
@@ -439,7 +590,7 @@ async def _try_update_injury_data() -> bool:
         for row in db_records:
             key = f"{row['team']}|{row['player']}"
             if key not in new_keys:
-                await db_service.delete_injury_status(row['team'], row['player'])
+                changes[(row['team'], row['player'])] = None
                 notifications.append(InjuryNotification(
                     type="removed",
                     player=row['player'],
@@ -448,15 +599,16 @@ async def _try_update_injury_data() -> bool:
                     timestamp=now_il,
                 ))
 
+    await db_service.apply_injury_changes(
+        upserts=[rec for rec in changes.values() if rec is not None],
+        deletes=[key for key, rec in changes.items() if rec is None],
+    )
+
     if notifications:
         logger.info(f"Broadcasting {len(notifications)} injury update(s)")
         await broadcast_notifications(notifications)
 
-    now_ny = datetime.now(NY_TZ)
-    floored_minute = (now_ny.minute // 15) * 15
-    report_dt = now_ny.replace(minute=floored_minute, second=0, microsecond=0)
-    report_time_utc = report_dt.astimezone(timezone.utc).isoformat(timespec="minutes")
-    await broadcast_fetch_update(report_time_utc)
+    await broadcast_fetch_update(_current_report_time_utc())
     return True
 
 
@@ -490,19 +642,17 @@ async def initialize() -> None:
             db_timestamps[key] = str(ts)
 
     now_il = get_utc_now_str()
-    records = parse_injury_pdf(pdf_bytes)
-    for record in records:
+    report = await asyncio.to_thread(_report_parser.parse, pdf_bytes)
+    for record in report.records:
         key = f"{record.team}|{record.player}"
         last_update = db_timestamps.get(key, now_il)
         injury_store[key] = record.model_copy(update={"last_update": last_update})
+    _report_parser.commit(report)
 
     logger.info(f"Injury store initialized with {len(injury_store)} player(s)")
 
     global last_report_time
-    now_ny = datetime.now(NY_TZ)
-    floored_minute = (now_ny.minute // 15) * 15
-    report_dt = now_ny.replace(minute=floored_minute, second=0, microsecond=0)
-    last_report_time = report_dt.astimezone(timezone.utc).isoformat(timespec="minutes")
+    last_report_time = _current_report_time_utc()
 
 
 _RETRY_OFFSETS = [0, 5, 10, 15, 15, 15]
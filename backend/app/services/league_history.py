@@ -0,0 +1,152 @@
+import asyncio
+import bisect
+import logging
+from datetime import date
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.db_service import DBService
+
+logger = logging.getLogger(__name__)
+
+COUNTING_COLS = ['gp', 'fgm', 'fga', 'ftm', 'fta', 'three_pm', 'reb', 'ast', 'stl', 'blk', 'pts']
+
+# totals_df (ESPN) column -> team_daily_snapshot column
+_TOTALS_TO_SNAPSHOT = {
+    'GP': 'gp', 'FGM': 'fgm', 'FGA': 'fga', 'FTM': 'ftm', 'FTA': 'fta', '3PM': 'three_pm',
+    'REB': 'reb', 'AST': 'ast', 'STL': 'stl', 'BLK': 'blk', 'PTS': 'pts',
+}
+
+
+class LeagueHistory:
+    """In-memory copy of team_daily_snapshot as a (date x team x stat) cube.
+
+    The snapshot table holds cumulative season totals, so the stats for any date
+    range are one subtraction of two date slices. The cube is loaded once at
+    startup and extended by DataProvider after each snapshot it writes (or
+    reloaded when it finds the DB already ahead, e.g. written by another process),
+    which keeps date-range rankings and heatmaps off Postgres in steady state.
+    Callers fall back to DBService.get_snapshots_for_date_range until it is loaded.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = asyncio.Lock()
+            cls._instance.clear()
+        return cls._instance
+
+    def clear(self):
+        """Drop the cube; range queries go back to the database"""
+        self.loaded = False
+        self.dates: List[date] = []
+        self.team_ids = np.empty(0, dtype=np.int64)
+        self.counts = np.zeros((0, 0, len(COUNTING_COLS)), dtype=np.int64)
+        self.present = np.zeros((0, 0), dtype=bool)
+        self.names = np.empty((0, 0), dtype=object)
+
+    async def load(self, db_service: Optional[DBService] = None) -> bool:
+        """Build the cube from every stored snapshot. Returns False if none are available."""
+        async with self._lock:
+            return await self._load(db_service or DBService())
+
+    async def _load(self, db_service: DBService) -> bool:
+        rows = await db_service.get_snapshot_history()
+        if not rows:
+            logger.info("No snapshot history loaded; date ranges use the DB")
+            return False
+        self.clear()
+        self._build(rows)
+        self.loaded = True
+        logger.info(
+            f"Loaded league history: {len(self.dates)} dates x {len(self.team_ids)} teams"
+        )
+        return True
+
+    async def catch_up(self, snap_date: date, db_service: Optional[DBService] = None) -> None:
+        """Reload from the DB if the cube ends before ``snap_date``, a snapshot
+        this process didn't write (or whose extend it missed)."""
+        async with self._lock:
+            if self.loaded and self.dates[-1] < snap_date:
+                logger.info(f"League history ends {self.dates[-1]}, DB has {snap_date}; reloading")
+                await self._load(db_service or DBService())
+
+    async def extend(self, snap_date: date, totals_df: pd.DataFrame) -> None:
+        """Add (or replace) one date from the ESPN totals DataFrame just upserted.
+
+        Call only after the upsert succeeded: a load() holding the lock then either
+        read the row already or finishes first and the date is added on top.
+        """
+        rows = [
+            {
+                'date': snap_date,
+                'team_id': int(row['team_id']),
+                'team_name': str(row['team_name']),
+                **{snap: int(row[col]) for col, snap in _TOTALS_TO_SNAPSHOT.items()},
+            }
+            for _, row in totals_df.iterrows()
+        ]
+        async with self._lock:
+            if self.loaded:
+                self._build(rows)
+
+    def _build(self, rows: List[dict]) -> None:
+        """Place snapshot rows into the cube, growing the date/team axes as needed."""
+        new_dates = sorted({r['date'] for r in rows} - set(self.dates))
+        new_teams = np.setdiff1d(np.array([r['team_id'] for r in rows], dtype=np.int64), self.team_ids)
+        if len(new_dates) or len(new_teams):
+            dates = sorted(self.dates + new_dates)
+            team_ids = np.union1d(self.team_ids, new_teams)
+            d_at = np.searchsorted([d.toordinal() for d in dates], [d.toordinal() for d in self.dates])
+            t_at = np.searchsorted(team_ids, self.team_ids)
+            counts = np.zeros((len(dates), len(team_ids), len(COUNTING_COLS)), dtype=np.int64)
+            present = np.zeros((len(dates), len(team_ids)), dtype=bool)
+            names = np.empty((len(dates), len(team_ids)), dtype=object)
+            counts[np.ix_(d_at, t_at)] = self.counts
+            present[np.ix_(d_at, t_at)] = self.present
+            names[np.ix_(d_at, t_at)] = self.names
+            self.dates, self.team_ids = dates, team_ids
+            self.counts, self.present, self.names = counts, present, names
+
+        date_idx = {d: i for i, d in enumerate(self.dates)}
+        for r in rows:
+            i = date_idx[r['date']]
+            j = int(np.searchsorted(self.team_ids, r['team_id']))
+            self.counts[i, j] = [r[c] for c in COUNTING_COLS]
+            self.present[i, j] = True
+            self.names[i, j] = r['team_name']
+
+    def range_delta(self, start_date: date, end_date: date) -> Tuple[Optional[date], Optional[date], Optional[pd.DataFrame]]:
+        """(actual_end_date, actual_start_date, delta_df) for a date range.
+
+        Same date resolution as DBService.get_snapshots_for_date_range: the end is
+        the last snapshot on or before end_date, the start the first one on or after
+        start_date (no start snapshot means the season-to-date totals). delta_df
+        matches RankingService._compute_delta. Returns (None, None, None) when no
+        end snapshot exists.
+        """
+        end_i = bisect.bisect_right(self.dates, end_date) - 1
+        if end_i < 0:
+            return None, None, None
+        start_i = bisect.bisect_left(self.dates, start_date)
+        actual_start_date = self.dates[start_i] if start_i < len(self.dates) else None
+
+        end_mask = self.present[end_i]
+        if actual_start_date is None:
+            teams = end_mask
+            values = self.counts[end_i, teams]
+        else:
+            # Teams missing from the start snapshot are dropped, like the DB path's merge.
+            teams = end_mask & self.present[start_i]
+            values = self.counts[end_i, teams] - self.counts[start_i, teams]
+
+        delta = pd.DataFrame(values, columns=COUNTING_COLS)
+        delta.insert(0, 'team_name', self.names[end_i, teams])
+        delta.insert(0, 'team_id', self.team_ids[teams])
+        delta['fg_pct'] = (delta['fgm'] / delta['fga'].replace(0, float('nan'))).fillna(0)
+        delta['ft_pct'] = (delta['ftm'] / delta['fta'].replace(0, float('nan'))).fillna(0)
+        return self.dates[end_i], actual_start_date, delta
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import pandas as pd
 from datetime import date
@@ -6,10 +5,9 @@ from typing import Dict, List, Optional
 from app.models import LeagueSummary, HeatmapData, LeagueShotsData, AverageStats, RankingStats
 from app.services.data_provider import DataProvider
 from app.services.stats_calculator import StatsCalculator
-from app.services.nba_stats_service import NBAStatsService
+from app.services.schedule_context import ScheduleContextProvider
 from app.builders.response_builder import ResponseBuilder
 from app.exceptions import ResourceNotFoundError
-from app.config import settings
 
 class LeagueService:
     """Service for league-wide statistics and analytics operations"""
@@ -18,6 +16,7 @@ class LeagueService:
         self.data_provider = DataProvider()
         self.stats_calculator = StatsCalculator()
         self.response_builder = ResponseBuilder()
+        self.schedule_context = ScheduleContextProvider()
         self.logger = logging.getLogger(__name__)
     
     async def get_league_summary(self) -> LeagueSummary:
@@ -33,11 +32,8 @@ class LeagueService:
         nba_game_days_left = None
 
         try:
-            nba_service = NBAStatsService()
-            nba_avg_pace, nba_game_days_left = await asyncio.gather(
-                nba_service.get_nba_average_pace(settings.season_id),
-                nba_service.get_nba_game_days_remaining(),
-            )
+            context = await self.schedule_context.get()
+            nba_avg_pace, nba_game_days_left = context.nba_avg_pace, context.nba_game_days_left
         except Exception as e:
             self.logger.warning(f"Failed to fetch NBA stats: {e}")
 
@@ -85,16 +81,9 @@ class LeagueService:
         from app.services.ranking_service import RankingService
         from app.services.data_transformer import DataTransformer
 
-        actual_end_date, actual_start_date, rows_end, rows_start = \
-            await self.data_provider.db_service.get_snapshots_for_date_range(start_date, end_date)
-
-        if actual_end_date is None or not rows_end:
-            raise ResourceNotFoundError("No data available for the requested date range")
-
         ranking_service = RankingService()
-        end_df = pd.DataFrame(rows_end)
-        start_df = pd.DataFrame(rows_start) if rows_start else None
-        delta_df = ranking_service._compute_delta(end_df, start_df)
+        actual_end_date, actual_start_date, delta_df = \
+            await ranking_service._get_range_delta(start_date, end_date)
 
         averages_rankings_df = ranking_service._build_averages_rankings_df(delta_df)
         rankings_df = averages_rankings_df.sort_values(by='TOTAL_POINTS', ascending=False)
@@ -10,16 +10,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from datetime import date
 
 import numpy as np
 import pandas as pd
 
 from app.services.model_nightly_service import ModelNightlyService
 from app.services.nba_matchup_service import GameInfo
+from app.utils.metrics import INFERENCE_SECONDS
 from app.utils.name_matching import normalize_player_name
 from app.utils.team_abbr_map import team_id_for_abbr
 from model_stats_inference.serving.feature_store import FeatureStore
+from model_stats_inference.serving.config import MIN_INFERENCE_GAMES
+from model_stats_inference.serving.errors import ModelsNotTrainedError
 from model_stats_inference.serving.inference import LiveInference, PredictionRequest
+from model_stats_inference.serving.registry import ModelRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,7 @@ class LiveProjectionService:
     when the underlying store object changes (i.e. after a nightly refresh)."""
 
     _instance = None
+    _registry: ModelRegistry | None
     _inference: LiveInference | None
     _store_ref: FeatureStore | None
     _name_index: dict[str, int]
@@ -43,12 +49,53 @@ class LiveProjectionService:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._registry = None
             cls._instance._inference = None
             cls._instance._store_ref = None
             cls._instance._name_index = {}
             cls._instance._lock = asyncio.Lock()
         return cls._instance
 
+    async def warm_up(self) -> None:
+        """Startup (lifespan) task: load + warm the models, then build the
+        inference over the resident store and run one real prediction, so the
+        first /projections or /matchups request finds everything hot."""
+        try:
+            async with self._lock:
+                await self._ensure_registry()
+            inference = await self._ensure_inference()
+            if inference is None:
+                logger.info("Model warm-up: no feature vectors yet — models loaded, store skipped")
+                return
+            req = _warmup_request(inference.store)
+            if req is not None:
+                await _timed('predict_many', inference.predict_many, [req])
+            reg = self._registry
+            logger.info(
+                f"Model warm-up done: {len(reg.models)} models in {reg.load_seconds:.2f}s "
+                f"(+{reg.warmup_seconds or 0.0:.3f}s warm-up)"
+            )
+        except ModelsNotTrainedError as e:
+            logger.warning(f"Model warm-up skipped: {e}")
+        except Exception as e:
+            logger.error(f"Model warm-up failed: {e}", exc_info=True)
+
+    def load_status(self) -> ModelRegistry | None:
+        return self._registry
+
+    def inference_ready(self) -> bool:
+        return self._inference is not None
+
+    async def _ensure_registry(self) -> ModelRegistry:
+        """Caller holds self._lock."""
+        if self._registry is None:
+            def _load() -> ModelRegistry:
+                registry = ModelRegistry.load()
+                registry.warm_up()
+                return registry
+            self._registry = await asyncio.to_thread(_load)
+        return self._registry
+
     async def _ensure_inference(self) -> LiveInference | None:
         store = await ModelNightlyService().get_inference_store()
         if store is None:
@@ -58,7 +105,8 @@ class LiveProjectionService:
         async with self._lock:
             if self._inference is not None and self._store_ref is store:
                 return self._inference
-            self._inference = await asyncio.to_thread(LiveInference, store)
+            registry = await self._ensure_registry()
+            self._inference = await asyncio.to_thread(LiveInference, store, registry=registry)
             self._store_ref = store
             self._name_index = _build_name_index(store)
             return self._inference
@@ -97,12 +145,105 @@ class LiveProjectionService:
         if not reqs:
             return {}
 
-        results, errors = await asyncio.to_thread(inference.predict_many, reqs)
+        results, errors = await _timed('predict_many', inference.predict_many, reqs)
         out: dict[str, dict] = {}
         for (name, pid, default_min), res, err in zip(meta, results, errors):
             out[name] = _to_projection(inference.store, pid, default_min, today, res, err)
         return out
 
+    async def project_week(
+        self, players_df: pd.DataFrame, schedule: dict[date, dict[str, GameInfo]]
+    ) -> dict | None:
+        """Week-ahead projection for every player in ``players_df`` (a roster or the
+        whole pool) over ``schedule`` (date -> team -> game).
+
+        The schedule is expanded once into a (player, date, opponent, home,
+        rest-days) table and predicted in a single ``predict_frame`` call, then
+        summed to per-player and per-fantasy-team totals. Rest days after a
+        player's first game of the window come from the schedule itself; every
+        game is projected at the player's default minutes.
+        """
+        inference = await self._ensure_inference()
+        if inference is None:
+            return None
+        store = inference.store
+
+        players = pd.DataFrame({
+            'player_name': players_df['Name'].astype(str),
+            'pro_team': players_df['Pro Team'].astype(str),
+            'fantasy_team_id': players_df.get('team_id', pd.Series(0, index=players_df.index)).fillna(0).astype(int),
+            'fantasy_team_name': players_df.get('fantasy_team_name', pd.Series('', index=players_df.index)).fillna('').astype(str),
+        }).drop_duplicates('player_name')
+        players['player_id'] = players['player_name'].map(
+            lambda n: self._name_index.get(normalize_player_name(n)))
+        unmatched = int(players['player_id'].isna().sum())
+        if unmatched:
+            logger.info(f"Week projection: {unmatched} players have no feature-store match — skipped")
+        players = players.dropna(subset=['player_id']).astype({'player_id': int})
+
+        sched = pd.DataFrame(
+            [(pd.Timestamp(d), team, info.opponent, info.is_home)
+             for d, games in schedule.items() for team, info in games.items()],
+            columns=['game_date', 'pro_team', 'opponent', 'is_home'],
+        )
+        sched['opponent_team_id'] = sched['opponent'].map(_opponent_team_id)
+        sched = sched.dropna(subset=['opponent_team_id']).astype({'opponent_team_id': int})
+
+        games = players.merge(sched, on='pro_team').sort_values(['player_id', 'game_date'], ignore_index=True)
+        if games.empty:
+            return {'players': [], 'teams': []}
+        games['rest_days'] = games.groupby('player_id')['game_date'].diff().dt.days.astype(float)
+        default_min = {pid: _default_minutes(store, pid) for pid in games['player_id'].unique()}
+        games['minutes'] = games['player_id'].map(default_min)
+
+        preds, errors = await _timed('predict_frame', inference.predict_frame, games)
+        games['error'] = [None if e is None else str(e) for e in errors]
+        for target, key in _WEEK_TARGETS.items():
+            games[key] = preds[target] if target in preds.columns else 0.0
+
+        ok = games[games['error'].isna()]
+        sums = ok.groupby('player_id')[list(_WEEK_TARGETS.values())].sum()
+        n_games = games.groupby('player_id').size()
+        first = games.drop_duplicates('player_id').set_index('player_id')
+
+        out_players = []
+        for pid, row in first.iterrows():
+            if pid not in sums.index:
+                status, reason, totals = 'red', row['error'], None
+            else:
+                status, reason = _freshness(store, pid, row['game_date'])
+                totals = _week_stat_dict(sums.loc[pid])
+            out_players.append({
+                'player_name': row['player_name'],
+                'pro_team': row['pro_team'],
+                'fantasy_team_id': int(row['fantasy_team_id']),
+                'fantasy_team_name': row['fantasy_team_name'],
+                'games': int(n_games[pid]),
+                'default_minutes': default_min[pid],
+                'status': status,
+                'reason': reason,
+                'stats': totals,
+            })
+
+        rostered = ok[ok['fantasy_team_id'] != 0]
+        team_sums = rostered.groupby('fantasy_team_id')[list(_WEEK_TARGETS.values())].sum()
+        team_meta = rostered.groupby('fantasy_team_id').agg(
+            team_name=('fantasy_team_name', 'first'),
+            games=('player_id', 'size'),
+            players=('player_id', 'nunique'),
+        )
+        out_teams = [
+            {
+                'team_id': int(tid),
+                'team_name': meta['team_name'],
+                'games': int(meta['games']),
+                'players': int(meta['players']),
+                'stats': _week_stat_dict(team_sums.loc[tid]),
+            }
+            for tid, meta in team_meta.iterrows()
+        ]
+        return {'players': out_players, 'teams': out_teams}
+
     async def project_next_game(
         self, player_name: str, opponent: str, is_home: bool, minutes: float | None = None
     ) -> dict | None:
@@ -124,7 +265,7 @@ class LiveProjectionService:
             player_id=pid, opponent_team_id=opp_id, is_home=is_home,
             game_date=today, minutes=default_min if minutes is None else minutes,
         )
-        results, errors = await asyncio.to_thread(inference.predict_many, [req])
+        results, errors = await _timed('predict_many', inference.predict_many, [req])
         return _to_projection(inference.store, pid, default_min, today, results[0], errors[0])
 
     async def project_one(
@@ -145,12 +286,38 @@ class LiveProjectionService:
             player_id=pid, opponent_team_id=opp_id, is_home=is_home,
             game_date=pd.Timestamp.now().normalize(), minutes=minutes,
         )
-        results, errors = await asyncio.to_thread(inference.predict_many, [req])
+        results, errors = await _timed('predict_many', inference.predict_many, [req])
         if errors[0] is not None:
             return None
         return {'stats': _stat_dict(results[0])}
 
 
+async def _timed(method: str, fn, arg):
+    """Run a blocking inference call off the loop, timed for /metrics."""
+    with INFERENCE_SECONDS.time(method=method):
+        return await asyncio.to_thread(fn, arg)
+
+
+def _warmup_request(store: FeatureStore) -> PredictionRequest | None:
+    """The first predictable player against any other team — the prediction
+    only exercises the path (and the store's lazy caches); it is discarded."""
+    pv = store.player_vectors
+    if pv.empty or 'games_count' not in pv.columns:
+        return None
+    eligible = pv[pv['games_count'] >= MIN_INFERENCE_GAMES]
+    if eligible.empty:
+        return None
+    pid = eligible.index[0]
+    team = eligible.iloc[0].get('TEAM_ID')
+    opp = next((t for t in store.team_allowed_vectors.index if t != team), None)
+    if opp is None:
+        return None
+    return PredictionRequest(
+        player_id=int(pid), opponent_team_id=int(opp), is_home=True,
+        game_date=pd.Timestamp.now().normalize(), minutes=30.0,
+    )
+
+
 def _build_name_index(store: FeatureStore) -> dict[str, int]:
     pv = store.player_vectors
     if 'PLAYER_NAME' not in pv.columns:
@@ -176,6 +343,21 @@ def _default_minutes(store: FeatureStore, player_id: int) -> float:
     return 0.0
 
 
+# model target -> weekly total key (the counting stats; percentages are
+# re-derived from the summed makes / attempts)
+_WEEK_TARGETS = {
+    'PTS': 'pts', 'REB': 'reb', 'AST': 'ast', 'FG3M': 'three_pm', 'STL': 'stl',
+    'BLK': 'blk', 'FGM': 'fgm', 'FGA': 'fga', 'FTM': 'ftm', 'FTA': 'fta',
+}
+
+
+def _week_stat_dict(totals: pd.Series) -> dict[str, float]:
+    out = {key: round(float(totals[key]), 1) for key in _WEEK_TARGETS.values()}
+    out['fg_pct'] = round(float(totals['fgm'] / totals['fga']), 3) if totals['fga'] > 0 else 0.0
+    out['ft_pct'] = round(float(totals['ftm'] / totals['fta']), 3) if totals['fta'] > 0 else 0.0
+    return out
+
+
 def _stat_dict(result) -> dict[str, float]:
     preds = {k: v.value for k, v in result.stats.items()}
     return {
@@ -11,6 +11,8 @@ import logging
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
+from app.config import settings
+from app.services.db_service import DBService
 from app.services.model_nightly_service import ModelNightlyService
 
 logger = logging.getLogger(__name__)
@@ -49,3 +51,6 @@ async def start_scheduler():
             logger.info(f"Model nightly catch-up finished: {statuses}")
         except Exception:
             logger.exception("Model nightly pipeline failed; will retry at next slot")
+        if settings.fs_mirror_enabled:
+            # Pull the night's rows (if any landed) into the columnar mirror.
+            await DBService().refresh_fs_mirror()
@@ -31,6 +31,7 @@ from zoneinfo import ZoneInfo
 import pandas as pd
 
 from app.config import settings
+from app.services.batch_pool import get_batch_pool
 from app.services.db_service import DBService
 from model_stats_inference.research import config as rconfig
 from model_stats_inference.research import data as rdata
@@ -236,8 +237,9 @@ class ModelNightlyService:
             logger.error("Feature-store tables are empty — run --bootstrap first")
             return "store_not_bootstrapped"
 
-        evals, night_players, vectors = await asyncio.to_thread(
-            self._process_sync, players, team_games, night
+        evals, night_players, vectors = await get_batch_pool().run(
+            "model_nightly", ModelNightlyService._process_sync, players, team_games, night,
+            timeout=settings.model_nightly_job_timeout_s,
         )
 
         eval_rows = [_eval_to_tuple(ev, game_date) for ev in evals]
@@ -277,7 +279,10 @@ class ModelNightlyService:
         players, team_games = await self._db.get_fs_rows_before(game_date + timedelta(days=1))
         if players.empty or team_games.empty:
             return None
-        vectors = await asyncio.to_thread(self._vectors_from_frames, players, team_games)
+        vectors = await get_batch_pool().run(
+            "feature_vectors", ModelNightlyService._vectors_from_frames, players, team_games,
+            timeout=settings.model_nightly_job_timeout_s,
+        )
         return await self._db.upsert_feature_vectors(*vectors)
 
     # --- missing features (heal the store after a deploy) --------------------
@@ -371,7 +376,7 @@ class ModelNightlyService:
     def _process_sync(
         players: pd.DataFrame, team_games: pd.DataFrame, night: nightly.NightFetch
     ) -> tuple[list[EvalRow], pd.DataFrame, tuple[list, list, list]]:
-        """Heavy pandas/sklearn work in a thread: build the pre-night store, score
+        """Heavy pandas/sklearn work in a batch worker: build the pre-night store, score
         the night (leakage-safe), then fold the night in to materialize post-night
         vectors."""
         players = players.sort_values(["PLAYER_ID", "GAME_DATE"])
@@ -467,7 +472,10 @@ class ModelNightlyService:
             ):
                 return "db_write_failed"
 
-            vectors = await asyncio.to_thread(self._vectors_from_frames, players, team_games)
+            vectors = await get_batch_pool().run(
+                "feature_vectors", ModelNightlyService._vectors_from_frames, players, team_games,
+                timeout=settings.model_nightly_job_timeout_s,
+            )
             if not await self._db.upsert_feature_vectors(*vectors):
                 return "db_write_failed"
             self._invalidate_inference_store()
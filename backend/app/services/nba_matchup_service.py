@@ -190,6 +190,13 @@ class NbaMatchupService:
 
         return found
 
+    async def get_schedule(self, start: date, days: int = 7) -> dict[date, dict[str, GameInfo]]:
+        """Every countable game in [start, start + days), per US/Eastern date —
+        one whitelist lookup plus one concurrent fetch of the candidate days
+        (shared with the slate caches), instead of probing date by date."""
+        by_day = await self._countable_events_by_day(start, days - 1)
+        return {d: self._games_from(events) for d, events in by_day.items() if events}
+
     async def _ensure_whitelist(self) -> None:
         """Every game date of the season, from ESPN's whitelist calendar —
         static once published, so this is worth caching far longer than the
@@ -8,12 +8,15 @@ from pathlib import Path
 from typing import Optional
 
 from app.models.nba_player_models import NbaPlayerBio
+from app.utils.name_matching import resolve_join_key
 
 logger = logging.getLogger(__name__)
 
 _JSON_PATH = Path(__file__).resolve().parents[2] / "data" / "nba-players-2025-26.json"
 
 _by_id: Optional[dict[int, NbaPlayerBio]] = None
+# ESPN id -> resolve_join_key(display_name), computed once with the catalog.
+_join_key_by_id: dict[int, str] = {}
 
 
 def parse_espn_athlete_id(player_id: str | int) -> int:
@@ -42,7 +45,7 @@ def _bio_from_raw(raw: dict) -> NbaPlayerBio:
 
 
 def _load_catalog() -> dict[int, NbaPlayerBio]:
-    global _by_id
+    global _by_id, _join_key_by_id
     if _by_id is not None:
         return _by_id
     if not _JSON_PATH.exists():
@@ -58,6 +61,7 @@ def _load_catalog() -> dict[int, NbaPlayerBio]:
             continue
         catalog[espn_id] = _bio_from_raw(raw)
     _by_id = catalog
+    _join_key_by_id = {pid: resolve_join_key(bio.display_name) for pid, bio in catalog.items()}
     logger.info("Loaded %d NBA players from %s", len(catalog), _JSON_PATH)
     return _by_id
 
@@ -68,3 +72,13 @@ def get_player_bio(player_id: str | int) -> Optional[NbaPlayerBio]:
     except (ValueError, TypeError):
         return None
     return _load_catalog().get(espn_id)
+
+
+def get_player_join_key(player_id: str | int) -> Optional[str]:
+    """Precomputed name join key for a catalog player (None if unknown)."""
+    try:
+        espn_id = parse_espn_athlete_id(player_id)
+    except (ValueError, TypeError):
+        return None
+    _load_catalog()
+    return _join_key_by_id.get(espn_id)
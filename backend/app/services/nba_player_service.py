@@ -11,9 +11,9 @@ from app.models.nba_player_models import NbaPlayerBio, NbaPlayerStatsResponse
 from app.models.player import PlayerStats, StatTimePeriod
 from app.services.data_provider import DataProvider
 from app.services.db_service import DBService
-from app.services.nba_player_catalog import get_player_bio, parse_espn_athlete_id
+from app.services.nba_player_catalog import get_player_bio, get_player_join_key, parse_espn_athlete_id
 from app.services.player_service import espn_season_string, get_season_anchor_date
-from app.utils.name_matching import resolve_join_key
+from app.utils.name_matching import join_keys, resolve_join_key
 
 logger = logging.getLogger(__name__)
 
@@ -170,10 +170,8 @@ class NbaPlayerService:
         if espn_df is None or espn_df.empty or "Name" not in espn_df.columns:
             return _empty_response(espn_id)
 
-        key = resolve_join_key(bio.display_name)
-        espn_df = espn_df.copy()
-        espn_df["_join_key"] = espn_df["Name"].map(resolve_join_key)
-        matches = espn_df[espn_df["_join_key"] == key]
+        key = get_player_join_key(espn_id) or resolve_join_key(bio.display_name)
+        matches = espn_df[join_keys(espn_df) == key]
         if matches.empty:
             return _empty_response(espn_id)
 
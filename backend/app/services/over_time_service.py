@@ -0,0 +1,120 @@
+import hashlib
+import json
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from app.models import RankingsOverTimeResponse, TeamTimeSeriesPoint
+from app.services.cache_manager import CacheManager
+from app.services.db_service import DBService
+
+_SOURCE_TO_TABLE = {
+    "rankings_avg": "team_rankings_averages",
+    "rankings_totals": "team_rankings_totals",
+}
+
+_RANK_COLUMNS = ["rk_fg_pct", "rk_ft_pct", "rk_three_pm", "rk_reb", "rk_ast",
+                 "rk_stl", "rk_blk", "rk_pts", "rk_total", "gp"]
+_STAT_COLUMNS = ["fg_pct", "ft_pct", "three_pm", "reb", "ast", "stl", "blk", "pts"]
+
+SOURCE_COLUMNS: Dict[str, List[str]] = {
+    "rankings_avg": _RANK_COLUMNS,
+    "rankings_totals": _RANK_COLUMNS,
+    "snapshot": _STAT_COLUMNS,
+    "averages": _STAT_COLUMNS,
+}
+
+
+class OverTimeService:
+    """Serves /api/analytics/over-time from pre-encoded JSON bodies.
+
+    The history tables only grow when DataProvider syncs a completed scoring
+    period, so a body is a pure function of (source, category, team filter,
+    format, synced period). Each one is built and encoded once and stored in
+    CacheManager with a strong ETag; repeat requests are a dictionary lookup.
+    """
+
+    def __init__(self, db_service: DBService):
+        self.db_service = db_service
+        self.cache_manager = CacheManager()
+        self.logger = logging.getLogger(__name__)
+
+    async def get_over_time(
+        self,
+        source: str,
+        team_ids: Optional[List[int]] = None,
+        category: Optional[str] = None,
+        fmt: str = "rows",
+    ) -> Tuple[bytes, str]:
+        """Return (json_body, etag) for one over-time view"""
+        if category is not None and category not in SOURCE_COLUMNS[source]:
+            raise ValueError(f"Unknown category '{category}' for source '{source}'")
+
+        teams_key = tuple(sorted(set(team_ids))) if team_ids else None
+        key = (source, category, teams_key, fmt, self.cache_manager.history_period)
+        cached = self.cache_manager.over_time_cache.get(key)
+        if cached is not None:
+            return cached['body'], cached['etag']
+
+        rows = await self._fetch_rows(source, team_ids)
+        columns = [category] if category else SOURCE_COLUMNS[source]
+        if fmt == "columnar":
+            body = self._encode_columnar(source, rows, columns)
+        else:
+            body = self._encode_rows(rows, columns)
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+        # An empty result is also what the DB layer returns on failure, so only
+        # non-empty history is kept.
+        if rows:
+            self.cache_manager.over_time_cache[key] = {'body': body, 'etag': etag}
+        return body, etag
+
+    async def _fetch_rows(self, source: str, team_ids: Optional[List[int]]) -> List[dict]:
+        if source == "snapshot":
+            return await self.db_service.get_snapshot_over_time(team_ids)
+        if source == "averages":
+            return await self.db_service.get_averages_over_time(team_ids)
+        return await self.db_service.get_rankings_over_time(_SOURCE_TO_TABLE[source], team_ids)
+
+    @staticmethod
+    def _encode_rows(rows: List[dict], columns: List[str]) -> bytes:
+        keep = {"date", "team_id", "team_name", *columns}
+        points = [
+            TeamTimeSeriesPoint(**{
+                k: (v.isoformat() if isinstance(v, date) else v)
+                for k, v in row.items() if k in keep
+            })
+            for row in rows
+        ]
+        return RankingsOverTimeResponse(data=points).model_dump_json().encode()
+
+    @staticmethod
+    def _encode_columnar(source: str, rows: List[dict], columns: List[str]) -> bytes:
+        """{"dates": [...], "teams": [{team_id, team_name, values: {col: [...]}}]}
+
+        Every values array is aligned with ``dates``; a team with no row on a
+        date has null there.
+        """
+        dates = sorted({row["date"] for row in rows})
+        date_idx = {d: i for i, d in enumerate(dates)}
+        teams: Dict[int, dict] = {}
+        for row in rows:
+            team = teams.get(row["team_id"])
+            if team is None:
+                team = teams[row["team_id"]] = {
+                    "team_id": row["team_id"],
+                    "team_name": row["team_name"],
+                    "values": {c: [None] * len(dates) for c in columns},
+                }
+            i = date_idx[row["date"]]
+            for c in columns:
+                v = row.get(c)
+                team["values"][c][i] = float(v) if isinstance(v, Decimal) else v
+        payload = {
+            "source": source,
+            "dates": [d.isoformat() if isinstance(d, date) else d for d in dates],
+            "teams": [teams[t] for t in sorted(teams)],
+        }
+        return json.dumps(payload, separators=(",", ":")).encode()
@@ -0,0 +1,195 @@
+"""Sorted index and keyset cursors over a windowed players frame.
+
+/api/players pages through ~1,200 rows. Re-sorting the frame on every page
+request is O(n log n) each time; here each (sort column, direction) is
+argsorted once per frame and kept on the index, so any later page -- by
+offset or by cursor -- is an O(log n) seek plus an O(page) slice. The index
+lives next to its frame in player_service's windowed cache and is dropped
+with it.
+
+Order is (sort value, player id) so ties are total and a cursor -- the last
+row's value and id -- resumes at the right row even if the frame was rebuilt
+in between. NaN sorts last in either direction.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.exceptions import InvalidParameterError
+
+# API sort keys (Player / PlayerStats field names) -> players frame columns.
+SORT_COLUMNS = {
+    'player_name': 'Name',
+    'pro_team': 'Pro Team',
+    'pts': 'PTS',
+    'reb': 'REB',
+    'ast': 'AST',
+    'stl': 'STL',
+    'blk': 'BLK',
+    'fgm': 'FGM',
+    'fga': 'FGA',
+    'ftm': 'FTM',
+    'fta': 'FTA',
+    'fg_percentage': 'FG%',
+    'ft_percentage': 'FT%',
+    'three_pm': '3PM',
+    'minutes': 'MIN',
+    'gp': 'GP',
+    'season_rating': 'season_rating',
+    'last7_rating': 'last7_rating',
+    'last15_rating': 'last15_rating',
+    'last30_rating': 'last30_rating',
+}
+_TEXT_SORTS = {'player_name', 'pro_team'}
+
+
+@dataclass(frozen=True)
+class _SortedKeys:
+    order: np.ndarray          # frame row positions in sorted order
+    keys: np.ndarray           # float sort key per sorted position (ascending)
+    ids: np.ndarray            # tiebreak id per sorted position
+    uniques: Optional[np.ndarray] = None  # sorted distinct strings (text columns)
+
+
+def encode_cursor(sort_by: Optional[str], descending: bool, value, row_id: int) -> str:
+    raw = json.dumps({'s': sort_by, 'd': descending, 'v': value, 'id': row_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(data, dict) or not {'s', 'd', 'v', 'id'} <= data.keys():
+            raise ValueError("missing keys")
+        return data
+    except (ValueError, binascii.Error, UnicodeDecodeError) as e:
+        raise InvalidParameterError("Invalid cursor") from e
+
+
+class PlayerSortIndex:
+    """Per-frame cache of sort orders. The frame must not be mutated afterwards."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._ids = self._row_ids(df)
+        self._sorted: dict[Tuple[Optional[str], bool], _SortedKeys] = {}
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    @staticmethod
+    def _row_ids(df: pd.DataFrame) -> np.ndarray:
+        """ESPN player id per row; rows without one get a negative positional id."""
+        positional = -np.arange(1, len(df) + 1, dtype=np.int64)
+        if 'player_id' not in df.columns:
+            return positional
+        ids = pd.to_numeric(df['player_id'], errors='coerce').to_numpy(dtype=float)
+        return np.where(np.isnan(ids), positional, np.nan_to_num(ids)).astype(np.int64)
+
+    def _column(self, sort_by: str) -> str:
+        column = SORT_COLUMNS.get(sort_by)
+        if column is None or column not in self.df.columns:
+            raise InvalidParameterError(
+                f"Invalid sort_by '{sort_by}'. Valid options: {', '.join(SORT_COLUMNS)}"
+            )
+        return column
+
+    def _build(self, sort_by: Optional[str], descending: bool) -> _SortedKeys:
+        n = len(self.df)
+        uniques = None
+        if sort_by is None:
+            keys = np.arange(n, dtype=float)
+        else:
+            values = self.df[self._column(sort_by)]
+            if sort_by in _TEXT_SORTS:
+                codes, uniques = pd.factorize(values.astype(str), sort=True)
+                uniques = np.asarray(uniques, dtype=object)
+                keys = codes.astype(float)
+            else:
+                keys = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+            keys = np.where(np.isnan(keys), np.inf, -keys if descending else keys)
+        # lexsort: last key is primary.
+        order = np.lexsort((self._ids, keys))
+        return _SortedKeys(order, keys[order], self._ids[order], uniques)
+
+    def _get(self, sort_by: Optional[str], descending: bool) -> _SortedKeys:
+        key = (sort_by, descending)
+        sorted_keys = self._sorted.get(key)
+        if sorted_keys is None:
+            sorted_keys = self._sorted[key] = self._build(sort_by, descending)
+        return sorted_keys
+
+    @staticmethod
+    def _cursor_key(sorted_keys: _SortedKeys, value, descending: bool) -> float:
+        """Cursor value -> the float key space of ``sorted_keys``."""
+        if value is None:
+            return np.inf
+        if sorted_keys.uniques is not None:
+            pos = int(np.searchsorted(sorted_keys.uniques, str(value)))
+            exact = pos < len(sorted_keys.uniques) and sorted_keys.uniques[pos] == str(value)
+            key = float(pos) if exact else pos - 0.5
+        else:
+            key = float(value)
+        return -key if descending else key
+
+    def _seek(self, sorted_keys: _SortedKeys, key: float, row_id: int) -> int:
+        """First sorted position strictly after (key, row_id)."""
+        lo = int(np.searchsorted(sorted_keys.keys, key, side='left'))
+        hi = int(np.searchsorted(sorted_keys.keys, key, side='right'))
+        return lo + int(np.searchsorted(sorted_keys.ids[lo:hi], row_id, side='right'))
+
+    @staticmethod
+    def _cursor_value(sorted_keys: _SortedKeys, position: int, sort_by: Optional[str], descending: bool):
+        """Inverse of _cursor_key for the row at ``position``."""
+        key = float(sorted_keys.keys[position])
+        if sort_by is None:
+            return int(key)
+        if np.isinf(key):
+            return None
+        key = -key if descending else key
+        if sorted_keys.uniques is not None:
+            return str(sorted_keys.uniques[int(key)])
+        return key
+
+    def page(
+        self,
+        limit: int,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, Optional[str]]:
+        """Rows of one page and the cursor for the next (None on the last page).
+        ``cursor`` takes precedence over ``offset``."""
+        if sort_by is None:
+            descending = False  # natural (ESPN) order has no direction
+        sorted_keys = self._get(sort_by, descending)
+
+        start = offset
+        if cursor is not None:
+            data = decode_cursor(cursor)
+            if data['s'] != sort_by or bool(data['d']) != descending:
+                raise InvalidParameterError("Cursor does not match sort_by/order")
+            try:
+                key = self._cursor_key(sorted_keys, data['v'], descending)
+                start = self._seek(sorted_keys, key, int(data['id']))
+            except (TypeError, ValueError) as e:
+                raise InvalidParameterError("Invalid cursor") from e
+
+        end = min(start + limit, len(sorted_keys.order))
+        page_df = self.df.iloc[sorted_keys.order[start:end]]
+        next_cursor = None
+        if end < len(sorted_keys.order) and end > start:
+            last = end - 1
+            next_cursor = encode_cursor(
+                sort_by, descending, self._cursor_value(sorted_keys, last, sort_by, descending),
+                int(sorted_keys.ids[last]),
+            )
+        return page_df, next_cursor
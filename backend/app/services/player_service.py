@@ -6,8 +6,10 @@ from app.models import PaginatedPlayers, StatTimePeriod
 from app.exceptions import ResourceNotFoundError
 from app.services.data_provider import DataProvider
 from app.services.db_service import DBService
+from app.services.player_index import PlayerSortIndex
 from app.builders.response_builder import ResponseBuilder
-from app.utils.name_matching import resolve_join_key
+from app.utils.metrics import record_cache
+from app.utils.name_matching import JOIN_KEY_COL, NAME_KEY_COL, join_keys, resolve_join_key
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -55,6 +57,31 @@ _WINDOWED_PLAYERS_TTL = timedelta(minutes=5)
 _windowed_players_cache: dict = {}
 
 
+# fs_player_games keys players by nba_api PLAYER_ID, ESPN rows by ESPN athlete
+# id -- different id spaces that only meet on the player's name. A roster-scoped
+# window therefore maps the roster's join keys to NBA ids through the season's
+# stored (id, name) pairs; refreshed hourly like the anchor date (new names
+# only appear with nightly ingest).
+_NBA_IDS_TTL = timedelta(hours=1)
+_nba_ids_cache: dict = {'season': None, 'ids': None, 'ts': None}
+
+
+async def get_nba_ids_by_join_key(season: str, db_service: DBService) -> dict[str, list[int]]:
+    """join key -> fs_player_games player ids for ``season`` (every name a
+    player has been stored under maps to them)."""
+    cached = _nba_ids_cache
+    now = datetime.now()
+    if cached['season'] == season and cached['ids'] and now - cached['ts'] < _NBA_IDS_TTL:
+        return cached['ids']
+    ids: dict[str, list[int]] = {}
+    for row in await db_service.get_season_player_names(season):
+        key_ids = ids.setdefault(resolve_join_key(str(row['player_name'])), [])
+        if int(row['player_id']) not in key_ids:
+            key_ids.append(int(row['player_id']))
+    _nba_ids_cache.update({'season': season, 'ids': ids, 'ts': now})
+    return ids
+
+
 async def get_season_anchor_date(season: str, db_service: DBService) -> date:
     cached = _season_anchor_cache
     now = datetime.now()
@@ -98,27 +125,83 @@ async def build_windowed_players_df(
     fall back to anyway, so every player is simply zeroed to their window
     totals (0 if they have no rows), always has_data=True.
     """
+    agg_df, actual_start, actual_end = await _aggregate_window(time_period, db_service, start, end)
+    return _overlay_window_stats(time_period, espn_players_df, agg_df), actual_start, actual_end
+
+
+async def build_team_windowed_players_df(
+    time_period: StatTimePeriod,
+    espn_players_df: pd.DataFrame,
+    team_id: int,
+    db_service: DBService,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Tuple[pd.DataFrame, Optional[date], Optional[date]]:
+    """build_windowed_players_df for one fantasy team's roster.
+
+    Reuses the league-wide preset cache when it is warm; otherwise resolves
+    the roster's names to fs_player_games (NBA) ids, aggregates only those
+    players and overlays just those rows. Same semantics as the league-wide
+    build — the merge is still by join key — minus the league scan.
+    """
+    cached = _cached_windowed_players(time_period)
+    if cached is not None:
+        df = cached['df']
+        return df.loc[df['team_id'] == team_id], cached['start'], cached['end']
+
+    roster_df = espn_players_df.loc[espn_players_df['team_id'] == team_id]
+    nba_ids = await get_nba_ids_by_join_key(espn_season_string(settings.season_id), db_service)
+    player_ids = sorted({pid for key in join_keys(roster_df).unique() for pid in nba_ids.get(key, ())})
+    if not player_ids:
+        return _overlay_window_stats(time_period, roster_df, pd.DataFrame()), None, None
+    agg_df, actual_start, actual_end = await _aggregate_window(
+        time_period, db_service, start, end, player_ids=player_ids
+    )
+    return _overlay_window_stats(time_period, roster_df, agg_df), actual_start, actual_end
+
+
+def _cached_windowed_players(time_period: StatTimePeriod) -> Optional[dict]:
+    """Fresh league-wide windowed cache entry for a preset period, else None."""
+    if time_period == StatTimePeriod.CUSTOM:
+        return None
+    cached = _windowed_players_cache.get(time_period)
+    hit = cached is not None and datetime.now() - cached['ts'] < _WINDOWED_PLAYERS_TTL
+    record_cache('windowed_players', hit=hit)
+    return cached if hit else None
+
+
+async def _aggregate_window(
+    time_period: StatTimePeriod,
+    db_service: DBService,
+    start: Optional[date],
+    end: Optional[date],
+    player_ids: Optional[list[int]] = None,
+) -> Tuple[pd.DataFrame, Optional[date], Optional[date]]:
     season = espn_season_string(settings.season_id)
     anchor_date = await get_season_anchor_date(season, db_service)
     resolved_start, resolved_end = StatTimePeriod.resolve_window(
         time_period, start, end, settings.season_start, today=anchor_date
     )
-    agg_df, actual_start, actual_end = await db_service.aggregate_player_games(
-        resolved_start, resolved_end, season
+    return await db_service.aggregate_player_games(
+        resolved_start, resolved_end, season, player_ids=player_ids
     )
 
+
+def _overlay_window_stats(
+    time_period: StatTimePeriod, espn_players_df: pd.DataFrame, agg_df: pd.DataFrame
+) -> pd.DataFrame:
     merged = espn_players_df.copy()
     is_custom = time_period == StatTimePeriod.CUSTOM
-    merged['_join_key'] = merged['Name'].map(resolve_join_key)
+    merged[JOIN_KEY_COL] = join_keys(merged)
 
     if agg_df.empty:
         windowed = pd.Series(False, index=merged.index)
     else:
         agg_df = agg_df.copy()
-        agg_df['_join_key'] = agg_df['player_name'].map(resolve_join_key)
-        agg_df = agg_df.drop_duplicates('_join_key', keep='first')
-        db_cols = ['_join_key'] + list(_DB_STAT_COLS.values())
-        merged = merged.merge(agg_df[db_cols], on='_join_key', how='left', suffixes=('', '_db'))
+        agg_df[JOIN_KEY_COL] = agg_df['player_name'].map(resolve_join_key)
+        agg_df = agg_df.drop_duplicates(JOIN_KEY_COL, keep='first')
+        db_cols = [JOIN_KEY_COL] + list(_DB_STAT_COLS.values())
+        merged = merged.merge(agg_df[db_cols], on=JOIN_KEY_COL, how='left', suffixes=('', '_db'))
         windowed = merged['gp'].notna()
         for espn_col, db_col in _DB_STAT_COLS.items():
             merged.loc[windowed, espn_col] = merged.loc[windowed, db_col]
@@ -148,9 +231,8 @@ async def build_windowed_players_df(
         )
 
     merged['GP'] = merged['GP'].astype(int)
-    drop_cols = ['_join_key'] + list(_DB_STAT_COLS.values())
-    merged = merged.drop(columns=[c for c in drop_cols if c in merged.columns])
-    return merged, actual_start, actual_end
+    drop_cols = [JOIN_KEY_COL, NAME_KEY_COL] + list(_DB_STAT_COLS.values())
+    return merged.drop(columns=[c for c in drop_cols if c in merged.columns])
 
 
 class PlayerService:
@@ -168,20 +250,26 @@ class PlayerService:
         time_period: StatTimePeriod = StatTimePeriod.SEASON,
         start: Optional[date] = None,
         end: Optional[date] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+        cursor: Optional[str] = None,
     ) -> PaginatedPlayers:
         """Get all players with pagination
 
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when ``cursor`` is given
             limit: Number of players per page
             time_period: Time period for stats (season, last_7, last_15, last_30, custom)
             start: Start date, required when time_period is custom
             end: End date, required when time_period is custom
+            sort_by: Player/PlayerStats field to sort by (None keeps ESPN's order)
+            descending: Sort direction for ``sort_by``
+            cursor: ``next_cursor`` of the previous page
         """
         is_preset = time_period != StatTimePeriod.CUSTOM
-        cached = _windowed_players_cache.get(time_period) if is_preset else None
-        if cached is not None and datetime.now() - cached['ts'] < _WINDOWED_PLAYERS_TTL:
-            players_df, actual_start, actual_end = cached['df'], cached['start'], cached['end']
+        cached = _cached_windowed_players(time_period)
+        if cached is not None:
+            index, actual_start, actual_end = cached['index'], cached['start'], cached['end']
         else:
             stat_split_id = StatTimePeriod.to_stat_split_id(time_period)
             espn_players_df = await self.data_provider.get_players_df(stat_split_id)
@@ -192,25 +280,26 @@ class PlayerService:
             players_df, actual_start, actual_end = await build_windowed_players_df(
                 time_period, espn_players_df, self.data_provider.db_service, start, end
             )
+            # Sort orders are computed lazily and live as long as the frame.
+            index = PlayerSortIndex(players_df)
             if is_preset:
                 _windowed_players_cache[time_period] = {
-                    'df': players_df, 'start': actual_start, 'end': actual_end,
+                    'df': players_df, 'index': index, 'start': actual_start, 'end': actual_end,
                     'ts': datetime.now(),
                 }
 
-        total_count = len(players_df)
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-
-        page_df = players_df.iloc[start_idx:end_idx]
+        page_df, next_cursor = index.page(
+            limit, sort_by=sort_by, descending=descending, offset=(page - 1) * limit, cursor=cursor,
+        )
         players = self.response_builder.build_all_players_response(page_df)
 
         return PaginatedPlayers(
             players=players,
-            total_count=total_count,
+            total_count=len(index),
             page=page,
             limit=limit,
-            has_more=end_idx < total_count,
+            has_more=next_cursor is not None,
             actual_start=actual_start,
             actual_end=actual_end,
+            next_cursor=next_cursor,
         )
@@ -5,6 +5,7 @@ from typing import Optional
 from app.models import LeagueRankings
 from app.exceptions import InvalidParameterError, ResourceNotFoundError
 from app.services.data_provider import DataProvider
+from app.services.league_history import LeagueHistory
 from app.builders.response_builder import ResponseBuilder
 from app.utils.constants import RANKING_CATEGORIES, PER_GAME_CATEGORIES
 
@@ -44,16 +45,7 @@ class RankingService:
 
     async def _get_rankings_for_range(self, start_date: date, end_date: date,
                                        sort_by: Optional[str], order: str) -> LeagueRankings:
-        actual_end_date, actual_start_date, rows_end, rows_start = \
-            await self.data_provider.db_service.get_snapshots_for_date_range(start_date, end_date)
-
-        if actual_end_date is None or not rows_end:
-            raise ResourceNotFoundError("No data available for the requested date range")
-
-        end_df = pd.DataFrame(rows_end)
-        start_df = pd.DataFrame(rows_start) if rows_start else None
-
-        delta_df = self._compute_delta(end_df, start_df)
+        actual_end_date, actual_start_date, delta_df = await self._get_range_delta(start_date, end_date)
 
         averages_rankings_df = self._build_averages_rankings_df(delta_df)
         totals_rankings_df = self._build_totals_rankings_df_from_delta(delta_df)
@@ -74,6 +66,26 @@ class RankingService:
             actual_end_date=actual_end_date,
         )
 
+    async def _get_range_delta(self, start_date: date, end_date: date):
+        """(actual_end_date, actual_start_date, delta_df) from the in-memory history,
+        or from the DB snapshots while it is not loaded."""
+        history = LeagueHistory()
+        if history.loaded:
+            actual_end_date, actual_start_date, delta_df = history.range_delta(start_date, end_date)
+            if actual_end_date is None or delta_df.empty:
+                raise ResourceNotFoundError("No data available for the requested date range")
+            return actual_end_date, actual_start_date, delta_df
+
+        actual_end_date, actual_start_date, rows_end, rows_start = \
+            await self.data_provider.db_service.get_snapshots_for_date_range(start_date, end_date)
+
+        if actual_end_date is None or not rows_end:
+            raise ResourceNotFoundError("No data available for the requested date range")
+
+        end_df = pd.DataFrame(rows_end)
+        start_df = pd.DataFrame(rows_start) if rows_start else None
+        return actual_end_date, actual_start_date, self._compute_delta(end_df, start_df)
+
     def _compute_delta(self, end_df: pd.DataFrame, start_df: Optional[pd.DataFrame]) -> pd.DataFrame:
         """Compute per-team delta between end and start snapshots."""
         counting_cols = ['gp', 'fgm', 'fga', 'ftm', 'fta', 'three_pm', 'reb', 'ast', 'stl', 'blk', 'pts']
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshCoordinator:
+    """Single-flight, debounced runner for a background refresh.
+
+    ``trigger()`` starts the refresh unless one is already running (the caller
+    joins it) or the last one started less than ``min_interval`` seconds ago
+    (the trigger is dropped). Callers that need the outcome await
+    ``run_now()``, which joins the in-flight run or starts one regardless of the
+    interval. The shared task is shielded, so a cancelled caller (client
+    disconnect) never cancels the refresh for everyone else.
+    """
+
+    def __init__(self, refresh: Callable[..., Awaitable[Any]], min_interval: float, name: str = "refresh"):
+        self._refresh = refresh
+        self.min_interval = min_interval
+        self.name = name
+        self._task: Optional[asyncio.Task] = None
+        self._last_started: Optional[float] = None
+        self.last_result: Any = None
+        self.last_completed: Optional[float] = None
+        self.runs = 0
+
+    @property
+    def in_flight(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def _due(self) -> bool:
+        return self._last_started is None or time.monotonic() - self._last_started >= self.min_interval
+
+    def trigger(self, *args, force: bool = False) -> Optional[asyncio.Task]:
+        """Start a refresh if none is running and one is due. Returns the
+        in-flight task (new or joined), or None when debounced."""
+        if self.in_flight:
+            return self._task
+        if not force and not self._due():
+            return None
+        self._last_started = time.monotonic()
+        self._task = asyncio.create_task(self._run(*args))
+        return self._task
+
+    async def run_now(self, *args) -> Any:
+        """Join the in-flight refresh, or start one now, and return its result."""
+        task = self.trigger(*args, force=True)
+        return await asyncio.shield(task)
+
+    async def wait(self) -> Any:
+        """Wait for the in-flight refresh (if any); the latest completed result."""
+        if self.in_flight:
+            return await asyncio.shield(self._task)
+        return self.last_result
+
+    async def _run(self, *args) -> Any:
+        self.runs += 1
+        result = None
+        try:
+            result = await self._refresh(*args)
+        except Exception as e:
+            logger.error(f"{self.name} failed: {e}")
+        self.last_result = result
+        self.last_completed = time.monotonic()
+        return result
+
+    def reset(self) -> None:
+        """Forget the in-flight task, debounce window and counters (tests)."""
+        self._task = None
+        self._last_started = None
+        self.last_result = None
+        self.last_completed = None
+        self.runs = 0
@@ -0,0 +1,174 @@
+"""Schedule context shared by the estimator, league summary and team pages.
+
+NBA pace (avg games played per NBA team), NBA game days left and per-team
+roster slot usage all move at most once per scoring period (one ESPN fantasy
+day). They're computed together here and kept until ESPN reports a new
+scoring period, so readers get them from memory instead of each one hitting
+the NBA standings/calendar endpoints and re-parsing mMatchupScore. The
+estimator scheduler forces a refresh after its morning sync.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import pandas as pd
+
+from app.config import settings
+from app.services.data_provider import DataProvider
+from app.services.nba_stats_service import NBAStatsService
+
+logger = logging.getLogger(__name__)
+
+NBA_AVG_PACE_FALLBACK = 65.9
+
+SLOT_NAMES = ['PG', 'SG', 'SF', 'PF', 'C', 'G', 'F', 'UTIL']
+
+# Upper bound on a context's age, so one built while ESPN was down (no new
+# scoring period reported) isn't kept forever.
+_MAX_AGE = timedelta(hours=6)
+
+
+@dataclass(frozen=True)
+class ScheduleContext:
+    scoring_period_id: Optional[int]
+    nba_avg_pace: Optional[float]
+    nba_game_days_left: Optional[int]
+    slot_usage: Dict[int, Dict[str, int]]
+    team_names: Dict[int, str]
+    refreshed_at: datetime
+
+    @property
+    def resolved_pace(self) -> float:
+        """NBA pace, or the season-typical fallback when standings were unavailable."""
+        return self.nba_avg_pace if self.nba_avg_pace is not None else NBA_AVG_PACE_FALLBACK
+
+    def slot_pace_df(self) -> pd.DataFrame:
+        """
+        Returns a DataFrame with one row per fantasy team:
+          team_id, team_name,
+          PG, SG, SF, PF, C, G, F, UTIL  (games used per roster slot this season),
+          nba_game_days_remaining          (game days left in the regular season),
+          nba_avg_pace                     (avg games played per NBA team so far)
+        """
+        rows = [
+            {
+                'team_id': team_id,
+                'team_name': self.team_names.get(team_id, f'Team {team_id}'),
+                **{s: slots.get(s, 0) for s in SLOT_NAMES},
+                'nba_game_days_remaining': self.nba_game_days_left,
+                'nba_avg_pace': self.resolved_pace,
+            }
+            for team_id, slots in self.slot_usage.items()
+        ]
+        return pd.DataFrame(rows)
+
+
+class ScheduleContextProvider:
+    """Singleton holder of the current ScheduleContext.
+
+    ``get()`` is a memory read while the context matches the scoring period
+    DataProvider last saw; it refreshes (once, for all concurrent callers)
+    only on a cold start or a new period. ``refresh(force=True)`` is for the
+    schedulers.
+    """
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if ScheduleContextProvider._initialized:
+            return
+        self.data_provider = DataProvider()
+        self.nba_service = NBAStatsService()
+        self._context: Optional[ScheduleContext] = None
+        self._lock = asyncio.Lock()
+        ScheduleContextProvider._initialized = True
+
+    @property
+    def current(self) -> Optional[ScheduleContext]:
+        return self._context
+
+    def _is_current(self, context: Optional[ScheduleContext]) -> bool:
+        if context is None:
+            return False
+        period = self.data_provider.get_scoring_period_id()
+        if period is not None and context.scoring_period_id != period:
+            return False
+        return datetime.now() - context.refreshed_at < _MAX_AGE
+
+    async def get(self) -> ScheduleContext:
+        context = self._context
+        if self._is_current(context):
+            return context
+        return await self.refresh()
+
+    async def refresh(self, force: bool = False) -> ScheduleContext:
+        """Recompute the context. Callers queued behind a running refresh reuse
+        its result unless ``force`` is set."""
+        async with self._lock:
+            if not force and self._is_current(self._context):
+                return self._context
+            context = await self._build()
+            if context is not None:
+                self._context = context
+                return context
+            if self._context is not None:
+                return self._context
+            # Nothing to fall back on: serve NBA-only data, but don't keep it.
+            return await self._build_without_league()
+
+    async def _fetch_nba(self) -> tuple[Optional[float], Optional[int]]:
+        try:
+            pace, days_left = await asyncio.gather(
+                self.nba_service.get_nba_average_pace(settings.season_id),
+                self.nba_service.get_nba_game_days_remaining(),
+            )
+            return pace, days_left
+        except Exception as e:
+            logger.warning(f"Failed to fetch NBA schedule stats: {e}")
+            return None, None
+
+    async def _build(self) -> Optional[ScheduleContext]:
+        try:
+            totals_df = await self.data_provider.get_totals_df()
+            slot_usage = await self.data_provider.get_slot_usage()
+        except Exception as e:
+            logger.warning(f"Schedule context refresh failed, ESPN league data unavailable: {e}")
+            return None
+
+        pace, days_left = await self._fetch_nba()
+        if self._context is not None:  # keep yesterday's numbers over none
+            pace = pace if pace is not None else self._context.nba_avg_pace
+            days_left = days_left if days_left is not None else self._context.nba_game_days_left
+
+        team_names = {}
+        if totals_df is not None:
+            team_names = dict(zip(totals_df['team_id'], totals_df['team_name']))
+
+        return ScheduleContext(
+            scoring_period_id=self.data_provider.get_scoring_period_id(),
+            nba_avg_pace=pace,
+            nba_game_days_left=days_left,
+            slot_usage=slot_usage,
+            team_names=team_names,
+            refreshed_at=datetime.now(),
+        )
+
+    async def _build_without_league(self) -> ScheduleContext:
+        pace, days_left = await self._fetch_nba()
+        return ScheduleContext(
+            scoring_period_id=None,
+            nba_avg_pace=pace,
+            nba_game_days_left=days_left,
+            slot_usage={},
+            team_names={},
+            refreshed_at=datetime.now(),
+        )
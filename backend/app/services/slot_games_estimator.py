@@ -19,7 +19,7 @@ class SlotGamesEstimator:
     def estimate(self, slot_pace_df: pd.DataFrame) -> pd.DataFrame:
         """
         Args:
-            slot_pace_df: output of get_team_slot_pace_df() — one row per fantasy team
+            slot_pace_df: output of ScheduleContext.slot_pace_df() — one row per fantasy team
                           with columns: team_id, team_name, PG..UTIL,
                           nba_avg_pace, nba_game_days_remaining
 
@@ -58,3 +58,23 @@ class SlotGamesEstimator:
         result['proj_total'] = result[proj_cols].sum(axis=1)
 
         return result
+
+    @staticmethod
+    def adjust_projection(
+        slot_projection: dict[str, float] | None,
+        slot_deltas: dict[str, float],
+        fallback_total: float,
+    ) -> float:
+        """
+        Projected season games after per-slot changes (what-if scenarios).
+
+        Each slot's projection moves by its delta and stays within [0, cap].
+        Without a per-slot projection the deltas apply to ``fallback_total``,
+        bounded by the combined caps.
+        """
+        if slot_projection is None:
+            return float(min(max(fallback_total + sum(slot_deltas.values()), 0.0), sum(SLOT_CAPS.values())))
+        return float(sum(
+            min(max(slot_projection.get(slot, 0.0) + slot_deltas.get(slot, 0.0), 0.0), SLOT_CAPS[slot])
+            for slot in SLOTS
+        ))
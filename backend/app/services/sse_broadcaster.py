@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from collections import deque
+from typing import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+PING_FRAME = b": ping\n\n"
+
+
+class SSEBroadcaster:
+    """Fan-out of server-sent events through one shared ring buffer.
+
+    Each event is encoded to its wire frame (``id:``/``event:``/``data:`` lines)
+    once, in ``publish``; every connection then yields the same bytes object.
+    Clients keep only a cursor (the last event id they were sent), so a browser
+    reconnecting with ``Last-Event-ID`` resumes from the buffer, and a client that
+    falls more than ``max_lag`` events behind is disconnected instead of queueing
+    an unbounded backlog.
+    """
+
+    def __init__(self, capacity: int = 256, max_lag: int = 128, ping_interval: float = 30.0):
+        self.capacity = capacity
+        self.max_lag = min(max_lag, capacity)
+        self.ping_interval = ping_interval
+        self._frames: deque[tuple[int, bytes]] = deque(maxlen=capacity)
+        self._last_id = 0
+        self._wakeup = asyncio.Event()
+        self.subscribers = 0
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    @staticmethod
+    def encode(event_id: int, data: str, event: str | None = None) -> bytes:
+        lines = [f"id: {event_id}"]
+        if event:
+            lines.append(f"event: {event}")
+        lines.extend(f"data: {line}" for line in data.split("\n"))
+        return ("\n".join(lines) + "\n\n").encode()
+
+    def publish(self, data: str, event: str | None = None) -> int:
+        """Encode one event, append it to the ring and wake every waiting client."""
+        self._last_id += 1
+        self._frames.append((self._last_id, self.encode(self._last_id, data, event)))
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
+        return self._last_id
+
+    def frames_after(self, cursor: int) -> list[tuple[int, bytes]]:
+        """Buffered frames newer than ``cursor`` (oldest first)."""
+        if not self._frames or cursor >= self._last_id:
+            return []
+        start = max(0, cursor + 1 - self._frames[0][0])
+        return [self._frames[i] for i in range(start, len(self._frames))]
+
+    def _start_cursor(self, last_event_id: int | None) -> int:
+        # A fresh connection (or an id from before a server restart) only sees new
+        # events. A resume replays at most max_lag frames — starting further back
+        # would trip the lag check straight away and loop the client on reconnects.
+        if last_event_id is None or last_event_id > self._last_id:
+            return self._last_id
+        return max(last_event_id, self._last_id - self.max_lag)
+
+    async def stream(self, last_event_id: int | None = None) -> AsyncIterator[bytes]:
+        cursor = self._start_cursor(last_event_id)
+        self.subscribers += 1
+        logger.info(f"SSE client connected. Subscribers: {self.subscribers}")
+        try:
+            while True:
+                frames = self.frames_after(cursor)
+                if not frames:
+                    wakeup = self._wakeup
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=self.ping_interval)
+                    except asyncio.TimeoutError:
+                        yield PING_FRAME
+                    continue
+                for event_id, frame in frames:
+                    if self._last_id - cursor > self.max_lag:
+                        logger.warning(
+                            f"SSE client {self._last_id - cursor} events behind, disconnecting"
+                        )
+                        return
+                    yield frame
+                    cursor = event_id
+        finally:
+            self.subscribers -= 1
+            logger.info(f"SSE client disconnected. Subscribers: {self.subscribers}")
@@ -5,7 +5,8 @@ from typing import List, Optional
 from app.models import TeamDetail, TeamPlayers, Team, StatTimePeriod
 from app.exceptions import InvalidParameterError, ResourceNotFoundError
 from app.services.data_provider import DataProvider
-from app.services.player_service import build_windowed_players_df
+from app.services.player_service import build_team_windowed_players_df
+from app.services.schedule_context import ScheduleContextProvider
 from app.builders.response_builder import ResponseBuilder
 from app.utils.utils import is_team_exists
 from app.config import settings
@@ -16,6 +17,7 @@ class TeamService:
     def __init__(self):
         self.data_provider = DataProvider()
         self.response_builder = ResponseBuilder()
+        self.schedule_context = ScheduleContextProvider()
         self.logger = logging.getLogger(__name__)
 
     async def get_team_detail(
@@ -51,15 +53,15 @@ class TeamService:
         actual_start = None
         actual_end = None
         try:
-            players_df, slot_usage_map = await asyncio.gather(
+            players_df, context = await asyncio.gather(
                 self.data_provider.get_players_df(stat_split_id),
-                self.data_provider.get_slot_usage()
+                self.schedule_context.get()
             )
+            slot_usage_map = context.slot_usage
             if players_df is not None:
-                players_df, actual_start, actual_end = await build_windowed_players_df(
-                    time_period, players_df, self.data_provider.db_service, start, end
+                team_players_df, actual_start, actual_end = await build_team_windowed_players_df(
+                    time_period, players_df, team_id, self.data_provider.db_service, start, end
                 )
-                team_players_df = self._filter_team_players(players_df, team_id)
                 players_list = self.response_builder.build_players_list(team_players_df)
         except Exception as e:
             self.logger.warning(f"Player data unavailable for team {team_id}: {e}")
@@ -22,7 +22,8 @@ from app.models.trend_models import (
 )
 from app.services.db_service import DBService
 from app.services.player_service import espn_season_string, get_season_anchor_date
-from app.utils.name_matching import resolve_join_key
+from app.utils.metrics import record_cache
+from app.utils.name_matching import join_keys, resolve_join_key
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +61,13 @@ FORM_MIN_BASELINE_ATT = 50
 FORM_MIN_ABS_Z = 1.5
 
 
+def _espn_rows_by_join_key(players_df: pd.DataFrame) -> dict[str, Any]:
+    """ESPN player rows keyed by name join key (precomputed on the cached pool)."""
+    if 'Name' not in players_df.columns:
+        return {}
+    return dict(zip(join_keys(players_df), (row for _, row in players_df.iterrows())))
+
+
 def _season_outlier_stat(
     stat_name: str,
     spec: dict,
@@ -161,10 +169,7 @@ def compute_regression_groups(
     if mode == 'season' and baseline_df.empty:
         return []
 
-    espn_by_name = {
-        resolve_join_key(str(row.get('Name', ''))): row
-        for _, row in players_df.iterrows()
-    }
+    espn_by_name = _espn_rows_by_join_key(players_df)
     baseline_by_id = (
         {int(r['player_id']): r for _, r in baseline_df.iterrows()}
         if not baseline_df.empty else {}
@@ -241,10 +246,7 @@ def compute_minutes_movers(
     if season_df.empty or window_df.empty:
         return []
 
-    espn_by_name = {
-        resolve_join_key(str(row.get('Name', ''))): row
-        for _, row in players_df.iterrows()
-    }
+    espn_by_name = _espn_rows_by_join_key(players_df)
     window_by_id = {int(r['player_id']): r for _, r in window_df.iterrows()}
 
     items: list[MinutesMoverItem] = []
@@ -333,10 +335,7 @@ def compute_usage_role(
     if games_df.empty:
         return []
 
-    espn_by_name = {
-        resolve_join_key(str(row.get('Name', ''))): row
-        for _, row in players_df.iterrows()
-    }
+    espn_by_name = _espn_rows_by_join_key(players_df)
 
     items: list[UsageRoleItem] = []
     for player_id, group in games_df.groupby('player_id'):
@@ -519,20 +518,24 @@ class _TTLLRUCache:
     (cheap, the dict is capped) then evict the least-recently-used entry
     until back under maxsize."""
 
-    def __init__(self, maxsize: int, ttl: timedelta):
+    def __init__(self, maxsize: int, ttl: timedelta, name: str = 'ttl_lru'):
         self._maxsize = maxsize
         self._ttl = ttl
+        self._name = name
         self._data: OrderedDict[Any, tuple[Any, datetime]] = OrderedDict()
 
     def get(self, key: Any) -> Any:
         entry = self._data.get(key)
         if entry is None:
+            record_cache(self._name, hit=False)
             return None
         value, expires_at = entry
         if datetime.now() >= expires_at:
             del self._data[key]
+            record_cache(self._name, hit=False)
             return None
         self._data.move_to_end(key)
+        record_cache(self._name, hit=True)
         return value
 
     def set(self, key: Any, value: Any) -> None:
@@ -563,7 +566,9 @@ class TrendService:
         self._minutes_inflight: dict[int, asyncio.Future] = {}
         self._usage_cache: dict[int, dict] = {}
         self._usage_inflight: dict[int, asyncio.Future] = {}
-        self._game_log_cache = _TTLLRUCache(maxsize=_GAME_LOG_CACHE_MAXSIZE, ttl=_TREND_CACHE_TTL)
+        self._game_log_cache = _TTLLRUCache(
+            maxsize=_GAME_LOG_CACHE_MAXSIZE, ttl=_TREND_CACHE_TTL, name='trend_game_log'
+        )
         self._game_log_inflight: dict[tuple, asyncio.Future] = {}
         self._league_cache: dict[str, dict] = {}
         self._league_inflight: dict[str, asyncio.Future] = {}
@@ -0,0 +1,34 @@
+"""Responses for payloads encoded once and served as bytes (estimator results,
+draft report): ETag revalidation and a pre-gzipped body for clients that
+accept it."""
+
+from typing import Protocol
+
+from fastapi import Request, Response
+
+
+class EncodedPayload(Protocol):
+    etag: str
+    body: bytes
+
+    @property
+    def gzip_body(self) -> bytes: ...
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(","))
+
+
+def encoded_response(request: Request, payload: EncodedPayload, cache_control: str = "no-cache") -> Response:
+    """304 when the client's ETag matches, else the body as-is (gzip if accepted)."""
+    headers = {"ETag": payload.etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            payload.gzip_body, media_type="application/json",
+            headers={**headers, "Content-Encoding": "gzip"},
+        )
+    return Response(payload.body, media_type="application/json", headers=headers)
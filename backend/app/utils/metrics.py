@@ -0,0 +1,307 @@
+"""In-process metrics with Prometheus text exposition.
+
+A deliberately small registry (counters, gauges, histograms with string labels)
+rather than a client library: everything lives in this process, renders at
+``/metrics`` and is readable from tests through ``value()``. ``MetricsMiddleware``
+records per-route latency, in-flight requests and response sizes; the service
+hooks below are timed/counted where the work happens.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Seconds. Covers cached responses (sub-ms) through cold ESPN fetches / model
+# batches (several seconds).
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+LabelKey = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _fmt(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _label_str(self, key: LabelKey, extra: Optional[tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, key))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{n}="{_escape(v)}"' for n, v in pairs) + '}'
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.kind}']
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        for key, v in sorted(self._values.items()):
+            yield f'{self.name}{self._label_str(key)} {_fmt(v)}'
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [count per bucket (non-cumulative, last = +Inf), sum]
+        self._values: dict[LabelKey, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[i] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the wall time of the ``with`` body (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def sum(self, **labels) -> float:
+        entry = self._values.get(self._key(labels))
+        return entry[1][0] if entry else 0.0
+
+    def samples(self) -> Iterator[str]:
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, n in zip((*self.buckets, float('inf')), counts):
+                cumulative += n
+                yield f'{self.name}_bucket{self._label_str(key, ("le", _fmt(bound)))} {cumulative}'
+            yield f'{self.name}_sum{self._label_str(key)} {_fmt(total[0])}'
+            yield f'{self.name}_count{self._label_str(key)} {cumulative}'
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: tuple[str, ...] = (),
+                  buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        return '\n'.join(m.render() for m in self._metrics.values()) + '\n'
+
+    def clear(self) -> None:
+        """Reset every value (tests)."""
+        for m in self._metrics.values():
+            m.clear()
+
+
+REGISTRY = Registry()
+
+# HTTP
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    'http_request_duration_seconds', 'Request latency by route template.', ('method', 'route', 'status'))
+HTTP_RESPONSE_BYTES = REGISTRY.histogram(
+    'http_response_size_bytes', 'Response body size by route template.', ('method', 'route'), SIZE_BUCKETS)
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    'http_requests_in_flight', 'Requests currently being served.', ('method',))
+
+# Upstreams and heavy work
+ESPN_FETCH_SECONDS = REGISTRY.histogram(
+    'espn_fetch_duration_seconds', 'ESPN fantasy API request time by view.', ('view', 'status'))
+DB_ACQUIRE_SECONDS = REGISTRY.histogram(
+    'db_pool_acquire_seconds', 'Time waiting for a pooled DB connection by pool lane.', ('lane',))
+DB_POOL_WAITING = REGISTRY.gauge(
+    'db_pool_acquires_waiting', 'Acquires currently queued for a DB connection by pool lane.', ('lane',))
+DB_POOL_IN_USE = REGISTRY.gauge(
+    'db_pool_connections_in_use', 'DB connections currently checked out by pool lane.', ('lane',))
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    'db_query_duration_seconds', 'DB statement time by leading SQL keyword.', ('statement',))
+DB_HOT_QUERY_SECONDS = REGISTRY.histogram(
+    'db_hot_query_duration_seconds', 'Prepared hot-query time by query name.', ('query',))
+INFERENCE_SECONDS = REGISTRY.histogram(
+    'live_inference_duration_seconds', 'Stat-model inference call time.', ('method',))
+ESTIMATOR_SECONDS = REGISTRY.histogram(
+    'fantasy_estimator_duration_seconds', 'FantasyEstimator.estimate run time.')
+BATCH_JOB_SECONDS = REGISTRY.histogram(
+    'batch_job_duration_seconds', 'Worker-process batch job time by outcome.', ('job', 'status'))
+
+# Caches
+CACHE_REQUESTS = REGISTRY.counter(
+    'cache_requests_total', 'In-process cache lookups.', ('cache', 'result'))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+def record_query(logged_query) -> None:
+    """asyncpg query-logger callback (see Connection.add_query_logger)."""
+    query = (getattr(logged_query, 'query', '') or '').lstrip()
+    statement = query.split(None, 1)[0].lower() if query else 'unknown'
+    if statement not in ('select', 'insert', 'update', 'delete', 'with', 'copy'):
+        statement = 'other'
+    DB_QUERY_SECONDS.observe(float(getattr(logged_query, 'elapsed', 0.0) or 0.0), statement=statement)
+
+
+class TimedPool:
+    """Thin asyncpg pool proxy that records how long ``acquire()`` waits and
+    how many connections are queued for / checked out of its ``lane``."""
+
+    def __init__(self, pool, lane: str = 'interactive'):
+        self._pool = pool
+        self.lane = lane
+
+    def acquire(self, *, timeout: Optional[float] = None) -> '_TimedAcquire':
+        return _TimedAcquire(self._pool, timeout, self.lane)
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
+
+
+class _TimedAcquire:
+    def __init__(self, pool, timeout: Optional[float], lane: str):
+        self._pool = pool
+        self._timeout = timeout
+        self._lane = lane
+        self._conn = None
+
+    async def __aenter__(self):
+        start = time.perf_counter()
+        DB_POOL_WAITING.inc(lane=self._lane)
+        try:
+            self._conn = await self._pool.acquire(timeout=self._timeout)
+        finally:
+            DB_POOL_WAITING.dec(lane=self._lane)
+            DB_ACQUIRE_SECONDS.observe(time.perf_counter() - start, lane=self._lane)
+        DB_POOL_IN_USE.inc(lane=self._lane)
+        return self._conn
+
+    async def __aexit__(self, *exc):
+        conn, self._conn = self._conn, None
+        DB_POOL_IN_USE.dec(lane=self._lane)
+        await self._pool.release(conn)
+
+
+_UNMATCHED_ROUTE = '<unmatched>'
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: latency / size per route template, in-flight gauge.
+
+    The route label is the matched path template (``/api/teams/{team_id}``),
+    which FastAPI's router leaves in ``scope['route']``; anything unmatched
+    shares one label so scanners can't blow up the label space.
+    """
+
+    def __init__(self, app, skip_paths: tuple[str, ...] = ('/metrics',)):
+        self.app = app
+        self.skip_paths = skip_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope.get('path') in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get('method', 'GET')
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            elif message['type'] == 'http.response.body':
+                size += len(message.get('body', b''))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec(method=method)
+            route = getattr(scope.get('route'), 'path', None) or _UNMATCHED_ROUTE
+            HTTP_REQUEST_SECONDS.observe(elapsed, method=method, route=route, status=str(status))
+            HTTP_RESPONSE_BYTES.observe(size, method=method, route=route)
@@ -1,17 +1,32 @@
 """Shared player-name normalization for joining across data sources (ESPN
 site/fantasy APIs, official NBA injury PDF) that don't agree on diacritics or
-punctuation (e.g. 'Nikola Jokic' vs 'Nikola Jokić')."""
+punctuation (e.g. 'Nikola Jokic' vs 'Nikola Jokić').
+
+Normalization is memoized — the same few thousand names go through it on every
+request — and frames loaded once per cache window (the ESPN players pool) carry
+a precomputed normalized-name column from ``add_name_keys``, so joins on names
+are plain dict / merge lookups with no per-request Unicode work. NAME_OVERRIDES
+is applied on top at join time, never baked into a cached column."""
 
 import re
 import unicodedata
+from functools import lru_cache
+
+import pandas as pd
 
 _NORMALIZE_RE = re.compile(r"[^a-z0-9]")
 
+# Precomputed normalized-name column attached by add_name_keys.
+NAME_KEY_COL = "_name_key"
+# Merge column callers attach from join_keys() for the duration of a join.
+JOIN_KEY_COL = "_join_key"
+
 
 def _to_ascii(name: str) -> str:
     return unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
 
 
+@lru_cache(maxsize=16384)
 def normalize_player_name(name: str) -> str:
     return _NORMALIZE_RE.sub("", _to_ascii(name).lower())
 
@@ -23,5 +38,34 @@ NAME_OVERRIDES: dict[str, str] = {}
 
 
 def resolve_join_key(name: str) -> str:
+    # The override lookup stays outside the memo so NAME_OVERRIDES edits apply
+    # immediately.
     normalized = normalize_player_name(name)
     return NAME_OVERRIDES.get(normalized, normalized)
+
+
+def add_name_keys(df: pd.DataFrame, name_col: str = "Name") -> pd.DataFrame:
+    """Attach NAME_KEY_COL for ``name_col`` in place (each distinct name is
+    normalized once). Returns ``df`` for chaining."""
+    if name_col not in df.columns:
+        return df
+    names = df[name_col].fillna("").astype(str)
+    keys = {n: normalize_player_name(n) for n in names.unique()}
+    df[NAME_KEY_COL] = names.map(keys)
+    return df
+
+
+def name_keys(df: pd.DataFrame, name_col: str = "Name") -> pd.Series:
+    """normalize_player_name of ``name_col``, read from the precomputed column when present."""
+    if NAME_KEY_COL in df.columns:
+        return df[NAME_KEY_COL]
+    return df[name_col].fillna("").astype(str).map(normalize_player_name)
+
+
+def join_keys(df: pd.DataFrame, name_col: str = "Name") -> pd.Series:
+    """resolve_join_key of ``name_col``: name_keys with NAME_OVERRIDES applied
+    now, so override edits reach frames keyed before the edit."""
+    keys = name_keys(df, name_col)
+    if not NAME_OVERRIDES:
+        return keys
+    return keys.map(lambda k: NAME_OVERRIDES.get(k, k))
@@ -0,0 +1,23 @@
+"""Offline benchmark suite for the backend's hot paths.
+
+Usage (from backend/):
+    python -m benchmarks run                      # print timings
+    python -m benchmarks run --save               # overwrite benchmarks/baseline.json
+    python -m benchmarks compare                  # run and flag regressions vs the baseline
+    python -m benchmarks compare --threshold 0.4 --only feature_store_build
+    python -m benchmarks record                   # snapshot live ESPN payloads (needs .env)
+
+Each case times only the hot call; its inputs are built once beforehand from
+``fixtures``. Baselines are machine-specific — re-save one on the machine you
+compare on before starting performance work.
+"""
+
+import os
+
+# Without a .env, fall back to the placeholders the test suite uses so app
+# modules import. (Process env beats .env in pydantic-settings, so these must
+# not be set when one exists.)
+if not os.path.exists(".env"):
+    for _key, _value in {"SEASON_ID": "2026", "LEAGUE_ID": "1234567890"}.items():
+        os.environ.setdefault(_key, _value)
+os.environ.setdefault("LOG_LEVEL", "WARNING")
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+from benchmarks import runner
+from benchmarks.cases import CASES
+from benchmarks.fixtures import RECORDED_DIR
+
+
+async def _record(out_dir: Path) -> None:
+    """Snapshot the live ESPN payloads the ESPN-transform cases consume."""
+    from app.services.data_provider import DataProvider
+
+    dp = DataProvider()
+    players_filter = {"players": {
+        "filterStatus": {"value": ["ONTEAM", "FREEAGENT", "WAIVERS"]},
+        "sortPercOwned": {"sortPriority": 1, "sortAsc": False},
+        "limit": 1200, "offset": 0,
+    }}
+    try:
+        standings = await dp._espn_get("standings", dp.espn_standings_url)
+        players = await dp._espn_get(
+            "players", dp.espn_players_url, headers={"X-Fantasy-Filter": json.dumps(players_filter)})
+        standings.raise_for_status()
+        players.raise_for_status()
+    finally:
+        await dp.close()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "standings.json").write_text(json.dumps(standings.json()))
+    (out_dir / "players.json").write_text(json.dumps(players.json()))
+    print(f"Recorded standings.json and players.json to {out_dir}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def common(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--only", nargs="+", choices=sorted(CASES), help="cases to run (default: all)")
+        p.add_argument("--repeat", type=int, help="timed runs per case (default: per-case)")
+        p.add_argument("--seed", type=int, default=0)
+
+    p_run = sub.add_parser("run", help="time every case")
+    common(p_run)
+    p_run.add_argument("--save", action="store_true", help="write the results to the baseline file")
+    p_run.add_argument("--output", type=Path, default=runner.BASELINE_PATH)
+
+    p_cmp = sub.add_parser("compare", help="run and compare with the baseline; exit 1 on regression")
+    common(p_cmp)
+    p_cmp.add_argument("--baseline", type=Path, default=runner.BASELINE_PATH)
+    p_cmp.add_argument("--threshold", type=float, default=0.25,
+                       help="allowed slowdown as a fraction of the baseline median (default 0.25)")
+    p_cmp.add_argument("--memory-threshold", type=float, default=None,
+                       help="allowed peak-memory growth fraction (default: --threshold)")
+
+    p_rec = sub.add_parser("record", help="save live ESPN payloads for the transform cases")
+    p_rec.add_argument("--out", type=Path, default=RECORDED_DIR)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.command == "record":
+        asyncio.run(_record(args.out))
+        return 0
+
+    report = runner.run(args.only, args.repeat, args.seed)
+    if args.command == "run":
+        if args.save:
+            runner.save(report, args.output)
+            print(f"Saved {len(report['cases'])} case(s) to {args.output}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline} — create one with: python -m benchmarks run --save")
+        return 2
+    rows = runner.compare(runner.load(args.baseline), report, args.threshold, args.memory_threshold)
+    print()
+    print(runner.format_comparison(rows))
+    regressed = [r["name"] for r in rows if r["regressed"]]
+    if regressed:
+        print(f"\n{len(regressed)} regression(s): {', '.join(regressed)}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""Benchmark cases. Each is a context manager that builds its inputs from the
+shared ``Fixtures`` and yields the zero-argument callable to time (a coroutine
+function is fine — the runner drives it on one event loop)."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fixtures import FANTASY_TEAM_MAP, Fixtures
+
+CaseSetup = Callable[[Fixtures], Iterator[Callable[[], Any]]]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[[Fixtures], Any]  # contextmanager factory
+    repeat: int = 10
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, repeat: int = 10):
+    def register(fn: CaseSetup) -> CaseSetup:
+        CASES[name] = Case(name, contextmanager(fn), repeat)
+        return fn
+    return register
+
+
+# --- ESPN payload transforms ---------------------------------------------------
+
+@case("raw_all_players_to_df")
+def _raw_all_players(fx: Fixtures):
+    from app.services.data_transformer import DataTransformer
+
+    transformer, payload = DataTransformer(), fx.players_payload
+    yield lambda: transformer.raw_all_players_to_df(payload, 0, FANTASY_TEAM_MAP)
+
+
+@case("calculate_rankings", repeat=50)
+def _calculate_rankings(fx: Fixtures):
+    from app.services.stats_calculator import StatsCalculator
+
+    calc, averages = StatsCalculator(), fx.averages_df
+    yield lambda: calc.calculate_rankings(averages)
+
+
+@case("normalize_for_heatmap", repeat=50)
+def _normalize_for_heatmap(fx: Fixtures):
+    from app.services.stats_calculator import StatsCalculator
+
+    calc, averages = StatsCalculator(), fx.averages_df
+    yield lambda: calc.normalize_for_heatmap(averages)
+
+
+# --- Estimator -------------------------------------------------------------------
+
+@case("fantasy_estimator", repeat=3)
+def _fantasy_estimator(fx: Fixtures):
+    from app.fantsy_estimator import FantasyEstimator
+
+    snapshots = fx.snapshots
+    yield lambda: FantasyEstimator().estimate(snapshots, 65.9)
+
+
+# --- Stat models -------------------------------------------------------------------
+
+@case("feature_store_build", repeat=3)
+def _feature_store_build(fx: Fixtures):
+    from model_stats_inference.serving.feature_store import FeatureStore
+
+    players, (allowed, own) = fx.history[0], fx.team_tables
+    yield lambda: FeatureStore.build(players, allowed, own)
+
+
+@case("predict_many_full_slate", repeat=5)
+def _predict_many(fx: Fixtures):
+    from app.utils.team_abbr_map import team_id_for_abbr
+    from model_stats_inference.serving.inference import LiveInference, PredictionRequest
+
+    store = fx.feature_store
+    inference = LiveInference(store)
+    pv = store.player_vectors
+    game_date = pd.Timestamp(pv["last_game_date"].max()) + pd.Timedelta(days=2)
+    team_of = {int(pid): int(team) for pid, team in zip(pv["PLAYER_ID"], pv["TEAM_ID"])}
+    slate = {team_id_for_abbr(a): (team_id_for_abbr(o), home) for a, (o, home) in fx.slate.items()}
+    requests = [
+        PredictionRequest(player_id=pid, opponent_team_id=slate[team][0], is_home=slate[team][1],
+                          game_date=game_date, minutes=28.0)
+        for pid, team in team_of.items() if team in slate
+    ]
+    yield lambda: inference.predict_many(requests)
+
+
+# --- Trend calculators --------------------------------------------------------------
+
+@case("trend_regression_groups")
+def _trend_regression(fx: Fixtures):
+    from app.services.trend_service import compute_regression_groups
+
+    t = fx.trend_inputs
+    yield lambda: compute_regression_groups(
+        t["season"], t["baseline"], t["games_last_15d"], t["players_df"], window_df=t["window"])
+
+
+@case("trend_minutes_movers")
+def _trend_minutes(fx: Fixtures):
+    from app.services.trend_service import compute_minutes_movers
+
+    t = fx.trend_inputs
+    yield lambda: compute_minutes_movers(t["season"], t["window"], t["games_last_15d"], t["players_df"])
+
+
+@case("trend_usage_role", repeat=5)
+def _trend_usage(fx: Fixtures):
+    from app.services.trend_service import compute_usage_role
+
+    t = fx.trend_inputs
+    yield lambda: compute_usage_role(t["usage"], t["games_last_15d"], t["players_df"], t["window_start"])
+
+
+# --- Route assembly -------------------------------------------------------------------
+
+@case("matchups_today_assembly")
+def _matchups_today(fx: Fixtures):
+    """/api/matchups/today with every upstream (schedule, defense, ESPN pool,
+    depth charts, injuries, model batch) answered from memory, so only the
+    handler's own join + response-model assembly is timed."""
+    from app.routes import matchups
+    from app.services.nba_matchup_service import GameInfo
+    from app.utils.name_matching import name_keys
+
+    players_df = fx.players_df
+    games = {abbr: GameInfo(opponent=opp, is_home=home) for abbr, (opp, home) in fx.slate.items()}
+    rng = np.random.default_rng(fx.seed)
+    stat_keys = ("pts", "reb", "ast", "stl", "blk", "three_pm", "fg_pct")
+    order = list(games)
+    all_def = {
+        "ranks": {a: {k: int(rng.integers(1, 31)) for k in stat_keys} for a in order},
+        "values": {a: {k: float(rng.uniform(0, 1) if k == "fg_pct" else rng.uniform(5, 115)) for k in stat_keys}
+                   for a in order},
+        "league_avg_values": {k: 0.47 if k == "fg_pct" else 50.0 for k in stat_keys},
+        "pace": {a: float(rng.normal(99, 2)) for a in order},
+    }
+    keys = name_keys(players_df)
+    depth = {a: set(keys[players_df["Pro Team"] == a].head(10)) for a in order}
+    injuries = [{"player": n, "status": "Out"} for n in players_df["Name"].iloc[::25]]
+    stats = {k: 10.0 for k in ("pts", "reb", "ast", "three_pm", "stl", "blk", "fgm", "fga", "fg_pct",
+                                "ftm", "fta", "ft_pct")}
+    projections = {
+        n: {"default_minutes": 28.0, "status": "green", "reason": "", "stats": stats}
+        for n in players_df["Name"] if n
+    }
+
+    matchup_service = MagicMock()
+    matchup_service.get_games_today = AsyncMock(return_value=games)
+    matchup_service.get_all_def_data = AsyncMock(return_value=all_def)
+    matchup_service.get_schedule_date = MagicMock(return_value=date.today().isoformat())
+    data_provider = MagicMock()
+    data_provider.get_players_df = AsyncMock(return_value=players_df)
+    depth_service = MagicMock()
+    depth_service.get_on_depth_chart_names = AsyncMock(return_value=depth)
+    projection_service = MagicMock()
+    projection_service.project_today = AsyncMock(return_value=projections)
+    db = MagicMock()
+    db.return_value.load_all_injury_statuses = AsyncMock(return_value=injuries)
+
+    async def run():
+        matchups.clear_matchup_response_cache()
+        return await matchups.get_matchups_today(date=None)
+
+    with patch.object(matchups, "_matchup_service", matchup_service), \
+            patch.object(matchups, "_data_provider", data_provider), \
+            patch.object(matchups, "_depth_chart_service", depth_service), \
+            patch.object(matchups, "_projection_service", projection_service), \
+            patch.object(matchups, "DBService", db):
+        yield run
@@ -0,0 +1,294 @@
+"""Deterministic inputs for the benchmark cases — no network, no database.
+
+ESPN payloads come from ``benchmarks/recorded/<name>.json`` when a recorded copy
+exists (see ``python -m benchmarks record``) and are otherwise synthesized in
+the same shape at production scale: a 12-team league, a ~1000-player
+kona_player_info pool. The ``fs_player_games`` history is a synthetic season in
+the pipeline frame layout ``DBService.fs_records_to_frame`` produces: 30 NBA
+teams, 15 players each, a full 15-game slate every other day.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.services.data_transformer import DataTransformer
+from app.utils.constants import ESPN_COLUMN_MAP, PRO_TEAM_MAP
+from app.utils.name_matching import add_name_keys
+from app.utils.team_abbr_map import TEAM_ID_TO_ABBR, TEAM_IDS
+from model_stats_inference.research import data as rdata
+from model_stats_inference.serving.feature_store import FeatureStore
+
+RECORDED_DIR = Path(__file__).resolve().parent / "recorded"
+
+N_FANTASY_TEAMS = 12
+FANTASY_TEAM_MAP = {i: f"Fantasy Team {i:02d}" for i in range(1, N_FANTASY_TEAMS + 1)}
+POOL_SIZE = 1000
+PLAYERS_PER_TEAM = 15
+HISTORY_DATES = 40
+HISTORY_SEASON = "2025-26"
+HISTORY_START = pd.Timestamp("2025-10-22")
+
+_STAT_ID = {col: key for key, col in ESPN_COLUMN_MAP.items()}
+
+# Per-minute production rates (rough NBA scale), as in the serving test fixtures.
+_RATES = {
+    "PTS": 0.60, "REB": 0.25, "OREB": 0.07, "DREB": 0.18, "AST": 0.15,
+    "FG3M": 0.06, "FG3A": 0.18, "STL": 0.04, "BLK": 0.03, "TOV": 0.07,
+    "FGM": 0.22, "FGA": 0.45, "FTM": 0.12, "FTA": 0.15, "PF": 0.07,
+}
+_POSITIONS = ["G", "G", "G-F", "F", "F", "F-C", "C"]
+
+
+def player_name(i: int) -> str:
+    return f"Bench Player{i:04d}"
+
+
+def load_recorded(name: str) -> dict | None:
+    path = RECORDED_DIR / f"{name}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _standings_payload(rng: np.random.Generator) -> dict:
+    teams = []
+    for team_id in range(1, N_FANTASY_TEAMS + 1):
+        gp = int(rng.integers(300, 340))
+        fga = gp * rng.uniform(11, 13)
+        fta = gp * rng.uniform(3.5, 4.5)
+        totals = {
+            "GP": gp, "FGA": fga, "FGM": fga * rng.uniform(0.44, 0.5),
+            "FTA": fta, "FTM": fta * rng.uniform(0.74, 0.82),
+            "3PM": gp * rng.uniform(1.5, 2.2), "REB": gp * rng.uniform(5, 6.5),
+            "AST": gp * rng.uniform(3, 4), "STL": gp * rng.uniform(0.9, 1.2),
+            "BLK": gp * rng.uniform(0.5, 0.8), "PTS": gp * rng.uniform(14, 17),
+        }
+        values = {_STAT_ID[k]: float(round(v)) for k, v in totals.items()}
+        values[_STAT_ID["FG%"]] = values[_STAT_ID["FGM"]] / values[_STAT_ID["FGA"]]
+        values[_STAT_ID["FT%"]] = values[_STAT_ID["FTM"]] / values[_STAT_ID["FTA"]]
+        teams.append({"id": team_id, "name": FANTASY_TEAM_MAP[team_id], "valuesByStat": values})
+    return {"scoringPeriodId": 60, "teams": teams}
+
+
+def _players_payload(rng: np.random.Generator) -> dict:
+    pro_team_ids = [t for t in PRO_TEAM_MAP if t != 0]
+    entries = []
+    for i in range(POOL_SIZE):
+        rostered = i < len(pro_team_ids) * PLAYERS_PER_TEAM
+        pro_team = pro_team_ids[i % len(pro_team_ids)] if rostered else int(rng.choice([0, *pro_team_ids]))
+        on_team = int(rng.integers(1, N_FANTASY_TEAMS + 1)) if i < 13 * N_FANTASY_TEAMS else 0
+        stats = []
+        for split in (0, 1, 2, 3):
+            gp = float(rng.integers(3, 60))
+            mpg = float(rng.uniform(8, 36))
+            per_game = {k: _RATES[k] * mpg for k in ("PTS", "REB", "AST", "STL", "BLK", "FGM", "FGA", "FTM", "FTA")}
+            per_game["3PM"] = _RATES["FG3M"] * mpg
+            raw = {_STAT_ID[k]: round(v * gp, 1) for k, v in per_game.items()}
+            raw[_STAT_ID["GP"]] = gp
+            raw[_STAT_ID["MIN"]] = round(mpg * gp, 1)
+            raw[_STAT_ID["FG%"]] = raw[_STAT_ID["FGM"]] / max(raw[_STAT_ID["FGA"]], 1)
+            raw[_STAT_ID["FT%"]] = raw[_STAT_ID["FTM"]] / max(raw[_STAT_ID["FTA"]], 1)
+            raw["99"] = 1.0  # unmapped stat ids are present in real payloads
+            stats.append({"scoringPeriodId": 0, "statSplitTypeId": split,
+                          "seasonId": settings.season_id, "stats": raw})
+            # per-scoring-period rows the transformer must skip
+            stats.append({"scoringPeriodId": 12, "statSplitTypeId": split,
+                          "seasonId": settings.season_id, "stats": raw})
+        entries.append({
+            "id": 100000 + i,
+            "onTeamId": on_team,
+            "status": "ONTEAM" if on_team else "FREEAGENT",
+            "ratings": {str(s): {"totalRating": float(rng.normal(0, 5))} for s in range(4)},
+            "player": {
+                "id": 100000 + i,
+                "fullName": player_name(i),
+                "proTeamId": pro_team,
+                "injured": bool(rng.random() < 0.05),
+                "eligibleSlots": sorted(rng.choice(5, size=2, replace=False).tolist()) + [5, 11, 12],
+                "stats": stats,
+            },
+        })
+    return {"players": entries}
+
+
+def _history(rng: np.random.Generator) -> tuple[pd.DataFrame, pd.DataFrame]:
+    team_ids = sorted(TEAM_IDS)
+    player_rows, team_rows = [], []
+    roster = {t: [k * len(team_ids) + j for k in range(PLAYERS_PER_TEAM)] for j, t in enumerate(team_ids)}
+    factor = rng.uniform(0.6, 1.4, size=len(team_ids) * PLAYERS_PER_TEAM)
+    game_no = 0
+    for d in range(HISTORY_DATES):
+        game_date = HISTORY_START + pd.Timedelta(days=2 * d)
+        order = rng.permutation(team_ids)
+        for home, away in zip(order[::2], order[1::2]):
+            gid = f"0022500{game_no:04d}"
+            game_no += 1
+            for team, opp, is_home in ((home, away, True), (away, home, False)):
+                team_rows.append({
+                    "SEASON": HISTORY_SEASON, "TEAM_ID": int(team), "GAME_ID": gid, "GAME_DATE": game_date,
+                    "PTS": round(rng.normal(112, 9)), "REB": round(rng.normal(44, 5)),
+                    "AST": round(rng.normal(25, 4)), "STL": round(rng.normal(7, 2)),
+                    "BLK": round(rng.normal(5, 2)), "FG3M": round(rng.normal(12, 3)),
+                    "FG_PCT": round(float(rng.normal(0.47, 0.04)), 3),
+                    "FGA": round(rng.normal(88, 6)), "FTA": round(rng.normal(20, 5)),
+                    "TOV": round(rng.normal(14, 3)), "MIN": 240.0,
+                })
+                for slot, pid in enumerate(roster[int(team)]):
+                    if rng.random() < 0.08:
+                        continue
+                    mins = float(np.clip(rng.normal(34 - 1.8 * slot, 4), 4, 44))
+                    row = {
+                        "SEASON": HISTORY_SEASON, "PLAYER_ID": pid + 1, "PLAYER_NAME": player_name(pid),
+                        "TEAM_ID": int(team), "GAME_ID": gid, "GAME_DATE": game_date,
+                        "MATCHUP": f"{TEAM_ID_TO_ABBR[int(team)]} {'vs.' if is_home else '@'} {TEAM_ID_TO_ABBR[int(opp)]}",
+                        "POSITION": _POSITIONS[slot % len(_POSITIONS)], "MIN": round(mins, 1),
+                        "PLUS_MINUS": float(round(rng.normal(0, 8))),
+                    }
+                    for stat, rate in _RATES.items():
+                        noise = rng.normal(0, max(1.0, rate * mins * 0.2))
+                        row[stat] = max(0, round(rate * factor[pid] * mins + noise))
+                    row["FGA"] = max(row["FGA"], row["FGM"])
+                    row["FTA"] = max(row["FTA"], row["FTM"])
+                    row["FG3A"] = max(row["FG3A"], row["FG3M"])
+                    player_rows.append(row)
+    return pd.DataFrame(player_rows), pd.DataFrame(team_rows)
+
+
+def _snapshots(rng: np.random.Generator, n_days: int = 90) -> pd.DataFrame:
+    """team_daily_snapshot rows (cumulative totals) for FantasyEstimator."""
+    rows, start = [], date(2025, 10, 22)
+    totals = {t: np.zeros(10) for t in range(1, N_FANTASY_TEAMS + 1)}
+    gp = {t: 0 for t in totals}
+    for day in range(n_days):
+        for t in totals:
+            games = int(rng.integers(0, 9))
+            fga = games * rng.uniform(11, 13)
+            fta = games * rng.uniform(3.5, 4.5)
+            totals[t] += [fga * 0.47, fga, fta * 0.78, fta, games * 1.8, games * 5.7,
+                          games * 3.5, games * 1.0, games * 0.65, games * 15.5]
+            gp[t] += games
+            fgm, fga_, ftm, fta_, tpm, reb, ast, stl, blk, pts = (int(v) for v in totals[t])
+            rows.append({
+                "id": len(rows) + 1, "scoring_period_id": day + 1, "date": start + timedelta(days=day),
+                "team_id": t, "team_name": FANTASY_TEAM_MAP[t], "gp": gp[t],
+                "fgm": fgm, "fga": fga_, "fg_pct": fgm / fga_ if fga_ else 0.0,
+                "ftm": ftm, "fta": fta_, "ft_pct": ftm / fta_ if fta_ else 0.0,
+                "three_pm": tpm, "reb": reb, "ast": ast, "stl": stl, "blk": blk, "pts": pts,
+                "created_at": pd.Timestamp(start + timedelta(days=day)),
+            })
+    return pd.DataFrame(rows)
+
+
+def _trend_inputs(history: tuple[pd.DataFrame, pd.DataFrame], players_df: pd.DataFrame,
+                  rng: np.random.Generator) -> dict:
+    players, team_logs = history
+    games = players.rename(columns={"PLAYER_ID": "player_id", "PLAYER_NAME": "player_name"})
+    last = games["GAME_DATE"].max()
+
+    def totals(df: pd.DataFrame, scale: float = 1.0) -> pd.DataFrame:
+        agg = df.groupby(["player_id", "player_name"], as_index=False).agg(
+            gp=("GAME_ID", "count"), fg3m=("FG3M", "sum"), fg3a=("FG3A", "sum"),
+            ftm=("FTM", "sum"), fta=("FTA", "sum"), fgm=("FGM", "sum"), fga=("FGA", "sum"),
+            min=("MIN", "sum"),
+        )
+        for col in ("gp", "fg3m", "fg3a", "ftm", "fta", "fgm", "fga", "min"):
+            agg[col] = agg[col] * scale
+        for made, att in (("fg3m", "fg3a"), ("ftm", "fta"), ("fgm", "fga")):
+            agg[f"{made[:-1]}_pct"] = (agg[made] / agg[att].replace(0, np.nan)).fillna(0.0)
+        return agg
+
+    # Prior seasons: twice the volume, 3P% shifted per player so some qualify.
+    baseline = totals(games, scale=2.0)
+    baseline["fg3m"] = (baseline["fg3m"] * rng.uniform(0.8, 1.2, len(baseline))).round()
+    baseline["fg3_pct"] = (baseline["fg3m"] / baseline["fg3a"].replace(0, np.nan)).fillna(0.0)
+
+    team = team_logs.set_index(["GAME_ID", "TEAM_ID"])
+    keys = pd.MultiIndex.from_arrays([games["GAME_ID"], games["TEAM_ID"]])
+    usage = pd.DataFrame({
+        "player_id": games["player_id"], "player_name": games["player_name"],
+        "game_id": games["GAME_ID"], "game_date": games["GAME_DATE"].dt.date,
+        "p_min": games["MIN"], "p_fga": games["FGA"], "p_fta": games["FTA"], "p_tov": games["TOV"],
+        "t_fga": team["FGA"].reindex(keys).to_numpy(), "t_fta": team["FTA"].reindex(keys).to_numpy(),
+        "t_tov": team["TOV"].reindex(keys).to_numpy(), "t_min": 240.0,
+    })
+    recent = games[games["GAME_DATE"] > last - pd.Timedelta(days=15)]
+    return {
+        "season": totals(games),
+        "baseline": baseline,
+        "window": totals(games[games["GAME_DATE"] > last - pd.Timedelta(days=10)]),
+        "usage": usage,
+        "games_last_15d": recent.groupby("player_id").size().to_dict(),
+        "window_start": (last - pd.Timedelta(days=10)).date(),
+        "players_df": players_df,
+    }
+
+
+@dataclass
+class Fixtures:
+    seed: int = 0
+
+    def _rng(self, salt: int) -> np.random.Generator:
+        return np.random.default_rng([self.seed, salt])
+
+    @cached_property
+    def standings_payload(self) -> dict:
+        return load_recorded("standings") or _standings_payload(self._rng(1))
+
+    @cached_property
+    def players_payload(self) -> dict:
+        return load_recorded("players") or _players_payload(self._rng(2))
+
+    @cached_property
+    def history(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """(fs_player_games, fs_team_games) pipeline frames."""
+        return _history(self._rng(3))
+
+    @cached_property
+    def snapshots(self) -> pd.DataFrame:
+        return _snapshots(self._rng(4))
+
+    @cached_property
+    def slate(self) -> dict[str, tuple[str, bool]]:
+        """Canonical abbr -> (opponent abbr, is_home) for a full 15-game slate."""
+        abbrs = sorted(TEAM_ID_TO_ABBR.values())
+        order = self._rng(5).permutation(abbrs)
+        out = {}
+        for home, away in zip(order[::2], order[1::2]):
+            out[str(home)] = (str(away), True)
+            out[str(away)] = (str(home), False)
+        return out
+
+    # Derived inputs, built once and shared by the cases that need them.
+
+    @cached_property
+    def players_df(self) -> pd.DataFrame:
+        """The ESPN pool frame as DataProvider caches it (name keys attached)."""
+        return add_name_keys(DataTransformer().raw_all_players_to_df(self.players_payload, 0, FANTASY_TEAM_MAP))
+
+    @cached_property
+    def averages_df(self) -> pd.DataFrame:
+        transformer = DataTransformer()
+        return transformer.totals_to_averages_df(transformer.raw_standings_to_totals_df(self.standings_payload))
+
+    @cached_property
+    def team_tables(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        _, team_logs = self.history
+        return rdata.build_team_allowed(team_logs), rdata.build_team_own(team_logs)
+
+    @cached_property
+    def feature_store(self) -> FeatureStore:
+        return FeatureStore.build(self.history[0], *self.team_tables)
+
+    @cached_property
+    def trend_inputs(self) -> dict:
+        """Aggregates in the shapes TrendService hands its pure calculators."""
+        return _trend_inputs(self.history, self.players_df, self._rng(6))
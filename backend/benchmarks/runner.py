@@ -0,0 +1,148 @@
+"""Timing, peak-memory measurement and baseline comparison."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import inspect
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.cases import CASES, Case
+from benchmarks.fixtures import Fixtures
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# Below this much absolute slowdown a relative regression is treated as noise
+# (sub-millisecond cases jitter by more than any sensible threshold).
+MIN_TIME_DELTA_S = 0.002
+MIN_MEMORY_DELTA_MIB = 1.0
+
+
+@dataclass
+class Result:
+    median_s: float
+    min_s: float
+    repeat: int
+    peak_mib: float
+
+
+def _call(fn: Callable[[], Any], loop: asyncio.AbstractEventLoop) -> Any:
+    out = fn()
+    if inspect.isawaitable(out):
+        out = loop.run_until_complete(out)
+    return out
+
+
+def measure(case: Case, fixtures: Fixtures, repeat: int | None = None) -> Result:
+    """One warm-up call, ``repeat`` timed calls, then one call under tracemalloc
+    for the peak (traced separately — tracing slows the timed runs down)."""
+    repeat = repeat or case.repeat
+    loop = asyncio.new_event_loop()
+    try:
+        with case.setup(fixtures) as fn:
+            _call(fn, loop)
+            times = []
+            for _ in range(repeat):
+                gc.collect()
+                start = time.perf_counter()
+                _call(fn, loop)
+                times.append(time.perf_counter() - start)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                _call(fn, loop)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    finally:
+        loop.close()
+    return Result(
+        median_s=statistics.median(times), min_s=min(times), repeat=repeat,
+        peak_mib=peak / (1024 * 1024),
+    )
+
+
+def run(names: Iterable[str] | None = None, repeat: int | None = None, seed: int = 0,
+        log: Callable[[str], None] = print) -> dict:
+    fixtures = Fixtures(seed=seed)
+    selected = list(names) if names else list(CASES)
+    unknown = [n for n in selected if n not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {unknown}. Known: {sorted(CASES)}")
+    results = {}
+    for name in selected:
+        result = measure(CASES[name], fixtures, repeat)
+        results[name] = asdict(result)
+        log(f"{name:<28} median {result.median_s * 1000:10.2f} ms   min {result.min_s * 1000:10.2f} ms"
+            f"   peak {result.peak_mib:8.1f} MiB")
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "seed": seed,
+        },
+        "cases": results,
+    }
+
+
+def save(report: dict, path: Path = BASELINE_PATH, merge: bool = True) -> None:
+    """Write the report; with ``merge``, cases not re-run keep their old baseline."""
+    if merge and path.exists():
+        old = json.loads(path.read_text())
+        report = {"meta": report["meta"], "cases": {**old.get("cases", {}), **report["cases"]}}
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: Path = BASELINE_PATH) -> dict:
+    return json.loads(path.read_text())
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.25,
+            memory_threshold: float | None = None) -> list[dict]:
+    """One row per case present in both reports. ``regressed`` is set when the
+    median time (or peak memory) grew by more than the threshold fraction and by
+    more than the absolute noise floor."""
+    memory_threshold = threshold if memory_threshold is None else memory_threshold
+    rows = []
+    for name, cur in current["cases"].items():
+        base = baseline["cases"].get(name)
+        if base is None:
+            continue
+        time_ratio = cur["median_s"] / base["median_s"] if base["median_s"] else float("inf")
+        mem_ratio = cur["peak_mib"] / base["peak_mib"] if base["peak_mib"] else 1.0
+        slow = (time_ratio > 1 + threshold
+                and cur["median_s"] - base["median_s"] > MIN_TIME_DELTA_S)
+        fat = (mem_ratio > 1 + memory_threshold
+               and cur["peak_mib"] - base["peak_mib"] > MIN_MEMORY_DELTA_MIB)
+        rows.append({
+            "name": name, "time_ratio": time_ratio, "memory_ratio": mem_ratio,
+            "baseline_s": base["median_s"], "current_s": cur["median_s"],
+            "baseline_mib": base["peak_mib"], "current_mib": cur["peak_mib"],
+            "regressed": slow or fat,
+        })
+    return rows
+
+
+def format_comparison(rows: list[dict]) -> str:
+    lines = [f"{'case':<28} {'base ms':>10} {'now ms':>10} {'x time':>7} {'base MiB':>9} {'now MiB':>9} {'x mem':>6}"]
+    for r in rows:
+        flag = "  REGRESSION" if r["regressed"] else ""
+        lines.append(
+            f"{r['name']:<28} {r['baseline_s'] * 1000:10.2f} {r['current_s'] * 1000:10.2f} {r['time_ratio']:7.2f}"
+            f" {r['baseline_mib']:9.1f} {r['current_mib']:9.1f} {r['memory_ratio']:6.2f}{flag}"
+        )
+    return "\n".join(lines)
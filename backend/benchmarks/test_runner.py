@@ -0,0 +1,51 @@
+import json
+
+from benchmarks import runner
+
+
+def _report(**cases):
+    return {"meta": {}, "cases": {
+        name: {"median_s": t, "min_s": t, "repeat": 3, "peak_mib": m} for name, (t, m) in cases.items()
+    }}
+
+
+def test_compare_flags_time_and_memory_regressions():
+    baseline = _report(slow=(1.0, 10.0), fat=(1.0, 10.0), steady=(1.0, 10.0), tiny=(0.0005, 0.1))
+    current = _report(slow=(1.4, 10.0), fat=(1.0, 20.0), steady=(1.1, 11.0), tiny=(0.0010, 0.5), new=(1.0, 1.0))
+
+    rows = {r["name"]: r for r in runner.compare(baseline, current, threshold=0.25)}
+
+    assert set(rows) == {"slow", "fat", "steady", "tiny"}      # no baseline for "new"
+    assert rows["slow"]["regressed"] and rows["fat"]["regressed"]
+    assert not rows["steady"]["regressed"]
+    # 2x slower but under the absolute noise floors
+    assert rows["tiny"]["time_ratio"] == 2.0 and not rows["tiny"]["regressed"]
+    assert "REGRESSION" in runner.format_comparison(list(rows.values()))
+
+
+def test_save_merges_with_existing_baseline(tmp_path):
+    path = tmp_path / "baseline.json"
+    runner.save(_report(a=(1.0, 1.0), b=(2.0, 2.0)), path)
+    runner.save(_report(b=(3.0, 3.0)), path)
+
+    cases = json.loads(path.read_text())["cases"]
+    assert cases["a"]["median_s"] == 1.0 and cases["b"]["median_s"] == 3.0
+
+
+def test_measure_runs_sync_and_async_cases():
+    from contextlib import contextmanager
+
+    from benchmarks.cases import Case
+
+    calls = []
+
+    @contextmanager
+    def setup(fx):
+        async def work():
+            calls.append(1)
+            return sum(range(1000))
+        yield work
+
+    result = runner.measure(Case("demo", setup, repeat=3), fixtures=None)
+    assert len(calls) == 5            # warm-up + 3 timed + 1 traced
+    assert result.repeat == 3 and result.min_s <= result.median_s
@@ -0,0 +1,14 @@
+-- The /api/league/draft-report response, materialized once the draft is
+-- complete. `picks` keeps the resolved pick rows (incl. player names, the only
+-- part of the ESPN players directory the report needs) so a team rename is
+-- re-encoded from here without calling ESPN; `team_names` is what `body` was
+-- encoded with.
+CREATE TABLE IF NOT EXISTS draft_report (
+    season_id INT PRIMARY KEY,
+    etag TEXT NOT NULL,
+    body BYTEA NOT NULL,
+    picks JSONB NOT NULL,
+    team_names JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
@@ -49,3 +49,13 @@ CREATE TABLE IF NOT EXISTS estimator_rank_probability (
     created_at TIMESTAMPTZ DEFAULT NOW(),
     PRIMARY KEY (team_id, rank)
 );
+
+-- The /api/estimator/results response, encoded once per run so a cold start
+-- serves one row instead of rebuilding it from the three tables above.
+CREATE TABLE IF NOT EXISTS estimator_payload (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    as_of_date DATE,
+    etag TEXT NOT NULL,
+    body BYTEA NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
@@ -7,6 +7,14 @@ order (``TimeSeriesSplit``) so the selection never peeks at the future.
 
 Honest generalization metrics come from a separate chronological holdout (train
 on the earliest 80% of games, score the latest 20%).
+
+Targets are selected together (``select_targets``). Every target whose usable rows
+are the same set shares one imputed/standardized matrix, one holdout transform and,
+per chronological fold, one centered training block with its Gram matrix — the
+only parts of LassoCV that do not depend on y. Only the alpha path (which
+coordinate descent warm-starts from one alpha to the next) and the final refits run
+per target, on a thread pool. The arithmetic is exactly LassoCV's, so alphas,
+coefficients and holdout metrics are unchanged.
 """
 
 from __future__ import annotations
@@ -15,7 +23,8 @@ from dataclasses import dataclass, field
 
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import Lasso, LassoCV
+from joblib import Parallel, delayed
+from sklearn.linear_model import Lasso, lasso_path
 from sklearn.metrics import mean_absolute_error, r2_score
 from sklearn.model_selection import TimeSeriesSplit
 from sklearn.pipeline import Pipeline
@@ -62,17 +71,110 @@ def _prepare(matrix: pd.DataFrame, feature_cols: list[str], target: str):
     return X, y
 
 
-def select_for_target(matrix: pd.DataFrame, feature_cols: list[str], target: str) -> SelectionResult:
-    X, y = _prepare(matrix, feature_cols, target)
-    tscv = TimeSeriesSplit(n_splits=config.CV_SPLITS)
+# LassoCV(cv=TimeSeriesSplit(CV_SPLITS), max_iter=5000, random_state=0) defaults,
+# spelled out because the path below replays its fit step by step.
+_EPS = 1e-3
+_N_ALPHAS = 100
+_MAX_ITER = 5000
+_TOL = 1e-4
+
+
+@dataclass
+class _Fold:
+    """One chronological CV fold of a row group; target-independent."""
+
+    train: np.ndarray
+    test: np.ndarray
+    X_train: np.ndarray          # centered, Fortran-ordered for coordinate descent
+    X_offset: np.ndarray
+    gram: np.ndarray
+    X_test: np.ndarray
+
+
+@dataclass
+class _RowGroup:
+    """Targets with identical usable rows, and everything derived from X alone."""
+
+    targets: list[str]
+    Y: dict[str, np.ndarray]
+    Xs: np.ndarray                   # impute+scale fit on all rows (Fortran)
+    folds: list[_Fold]
+    Xs_tr: np.ndarray                # impute+scale fit on the first 80% ...
+    Xs_te: np.ndarray                # ... applied to the last 20%
+    split: int
+
+
+def _row_groups(matrix: pd.DataFrame, feature_cols: list[str], targets: list[str]) -> list[_RowGroup]:
+    history = (matrix["HISTORY_GAMES"] >= config.MIN_HISTORY_GAMES).to_numpy()
+    by_rows: dict[bytes, list[str]] = {}
+    for target in targets:
+        mask = history & matrix[f"y_{target}"].notna().to_numpy()
+        by_rows.setdefault(np.packbits(mask).tobytes(), []).append(target)
+
+    groups = []
+    for members in by_rows.values():
+        # Same rows in the same order -> _prepare sorts them identically for every
+        # member, so one call stands in for all of them.
+        X, y0 = _prepare(matrix, feature_cols, members[0])
+        Y = {t: matrix.loc[y0.index, f"y_{t}"].astype(float).to_numpy() for t in members}
+
+        Xs = np.asfortranarray(_pipeline("passthrough").fit_transform(X), dtype=np.float64)
+        folds = []
+        for train, test in TimeSeriesSplit(n_splits=config.CV_SPLITS).split(Xs):
+            X_train = np.asfortranarray(Xs[train])
+            X_offset = np.average(X_train, axis=0)
+            X_train -= X_offset
+            gram = np.empty((Xs.shape[1], Xs.shape[1]), dtype=Xs.dtype, order="C")
+            np.dot(X_train.T, X_train, out=gram)
+            folds.append(_Fold(train, test, X_train, X_offset, gram, Xs[test]))
 
-    # --- selection model: LassoCV on all rows, alpha by chronological CV -----
-    select_pipe = _pipeline(
-        LassoCV(cv=tscv, max_iter=5000, n_jobs=-1, random_state=0)
+        split = int(len(X) * 0.8)
+        holdout = _pipeline("passthrough")
+        Xs_tr = holdout.fit_transform(X.iloc[:split])
+        Xs_te = holdout.transform(X.iloc[split:])
+        groups.append(_RowGroup(members, Y, Xs, folds, Xs_tr, Xs_te, split))
+    return groups
+
+
+def _alpha_grid(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """LassoCV's alpha grid: from the smallest alpha that zeroes every coefficient,
+    max|X_c^T y_c| / n on the centered data, down to ``_EPS`` of it, log-spaced."""
+    y = y - np.average(y)
+    Xy = X.T @ y - np.average(X, axis=0) * np.sum(y)
+    alpha_max = np.sqrt(np.max(Xy ** 2)) / X.shape[0]
+    if alpha_max <= np.finfo(np.float64).resolution:
+        return np.full(_N_ALPHAS, np.finfo(np.float64).resolution)
+    return np.geomspace(alpha_max, alpha_max * _EPS, num=_N_ALPHAS)
+
+
+def _fold_mse(fold: _Fold, y: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+    """Test MSE along the alpha path for one fold — LassoCV's _path_residuals with
+    the fold's centering and Gram matrix supplied instead of recomputed."""
+    y_train = y[fold.train]
+    y_offset = np.average(y_train, axis=0)
+    y_train -= y_offset
+    Xy = np.empty(fold.X_train.shape[1], dtype=fold.X_train.dtype, order="C")
+    np.dot(fold.X_train.T, y_train, out=Xy)
+    _, coefs, _ = lasso_path(
+        fold.X_train, y_train, eps=_EPS, alphas=alphas, precompute=fold.gram, Xy=Xy,
+        copy_X=False, max_iter=_MAX_ITER, tol=_TOL, random_state=0, selection="cyclic",
     )
-    select_pipe.fit(X, y)
-    lasso: LassoCV = select_pipe.named_steps["model"]
+    # Same (n, 1, n_alphas) shapes as _path_residuals, so the same float ops.
+    coefs = coefs[np.newaxis, :, :]
+    intercepts = np.atleast_1d(y_offset)[:, np.newaxis] - np.dot(fold.X_offset, coefs)
+    residues = np.dot(fold.X_test, coefs) - y[fold.test][:, np.newaxis, np.newaxis]
+    residues += intercepts
+    return (residues ** 2).mean(axis=0).mean(axis=0)
 
+
+def _fit_target(group: _RowGroup, target: str, feature_cols: list[str],
+                alphas: np.ndarray, mse_path: np.ndarray) -> SelectionResult:
+    y = group.Y[target]
+    alpha = alphas[np.argmin(mse_path.mean(axis=1))]
+
+    # --- selection model: refit on all rows at the CV alpha ------------------
+    lasso = Lasso(alpha=alpha, precompute=False, max_iter=_MAX_ITER, tol=_TOL, random_state=0)
+    lasso.fit(group.Xs, y)
     coef = pd.Series(lasso.coef_, index=feature_cols, name="coef")
     ranked = coef.reindex(coef.abs().sort_values(ascending=False).index)
     selected = ranked.head(config.N_SELECT)
@@ -81,12 +183,8 @@ def select_for_target(matrix: pd.DataFrame, feature_cols: list[str], target: str
     ).reset_index(drop=True)
 
     # --- honest metrics: chronological 80/20 holdout -------------------------
-    split = int(len(X) * 0.8)
-    X_tr, X_te = X.iloc[:split], X.iloc[split:]
-    y_tr, y_te = y.iloc[:split], y.iloc[split:]
-    eval_pipe = _pipeline(Lasso(alpha=lasso.alpha_, max_iter=5000))
-    eval_pipe.fit(X_tr, y_tr)
-    y_pred = eval_pipe.predict(X_te)
+    y_tr, y_te = y[:group.split], y[group.split:]
+    y_pred = Lasso(alpha=alpha, max_iter=_MAX_ITER).fit(group.Xs_tr, y_tr).predict(group.Xs_te)
 
     mae = mean_absolute_error(y_te, y_pred)
     r2 = r2_score(y_te, y_pred)
@@ -94,20 +192,45 @@ def select_for_target(matrix: pd.DataFrame, feature_cols: list[str], target: str
 
     return SelectionResult(
         target=target,
-        alpha=float(lasso.alpha_),
-        n_rows=len(X),
+        alpha=float(alpha),
+        n_rows=len(y),
         mae=float(mae),
         r2=float(r2),
         baseline_mae=float(baseline_mae),
         coef=coef,
         selected=selected_df,
-        alphas=lasso.alphas_,
-        mse_path=lasso.mse_path_.mean(axis=1),
-        y_true=y_te.to_numpy(),
+        alphas=alphas,
+        mse_path=mse_path.mean(axis=1),
+        y_true=y_te,
         y_pred=y_pred,
     )
 
 
+def select_targets(matrix: pd.DataFrame, feature_cols: list[str], targets: list[str],
+                   n_jobs: int = -1) -> dict[str, SelectionResult]:
+    """LassoCV selection + holdout metrics for several targets at once."""
+    groups = _row_groups(matrix, feature_cols, targets)
+    grids = {t: _alpha_grid(g.Xs, g.Y[t]) for g in groups for t in g.targets}
+    cells = [(g, t, fold) for g in groups for t in g.targets for fold in g.folds]
+    # Coordinate descent and BLAS release the GIL; threads share the Gram matrices.
+    pool = Parallel(n_jobs=n_jobs, prefer="threads")
+    mses = pool(delayed(_fold_mse)(fold, g.Y[t], grids[t]) for g, t, fold in cells)
+
+    mse_paths: dict[str, list[np.ndarray]] = {}
+    for (_, t, _), mse in zip(cells, mses):
+        mse_paths.setdefault(t, []).append(mse)
+    fitted = pool(
+        delayed(_fit_target)(g, t, feature_cols, grids[t], np.stack(mse_paths[t], axis=1))
+        for g in groups for t in g.targets
+    )
+    by_target = {res.target: res for res in fitted}
+    return {t: by_target[t] for t in targets}
+
+
+def select_for_target(matrix: pd.DataFrame, feature_cols: list[str], target: str) -> SelectionResult:
+    return select_targets(matrix, feature_cols, [target])[target]
+
+
 def run_selection(matrix: pd.DataFrame) -> dict[str, SelectionResult]:
     config.OUTPUT_DIR.mkdir(exist_ok=True)
     feature_cols = [
@@ -118,12 +241,11 @@ def run_selection(matrix: pd.DataFrame) -> dict[str, SelectionResult]:
     ]
     print(f"\nFeature matrix: {len(matrix):,} rows x {len(feature_cols)} features")
 
-    results: dict[str, SelectionResult] = {}
+    print(f"  selecting for {', '.join(config.TARGETS)} ...", flush=True)
+    results = select_targets(matrix, feature_cols, config.TARGETS)
     summary_rows = []
-    for target in config.TARGETS:
-        print(f"  selecting for {target} ...", flush=True)
-        res = select_for_target(matrix, feature_cols, target)
-        results[target] = res
+    for target, res in results.items():
+        print(f"  {target}")
         res.selected.to_csv(config.OUTPUT_DIR / f"selected_{target}.csv", index=False)
         nonzero = int((res.coef != 0).sum())
         print(
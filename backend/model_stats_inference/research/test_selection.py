@@ -0,0 +1,62 @@
+"""Batched selection must reproduce the per-target impute→scale→LassoCV pipeline.
+
+Run: uv run pytest model_stats_inference/research/test_selection.py
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import Lasso, LassoCV
+from sklearn.model_selection import TimeSeriesSplit
+
+from model_stats_inference.research import config
+from model_stats_inference.research.selection import _pipeline, _prepare, select_targets
+
+FEATURES = [f"f{i}" for i in range(12)]
+TARGETS = ["PTS", "REB", "AST"]
+
+
+@pytest.fixture(scope="module")
+def matrix() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    n = 400
+    X = rng.normal(size=(n, len(FEATURES)))
+    X[rng.random(X.shape) < 0.05] = np.nan
+    df = pd.DataFrame(X, columns=FEATURES)
+    df["GAME_DATE"] = pd.Timestamp("2024-11-01") + pd.to_timedelta(rng.integers(0, 120, n), "D")
+    df["HISTORY_GAMES"] = rng.integers(0, 20, n).astype(float)
+    filled = np.nan_to_num(X)
+    df["y_PTS"] = 3 * filled[:, 0] - 2 * filled[:, 1] + rng.normal(0, 1, n)
+    df["y_REB"] = filled[:, 2] + 0.5 * filled[:, 3] + rng.normal(0, 1, n)
+    df["y_AST"] = filled[:, 4] + rng.normal(0, 1, n)
+    df.loc[df.index[::13], "y_AST"] = np.nan   # a second row group
+    return df
+
+
+def _reference(matrix: pd.DataFrame, target: str):
+    """The pre-batching implementation: one full pipeline per target."""
+    X, y = _prepare(matrix, FEATURES, target)
+    pipe = _pipeline(LassoCV(cv=TimeSeriesSplit(n_splits=config.CV_SPLITS), max_iter=5000, random_state=0))
+    lasso = pipe.fit(X, y).named_steps["model"]
+    split = int(len(X) * 0.8)
+    holdout = _pipeline(Lasso(alpha=lasso.alpha_, max_iter=5000)).fit(X.iloc[:split], y.iloc[:split])
+    return lasso, holdout.predict(X.iloc[split:])
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_select_targets_matches_lassocv_pipeline(matrix, n_jobs):
+    results = select_targets(matrix, FEATURES, TARGETS, n_jobs=n_jobs)
+    assert list(results) == TARGETS
+    for target in TARGETS:
+        lasso, y_pred = _reference(matrix, target)
+        res = results[target]
+        assert res.alpha == lasso.alpha_
+        np.testing.assert_array_equal(res.alphas, lasso.alphas_)
+        np.testing.assert_allclose(res.mse_path, lasso.mse_path_.mean(axis=1), rtol=1e-12)
+        np.testing.assert_allclose(res.coef.to_numpy(), lasso.coef_, rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(res.y_pred, y_pred, rtol=1e-12)
+        nonzero = {f for f, c in zip(FEATURES, lasso.coef_) if c != 0}
+        assert set(res.coef[res.coef != 0].index) == nonzero
+        assert res.n_rows == len(_prepare(matrix, FEATURES, target)[1])
@@ -0,0 +1,133 @@
+"""Compiled tree-ensemble predictor for the served HistGradientBoosting models.
+
+sklearn's ``predict`` is built for large batches: every call re-validates the
+DataFrame, re-checks feature names, walks the ``ExposureRegressor`` wrapper and
+dispatches one OpenMP traversal per tree. For the single-row / few-row batches the
+app sends (one slider move, one player page) that fixed overhead is nearly all of
+the cost. Here each fitted HGB is flattened once into packed node arrays and all
+trees are walked together, one numpy step per tree level::
+
+    node[row, tree] -> left/right child, NaN -> the node's missing-value side
+
+Leaves point at themselves, so ``max_depth`` steps settle every row in every tree.
+Leaf values are then summed tree by tree in sklearn's order (baseline first) and
+pushed through the loss link, which keeps results identical to ``model.predict``.
+
+Only numeric, single-output HGB regressors (optionally wrapped in an
+``ExposureRegressor``) compile; ``compile_model`` returns None for anything else
+and the caller keeps using the joblib model.
+
+Flattening reads sklearn internals (``_loss.link``, ``_predictors``,
+``_baseline_prediction``) that carry no compatibility promise. If a sklearn
+release moves or reshapes any of them, compilation returns None rather than
+failing the load, and ``ModelRegistry`` checks every compiled predictor against
+``model.predict`` before serving it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingRegressor
+
+from ..training.models import ExposureRegressor
+
+try:
+    from sklearn._loss.link import IdentityLink, LogLink
+    _LINKS = {IdentityLink: "identity", LogLink: "log"}
+except ImportError:  # private module moved: nothing compiles, sklearn serves
+    _LINKS = {}
+
+
+@dataclass
+class CompiledTrees:
+    features: list[str]          # column order the arrays below index into
+    feature: np.ndarray          # (n_nodes,) int64 split column; 0 on leaves
+    threshold: np.ndarray        # (n_nodes,) float64 — go left iff x <= threshold
+    missing_left: np.ndarray     # (n_nodes,) bool — NaN goes left
+    left: np.ndarray             # (n_nodes,) int64 global index; self on leaves
+    right: np.ndarray            # (n_nodes,) int64 global index; self on leaves
+    value: np.ndarray            # (n_nodes,) float64 leaf value (shrinkage applied)
+    roots: np.ndarray            # (n_trees,) int64
+    max_depth: int
+    baseline: float
+    link: str                    # "identity" | "log"
+    exposure_idx: int | None = None   # column of t for ExposureRegressor, else None
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """``model.predict`` for a float64 (n_rows, len(features)) array."""
+        X = np.asarray(X, dtype=np.float64)
+        rows = np.arange(len(X))[:, np.newaxis]
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.max_depth):
+            x = X[rows, self.feature[node]]
+            go_left = np.where(np.isnan(x), self.missing_left[node], x <= self.threshold[node])
+            node = np.where(go_left, self.left[node], self.right[node])
+
+        # Baseline, then trees in order — sklearn's accumulation order, so the
+        # float sum (and hence the prediction) is the same to the last bit.
+        terms = np.empty((len(X), len(self.roots) + 1))
+        terms[:, 0] = self.baseline
+        terms[:, 1:] = self.value[node]
+        raw = np.cumsum(terms, axis=1)[:, -1]
+        out = np.exp(raw) if self.link == "log" else raw
+        if self.exposure_idx is not None:
+            out = np.clip(X[:, self.exposure_idx], 0.0, None) * out
+        return out
+
+
+def _compile_hgb(model: HistGradientBoostingRegressor, features: list[str]) -> CompiledTrees | None:
+    try:
+        return _flatten_hgb(model, features)
+    except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+        return None  # sklearn internals not in the layout this was written against
+
+
+def _flatten_hgb(model: HistGradientBoostingRegressor, features: list[str]) -> CompiledTrees | None:
+    link = _LINKS.get(type(model._loss.link))
+    if (
+        link is None
+        or model.n_trees_per_iteration_ != 1
+        or (model.is_categorical_ is not None and model.is_categorical_.any())
+        or list(getattr(model, "feature_names_in_", features)) != list(features)
+    ):
+        return None
+
+    trees = [p[0].nodes for p in model._predictors]
+    offsets = np.cumsum([0] + [len(t) for t in trees[:-1]])
+    nodes = np.concatenate(trees) if trees else np.empty(0, dtype=np.float64)
+    if len(nodes) == 0:
+        return None
+
+    own = np.concatenate([off + np.arange(len(t)) for off, t in zip(offsets, trees)])
+    base = np.repeat(offsets, [len(t) for t in trees])
+    leaf = nodes["is_leaf"].astype(bool)
+    return CompiledTrees(
+        features=list(features),
+        feature=np.where(leaf, 0, nodes["feature_idx"]).astype(np.int64),
+        threshold=nodes["num_threshold"].astype(np.float64),
+        missing_left=nodes["missing_go_to_left"].astype(bool),
+        left=np.where(leaf, own, base + nodes["left"]).astype(np.int64),
+        right=np.where(leaf, own, base + nodes["right"]).astype(np.int64),
+        value=nodes["value"].astype(np.float64),
+        roots=offsets.astype(np.int64),
+        max_depth=int(nodes["depth"].max()),
+        baseline=float(model._baseline_prediction.ravel()[0]),
+        link=link,
+    )
+
+
+def compile_model(model, features: list[str]) -> CompiledTrees | None:
+    """Flatten a fitted served model, or None if it is not a supported HGB."""
+    if isinstance(model, ExposureRegressor):
+        base = getattr(model, "base_", None)
+        if not isinstance(base, HistGradientBoostingRegressor) or model.exposure_col not in features:
+            return None
+        compiled = _compile_hgb(base, features)
+        if compiled is not None:
+            compiled.exposure_idx = features.index(model.exposure_col)
+        return compiled
+    if isinstance(model, HistGradientBoostingRegressor):
+        return _compile_hgb(model, features)
+    return None
@@ -79,6 +79,7 @@ class FeatureStore:
         """
         self._team_state_cache: dict[int, TeamState] = {}
         self._player_feature_rows: pd.DataFrame | None = None
+        self._team_feature_rows: tuple[pd.DataFrame, pd.DataFrame] | None = None
 
     # --- construction ------------------------------------------------------
 
@@ -209,20 +210,34 @@ class FeatureStore:
         games = int(row["games_count"])
         if games < config.MIN_INFERENCE_GAMES:
             raise InsufficientHistoryError(player_id, games, config.MIN_INFERENCE_GAMES)
-        if self._player_feature_rows is None:
-            feature_cols = [c for c in self.player_vectors.columns if c not in _PLAYER_META]
-            # float64 copy: parquet loads arrow-backed columns whose per-value
-            # iteration makes the assembly-time .to_dict() several times slower.
-            self._player_feature_rows = self.player_vectors[feature_cols].astype("float64")
         return PlayerState(
             player_id=player_id,
             team_id=int(row["TEAM_ID"]),
             position=str(row.get("POSITION", "")),
             last_game_date=row["last_game_date"],
             games_count=games,
-            vector=self._player_feature_rows.loc[player_id],
+            vector=self.player_feature_rows().loc[player_id],
         )
 
+    def player_feature_rows(self) -> pd.DataFrame:
+        """Every player's feature vector (metadata columns dropped), float64, by PLAYER_ID."""
+        if self._player_feature_rows is None:
+            feature_cols = [c for c in self.player_vectors.columns if c not in _PLAYER_META]
+            # float64 copy: parquet loads arrow-backed columns whose per-value
+            # iteration makes the assembly-time .to_dict() several times slower.
+            self._player_feature_rows = self.player_vectors[feature_cols].astype("float64")
+        return self._player_feature_rows
+
+    def team_feature_rows(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """(allowed, own) float64 frames by TEAM_ID, for teams present in both —
+        the stacked form of ``get_team_state`` for column-wise gathers."""
+        if self._team_feature_rows is None:
+            teams = self.team_allowed_vectors.index.intersection(self.team_own_vectors.index)
+            allowed = self.team_allowed_vectors.loc[teams].drop(columns=["TEAM_ID"]).astype("float64")
+            own = self.team_own_vectors.loc[teams].drop(columns=["TEAM_ID"]).astype("float64")
+            self._team_feature_rows = (allowed, own)
+        return self._team_feature_rows
+
     def get_team_state(self, team_id: int) -> TeamState:
         cached = self._team_state_cache.get(team_id)
         if cached is not None:
@@ -10,14 +10,14 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import joblib
 import numpy as np
 import pandas as pd
 
+from .compiled import CompiledTrees
 from . import config
-from .errors import InsufficientHistoryError, ModelsNotTrainedError, UnknownPlayerError
+from .errors import InsufficientHistoryError, UnknownPlayerError, UnknownTeamError
 from .feature_store import FeatureStore
-from .reconcile import Reconciler
+from .registry import ModelRegistry
 
 
 # Features `_assemble_row` computes per request instead of reading from the stored
@@ -59,28 +59,25 @@ class PredictionResult:
 class LiveInference:
     """Loads the trained per-stat models and serves predictions off a FeatureStore."""
 
-    def __init__(self, store: FeatureStore, models_dir: Path | None = None):
+    def __init__(self, store: FeatureStore, models_dir: Path | None = None,
+                 registry: ModelRegistry | None = None):
         self.store = store
-        self.models: dict[str, dict] = {}
-        d = models_dir or config.MODELS_DIR
-        for path in sorted(Path(d).glob("*.joblib")):
-            if path.name == "reconciler.joblib":
-                continue
-            payload = joblib.load(path)
-            self.models[payload["target"]] = payload
+        # A registry the app loaded (and warmed) at startup, or a fresh load.
+        self.registry = registry or ModelRegistry.load(models_dir)
+        self.models: dict[str, dict] = self.registry.models
+        # Packed-array predictors (see compiled.py): exported by training, or built
+        # at load for artifacts that predate the export. Models that don't compile
+        # (non-HGB registry entries) keep going through their own .predict.
+        self.compiled: dict[str, CompiledTrees] = self.registry.compiled
         # Learned color scale (spread of the Pearson residual) per target, if present.
         self.resid_sigma: dict[str, float] = {
             t: p.get("metrics", {}).get("resid_sigma")
             for t, p in self.models.items()
             if p.get("metrics", {}).get("resid_sigma") is not None
         }
-        if not self.models:
-            raise ModelsNotTrainedError(
-                f"no models found in {d} — run `python -m model_stats_inference.training.train`"
-            )
         # MinT reconciler (coherent shooting lines: PTS = 2·FGM + FG3M + FTM).
         # Optional — absent reconciler.joblib just skips reconciliation.
-        self.reconciler = Reconciler.load(Path(d) / "reconciler.joblib")
+        self.reconciler = self.registry.reconciler
 
     def predict(self, req: PredictionRequest) -> PredictionResult:
         results, errors = self.predict_many([req])
@@ -121,33 +118,7 @@ class LiveInference:
         if not valid:
             return results, errors
 
-        X = pd.DataFrame(rows)
-        # One predict call per model over the whole batch (vs ~N per player).
-        batched: dict[str, np.ndarray] = {}
-        for target, payload in self.models.items():
-            # reindex (not X[...]) so a model deployed with features the stored
-            # vectors don't carry yet degrades to NaN (HGB-native) instead of
-            # KeyError-ing the whole batch — vectors self-heal on the next
-            # nightly re-materialization.
-            feats = payload["features"]
-            # Hand sklearn a consolidated float64 block: check_array on the
-            # column-fragmented reindex result costs ~10x the tree traversal.
-            Xm = pd.DataFrame(
-                np.ascontiguousarray(X.reindex(columns=feats).to_numpy(dtype=np.float64)),
-                columns=feats,
-            )
-            vals = payload["model"].predict(Xm)
-            if payload.get("clip_at_zero", True):
-                vals = np.clip(vals, 0.0, None)
-            batched[target] = vals
-
-        # Reconcile the shooting block so PTS = 2·FGM + FG3M + FTM (coherent lines).
-        # Overwrites those 6 targets in place; REB/AST/STL/BLK pass through untouched.
-        if self.reconciler is not None and all(t in batched for t in self.reconciler.targets):
-            Y = np.column_stack([batched[t] for t in self.reconciler.targets])
-            Yt = self.reconciler.apply(Y)
-            for k, t in enumerate(self.reconciler.targets):
-                batched[t] = Yt[:, k]
+        batched = self._run_models(pd.DataFrame(rows))
 
         for j, i in enumerate(valid):
             req = reqs[i]
@@ -169,6 +140,131 @@ class LiveInference:
 
         return results, errors
 
+    def predict_frame(self, games: pd.DataFrame) -> tuple[pd.DataFrame, list[Exception | None]]:
+        """Column-wise ``predict_many`` for large schedules (a roster-week, a league-week).
+
+        ``games`` has one row per (player, game): ``player_id``, ``opponent_team_id``,
+        ``is_home``, ``game_date``, ``minutes`` and optionally ``rest_days`` (NaN ->
+        days since the player's last stored game, as ``_assemble_row`` does). Each
+        model then runs once over the whole table. Returns per-target predictions
+        aligned to ``games`` (NaN rows for players that can't be predicted) and the
+        per-row errors. Identical numbers to ``predict_many`` for the same inputs.
+        """
+        features = list(dict.fromkeys(f for p in self.models.values() for f in p["features"]))
+        X, valid, errors = self.assemble_frame(games, features)
+        out = pd.DataFrame(np.nan, index=games.index, columns=list(self.models))
+        if valid.any():
+            for target, vals in self._run_models(X).items():
+                out.loc[valid, target] = vals
+        return out, errors
+
+    def assemble_frame(
+        self, games: pd.DataFrame, features: list[str]
+    ) -> tuple[pd.DataFrame, np.ndarray, list[Exception | None]]:
+        """``_assemble_row`` for a whole table: (X for the valid rows, valid mask, errors).
+
+        Feature rows are gathered from the store with one reindex per block (player,
+        own team, opponent) instead of a dict per request; only ``features`` are
+        materialized.
+        """
+        n = len(games)
+        errors: list[Exception | None] = [None] * n
+        pids = games["player_id"].to_numpy(dtype=np.int64)
+        opp_ids = games["opponent_team_id"].to_numpy(dtype=np.int64)
+
+        pv = self.store.player_vectors
+        meta = pv.reindex(pids)
+        known = pd.Index(pids).isin(pv.index)
+        games_count = meta["games_count"].to_numpy(dtype=np.float64)
+        allowed, own = self.store.team_feature_rows()
+        own_ids = meta["TEAM_ID"].to_numpy(dtype=np.float64)
+        for i in np.flatnonzero(~known):
+            errors[i] = UnknownPlayerError(f"player {pids[i]} is not in the feature store")
+        for i in np.flatnonzero(known & (games_count < config.MIN_INFERENCE_GAMES)):
+            errors[i] = InsufficientHistoryError(int(pids[i]), int(games_count[i]), config.MIN_INFERENCE_GAMES)
+        for i in np.flatnonzero(known & ~pd.Index(own_ids).isin(allowed.index)):
+            if errors[i] is None:
+                errors[i] = UnknownTeamError(f"team {int(own_ids[i])} is not in the feature store")
+        for i in np.flatnonzero(~pd.Index(opp_ids).isin(allowed.index)):
+            if errors[i] is None:
+                errors[i] = UnknownTeamError(f"team {opp_ids[i]} is not in the feature store")
+
+        valid = np.array([e is None for e in errors], dtype=bool)
+        if not valid.any():
+            return pd.DataFrame(columns=features, dtype=np.float64), valid, errors
+
+        sub, meta = games[valid], meta[valid]
+        # Later blocks win, exactly like the dict.update order in _assemble_row.
+        blocks = [
+            self.store.player_feature_rows().reindex(pids[valid]),
+            own.reindex(own_ids[valid].astype(np.int64)),
+            allowed.reindex(opp_ids[valid]),
+        ]
+        source: dict[str, np.ndarray] = {}
+        for block in blocks:
+            for col in block.columns:
+                source[col] = block[col].to_numpy()
+
+        game_date = pd.to_datetime(sub["game_date"]).reset_index(drop=True)
+        rest = (game_date - pd.to_datetime(meta["last_game_date"]).reset_index(drop=True)).dt.days
+        rest = rest.to_numpy(dtype=np.float64)
+        if "rest_days" in sub.columns:
+            override = sub["rest_days"].to_numpy(dtype=np.float64)
+            rest = np.where(np.isnan(override), rest, override)
+        pos = (meta["POSITION"].fillna("").astype(str) if "POSITION" in meta.columns
+               else pd.Series("", index=meta.index))
+        t = sub["minutes"].to_numpy(dtype=np.float64)
+        source.update({
+            "IS_HOME": sub["is_home"].to_numpy(dtype=np.float64),
+            "REST_DAYS": rest,
+            "IS_BACK_TO_BACK": (rest == 1).astype(np.float64),
+            "HISTORY_GAMES": meta["games_count"].to_numpy(dtype=np.float64),
+            "IS_GUARD": pos.str.contains("G", regex=False).to_numpy(dtype=np.float64),
+            "IS_FORWARD": pos.str.contains("F", regex=False).to_numpy(dtype=np.float64),
+            "IS_CENTER": pos.str.contains("C", regex=False).to_numpy(dtype=np.float64),
+            "T_MIN": t,
+        })
+
+        cols: dict[str, np.ndarray] = {}
+        for feat in features:
+            base = feat[len(REQUEST_TIME_PREFIX):] if feat.startswith(REQUEST_TIME_PREFIX) else None
+            if base is not None and base.endswith("_rate") and base in source:
+                cols[feat] = t * source[base]
+            elif feat in source:
+                cols[feat] = source[feat]
+        return pd.DataFrame(cols).reindex(columns=features), valid, errors
+
+    def _run_models(self, X: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Every model over one feature table (clipped, then reconciled)."""
+        # One predict call per model over the whole batch (vs ~N per player).
+        batched: dict[str, np.ndarray] = {}
+        for target, payload in self.models.items():
+            # reindex (not X[...]) so a model deployed with features the stored
+            # vectors don't carry yet degrades to NaN (HGB-native) instead of
+            # KeyError-ing the whole batch — vectors self-heal on the next
+            # nightly re-materialization.
+            feats = payload["features"]
+            Xa = np.ascontiguousarray(X.reindex(columns=feats).to_numpy(dtype=np.float64))
+            compiled = self.compiled.get(target)
+            if compiled is not None:
+                vals = compiled.predict(Xa)
+            else:
+                # Hand sklearn a consolidated float64 block: check_array on the
+                # column-fragmented reindex result costs ~10x the tree traversal.
+                vals = payload["model"].predict(pd.DataFrame(Xa, columns=feats))
+            if payload.get("clip_at_zero", True):
+                vals = np.clip(vals, 0.0, None)
+            batched[target] = vals
+
+        # Reconcile the shooting block so PTS = 2·FGM + FG3M + FTM (coherent lines).
+        # Overwrites those 6 targets in place; REB/AST/STL/BLK pass through untouched.
+        if self.reconciler is not None and all(t in batched for t in self.reconciler.targets):
+            Y = np.column_stack([batched[t] for t in self.reconciler.targets])
+            Yt = self.reconciler.apply(Y)
+            for k, t in enumerate(self.reconciler.targets):
+                batched[t] = Yt[:, k]
+        return batched
+
     # --- feature-row assembly ---------------------------------------------
 
     def _assemble_row(self, state, own, opp, req: PredictionRequest) -> dict:
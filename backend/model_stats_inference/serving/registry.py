@@ -0,0 +1,125 @@
+"""Model registry: load every per-target model once, in parallel, and warm it up.
+
+``LiveInference`` used to unpickle each ``<TARGET>.joblib`` serially in its
+constructor, so whichever request built it first paid the whole load. The
+registry does that work up front (the app runs it in the FastAPI lifespan):
+
+* models load on a thread pool — file reads and the numpy buffers inside the
+  pickles don't need the GIL;
+* with ``mmap=True`` joblib maps the large arrays (tree node tables, compiled
+  predictors) straight from the uncompressed dump instead of copying them;
+* a compiled predictor is only kept if it reproduces ``model.predict`` on a
+  small probe batch (it is built from private sklearn internals);
+* ``warm_up`` pushes one synthetic row through every model, which faults the
+  mapped pages in and takes the first-call costs of the predict paths;
+* per-model timings are kept for ``/api/projections/models/status``.
+
+Training writes model files via rename (see ``train.save_model``), so a retrain
+never rewrites a file a running server has mapped.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from . import config
+from .compiled import CompiledTrees, compile_model
+from .errors import ModelsNotTrainedError
+from .reconcile import Reconciler
+
+_PROBE_ROWS = 16
+
+
+def _probe(features: list[str]) -> np.ndarray:
+    """Deterministic check batch: spread-out values, a few NaNs, a 30-minute row of zeros."""
+    X = np.random.default_rng(0).uniform(0.0, 40.0, (_PROBE_ROWS, len(features)))
+    X[::5, ::3] = np.nan
+    X[0] = 0.0
+    if "T_MIN" in features:
+        X[0, features.index("T_MIN")] = 30.0
+    return X
+
+
+def _verified(compiled: CompiledTrees | None, model, features: list[str]) -> CompiledTrees | None:
+    """``compiled`` if it matches ``model.predict`` on the probe batch, else None."""
+    if compiled is None:
+        return None
+    X = _probe(features)
+    try:
+        got = compiled.predict(X)
+    except (IndexError, TypeError, ValueError):
+        return None
+    want = model.predict(pd.DataFrame(X, columns=features))
+    return compiled if np.allclose(got, want, rtol=1e-9, atol=1e-12, equal_nan=True) else None
+
+
+@dataclass
+class ModelLoad:
+    target: str
+    seconds: float
+    bytes: int
+    compiled: bool
+
+
+@dataclass
+class ModelRegistry:
+    models_dir: Path
+    models: dict[str, dict]                    # target -> joblib payload
+    compiled: dict[str, CompiledTrees]
+    reconciler: Reconciler | None
+    loads: list[ModelLoad] = field(default_factory=list)
+    load_seconds: float = 0.0                  # wall time of the whole parallel load
+    warmup_seconds: float | None = None        # None until warm_up() has run
+
+    @classmethod
+    def load(cls, models_dir: Path | None = None, max_workers: int | None = None,
+             mmap: bool = True) -> "ModelRegistry":
+        d = Path(models_dir or config.MODELS_DIR)
+        paths = [p for p in sorted(d.glob("*.joblib")) if p.name != "reconciler.joblib"]
+        if not paths:
+            raise ModelsNotTrainedError(
+                f"no models found in {d} — run `python -m model_stats_inference.training.train`"
+            )
+
+        def _one(path: Path) -> tuple[dict, CompiledTrees | None, ModelLoad]:
+            t0 = time.perf_counter()
+            payload = joblib.load(path, mmap_mode="r" if mmap else None)
+            compiled = _verified(
+                payload.get("compiled") or compile_model(payload["model"], payload["features"]),
+                payload["model"], payload["features"])
+            took = time.perf_counter() - t0
+            return payload, compiled, ModelLoad(
+                payload["target"], took, path.stat().st_size, compiled is not None)
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers or min(len(paths), 8)) as pool:
+            loaded = list(pool.map(_one, paths))
+        reconciler = Reconciler.load(d / "reconciler.joblib")
+        took = time.perf_counter() - t0
+
+        models = {payload["target"]: payload for payload, _, _ in loaded}
+        compiled = {payload["target"]: c for payload, c, _ in loaded if c is not None}
+        return cls(d, models, compiled, reconciler, [m for _, _, m in loaded], took)
+
+    def warm_up(self) -> float:
+        """One synthetic prediction per model (a 30-minute row of zeros)."""
+        t0 = time.perf_counter()
+        for target, payload in self.models.items():
+            feats = payload["features"]
+            X = np.zeros((1, len(feats)))
+            if "T_MIN" in feats:
+                X[0, feats.index("T_MIN")] = 30.0
+            compiled = self.compiled.get(target)
+            if compiled is not None:
+                compiled.predict(X)
+            else:
+                payload["model"].predict(pd.DataFrame(X, columns=feats))
+        self.warmup_seconds = time.perf_counter() - t0
+        return self.warmup_seconds
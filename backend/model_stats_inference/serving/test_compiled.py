@@ -0,0 +1,91 @@
+"""Compiled tree predictor: packed-array traversal must reproduce sklearn's
+``predict`` on the training matrix, and anything that doesn't compile falls back
+to the joblib model.
+
+Run: uv run pytest model_stats_inference/serving/test_compiled.py
+"""
+
+from __future__ import annotations
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_stats_inference.research import config as rconfig
+from model_stats_inference.serving.compiled import compile_model
+from model_stats_inference.serving.conftest import FULL_PID, TEAM_B
+from model_stats_inference.serving.inference import LiveInference, PredictionRequest
+from model_stats_inference.training import models as registry
+
+
+@pytest.mark.parametrize("target", rconfig.TARGETS)
+def test_compiled_matches_sklearn_on_training_matrix(feature_matrix, models_dir, target):
+    payload = joblib.load(models_dir / f"{target}.joblib")
+    compiled = compile_model(payload["model"], payload["features"])
+    assert compiled is not None and compiled.exposure_idx is not None
+
+    X = feature_matrix[payload["features"]].astype(float)
+    expected = payload["model"].predict(X)
+    np.testing.assert_array_equal(compiled.predict(X.to_numpy()), expected)
+
+
+@pytest.mark.parametrize("name", ["hgb_l2", "hgb_poisson"])
+def test_bare_hgb_with_missing_values(name):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.uniform(0, 30, size=(400, 5)), columns=list("abcde"))
+    X.loc[X.index[::4], "b"] = np.nan          # learned missing-value directions
+    y = rng.poisson(1 + X["a"].to_numpy() / 10)
+    model = registry.build_estimator(name).fit(X, y)
+    compiled = compile_model(model, list(X.columns))
+
+    probe = X.to_numpy().copy()
+    probe[::3, 0] = np.nan                     # NaN where training never had one
+    np.testing.assert_array_equal(compiled.predict(probe), model.predict(pd.DataFrame(probe, columns=X.columns)))
+
+
+def test_missing_sklearn_internals_do_not_compile():
+    X = pd.DataFrame(np.random.default_rng(0).uniform(0, 30, size=(200, 3)), columns=list("abc"))
+    model = registry.build_estimator("hgb_l2").fit(X, X["a"] * 0.5)
+    del model._predictors
+    assert compile_model(model, list(X.columns)) is None
+
+
+def test_mismatched_compiled_predictor_is_dropped_at_load(store, models_dir, tmp_path):
+    out = tmp_path / "models"
+    out.mkdir()
+    for path in models_dir.glob("*.joblib"):
+        payload = joblib.load(path)
+        if payload.get("target") == "PTS":
+            payload["compiled"] = compile_model(payload["model"], payload["features"])
+            payload["compiled"].baseline += 0.5
+        joblib.dump(payload, out / path.name)
+
+    inf = LiveInference(store, models_dir=out)
+    assert "PTS" not in inf.compiled and "REB" in inf.compiled
+    assert not next(m for m in inf.registry.loads if m.target == "PTS").compiled
+
+
+def test_uncompilable_model_falls_back_to_joblib(store, models_dir, tmp_path):
+    out = tmp_path / "models"
+    out.mkdir()
+    for path in models_dir.glob("*.joblib"):
+        payload = joblib.load(path)
+        if payload.get("target") == "PTS":
+            X = pd.DataFrame(np.random.default_rng(0).uniform(0, 30, (60, len(payload["features"]))),
+                             columns=payload["features"])
+            payload["model"] = registry.build_estimator("linear").fit(X, X.iloc[:, 0] * 0.5)
+        joblib.dump(payload, out / path.name)
+    assert compile_model(joblib.load(out / "PTS.joblib")["model"], ["T_MIN"]) is None
+
+    inf = LiveInference(store, models_dir=out)
+    assert "PTS" not in inf.compiled and "REB" in inf.compiled
+    last = pd.Timestamp(store.player_vectors.loc[FULL_PID]["last_game_date"])
+    reqs = [
+        PredictionRequest(player_id=FULL_PID, opponent_team_id=TEAM_B, is_home=True,
+                          game_date=last + pd.Timedelta(days=2), minutes=m)
+        for m in (0, 18, 34)
+    ]
+    results, errors = inf.predict_many(reqs)
+    assert all(e is None for e in errors)
+    assert all(np.isfinite(r.stats["PTS"].value) for r in results)
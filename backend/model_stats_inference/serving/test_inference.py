@@ -125,3 +125,54 @@ def test_low_history_player_refused(store, models_dir):
 def test_no_models_raises(store, tmp_path):
     with pytest.raises(ModelsNotTrainedError):
         LiveInference(store, models_dir=tmp_path)
+
+
+def _games(store, pids, minutes=30.0):
+    rows = []
+    for k, pid in enumerate(pids):
+        last = pd.Timestamp(store.player_vectors.loc[pid, "last_game_date"]) if pid in store.player_vectors.index \
+            else pd.Timestamp("2025-01-01")
+        rows.append({"player_id": pid, "opponent_team_id": TEAM_B, "is_home": k % 2 == 0,
+                     "game_date": last + pd.Timedelta(days=1 + k), "minutes": minutes + k})
+    return pd.DataFrame(rows)
+
+
+def test_predict_frame_matches_predict_many(store, models_dir):
+    inf = LiveInference(store, models_dir=models_dir)
+    games = _games(store, [FULL_PID, 2, 3, LOW_PID, 999, FULL_PID])
+    reqs = [PredictionRequest(r.player_id, r.opponent_team_id, r.is_home, r.game_date, r.minutes)
+            for r in games.itertuples()]
+
+    frame, errors = inf.predict_frame(games)
+    results, ref_errors = inf.predict_many(reqs)
+
+    assert [type(e) for e in errors] == [type(e) for e in ref_errors]
+    for i, res in enumerate(results):
+        if res is None:
+            assert frame.iloc[i].isna().all()
+            continue
+        for target in inf.models:
+            assert frame.iloc[i][target] == res.stats[target].value
+
+
+def test_assemble_frame_matches_assemble_row(store, models_dir):
+    inf = LiveInference(store, models_dir=models_dir)
+    games = _games(store, [FULL_PID, 3])
+    reqs = [PredictionRequest(r.player_id, r.opponent_team_id, r.is_home, r.game_date, r.minutes)
+            for r in games.itertuples()]
+    rows = []
+    for req in reqs:
+        state = store.get_player_state(req.player_id)
+        rows.append(inf._assemble_row(
+            state, store.get_team_state(state.team_id), store.get_team_state(req.opponent_team_id), req))
+    ref = pd.DataFrame(rows)
+
+    X, valid, _ = inf.assemble_frame(games, list(ref.columns))
+    assert valid.all()
+    pd.testing.assert_frame_equal(X, ref, check_dtype=False)
+
+    # Explicit rest days (a later game in a projected week) override the store gap.
+    games["rest_days"] = [np.nan, 1.0]
+    X, _, _ = inf.assemble_frame(games, ["REST_DAYS", "IS_BACK_TO_BACK"])
+    assert X["REST_DAYS"].tolist() == [ref["REST_DAYS"][0], 1.0]
+    assert X["IS_BACK_TO_BACK"].tolist() == [float(ref["REST_DAYS"][0] == 1), 1.0]
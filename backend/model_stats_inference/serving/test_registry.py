@@ -0,0 +1,58 @@
+"""ModelRegistry: parallel, memory-mapped model loading with a warm-up pass.
+
+Run: uv run pytest model_stats_inference/serving/test_registry.py
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_stats_inference.research import config as rconfig
+from model_stats_inference.serving.conftest import FULL_PID, TEAM_B
+from model_stats_inference.serving.errors import ModelsNotTrainedError
+from model_stats_inference.serving.inference import LiveInference, PredictionRequest
+from model_stats_inference.serving.registry import ModelRegistry
+
+
+def _requests(store):
+    last = pd.Timestamp(store.player_vectors.loc[FULL_PID]["last_game_date"])
+    return [
+        PredictionRequest(player_id=FULL_PID, opponent_team_id=TEAM_B, is_home=True,
+                          game_date=last + pd.Timedelta(days=2), minutes=m)
+        for m in (12, 30)
+    ]
+
+
+def test_parallel_mmap_load_records_timings(models_dir):
+    registry = ModelRegistry.load(models_dir, max_workers=4)
+    assert set(registry.models) == set(rconfig.TARGETS)
+    assert {m.target for m in registry.loads} == set(rconfig.TARGETS)
+    assert all(m.seconds > 0 and m.bytes > 0 and m.compiled for m in registry.loads)
+    assert registry.load_seconds > 0 and registry.reconciler is not None
+    # Arrays come back mapped from the dump, not copied.
+    tree = registry.models["PTS"]["model"].base_._predictors[0][0]
+    assert isinstance(tree.nodes, np.memmap)
+
+    assert registry.warmup_seconds is None
+    assert registry.warm_up() > 0 and registry.warmup_seconds is not None
+
+
+def test_shared_registry_predicts_like_a_fresh_load(store, models_dir):
+    registry = ModelRegistry.load(models_dir)
+    registry.warm_up()
+    warm = LiveInference(store, registry=registry)
+    cold = LiveInference(store, models_dir=models_dir)
+    assert warm.registry is registry
+
+    reqs = _requests(store)
+    got, _ = warm.predict_many(reqs)
+    want, _ = cold.predict_many(reqs)
+    for g, w in zip(got, want):
+        assert {k: v.value for k, v in g.stats.items()} == {k: v.value for k, v in w.stats.items()}
+
+
+def test_empty_dir_raises(tmp_path):
+    with pytest.raises(ModelsNotTrainedError):
+        ModelRegistry.load(tmp_path)
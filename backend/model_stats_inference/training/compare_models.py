@@ -2,11 +2,16 @@
 
     uv run python -m model_stats_inference.training.compare_models
     uv run python -m model_stats_inference.training.compare_models --models hgb_l2 linear
+    uv run python -m model_stats_inference.training.compare_models --jobs 8
 
 For every target stat, each estimator from the registry is cross-validated on the
 *identical* feature set and KFold splits used in training (so differences come only
 from the model/loss), then a per-stat leaderboard is printed and written to
 outputs/model_comparison.{csv,png}. Does NOT touch the production models/ joblibs.
+The whole (target, model, fold) grid runs in one process pool over the shared
+memory-mapped matrix (training/orchestrator.py). Cells already in the fold cache
+(training/cv_cache.py) are reused, so adding one model to the bake-off only fits
+that model.
 """
 
 from __future__ import annotations
@@ -17,30 +22,38 @@ import pandas as pd
 
 from . import config
 from . import models as registry
-from .train import cross_validate_target, ensure_feature_sets, load_feature_set, _prepare
+from . import orchestrator
+from .cv_cache import CVCache
+from .train import ensure_feature_sets, load_feature_set
 
 BASELINE = "hgb_l2"  # Δ columns are reported relative to this model.
 
 
-def run(model_names: list[str]) -> pd.DataFrame:
+def run(model_names: list[str], jobs: int | None = None, use_cache: bool = True) -> pd.DataFrame:
     if not config.FEATURE_MATRIX.exists():
         raise FileNotFoundError(
             f"{config.FEATURE_MATRIX} not found — run the research pipeline first."
         )
-    matrix = pd.read_parquet(config.FEATURE_MATRIX)
+    store = orchestrator.MatrixStore.from_parquet(config.FEATURE_MATRIX)
     ensure_feature_sets()
 
     print(f"Comparing {model_names} on {len(config.TARGETS)} targets "
-          f"({config.KFOLDS}-fold CV, same features)\n")
+          f"({config.KFOLDS}-fold CV, same features, "
+          f"{jobs or orchestrator.default_jobs()} jobs)\n")
+
+    specs = [
+        orchestrator.CVSpec(target, name, tuple(load_feature_set(target)))
+        for target in config.TARGETS
+        for name in model_names
+    ]
+    grid = orchestrator.run_grid(
+        store, specs, jobs=jobs, cache=CVCache() if use_cache else None
+    )
 
     rows = []
     for target in config.TARGETS:
-        features = load_feature_set(target)
-        X, y = _prepare(matrix, features, target)
         for name in model_names:
-            res = cross_validate_target(
-                X, y, target, features, make_est=lambda n=name: registry.build_estimator(n)
-            )
+            res, _ = grid[(target, name)]
             rows.append({
                 "target": target,
                 "model": name,
@@ -114,11 +127,19 @@ def main() -> None:
         "--models", nargs="+", default=registry.list_estimators(),
         help=f"registered estimators to compare (default: all = {registry.list_estimators()})",
     )
+    ap.add_argument(
+        "--jobs", type=int, default=None,
+        help="worker processes for the (target, model, fold) grid (default: all cores; 1 = in-process)",
+    )
+    ap.add_argument(
+        "--no-cache", action="store_true",
+        help="refit every fold instead of reusing unchanged cells from outputs/cv_cache",
+    )
     args = ap.parse_args()
     unknown = [m for m in args.models if m not in registry.ESTIMATORS]
     if unknown:
         raise SystemExit(f"unknown estimator(s): {unknown}; registered: {registry.list_estimators()}")
-    run(args.models)
+    run(args.models, jobs=args.jobs, use_cache=not args.no_cache)
 
 
 if __name__ == "__main__":
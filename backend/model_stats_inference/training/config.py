@@ -22,6 +22,12 @@ MODELS_DIR = ROOT.parent / "models"               # saved estimators
 FEATURE_MATRIX = rconfig.DATA_DIR / "feature_matrix.parquet"
 SELECTED_JSON = rconfig.OUTPUT_DIR / "selected_features.json"
 
+# Memory-mapped float32 copy of FEATURE_MATRIX shared by the CV worker processes
+# (training/orchestrator.py); rebuilt whenever the parquet changes.
+MATRIX_STORE_DIR = OUTPUT_DIR / "matrix_store"
+# Content-addressed per-fold OOF predictions + fitted models (training/cv_cache.py).
+CV_CACHE_DIR = OUTPUT_DIR / "cv_cache"
+
 # --- Shared with research --------------------------------------------------
 
 TARGETS = rconfig.TARGETS
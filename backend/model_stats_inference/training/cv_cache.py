@@ -0,0 +1,110 @@
+"""Content-addressed cache of per-fold CV outputs (OOF predictions + fitted models).
+
+Every `train` / `compare_models` run used to refit the whole (target, model, fold)
+grid even when nothing that feeds a fit had changed. A cell's output is a pure
+function of
+
+  * the data it reads   — the target's rows of its feature columns, and y;
+  * the estimator       — class + full deep `get_params()` + sklearn version;
+  * the fold            — the held-out row positions (or "all rows" for a final fit);
+
+so the hash of those is its key. Editing one target's feature set, retuning one
+registry entry or adding a model to the bake-off invalidates exactly the cells
+that read them; everything else is loaded from disk.
+
+Entries are written by whichever process fitted them (worker or parent), via a
+temp file + ``os.replace`` so a crashed run never leaves a half-written entry.
+Nothing is ever evicted — delete ``outputs/cv_cache`` to reclaim the space.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import joblib
+import numpy as np
+import sklearn
+from sklearn.base import BaseEstimator
+
+from . import config
+from . import models as registry
+
+
+def _normalize(value):
+    """JSON-stable view of a get_params() value. Nested estimators reduce to their
+    class path — their own params are already flattened into the deep dict."""
+    if isinstance(value, BaseEstimator):
+        return f"{type(value).__module__}.{type(value).__qualname__}"
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def estimator_fingerprint(model_name: str) -> str:
+    """Hash of what the registry entry would build today (not of its name)."""
+    est = registry.build_estimator(model_name)
+    payload = {
+        "class": _normalize(est),
+        "params": _normalize(est.get_params(deep=True)),
+        "sklearn": sklearn.__version__,
+        "clip_at_zero": config.CLIP_AT_ZERO,
+    }
+    return hashlib.blake2b(
+        json.dumps(payload, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+
+
+def cell_key(data_fp: str, estimator_fp: str, test_positions: np.ndarray | None) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(data_fp.encode())
+    h.update(estimator_fp.encode())
+    if test_positions is None:
+        h.update(b"final:all-rows")
+    else:
+        h.update(np.ascontiguousarray(test_positions, dtype=np.int64).tobytes())
+    return h.hexdigest()
+
+
+class CVCache:
+    """One directory of ``<key>.pred.npy`` / ``<key>.model.joblib`` entries."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = Path(root or config.CV_CACHE_DIR)
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def get_pred(self, key: str) -> np.ndarray | None:
+        path = self._path(key, ".pred.npy")
+        return np.load(path) if path.exists() else None
+
+    def get_model(self, key: str) -> BaseEstimator | None:
+        path = self._path(key, ".model.joblib")
+        return joblib.load(path) if path.exists() else None
+
+    def put(self, key: str, pred: np.ndarray | None, model: BaseEstimator) -> None:
+        # Model first: a fold counts as cached once its prediction exists, and the
+        # prediction is only written after the model it came from.
+        self._atomic(self._path(key, ".model.joblib"), lambda f: joblib.dump(model, f))
+        if pred is not None:
+            self._atomic(self._path(key, ".pred.npy"), lambda f: np.save(f, np.asarray(pred)))
+
+    @staticmethod
+    def _atomic(path: Path, write) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,322 @@
+"""Parallel cross-validation over one shared, memory-mapped feature matrix.
+
+    uv run python -m model_stats_inference.training.train --jobs 8
+    uv run python -m model_stats_inference.training.compare_models --jobs 8
+
+`train` and `compare_models` used to walk TARGETS one after another, and every
+``cross_val_predict(n_jobs=-1)`` worker re-pickled its X slice out of the full
+parquet frame. Here the matrix is converted once into a float32 ``.npy`` store
+(`MatrixStore`) that every worker opens with ``mmap_mode="r"`` — the OS page cache
+holds a single copy however many processes read it — and the grid of
+(target, model, fold) fits is scheduled across a process pool.
+
+A task carries only names and a fold number. Each worker rebuilds the target's row
+selection and the KFold split from the store itself, so nothing matrix-sized is
+ever pickled; only the fold's predictions (and, for the final fit, the model) come
+back. Splits are the exact `KFold(shuffle, RANDOM_STATE)` splits
+`train.cross_validate_target` uses, but fits read the float32 store, not the
+float64 frame: features are float32-cast, so a split threshold (and with it the
+fold predictions and CV metrics) can differ slightly from the serial path. They
+are identical only when every feature value is exactly representable in float32.
+
+Cells whose inputs haven't changed since a previous run are served from the
+content-addressed fold cache (training/cv_cache.py) and never scheduled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator
+from sklearn.model_selection import KFold
+from threadpoolctl import threadpool_limits
+
+from ..research.features import feature_columns
+from . import config
+from . import models as registry
+from .cv_cache import CVCache, cell_key, estimator_fingerprint
+from .train import TrainResult, summarize_cv
+
+def _source_stamp(path: Path) -> str:
+    st = Path(path).stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+@dataclass
+class MatrixStore:
+    """The feature matrix as memory-mapped arrays: X (float32, rows × features),
+    one float64 column per target, and the original row index (the reconciler
+    aligns OOF residuals on it).
+
+    Rebuilt only when the source parquet changes (size + mtime), so a second run
+    opens the store without parsing the parquet at all.
+    """
+
+    root: Path
+    columns: list[str]
+    targets: list[str]
+    X: np.ndarray            # (n, p) float32, mmap
+    Y: np.ndarray            # (n, len(targets)) float64, mmap
+    index: np.ndarray        # (n,) int64, mmap
+
+    def __post_init__(self) -> None:
+        self._col_pos = {c: i for i, c in enumerate(self.columns)}
+        self._rows: dict[str, np.ndarray] = {}
+        self._fingerprints: dict[tuple[str, tuple[str, ...]], str] = {}
+
+    @classmethod
+    def build(cls, matrix: pd.DataFrame, root: Path, source_stamp: str = "") -> "MatrixStore":
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        columns = feature_columns(matrix)  # meta/id and target columns are never stored as X
+        targets = [t for t in config.TARGETS if f"{config.TARGET_PREFIX}{t}" in matrix.columns]
+        np.save(root / "X.npy", np.ascontiguousarray(matrix[columns].to_numpy(dtype=np.float32)))
+        np.save(
+            root / "Y.npy",
+            np.ascontiguousarray(
+                matrix[[f"{config.TARGET_PREFIX}{t}" for t in targets]].to_numpy(dtype=np.float64)
+            ),
+        )
+        np.save(root / "index.npy", matrix.index.to_numpy(dtype=np.int64))
+        # meta.json last: its presence marks a complete store.
+        (root / "meta.json").write_text(json.dumps(
+            {"source": source_stamp, "columns": columns, "targets": targets}
+        ))
+        return cls.open(root)
+
+    @classmethod
+    def open(cls, root: Path) -> "MatrixStore":
+        root = Path(root)
+        meta = json.loads((root / "meta.json").read_text())
+        return cls(
+            root=root,
+            columns=meta["columns"],
+            targets=meta["targets"],
+            X=np.load(root / "X.npy", mmap_mode="r"),
+            Y=np.load(root / "Y.npy", mmap_mode="r"),
+            index=np.load(root / "index.npy", mmap_mode="r"),
+        )
+
+    @classmethod
+    def from_parquet(cls, path: Path, root: Path | None = None) -> "MatrixStore":
+        """Open the store for `path`, (re)building it if the parquet changed."""
+        root = Path(root or config.MATRIX_STORE_DIR)
+        stamp = _source_stamp(path)
+        meta_path = root / "meta.json"
+        if meta_path.exists():
+            try:
+                if json.loads(meta_path.read_text()).get("source") == stamp:
+                    return cls.open(root)
+            except (OSError, ValueError):
+                pass  # half-written store — rebuild below
+            meta_path.unlink(missing_ok=True)
+        return cls.build(pd.read_parquet(path), root, source_stamp=stamp)
+
+    # --- per-target views (what train._prepare selects) ----------------------
+
+    def rows(self, target: str) -> np.ndarray:
+        """Positions of the target's training rows (enough history, known y)."""
+        rows = self._rows.get(target)
+        if rows is None:
+            hist = np.asarray(self.X[:, self._col_pos["HISTORY_GAMES"]])
+            y = np.asarray(self.Y[:, self.targets.index(target)])
+            rows = np.flatnonzero((hist >= config.MIN_HISTORY_GAMES) & ~np.isnan(y))
+            self._rows[target] = rows
+        return rows
+
+    def y(self, target: str) -> np.ndarray:
+        return np.asarray(self.Y[self.rows(target), self.targets.index(target)])
+
+    def row_index(self, target: str) -> np.ndarray:
+        return np.asarray(self.index[self.rows(target)])
+
+    def frame(self, target: str, features: list[str], positions: np.ndarray | None = None) -> pd.DataFrame:
+        """X for the target's rows (or a subset of them), as a named frame.
+
+        The estimators need column names (`ExposureRegressor` reads its exposure
+        column by name; HGB records ``feature_names_in_`` for serving).
+        """
+        rows = self.rows(target)
+        if positions is not None:
+            rows = rows[positions]
+        cols = [self._col_pos[f] for f in features]
+        return pd.DataFrame(np.asarray(self.X[np.ix_(rows, cols)]), columns=list(features))
+
+    def fingerprint(self, target: str, features: tuple[str, ...]) -> str:
+        """Content hash of exactly what a (target, features) fit reads: the row
+        keys, y, the feature names (order included) and their values. Columns the
+        cell doesn't use can change freely without invalidating it."""
+        key = (target, tuple(features))
+        fp = self._fingerprints.get(key)
+        if fp is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(json.dumps([target, list(features)]).encode())
+            h.update(np.ascontiguousarray(self.row_index(target)).tobytes())
+            h.update(np.ascontiguousarray(self.y(target)).tobytes())
+            h.update(np.ascontiguousarray(self.frame(target, list(features)).to_numpy()).tobytes())
+            fp = self._fingerprints[key] = h.hexdigest()
+        return fp
+
+
+def fold_splits(n_rows: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    """The training KFold splits for a target with `n_rows` rows."""
+    kf = KFold(n_splits=config.KFOLDS, shuffle=True, random_state=config.RANDOM_STATE)
+    return list(kf.split(np.empty((n_rows, 1))))
+
+
+# --- tasks ----------------------------------------------------------------
+
+@dataclass(frozen=True)
+class CVSpec:
+    """One cell of the grid: a target cross-validated with a registered model."""
+
+    target: str
+    model_name: str
+    features: tuple[str, ...]
+    fit_final: bool = False   # also fit on every row (train.py's saved model)
+
+
+@dataclass(frozen=True)
+class FoldTask:
+    target: str
+    model_name: str
+    features: tuple[str, ...]
+    fold: int | None          # None = final fit on all rows
+    cache_key: str | None = None
+
+
+# Per-worker state: the opened store, the CV cache and the thread cap, set by
+# _init_worker.
+_WORKER: dict = {}
+
+
+def _init_worker(root: str, threads: int, cache_root: str | None = None) -> None:
+    _WORKER["store"] = MatrixStore.open(Path(root))
+    _WORKER["cache"] = CVCache(Path(cache_root)) if cache_root else None
+    # HGB parallelises with OpenMP; N workers × all-cores threads would thrash.
+    _WORKER["limits"] = threadpool_limits(limits=threads)
+
+
+def _run_task(task: FoldTask):
+    store: MatrixStore = _WORKER["store"]
+    features = list(task.features)
+    y = store.y(task.target)
+    cache: CVCache | None = _WORKER.get("cache")
+    model = registry.build_estimator(task.model_name)
+    if task.fold is None:
+        model.fit(store.frame(task.target, features), y)
+        if cache is not None and task.cache_key:
+            cache.put(task.cache_key, None, model)
+        return task, None, model
+    tr, te = fold_splits(len(y))[task.fold]
+    model.fit(store.frame(task.target, features, tr), y[tr])
+    pred = model.predict(store.frame(task.target, features, te))
+    if config.CLIP_AT_ZERO:
+        pred = np.clip(pred, 0, None)
+    # The fold model itself stays in the cache; only the prediction travels back.
+    if cache is not None and task.cache_key:
+        cache.put(task.cache_key, pred, model)
+    return task, pred, None
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def _plan(
+    store: MatrixStore, specs: list[CVSpec], cache: CVCache | None
+) -> tuple[list[FoldTask], list[tuple]]:
+    """Split the grid into tasks to run and outcomes already in the cache."""
+    est_fps: dict[str, str] = {}
+    todo: list[FoldTask] = []
+    cached: list[tuple] = []
+    for s in specs:
+        folds: list[int | None] = [*range(config.KFOLDS)] + ([None] if s.fit_final else [])
+        if cache is None:
+            todo.extend(FoldTask(s.target, s.model_name, s.features, k) for k in folds)
+            continue
+        data_fp = store.fingerprint(s.target, s.features)
+        if s.model_name not in est_fps:
+            est_fps[s.model_name] = estimator_fingerprint(s.model_name)
+        est_fp = est_fps[s.model_name]
+        splits = fold_splits(len(store.rows(s.target)))
+        for k in folds:
+            key = cell_key(data_fp, est_fp, None if k is None else splits[k][1])
+            task = FoldTask(s.target, s.model_name, s.features, k, cache_key=key)
+            hit = cache.get_model(key) if k is None else cache.get_pred(key)
+            if hit is None:
+                todo.append(task)
+            elif k is None:
+                cached.append((task, None, hit))
+            else:
+                cached.append((task, hit, None))
+    return todo, cached
+
+
+def run_grid(
+    store: MatrixStore,
+    specs: list[CVSpec],
+    jobs: int | None = None,
+    cache: CVCache | None = None,
+) -> dict[tuple[str, str], tuple[TrainResult, BaseEstimator | None]]:
+    """Cross-validate every spec; returns (target, model) -> (result, final model).
+
+    With a `cache`, cells whose inputs are unchanged are loaded instead of refit
+    (see training/cv_cache.py). ``jobs=1`` runs in-process (no pool) — same code
+    path, easier to debug.
+    """
+    jobs = max(1, jobs or default_jobs())
+    tasks, outcomes = _plan(store, specs, cache)
+    # Longest tasks first: final fits see every row, so start them early.
+    tasks.sort(key=lambda t: t.fold is not None)
+    if cache is not None:
+        print(f"  CV cache: {len(outcomes)} of {len(outcomes) + len(tasks)} fits reused, "
+              f"{len(tasks)} to run")
+
+    threads = max(1, default_jobs() // jobs)
+    cache_root = str(cache.root) if cache is not None else None
+    if tasks and jobs == 1:
+        _init_worker(str(store.root), threads, cache_root)
+        try:
+            outcomes += [_run_task(t) for t in tasks]
+        finally:
+            _WORKER.pop("limits").restore_original_limits()
+            _WORKER.clear()
+    elif tasks:
+        # spawn, not fork: the parent has usually initialised OpenMP (HGB) by now,
+        # and forking a process with live OpenMP threads can deadlock the child.
+        # Workers need nothing from the parent but the store path anyway.
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(str(store.root), threads, cache_root),
+        ) as pool:
+            outcomes += list(pool.map(_run_task, tasks))
+
+    preds: dict[tuple[str, str], dict[int, np.ndarray]] = {}
+    finals: dict[tuple[str, str], BaseEstimator] = {}
+    for task, pred, model in outcomes:
+        key = (task.target, task.model_name)
+        if task.fold is None:
+            finals[key] = model
+        else:
+            preds.setdefault(key, {})[task.fold] = pred
+
+    out = {}
+    for s in specs:
+        key = (s.target, s.model_name)
+        y = store.y(s.target)
+        splits = fold_splits(len(y))
+        folds = [(splits[k][1], preds[key][k]) for k in range(config.KFOLDS)]
+        res = summarize_cv(s.target, list(s.features), y, store.row_index(s.target), folds)
+        out[key] = (res, finals.get(key))
+    return out
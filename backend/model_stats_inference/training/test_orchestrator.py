@@ -0,0 +1,115 @@
+"""Parallel CV orchestrator: the memory-mapped store, the process-pool grid and the
+fold cache must reproduce the serial `cross_validate_target` numbers — exactly on
+float32-exact features, within a small bound on arbitrary float64 ones.
+
+Run: uv run pytest model_stats_inference/training/test_orchestrator.py
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from model_stats_inference.training import config
+from model_stats_inference.training import models as registry
+from model_stats_inference.training.cv_cache import CVCache
+from model_stats_inference.training.orchestrator import CVSpec, MatrixStore, _plan, run_grid
+from model_stats_inference.training.train import _prepare, cross_validate_target
+
+FEATURES = ["T_MIN", "PTS_w5_mean", "HISTORY_GAMES"]
+
+
+@pytest.fixture(scope="module")
+def matrix() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 240
+    # Quarter-steps are exact in float32, so the float32 store loses nothing.
+    t_min = np.round(rng.uniform(10, 36, n) * 4) / 4
+    pts_mean = np.round(rng.uniform(5, 25, n) * 4) / 4
+    pts = np.round(t_min * pts_mean / 30 + rng.normal(0, 2, n)).clip(0)
+    df = pd.DataFrame({
+        "PLAYER_ID": rng.integers(1, 20, n),
+        "GAME_DATE": pd.Timestamp("2024-11-01") + pd.to_timedelta(rng.integers(0, 90, n), "D"),
+        "T_MIN": t_min,
+        "PTS_w5_mean": pts_mean,
+        "HISTORY_GAMES": rng.integers(0, 30, n).astype(float),
+    })
+    for t in config.TARGETS:
+        df[f"y_{t}"] = pts if t == "PTS" else np.nan
+    df.loc[df.index[::17], "y_PTS"] = np.nan   # unknown targets are skipped
+    return df
+
+
+def test_store_roundtrip_and_rebuild_on_change(matrix, tmp_path):
+    src = tmp_path / "feature_matrix.parquet"
+    matrix.to_parquet(src, index=False)
+    store = MatrixStore.from_parquet(src, tmp_path / "store")
+    assert store.X.dtype == np.float32 and isinstance(store.X, np.memmap)
+    assert "PLAYER_ID" not in store.columns and "y_PTS" not in store.columns
+
+    X, y = _prepare(matrix, FEATURES, "PTS")
+    np.testing.assert_array_equal(store.row_index("PTS"), y.index.to_numpy())
+    np.testing.assert_array_equal(store.frame("PTS", FEATURES).to_numpy(), X.to_numpy())
+
+    # Same parquet -> reopened, not rebuilt; a rewrite invalidates it.
+    mtime = (tmp_path / "store" / "X.npy").stat().st_mtime_ns
+    MatrixStore.from_parquet(src, tmp_path / "store")
+    assert (tmp_path / "store" / "X.npy").stat().st_mtime_ns == mtime
+    matrix.iloc[:100].to_parquet(src, index=False)
+    assert len(MatrixStore.from_parquet(src, tmp_path / "store").index) == 100
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_grid_matches_serial_cv(matrix, tmp_path, jobs):
+    store = MatrixStore.build(matrix, tmp_path / "store")
+    grid = run_grid(store, [CVSpec("PTS", "hgb_l2", tuple(FEATURES), fit_final=True)], jobs=jobs)
+    res, final = grid[("PTS", "hgb_l2")]
+
+    X, y = _prepare(matrix, FEATURES, "PTS")
+    ref = cross_validate_target(X, y, "PTS", FEATURES, make_est=lambda: registry.build_estimator("hgb_l2"))
+    assert res.n_rows == ref.n_rows
+    assert res.rmse_mean == pytest.approx(ref.rmse_mean)
+    assert res.r2_std == pytest.approx(ref.r2_std)
+    np.testing.assert_allclose(res.oof_pred, ref.oof_pred)
+    np.testing.assert_array_equal(res.oof_index, ref.oof_index)
+
+    expected = registry.build_estimator("hgb_l2").fit(X, y).predict(X)
+    np.testing.assert_allclose(final.predict(X), expected)
+
+
+def test_float32_store_stays_close_to_serial_cv(matrix, tmp_path):
+    rng = np.random.default_rng(1)
+    noisy = matrix.copy()
+    noisy["T_MIN"] += rng.uniform(0, 0.25, len(noisy)) / 3  # not float32-exact
+    noisy["PTS_w5_mean"] += rng.uniform(0, 0.25, len(noisy)) / 7
+    store = MatrixStore.build(noisy, tmp_path / "store")
+    res, _ = run_grid(store, [CVSpec("PTS", "hgb_l2", tuple(FEATURES))], jobs=1)[("PTS", "hgb_l2")]
+
+    X, y = _prepare(noisy, FEATURES, "PTS")
+    ref = cross_validate_target(X, y, "PTS", FEATURES, make_est=lambda: registry.build_estimator("hgb_l2"))
+    assert res.rmse_mean == pytest.approx(ref.rmse_mean, rel=1e-2)
+    assert res.r2_mean == pytest.approx(ref.r2_mean, abs=1e-2)
+
+
+def test_cache_reuses_unchanged_cells_only(matrix, tmp_path):
+    store = MatrixStore.build(matrix, tmp_path / "store")
+    cache = CVCache(tmp_path / "cache")
+    base = CVSpec("PTS", "hgb_l2", tuple(FEATURES), fit_final=True)
+    first, _ = run_grid(store, [base], jobs=1, cache=cache)[("PTS", "hgb_l2")]
+
+    # Unchanged: nothing to run, and the cached numbers are the fitted ones.
+    todo, cached = _plan(store, [base], cache)
+    assert todo == [] and len(cached) == config.KFOLDS + 1
+    again, final = run_grid(store, [base], jobs=1, cache=cache)[("PTS", "hgb_l2")]
+    np.testing.assert_array_equal(again.oof_pred, first.oof_pred)
+    assert final is not None
+
+    # A new model or a different feature list invalidates only its own cells.
+    other_model = CVSpec("PTS", "linear", tuple(FEATURES))
+    fewer_feats = CVSpec("PTS", "hgb_l2", tuple(FEATURES[:2]))
+    todo, cached = _plan(store, [base, other_model, fewer_feats], cache)
+    assert len(cached) == config.KFOLDS + 1
+    assert {(t.model_name, t.features) for t in todo} == {
+        ("linear", tuple(FEATURES)), ("hgb_l2", tuple(FEATURES[:2])),
+    }
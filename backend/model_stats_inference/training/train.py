@@ -1,6 +1,6 @@
 """Train one model per target stat on its own selected feature set.
 
-    uv run python -m model_stats_inference.training.train
+    uv run python -m model_stats_inference.training.train [--jobs N]
 
 For each target:
   - load its feature list from training/feature_sets/<target>.json
@@ -8,11 +8,18 @@ For each target:
     which features a model trains on)
   - run K-fold CV -> per-fold RMSE / MAE / R2 (mean +/- std) + out-of-fold preds
   - fit a final model on all rows and save it to model_stats_inference/models/
+
+Every (target, fold) fit and the final fits run in parallel over a memory-mapped
+copy of the matrix (see training/orchestrator.py); `--jobs 1` keeps it in-process.
+Fits whose data, features, estimator config and fold are unchanged since the last
+run come from the fold cache (training/cv_cache.py); `--no-cache` refits all.
 """
 
 from __future__ import annotations
 
+import argparse
 import json
+import os
 from dataclasses import dataclass, field
 from typing import Callable
 
@@ -21,11 +28,11 @@ import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.model_selection import KFold, cross_val_predict
+from sklearn.model_selection import KFold
 
 from . import config
-from . import plots
 from . import reconcile
+from ..serving.compiled import compile_model
 
 
 @dataclass
@@ -89,34 +96,53 @@ def cross_validate_target(
 
     `make_est` defaults to the production model (`config.make_model`); the
     comparison script passes a registry factory to score other models on the
-    *same* folds and features. Saves nothing — pure evaluation.
+    *same* folds and features. Saves nothing — pure evaluation. This is the
+    serial, in-memory path; `orchestrator.run_grid` runs the same folds across a
+    process pool.
     """
     make_est = make_est or config.make_model
     kf = KFold(n_splits=config.KFOLDS, shuffle=True, random_state=config.RANDOM_STATE)
 
-    # Per-fold metrics (so we get a std / band), computed on each fold's test part.
-    rmses, maes, r2s = [], [], []
+    folds = []
     for tr, te in kf.split(X):
         model = make_est()
         model.fit(X.iloc[tr], y.iloc[tr])
         pred = model.predict(X.iloc[te])
         if config.CLIP_AT_ZERO:
             pred = np.clip(pred, 0, None)
-        rmses.append(np.sqrt(mean_squared_error(y.iloc[te], pred)))
-        maes.append(mean_absolute_error(y.iloc[te], pred))
-        r2s.append(r2_score(y.iloc[te], pred))
+        folds.append((te, pred))
+
+    return summarize_cv(target, features, y.to_numpy(), y.index.to_numpy(), folds)
+
 
-    # Out-of-fold predictions for the scatter plot.
-    oof = cross_val_predict(make_est(), X, y, cv=kf, n_jobs=-1)
-    if config.CLIP_AT_ZERO:
-        oof = np.clip(oof, 0, None)
+def summarize_cv(
+    target: str,
+    features: list[str],
+    y: np.ndarray,
+    index: np.ndarray,
+    folds: list[tuple[np.ndarray, np.ndarray]],
+) -> TrainResult:
+    """Turn per-fold (test positions, clipped predictions) into a TrainResult.
+
+    Per-fold metrics give the std bands; the same predictions stitched together
+    are the out-of-fold vector (identical to ``cross_val_predict`` on these folds,
+    without fitting every fold a second time).
+    """
+    y = np.asarray(y, dtype=float)
+    oof = np.empty(len(y), dtype=float)
+    rmses, maes, r2s = [], [], []
+    for te, pred in folds:
+        oof[te] = pred
+        rmses.append(np.sqrt(mean_squared_error(y[te], pred)))
+        maes.append(mean_absolute_error(y[te], pred))
+        r2s.append(r2_score(y[te], pred))
 
     baseline_rmse = float(np.sqrt(mean_squared_error(y, np.full(len(y), y.mean()))))
 
     # Learned color scale: spread of the magnitude-normalized (Pearson) residual,
     # m = (actual - pred)/sqrt(pred+1), measured on the held-out OOF predictions.
     # Robust (MAD-based) so a few blow-ups don't inflate it. No hand-picked numbers.
-    resid = (y.to_numpy() - oof) / np.sqrt(np.clip(oof, 0, None) + 1.0)
+    resid = (y - oof) / np.sqrt(np.clip(oof, 0, None) + 1.0)
     resid_bias = float(np.median(resid))
     mad = float(np.median(np.abs(resid - resid_bias)))
     resid_sigma = float(1.4826 * mad) if mad > 0 else float(np.std(resid))
@@ -124,7 +150,7 @@ def cross_validate_target(
     return TrainResult(
         target=target,
         features=features,
-        n_rows=len(X),
+        n_rows=len(y),
         rmse_mean=float(np.mean(rmses)),
         rmse_std=float(np.std(rmses)),
         mae_mean=float(np.mean(maes)),
@@ -134,12 +160,40 @@ def cross_validate_target(
         baseline_rmse=baseline_rmse,
         resid_sigma=resid_sigma,
         resid_bias=resid_bias,
-        oof_true=y.to_numpy(),
+        oof_true=y,
         oof_pred=oof,
-        oof_index=y.index.to_numpy(),
+        oof_index=np.asarray(index),
     )
 
 
+def save_model(target: str, features: list[str], final: BaseEstimator, res: TrainResult) -> None:
+    config.MODELS_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "target": target,
+        "features": features,
+        "model": final,
+        # Packed node arrays for the serving fast path; None for estimators
+        # that don't compile (serving then calls model.predict).
+        "compiled": compile_model(final, features),
+        "model_name": config.MODEL_NAME,
+        "clip_at_zero": config.CLIP_AT_ZERO,
+        "metrics": {
+            "rmse_mean": res.rmse_mean,
+            "rmse_std": res.rmse_std,
+            "mae_mean": res.mae_mean,
+            "r2_mean": res.r2_mean,
+            "resid_sigma": res.resid_sigma,
+            "resid_bias": res.resid_bias,
+        },
+    }
+    # Write-then-rename: a running server memory-maps these files (serving
+    # ModelRegistry), so the old inode must stay intact until it reloads.
+    path = config.MODELS_DIR / f"{target}.joblib"
+    tmp = path.with_suffix(".joblib.tmp")
+    joblib.dump(payload, tmp)
+    os.replace(tmp, path)
+
+
 def train_target(matrix: pd.DataFrame, target: str) -> TrainResult:
     features = load_feature_set(target)
     X, y = _prepare(matrix, features, target)
@@ -149,43 +203,50 @@ def train_target(matrix: pd.DataFrame, target: str) -> TrainResult:
     # Final model trained on everything, then saved.
     final = config.make_model()
     final.fit(X, y)
-    config.MODELS_DIR.mkdir(parents=True, exist_ok=True)
-    joblib.dump(
-        {
-            "target": target,
-            "features": features,
-            "model": final,
-            "model_name": config.MODEL_NAME,
-            "clip_at_zero": config.CLIP_AT_ZERO,
-            "metrics": {
-                "rmse_mean": res.rmse_mean,
-                "rmse_std": res.rmse_std,
-                "mae_mean": res.mae_mean,
-                "r2_mean": res.r2_mean,
-                "resid_sigma": res.resid_sigma,
-                "resid_bias": res.resid_bias,
-            },
-        },
-        config.MODELS_DIR / f"{target}.joblib",
-    )
-
+    save_model(target, features, final, res)
     return res
 
 
 def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument(
+        "--jobs", type=int, default=None,
+        help="worker processes for the (target, fold) grid (default: all cores; 1 = in-process)",
+    )
+    ap.add_argument(
+        "--no-cache", action="store_true",
+        help="refit every fold instead of reusing unchanged cells from outputs/cv_cache",
+    )
+    args = ap.parse_args()
+
+    # Imported here: the orchestrator imports this module (TrainResult, summarize_cv),
+    # and plots needs matplotlib (ml-research group), which the orchestrator's
+    # worker processes — and the test environment — do not.
+    from . import orchestrator, plots
+    from .cv_cache import CVCache
+
     if not config.FEATURE_MATRIX.exists():
         raise FileNotFoundError(
             f"{config.FEATURE_MATRIX} not found — run the research pipeline first."
         )
-    matrix = pd.read_parquet(config.FEATURE_MATRIX)
+    store = orchestrator.MatrixStore.from_parquet(config.FEATURE_MATRIX)
     ensure_feature_sets()
-    print(f"Feature matrix: {len(matrix):,} rows; training {len(config.TARGETS)} models "
-          f"({config.KFOLDS}-fold CV)\n")
+    print(f"Feature matrix: {len(store.index):,} rows; training {len(config.TARGETS)} models "
+          f"({config.KFOLDS}-fold CV, {args.jobs or orchestrator.default_jobs()} jobs)\n")
+
+    specs = [
+        orchestrator.CVSpec(t, config.MODEL_NAME, tuple(load_feature_set(t)), fit_final=True)
+        for t in config.TARGETS
+    ]
+    cache = None if args.no_cache else CVCache()
+    grid = orchestrator.run_grid(store, specs, jobs=args.jobs, cache=cache)
 
     results: dict[str, TrainResult] = {}
     card = {}
-    for target in config.TARGETS:
-        res = train_target(matrix, target)
+    for spec in specs:
+        target = spec.target
+        res, final = grid[(target, config.MODEL_NAME)]
+        save_model(target, res.features, final, res)
         results[target] = res
         print(
             f"  {target:<5} n={res.n_rows:,}  "
@@ -13,7 +13,9 @@ os.environ.update({
     "CORS_ORIGINS": "http://localhost:3000,http://localhost:5173",
     "ENVIRONMENT": "test",
     "LOG_LEVEL": "WARNING",
-    "PORT": "8000"
+    "PORT": "8000",
+    "MODEL_WARMUP_ENABLED": "false",
+    "BATCH_WORKERS": "0",
 })
 
 # Import after setting environment variables
@@ -34,13 +36,16 @@ class MockDBService:
     back entirely to the mocked ESPN players_df (preserving pre-existing
     route-test expectations that all time periods return the same data)."""
 
-    async def aggregate_player_games(self, start, end, season):
+    async def aggregate_player_games(self, start, end, season, player_ids=None):
         import pandas as pd
         return pd.DataFrame(), None, None
 
     async def get_latest_game_date(self, season):
         return None
 
+    async def get_season_player_names(self, season):
+        return []
+
 
 # Create a mock DataProvider class that behaves properly with the singleton pattern
 class MockDataProvider:
@@ -155,6 +160,9 @@ class MockDataProvider:
     def get_data_date(self):
         return None
 
+    def get_scoring_period_id(self):
+        return None
+
     async def close(self):
         pass
 
@@ -186,6 +194,14 @@ def reset_windowed_players_cache():
     yield
     _windowed_players_cache.clear()
 
+@pytest.fixture(autouse=True)
+def reset_nba_ids_cache():
+    """Same as reset_season_anchor_cache, for the ESPN-name -> NBA-id map."""
+    from app.services.player_service import _nba_ids_cache
+    _nba_ids_cache.update({'season': None, 'ids': None, 'ts': None})
+    yield
+    _nba_ids_cache.update({'season': None, 'ids': None, 'ts': None})
+
 @pytest.fixture(autouse=True)
 def reset_nba_stats_service_singleton():
     """NBAStatsService is a singleton (pooled httpx client + TTL caches
@@ -199,6 +215,27 @@ def reset_nba_stats_service_singleton():
     NBAStatsService._instance = None
     NBAStatsService._initialized = False
 
+@pytest.fixture(autouse=True)
+def reset_schedule_context_singleton():
+    """Same as reset_nba_stats_service_singleton, for ScheduleContextProvider
+    (it holds the per-scoring-period context and its DataProvider)."""
+    from app.services.schedule_context import ScheduleContextProvider
+    ScheduleContextProvider._instance = None
+    ScheduleContextProvider._initialized = False
+    yield
+    ScheduleContextProvider._instance = None
+    ScheduleContextProvider._initialized = False
+
+@pytest.fixture(autouse=True)
+def reset_draft_report_service_singleton():
+    """DraftReportService holds the encoded draft report in memory once built."""
+    from app.services.draft_report_service import DraftReportService
+    DraftReportService._instance = None
+    DraftReportService._initialized = False
+    yield
+    DraftReportService._instance = None
+    DraftReportService._initialized = False
+
 @pytest.fixture
 def test_client():
     """Create a test client for the FastAPI application."""
@@ -0,0 +1,150 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.fantsy_estimator import FantasyEstimator
+from app.fantsy_estimator.scenario import Scenario, ScenarioEngine, TeamPerturbation
+from app.fantsy_estimator.scenario import scenario_engine
+from app.fantsy_estimator.scenario.scenario_engine import _rank_desc
+from app.services.slot_games_estimator import SLOT_CAPS, SLOTS
+
+N_TEAMS = 6
+
+
+def _snapshots(seed: int = 0, n_days: int = 40) -> pd.DataFrame:
+    """Cumulative team_daily_snapshot rows with a clear per-team strength gradient."""
+    rng = np.random.default_rng(seed)
+    rows, start = [], date(2025, 10, 22)
+    totals = {t: np.zeros(10) for t in range(1, N_TEAMS + 1)}
+    gp = {t: 0 for t in totals}
+    for day in range(n_days):
+        for t in totals:
+            games = int(rng.integers(3, 9))
+            scale = 1.0 + 0.03 * t
+            fga = games * rng.uniform(11, 13)
+            fta = games * rng.uniform(3.5, 4.5)
+            totals[t] += [fga * 0.47, fga, fta * 0.78, fta, games * 1.8 * scale, games * 5.7 * scale,
+                          games * 3.5 * scale, games * 1.0 * scale, games * 0.65 * scale, games * 15.5 * scale]
+            gp[t] += games
+            fgm, fga_, ftm, fta_, tpm, reb, ast, stl, blk, pts = (float(v) for v in totals[t])
+            rows.append({
+                "id": len(rows) + 1, "scoring_period_id": day + 1, "date": start + timedelta(days=day),
+                "team_id": t, "team_name": f"Team {t}", "gp": gp[t],
+                "fgm": fgm, "fga": fga_, "fg_pct": fgm / fga_, "ftm": ftm, "fta": fta_, "ft_pct": ftm / fta_,
+                "three_pm": tpm, "reb": reb, "ast": ast, "stl": stl, "blk": blk, "pts": pts,
+                "created_at": pd.Timestamp(start + timedelta(days=day)),
+            })
+    return pd.DataFrame(rows)
+
+
+def _slot_projection() -> pd.DataFrame:
+    rows = []
+    for t in range(1, N_TEAMS + 1):
+        row = {"team_id": t, "team_name": f"Team {t}"}
+        row.update({f"proj_{s}": 70.0 if s != "UTIL" else 200.0 for s in SLOTS})
+        row["proj_total"] = sum(v for k, v in row.items() if k.startswith("proj_"))
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    estimator = FantasyEstimator()
+    predictions, _, _ = estimator.estimate(_snapshots(), 30.0, _slot_projection())
+    return predictions, estimator.team_fits
+
+
+def _ranking(outcome):
+    return outcome.ranking_df.set_index("team_id")
+
+
+def test_fits_reproduce_the_baseline_predictions(baseline):
+    predictions, fits = baseline
+    assert [f.team_id for f in fits] == predictions["team_id"].tolist()
+    for fit, (_, row) in zip(fits, predictions.iterrows()):
+        mean, cov = fit.season_totals()
+        assert mean[-1] == pytest.approx(row["estimated_final_pts"])
+        assert cov[-1, -1] == pytest.approx(row["variance_pts"])
+        assert fit.projected_total_gp == pytest.approx(row["projected_total_gp"])
+
+
+def test_fit_matches_estimate_without_monte_carlo(baseline):
+    _, fits = baseline
+    refit = FantasyEstimator().fit(_snapshots(), 30.0, _slot_projection())
+    assert [f.team_id for f in refit] == [f.team_id for f in fits]
+    np.testing.assert_allclose(refit[2].cov_per_game, fits[2].cov_per_game)
+
+
+def test_seeded_runs_are_deterministic(baseline):
+    _, fits = baseline
+    scenario = [Scenario("boost", (TeamPerturbation(1, mean_shift={"pts": 1.0}),))]
+    a = ScenarioEngine(fits, num_runs=300, seed=7).run(scenario)
+    b = ScenarioEngine(fits, num_runs=300, seed=7).run(scenario)
+    for x, y in zip(a, b):
+        pd.testing.assert_frame_equal(x.ranking_df, y.ranking_df)
+        pd.testing.assert_frame_equal(x.rank_prob_df, y.rank_prob_df)
+
+
+def test_chunk_size_does_not_change_results(baseline, monkeypatch):
+    _, fits = baseline
+    scenario = [Scenario("boost", (TeamPerturbation(1, mean_shift={"pts": 1.0}),))]
+    whole = ScenarioEngine(fits, num_runs=300, seed=7).run(scenario)
+    monkeypatch.setattr(scenario_engine, "_CHUNK_VALUES", 7 * 2 * N_TEAMS * 10)  # 7 runs per chunk
+    chunked = ScenarioEngine(fits, num_runs=300, seed=7).run(scenario)
+    for x, y in zip(whole, chunked):
+        pd.testing.assert_frame_equal(x.ranking_df, y.ranking_df)
+        pd.testing.assert_frame_equal(x.rank_prob_df, y.rank_prob_df)
+
+
+def test_empty_scenario_matches_baseline_exactly(baseline):
+    _, fits = baseline
+    base, noop = ScenarioEngine(fits, num_runs=300, seed=1).run([Scenario("noop")])
+    assert base.name == "baseline"
+    assert (noop.ranking_df["delta_total_expected_pts"] == 0).all()
+    assert (noop.rank_prob_df["delta_prob"] == 0).all()
+    assert noop.rank_prob_df.groupby("team_id")["prob"].sum().tolist() == pytest.approx([1.0] * N_TEAMS)
+
+
+def test_mean_shift_moves_the_team_up(baseline):
+    _, fits = baseline
+    boost = Scenario("boost", (TeamPerturbation(1, mean_shift={stat: 0.5 for stat in
+                                                                ("three_pm", "reb", "ast", "stl", "blk", "pts")}),))
+    base, boosted = ScenarioEngine(fits, num_runs=500, seed=3).run([boost])
+    assert _ranking(boosted).loc[1, "delta_total_expected_pts"] > 5
+    first_place = boosted.rank_prob_df.query("team_id == 1 and rank == 1")
+    assert first_place["delta_prob"].iloc[0] > 0
+    # Rivals can only lose what team 1 gained.
+    assert _ranking(boosted)["delta_total_expected_pts"].sum() == pytest.approx(0.0, abs=1e-9)
+
+
+def test_slot_games_go_through_the_caps(baseline):
+    _, fits = baseline
+    base_gp = fits[0].projected_total_gp
+    more = Scenario("stream", (TeamPerturbation(1, slot_games={"PG": 5.0}),))
+    capped = Scenario("capped", (TeamPerturbation(1, slot_games={"PG": 500.0}),))
+    _, streamed, capped_out = ScenarioEngine(fits, num_runs=200, seed=0).run([more, capped])
+    assert _ranking(streamed).loc[1, "projected_total_gp"] == pytest.approx(base_gp + 5.0)
+    assert _ranking(capped_out).loc[1, "projected_total_gp"] == pytest.approx(base_gp - 70.0 + SLOT_CAPS["PG"])
+    assert _ranking(streamed).loc[1, "delta_total_expected_pts"] > 0
+
+
+def test_invalid_perturbations_raise(baseline):
+    _, fits = baseline
+    with pytest.raises(ValueError, match="unknown team_id"):
+        ScenarioEngine(fits, num_runs=100).run([Scenario("x", (TeamPerturbation(999),))])
+    with pytest.raises(ValueError, match="Unknown stats"):
+        TeamPerturbation(1, mean_shift={"fg_pct": 1.0})
+    with pytest.raises(ValueError, match="Unknown slots"):
+        TeamPerturbation(1, slot_games={"BENCH": 1.0})
+
+
+@pytest.mark.parametrize("average,method", [(True, "average"), (False, "first")])
+def test_rank_desc_matches_pandas_rank_with_ties(average, method):
+    x = np.random.default_rng(0).integers(0, 4, size=(20, 6, 3)).astype(float)
+    ranks = _rank_desc(x, axis=1, average=average)
+    for i in range(x.shape[0]):
+        for j in range(x.shape[2]):
+            expected = pd.Series(x[i, :, j]).rank(ascending=False, method=method).to_numpy()
+            np.testing.assert_array_equal(ranks[i, :, j], expected)
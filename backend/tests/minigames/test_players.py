@@ -0,0 +1,70 @@
+import json
+import os
+import random
+
+import pytest
+
+from app.minigames import players as mp
+
+
+def _player(pid, team="BOS", position="Guard", photo=True):
+    return {
+        "id": pid, "displayName": pid, "team": f"Team {team}", "teamAbbr": team,
+        "position": position, "photoUrl": f"https://x/{pid}.png" if photo else None,
+    }
+
+
+@pytest.fixture
+def bundle_file(tmp_path, monkeypatch):
+    path = tmp_path / "players.json"
+
+    def write(players):
+        path.write_text(json.dumps({"seasonLabel": "t", "source": "", "updatedAt": "", "players": players}))
+        # Distinct mtime even on coarse filesystem clocks.
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000 * (len(players) + 1)))
+
+    monkeypatch.setattr(mp, "_JSON_PATH", path)
+    monkeypatch.setattr(mp, "_index", None)
+    monkeypatch.setattr(mp, "_stat_key", None)
+    write([
+        _player("a", "BOS", "Guard"),
+        _player("b", "BOS", "Forward-Center", photo=False),
+        _player("c", "NYK", "Center"),
+    ])
+    return write
+
+
+def test_lookup_and_team_options(bundle_file):
+    players = mp.get_players()
+    assert isinstance(players, tuple) and mp.get_players() is players
+    assert mp.find_player_by_id(players, "b")["position"] == "Forward-Center"
+    assert mp.find_player_by_id(players, "zzz") is None
+    # Any other sequence still works, by scanning.
+    assert mp.find_player_by_id([players[2]], "c") is players[2]
+    assert [p["id"] for p in mp.players_with_photos(players)] == ["a", "c"]
+    assert mp.build_nba_team_options(players) == [
+        {"abbr": "BOS", "label": "Team BOS"}, {"abbr": "NYK", "label": "Team NYK"},
+    ]
+
+
+def test_pick_excludes(bundle_file):
+    random.seed(0)
+    players = mp.get_players()
+    assert {mp.pick_random_player(players, exclude_id="b")["id"] for _ in range(200)} == {"a", "c"}
+    assert mp.pick_random_player(players[2:], exclude_id="c")["id"] == "c"
+    assert mp.pick_random_player(()) is None
+    assert mp.pick_random_player_with_photo(players, exclude_id="a")["id"] == "c"
+
+
+def test_reload_only_when_content_changes(bundle_file):
+    first = mp.get_index()
+    assert mp.get_index() is first
+
+    # Touched but identical content: same index object.
+    os.utime(mp._JSON_PATH, ns=(0, mp._JSON_PATH.stat().st_mtime_ns + 5))
+    assert mp.get_index() is first
+
+    bundle_file([_player("d", "MIA")])
+    assert [p["id"] for p in mp.get_players()] == ["d"]
+    assert mp.get_index() is not first
@@ -1,13 +1,23 @@
 from datetime import date, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from app.main import app
 from app.models import HeatmapData
 from app.models.base import Team
-from app.models import RankingsOverTimeResponse
+from app.models import RankingsOverTimeColumnar, RankingsOverTimeResponse
+from app.services.cache_manager import CacheManager
 from app.services.db_service import DBService
 
 
+@pytest.fixture(autouse=True)
+def clear_over_time_cache():
+    CacheManager().over_time_cache = {}
+    yield
+    CacheManager().over_time_cache = {}
+
+
 def test_get_heatmap(test_client):
     """Test that the heatmap is returned correctly"""
     response = test_client.get("/api/analytics/heatmap")
@@ -89,3 +99,71 @@ def test_get_heatmap_only_start_date(test_client):
     response = test_client.get("/api/analytics/heatmap?start_date=2025-11-01")
     assert response.status_code == 422
 
+
+
+class TestOverTimeCache:
+    ROWS = [
+        {"date": date(2025, 11, 5), "team_id": 2, "team_name": "B", "rk_pts": 1.0, "gp": 3},
+        {"date": date(2025, 11, 5), "team_id": 1, "team_name": "A", "rk_pts": 2.0, "gp": 3},
+        {"date": date(2025, 11, 6), "team_id": 1, "team_name": "A", "rk_pts": 1.5, "gp": 4},
+    ]
+
+    @pytest.fixture(autouse=True)
+    def db(self):
+        inst = MagicMock()
+        inst.get_rankings_over_time = AsyncMock(return_value=self.ROWS)
+        app.dependency_overrides[DBService] = lambda: inst
+        yield inst
+        app.dependency_overrides.pop(DBService, None)
+
+    def test_repeat_requests_hit_cache_and_304(self, test_client, db):
+        first = test_client.get("/api/analytics/over-time")
+        etag = first.headers["etag"]
+        assert first.status_code == 200 and etag.startswith('"')
+        assert len(first.json()["data"]) == 3
+
+        again = test_client.get("/api/analytics/over-time")
+        assert again.content == first.content and again.headers["etag"] == etag
+        not_modified = test_client.get("/api/analytics/over-time", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304 and not_modified.content == b""
+        db.get_rankings_over_time.assert_awaited_once()
+
+    def test_new_history_period_invalidates(self, test_client, db):
+        cm = CacheManager()
+        period = cm.history_period
+        try:
+            test_client.get("/api/analytics/over-time")
+            cm.set_history_period(period + 1)
+            assert cm.over_time_cache == {}
+            test_client.get("/api/analytics/over-time")
+            assert db.get_rankings_over_time.await_count == 2
+        finally:
+            cm.set_history_period(period)
+
+    def test_columnar_format(self, test_client):
+        response = test_client.get("/api/analytics/over-time?format=columnar&category=rk_pts")
+        assert response.status_code == 200
+        assert response.json() == {
+            "source": "rankings_avg",
+            "dates": ["2025-11-05", "2025-11-06"],
+            "teams": [
+                {"team_id": 1, "team_name": "A", "values": {"rk_pts": [2.0, 1.5]}},
+                {"team_id": 2, "team_name": "B", "values": {"rk_pts": [1.0, None]}},
+            ],
+        }
+        RankingsOverTimeColumnar(**response.json())
+
+    def test_openapi_documents_both_formats(self):
+        schema = app.openapi()["paths"]["/api/analytics/over-time"]["get"]["responses"]["200"]
+        refs = {s["$ref"].rsplit("/", 1)[-1] for s in schema["content"]["application/json"]["schema"]["anyOf"]}
+        assert refs == {"RankingsOverTimeResponse", "RankingsOverTimeColumnar"}
+
+    def test_unknown_category(self, test_client):
+        response = test_client.get("/api/analytics/over-time?source=snapshot&category=rk_pts")
+        assert response.status_code == 422
+
+    def test_empty_history_not_cached(self, test_client, db):
+        db.get_rankings_over_time = AsyncMock(return_value=[])
+        test_client.get("/api/analytics/over-time")
+        test_client.get("/api/analytics/over-time")
+        assert db.get_rankings_over_time.await_count == 2
@@ -1,6 +1,17 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from app.models.estimator import TeamRanking
+from app.routes import estimator as estimator_routes
+from app.services.estimator_service import build_payload
+
+
+@pytest.fixture(autouse=True)
+def reset_refresh():
+    estimator_routes._refresh.reset()
+    yield
+    estimator_routes._refresh.reset()
 
 
 def _sample_ranking() -> dict:
@@ -33,7 +44,7 @@ def _full_payload():
 @patch("app.routes.estimator.EstimatorService")
 def test_estimator_results_cached(mock_svc_cls, mock_prov_cls, test_client):
     mock_svc = MagicMock()
-    mock_svc.get_latest = AsyncMock(return_value=_full_payload())
+    mock_svc.get_payload = AsyncMock(return_value=build_payload(_full_payload()))
     mock_svc_cls.return_value = mock_svc
     mock_prov_cls.return_value = MagicMock()
 
@@ -48,7 +59,7 @@ def test_estimator_results_cached(mock_svc_cls, mock_prov_cls, test_client):
 @patch("app.routes.estimator.EstimatorService")
 def test_estimator_results_no_data_404(mock_svc_cls, mock_prov_cls, test_client):
     mock_svc = MagicMock()
-    mock_svc.get_latest = AsyncMock(return_value=None)
+    mock_svc.get_payload = AsyncMock(return_value=None)
     mock_svc.run_and_store = AsyncMock(return_value=False)
     mock_svc_cls.return_value = mock_svc
 
@@ -64,9 +75,123 @@ def test_estimator_results_no_data_404(mock_svc_cls, mock_prov_cls, test_client)
 @patch("app.routes.estimator.EstimatorService")
 def test_estimator_results_service_error_500(mock_svc_cls, mock_prov_cls, test_client):
     mock_svc = MagicMock()
-    mock_svc.get_latest = AsyncMock(side_effect=RuntimeError("failure"))
+    mock_svc.get_payload = AsyncMock(side_effect=RuntimeError("failure"))
     mock_svc_cls.return_value = mock_svc
     mock_prov_cls.return_value = MagicMock()
 
     response = test_client.get("/api/estimator/results")
     assert response.status_code == 500
+
+
+@patch("app.routes.estimator.DataProvider")
+@patch("app.routes.estimator.EstimatorService")
+def test_estimator_results_cached_hits_share_one_background_sync(mock_svc_cls, mock_prov_cls, test_client):
+    mock_svc = MagicMock()
+    mock_svc.get_payload = AsyncMock(return_value=build_payload(_full_payload()))
+    mock_svc.run_and_store = AsyncMock(return_value=False)
+    mock_svc_cls.return_value = mock_svc
+    mock_prov = MagicMock()
+    mock_prov.sync_db_now = AsyncMock(return_value=False)
+    mock_prov_cls.return_value = mock_prov
+
+    for _ in range(10):
+        assert test_client.get("/api/estimator/results").status_code == 200
+
+    assert mock_prov.sync_db_now.await_count == 1
+    assert estimator_routes._refresh.runs == 1
+
+
+@patch("app.routes.estimator.DataProvider")
+@patch("app.routes.estimator.EstimatorService")
+def test_estimator_results_etag_and_304(mock_svc_cls, mock_prov_cls, test_client):
+    payload = build_payload(_full_payload())
+    mock_svc = MagicMock()
+    mock_svc.get_payload = AsyncMock(return_value=payload)
+    mock_svc_cls.return_value = mock_svc
+    mock_prov_cls.return_value = MagicMock()
+
+    first = test_client.get("/api/estimator/results")
+    assert first.status_code == 200
+    assert first.headers["etag"] == payload.etag
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.content == payload.body  # decoded by the client
+
+    again = test_client.get("/api/estimator/results", headers={"If-None-Match": payload.etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == payload.etag
+
+    stale = test_client.get("/api/estimator/results", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+
+
+@patch("app.routes.estimator.DataProvider")
+@patch("app.routes.estimator.EstimatorService")
+def test_estimator_results_identity_encoding(mock_svc_cls, mock_prov_cls, test_client):
+    payload = build_payload(_full_payload())
+    mock_svc = MagicMock()
+    mock_svc.get_payload = AsyncMock(return_value=payload)
+    mock_svc_cls.return_value = mock_svc
+    mock_prov_cls.return_value = MagicMock()
+
+    response = test_client.get("/api/estimator/results", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.content == payload.body
+
+
+def _scenario_outcomes():
+    import numpy as np
+    from app.fantsy_estimator.scenario import Scenario, ScenarioEngine, TeamFit, TeamPerturbation
+
+    fits = [
+        TeamFit(team_id=t, team_name=f"T{t}", current_totals=np.full(10, 100.0 * t),
+                mean_per_game=np.full(10, 1.0), cov_per_game=np.eye(10) * 0.01,
+                games_played=100.0, mean_gp_per_period=5.0, projected_total_gp=500.0)
+        for t in (1, 2, 3)
+    ]
+    scenario = Scenario("boost", (TeamPerturbation(1, mean_shift={"pts": 2.0}),))
+    return ScenarioEngine(fits, num_runs=100, seed=5).run([scenario])
+
+
+@patch("app.routes.estimator.EstimatorService")
+def test_estimator_scenarios(mock_svc_cls, test_client):
+    mock_svc = MagicMock()
+    mock_svc.run_scenarios = AsyncMock(return_value=(_scenario_outcomes(), 5))
+    mock_svc_cls.return_value = mock_svc
+
+    response = test_client.post("/api/estimator/scenarios", json={
+        "seed": 5, "num_runs": 100,
+        "scenarios": [{"name": "boost", "perturbations": [{"team_id": 1, "mean_shift": {"pts": 2.0}}]}],
+    })
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["seed"] == 5
+    assert [s["name"] for s in data["scenarios"]] == ["baseline", "boost"]
+    team = data["scenarios"][1]["teams"][0]
+    assert team["team_id"] == 1
+    assert len(team["rank_probabilities"]) == 3
+    assert sum(team["rank_probabilities"]) == pytest.approx(1.0)
+    assert set(team["expected_pts"]) == {"fg_pct", "ft_pct", "three_pm", "reb", "ast", "stl", "blk", "pts"}
+    scenarios, num_runs, seed = mock_svc.run_scenarios.await_args.args
+    assert scenarios[0].perturbations[0].mean_shift == {"pts": 2.0}
+    assert (num_runs, seed) == (100, 5)
+
+
+@patch("app.routes.estimator.EstimatorService")
+def test_estimator_scenarios_rejects_unknown_stat(mock_svc_cls, test_client):
+    response = test_client.post("/api/estimator/scenarios", json={
+        "scenarios": [{"name": "bad", "perturbations": [{"team_id": 1, "mean_shift": {"fg_pct": 1.0}}]}],
+    })
+    assert response.status_code == 400
+    mock_svc_cls.return_value.run_scenarios.assert_not_called()
+
+
+@patch("app.routes.estimator.EstimatorService")
+def test_estimator_scenarios_no_data_404(mock_svc_cls, test_client):
+    mock_svc = MagicMock()
+    mock_svc.run_scenarios = AsyncMock(return_value=([], 0))
+    mock_svc_cls.return_value = mock_svc
+    response = test_client.post("/api/estimator/scenarios", json={"scenarios": [{"name": "x"}]})
+    assert response.status_code == 404
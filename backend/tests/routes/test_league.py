@@ -37,9 +37,30 @@ def test_draft_report(test_client):
         "pick": 1, "round": 1, "team_id": 1, "team_name": "Team Alpha", "player_name": "Player A1"
     }
 
-@patch('app.services.draft_report_service.DraftReportService.get_draft_report')
-def test_draft_report_error(mock_get_draft_report, test_client):
+@patch('app.services.draft_report_service.DraftReportService.get_payload')
+def test_draft_report_error(mock_get_payload, test_client):
     from app.exceptions import ResourceNotFoundError
-    mock_get_draft_report.side_effect = ResourceNotFoundError("No draft picks found for this league")
+    mock_get_payload.side_effect = ResourceNotFoundError("No draft picks found for this league")
     response = test_client.get("/api/league/draft-report")
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+def test_draft_report_etag_revalidation(test_client):
+    response = test_client.get("/api/league/draft-report")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "no-cache"  # mock draft isn't marked complete
+
+    again = test_client.get("/api/league/draft-report", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+def test_draft_report_complete_is_cacheable(test_client):
+    from app.services.draft_report_service import encode_draft_report
+    payload = encode_draft_report(
+        [{"pick": 1, "round": 1, "team_id": 1, "player_name": "Player A1"}], {1: "Team Alpha"}
+    )
+    with patch('app.services.draft_report_service.DraftReportService.get_payload', return_value=payload):
+        response = test_client.get("/api/league/draft-report", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["etag"] == payload.etag
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    assert response.json()["picks"][0]["team_name"] == "Team Alpha"
@@ -137,3 +137,36 @@ def test_get_all_players_custom_end_in_future():
     response = client.get(f"/api/players/?time_period=custom&start={start}&end={end}")
     assert response.status_code == 422
     assert "future" in response.json()["detail"]
+
+
+def test_get_all_players_projection_returns_only_requested_fields():
+    response = client.get("/api/players/?fields=player_name,stats&limit=10")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["players"], "mock provider should return players"
+    assert all(set(p) == {"player_name", "stats"} for p in data["players"])
+    assert {"total_count", "has_more", "next_cursor"} <= data.keys()
+
+
+def test_get_all_players_unknown_field_is_422():
+    response = client.get("/api/players/?fields=player_name,salary")
+    assert response.status_code == 422
+
+
+def test_get_all_players_sorted():
+    data = client.get("/api/players/?sort_by=pts&order=desc&limit=10").json()
+    pts = [p["stats"]["pts"] for p in data["players"]]
+    assert pts == sorted(pts, reverse=True)
+    assert data["next_cursor"] is None
+
+
+def test_get_all_players_invalid_sort_by_is_422():
+    response = client.get("/api/players/?sort_by=bogus")
+    assert response.status_code == 422
+
+
+def test_get_all_players_cursor_for_other_sort_is_422():
+    from app.services.player_index import encode_cursor
+    cursor = encode_cursor("pts", True, 20.0, 101)
+    response = client.get(f"/api/players/?sort_by=reb&limit=10&cursor={cursor}")
+    assert response.status_code == 422
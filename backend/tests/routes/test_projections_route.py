@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def projection_service(monkeypatch):
+    svc = MagicMock()
+    monkeypatch.setattr('app.routes.projections._projection_service', svc)
+    return svc
+
+
+def test_model_status_before_load(projection_service):
+    projection_service.load_status.return_value = None
+    resp = TestClient(app).get('/api/projections/models/status')
+    assert resp.status_code == 200
+    assert resp.json() == {
+        'loaded': False, 'inference_ready': False,
+        'load_seconds': None, 'warmup_seconds': None, 'models': [],
+    }
+
+
+def test_model_status_reports_load_timings(projection_service):
+    projection_service.load_status.return_value = SimpleNamespace(
+        load_seconds=0.41234567,
+        warmup_seconds=0.0123,
+        loads=[
+            SimpleNamespace(target='PTS', seconds=0.2, bytes=587882, compiled=True),
+            SimpleNamespace(target='REB', seconds=0.19, bytes=558386, compiled=False),
+        ],
+    )
+    projection_service.inference_ready.return_value = True
+    data = TestClient(app).get('/api/projections/models/status').json()
+    assert data['loaded'] and data['inference_ready']
+    assert data['load_seconds'] == 0.4123
+    assert [m['target'] for m in data['models']] == ['PTS', 'REB']
+    assert data['models'][1] == {'target': 'REB', 'seconds': 0.19, 'bytes': 558386, 'compiled': False}
+
+
+def test_week_projection_filters_roster(projection_service, monkeypatch):
+    import pandas as pd
+    from unittest.mock import AsyncMock
+
+    matchups = MagicMock()
+    matchups.get_schedule = AsyncMock(return_value={})
+    monkeypatch.setattr('app.routes.projections._matchup_service', matchups)
+    provider = MagicMock()
+    provider.get_players_df = AsyncMock(return_value=pd.DataFrame({
+        'Name': ['A', 'B'], 'Pro Team': ['BOS', 'NYK'], 'team_id': [1, 2],
+    }))
+    monkeypatch.setattr('app.routes.projections.DataProvider', lambda: provider)
+    projection_service.project_week = AsyncMock(return_value={'players': [], 'teams': []})
+
+    resp = TestClient(app).get('/api/projections/week?start=2025-11-03&days=7&fantasy_team_id=2')
+    assert resp.status_code == 200
+    assert resp.json() == {'start_date': '2025-11-03', 'end_date': '2025-11-09', 'players': [], 'teams': []}
+    matchups.get_schedule.assert_awaited_once()
+    players_df = projection_service.project_week.await_args[0][0]
+    assert players_df['Name'].tolist() == ['B']
+
+
+def test_week_projection_models_not_ready(projection_service, monkeypatch):
+    import pandas as pd
+    from unittest.mock import AsyncMock
+
+    matchups = MagicMock()
+    matchups.get_schedule = AsyncMock(return_value={})
+    monkeypatch.setattr('app.routes.projections._matchup_service', matchups)
+    provider = MagicMock()
+    provider.get_players_df = AsyncMock(return_value=pd.DataFrame({'Name': [], 'Pro Team': [], 'team_id': []}))
+    monkeypatch.setattr('app.routes.projections.DataProvider', lambda: provider)
+    projection_service.project_week = AsyncMock(return_value=None)
+
+    assert TestClient(app).get('/api/projections/week').status_code == 503
@@ -0,0 +1,137 @@
+import asyncio
+import os
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from app.services.batch_pool import BatchJobError, BatchJobPool, _ArrowFrame, _decode, _encode
+
+
+# Worker-side jobs: module level so a spawned worker can import them.
+
+def _describe(df: pd.DataFrame, scale: float):
+    return df.assign(scaled=df["x"] * scale), os.getpid(), len(df)
+
+
+def _sleep(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def _crash() -> None:
+    os._exit(1)
+
+
+def _raise() -> None:
+    raise ValueError("bad input")
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "x": [1.5, 2.5, float("nan")],
+        "team_id": [1, 2, 3],
+        "date": [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3)],
+        "name": ["a", "b", None],
+    })
+
+
+class TestArrowTransport:
+    def test_frames_round_trip_as_arrow(self):
+        df = _frame()
+        encoded = _encode((df, 3.0, "tag"))
+        assert isinstance(encoded[0], _ArrowFrame)
+        assert encoded[1:] == (3.0, "tag")
+        pd.testing.assert_frame_equal(_decode(encoded)[0], df)
+
+    def test_unrepresentable_frame_falls_back_to_pickle(self):
+        df = pd.DataFrame({"mixed": [1, "two", 3.0]})
+        assert _encode(df) is df
+
+
+class TestBatchJobPool:
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self):
+        pool = BatchJobPool(workers=1)
+        try:
+            out, pid, n = await pool.run("test", _describe, _frame(), 2.0, timeout=60)
+        finally:
+            pool.shutdown()
+        assert pid != os.getpid()
+        assert n == 3
+        assert out["scaled"].tolist()[:2] == [3.0, 5.0]
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker_and_pool_recovers(self):
+        pool = BatchJobPool(workers=1)
+        try:
+            with pytest.raises(BatchJobError, match="timed out"):
+                await pool.run("test", _sleep, 30, timeout=3)
+            assert await pool.run("test", _sleep, 0, timeout=60) != os.getpid()
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout_spares_jobs_queued_behind_it(self):
+        pool = BatchJobPool(workers=1)
+        try:
+            hung = asyncio.ensure_future(pool.run("hung", _sleep, 30, timeout=3))
+            queued = asyncio.ensure_future(pool.run("queued", _sleep, 0.1, timeout=60))
+            with pytest.raises(BatchJobError, match="hung: timed out"):
+                await hung
+            assert await queued != os.getpid()
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_only_its_own_worker(self):
+        pool = BatchJobPool(workers=2)
+        try:
+            hung = asyncio.ensure_future(pool.run("hung", _sleep, 30, timeout=4))
+            neighbour = asyncio.ensure_future(pool.run("neighbour", _sleep, 6, timeout=60))
+            with pytest.raises(BatchJobError, match="timed out"):
+                await hung
+            assert await neighbour != os.getpid()
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_crash_is_isolated(self):
+        pool = BatchJobPool(workers=1)
+        try:
+            with pytest.raises(BatchJobError, match="died"):
+                await pool.run("test", _crash, timeout=60)
+            assert await pool.run("test", _sleep, 0, timeout=60) != os.getpid()
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_job_exception_propagates(self):
+        pool = BatchJobPool(workers=1)
+        try:
+            with pytest.raises(ValueError, match="bad input"):
+                await pool.run("test", _raise, timeout=60)
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_kills_worker(self):
+        pool = BatchJobPool(workers=1)
+        try:
+            task = asyncio.ensure_future(pool.run("test", _sleep, 30))
+            await asyncio.sleep(3)
+            (pid,) = pool._running
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert pool._running == {}
+            with pytest.raises(ProcessLookupError):
+                os.kill(pid, 0)
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_zero_workers_runs_in_thread(self):
+        pool = BatchJobPool(workers=0)
+        assert await pool.run("test", _sleep, 0) == os.getpid()
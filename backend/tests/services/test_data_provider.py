@@ -242,3 +242,36 @@ async def test_get_all_dataframes_tuple(provider):
 
     t, a, r = await provider.get_all_dataframes()
     assert len(t) == len(a) == len(r)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("written", [True, False])
+async def test_sync_extends_history_only_after_snapshot_upsert(provider, monkeypatch, written):
+    history = MagicMock(extend=AsyncMock(), catch_up=AsyncMock())
+    monkeypatch.setattr("app.services.data_provider.LeagueHistory", lambda: history)
+    provider._last_synced_period = 0
+    provider.db_service.get_db_max_scoring_period = AsyncMock(return_value=0)
+    provider.db_service.upsert_daily_snapshot = AsyncMock(return_value=written)
+    totals = pd.DataFrame({"team_id": [1], "team_name": ["A"], "FGM": [1], "FGA": [2], "FTM": [1], "FTA": [2]})
+
+    await provider._sync_db_if_needed(5, totals)
+
+    assert history.extend.await_count == int(written)
+    # A failed snapshot is retried on the next fetch.
+    assert provider._last_synced_period == (4 if written else 0)
+    history.catch_up.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sync_catches_history_up_when_snapshot_already_stored(provider, monkeypatch):
+    history = MagicMock(extend=AsyncMock(), catch_up=AsyncMock())
+    monkeypatch.setattr("app.services.data_provider.LeagueHistory", lambda: history)
+    provider._last_synced_period = 0
+    provider.db_service.get_db_max_scoring_period = AsyncMock(return_value=4)
+    totals = pd.DataFrame({"team_id": [1], "team_name": ["A"], "FGM": [1], "FGA": [2], "FTM": [1], "FTA": [2]})
+
+    await provider._sync_db_if_needed(5, totals)
+
+    provider.db_service.upsert_daily_snapshot.assert_not_awaited()
+    history.catch_up.assert_awaited_once()
+    assert provider._last_synced_period == 4
@@ -0,0 +1,97 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services import db_pool
+from app.services.db_pool import (
+    BATCH,
+    INTERACTIVE,
+    DBPoolManager,
+    batch_lane,
+    current_lane,
+    fetch_hot,
+    fetchrow_hot,
+    in_batch_lane,
+)
+from app.utils.metrics import DB_HOT_QUERY_SECONDS, REGISTRY
+
+QUERIES = {'one': 'SELECT $1::int AS v'}
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    REGISTRY.clear()
+    yield
+    REGISTRY.clear()
+
+
+class FakeConn:
+    def __init__(self):
+        self.fetch = AsyncMock(return_value=[{'v': 'text'}])
+        self.fetchrow = AsyncMock(return_value={'v': 'text'})
+
+
+@pytest.mark.asyncio
+async def test_lane_defaults_to_interactive_and_spawned_tasks_inherit_batch():
+    assert current_lane() == INTERACTIVE
+
+    async def lane_of_child():
+        return current_lane()
+
+    with batch_lane():
+        assert current_lane() == BATCH
+        assert await asyncio.create_task(lane_of_child()) == BATCH
+    assert current_lane() == INTERACTIVE
+    assert await in_batch_lane(lane_of_child()) == BATCH
+    assert current_lane() == INTERACTIVE
+
+
+@pytest.mark.asyncio
+async def test_fetch_hot_runs_query_text_and_records_time():
+    conn = FakeConn()
+
+    rows = await fetch_hot(conn, QUERIES, 'one', 1)
+    row = await fetchrow_hot(conn, QUERIES, 'one', 2)
+
+    assert rows == [{'v': 'text'}] and row == {'v': 'text'}
+    conn.fetch.assert_awaited_once_with(QUERIES['one'], 1)
+    conn.fetchrow.assert_awaited_once_with(QUERIES['one'], 2)
+    assert DB_HOT_QUERY_SECONDS.count(query='one') == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_creates_one_pool_per_lane(monkeypatch):
+    monkeypatch.setattr(db_pool.settings, 'database_url', 'postgresql://x')
+    monkeypatch.setattr(db_pool.settings, 'db_pool_min_size', 2)
+    monkeypatch.setattr(db_pool.settings, 'db_pool_max_size', 6)
+    monkeypatch.setattr(db_pool.settings, 'db_batch_pool_max_size', 3)
+    create_pool = AsyncMock(side_effect=lambda *a, **kw: MagicMock(close=AsyncMock()))
+    monkeypatch.setattr(db_pool.asyncpg, 'create_pool', create_pool)
+    manager = DBPoolManager()
+
+    interactive = await manager.get()
+    assert await manager.get() is interactive
+    with batch_lane():
+        batch = await manager.get()
+
+    assert batch is not interactive
+    assert (interactive.lane, batch.lane) == (INTERACTIVE, BATCH)
+    sizes = [(c.kwargs['min_size'], c.kwargs['max_size']) for c in create_pool.call_args_list]
+    assert sizes == [(2, 6), (0, 3)]
+
+    await manager.close()
+    assert await manager.get(BATCH) is not batch
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_without_database_url_returns_none(monkeypatch):
+    monkeypatch.setattr(db_pool.settings, 'database_url', None)
+    assert await DBPoolManager().get() is None
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_logs_and_returns_none_on_create_failure(monkeypatch):
+    monkeypatch.setattr(db_pool.settings, 'database_url', 'postgresql://x')
+    monkeypatch.setattr(db_pool.asyncpg, 'create_pool', AsyncMock(side_effect=OSError('refused')))
+    assert await DBPoolManager().get() is None
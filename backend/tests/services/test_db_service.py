@@ -4,7 +4,9 @@ from unittest.mock import AsyncMock
 import pandas as pd
 import pytest
 
+from app.services.db_pool import DBPoolManager
 from app.services.db_service import DBService
+from app.services.fs_mirror import FSMirror
 
 
 class FakeConn:
@@ -15,6 +17,12 @@ class FakeConn:
         else:
             self.fetch = AsyncMock(return_value=fetch_result or [])
         self.executemany = AsyncMock(return_value=None)
+        self.execute = AsyncMock(return_value=None)
+        self.transactions = 0
+
+    def transaction(self):
+        self.transactions += 1
+        return FakeAcquireCtx(self)
 
 
 class FakeAcquireCtx:
@@ -39,7 +47,8 @@ class FakePool:
 @pytest.fixture
 def db_service():
     svc = object.__new__(DBService)
-    svc._pool = None
+    svc._pools = DBPoolManager()
+    svc._fs_mirror = FSMirror()
     return svc
 
 
@@ -88,6 +97,35 @@ async def test_aggregate_player_games_success(db_service, monkeypatch):
     assert query_args[1:] == ("2025-26", date(2026, 1, 1), date(2026, 1, 10))
 
 
+@pytest.mark.asyncio
+async def test_aggregate_player_games_scoped_to_player_ids(db_service, monkeypatch):
+    conn = FakeConn(fetchrow_result={"start_date": None, "end_date": None}, fetch_result=[])
+    monkeypatch.setattr(db_service, "_get_pool", AsyncMock(return_value=FakePool(conn)))
+
+    await db_service.aggregate_player_games(
+        date(2026, 1, 1), date(2026, 1, 10), "2025-26", player_ids=[7, 9]
+    )
+
+    sql, *args = conn.fetch.call_args[0]
+    assert "player_id = ANY($4::bigint[])" in sql
+    assert args == ["2025-26", date(2026, 1, 1), date(2026, 1, 10), [7, 9]]
+    # Coverage stays league-wide.
+    assert "ANY" not in conn.fetchrow.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_get_season_player_names(db_service, monkeypatch):
+    rows = [{"player_id": 1628, "player_name": "Player C"}]
+    conn = FakeConn(fetch_result=rows)
+    monkeypatch.setattr(db_service, "_get_pool", AsyncMock(return_value=FakePool(conn)))
+    assert await db_service.get_season_player_names("2025-26") == rows
+    assert conn.fetch.call_args[0][1] == "2025-26"
+
+    conn = FakeConn(raise_on_fetch=True)
+    monkeypatch.setattr(db_service, "_get_pool", AsyncMock(return_value=FakePool(conn)))
+    assert await db_service.get_season_player_names("2025-26") == []
+
+
 @pytest.mark.asyncio
 async def test_aggregate_player_games_db_error_returns_empty(db_service, monkeypatch):
     conn = FakeConn(fetchrow_result=None, raise_on_fetch=False)
@@ -350,6 +388,37 @@ async def test_upsert_rankings_averages_preserves_tie_fraction(db_service, monke
     assert isinstance(params[-1], float)
 
 
+@pytest.mark.asyncio
+async def test_apply_injury_changes_one_transaction(db_service, monkeypatch):
+    from app.models.injury_models import InjuryRecord
+
+    conn = FakeConn()
+    monkeypatch.setattr(db_service, "_get_pool", AsyncMock(return_value=FakePool(conn)))
+    upserts = [
+        InjuryRecord(game="", team=team, player=player, status="Out", injury="Knee", last_update="")
+        for team, player in [("Boston Celtics", "Jayson Tatum"), ("Phoenix Suns", "Devin Booker")]
+    ]
+
+    ok = await db_service.apply_injury_changes(upserts, [("Boston Celtics", "Jaylen Brown")])
+
+    assert ok and conn.transactions == 1
+    (delete_sql, *delete_args), (upsert_sql, *upsert_args) = [c.args for c in conn.execute.call_args_list]
+    assert delete_sql.strip().startswith("DELETE") and "unnest" in delete_sql
+    assert delete_args == [["Boston Celtics"], ["Jaylen Brown"]]
+    assert "unnest" in upsert_sql and "IS DISTINCT FROM" in upsert_sql
+    assert upsert_args == [
+        ["Boston Celtics", "Phoenix Suns"], ["Jayson Tatum", "Devin Booker"], ["Out", "Out"], ["Knee", "Knee"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_apply_injury_changes_noop_skips_db(db_service, monkeypatch):
+    get_pool = AsyncMock()
+    monkeypatch.setattr(db_service, "_get_pool", get_pool)
+    assert await db_service.apply_injury_changes([], []) is True
+    get_pool.assert_not_awaited()
+
+
 class _FakeRecord(tuple):
     """Mimics asyncpg.Record: a tuple of values that also exposes .keys()."""
 
@@ -381,3 +450,25 @@ def test_fs_records_to_frame_handles_no_rows():
     from app.services.db_service import fs_records_to_frame
 
     assert fs_records_to_frame([]).empty
+
+
+@pytest.mark.asyncio
+async def test_get_draft_report_decodes_jsonb(db_service, monkeypatch):
+    conn = FakeConn(fetchrow_result={
+        "etag": '"abc"', "body": b'{"picks": []}',
+        "picks": '[{"pick": 1, "round": 1, "team_id": 3, "player_name": "A"}]',
+        "team_names": '{"3": "Team Gamma"}',
+    })
+    monkeypatch.setattr(db_service, "_get_pool", AsyncMock(return_value=FakePool(conn)))
+
+    row = await db_service.get_draft_report(2026)
+
+    assert row["picks"][0]["team_id"] == 3
+    assert row["team_names"] == {3: "Team Gamma"}
+    assert isinstance(row["body"], bytes)
+
+
+@pytest.mark.asyncio
+async def test_get_draft_report_no_pool_returns_none(db_service, monkeypatch):
+    monkeypatch.setattr(db_service, "_get_pool", AsyncMock(return_value=None))
+    assert await db_service.get_draft_report(2026) is None
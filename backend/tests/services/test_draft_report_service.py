@@ -1,15 +1,25 @@
+import json
+from datetime import datetime
+
 import pytest
 import pandas as pd
-from unittest.mock import patch, AsyncMock
-from app.services.draft_report_service import DraftReportService
+from unittest.mock import patch, AsyncMock, MagicMock
+from app.models import DraftReport
+from app.services.draft_report_service import DraftReportService, DraftReportPayload, encode_draft_report
+from app.services.schedule_context import ScheduleContext
 from app.exceptions import ResourceNotFoundError
 
 
 @pytest.fixture
 def draft_report_service():
-    with patch('app.services.draft_report_service.DataProvider'):
+    with patch('app.services.draft_report_service.DataProvider'), \
+            patch('app.services.draft_report_service.DBService'), \
+            patch('app.services.draft_report_service.ScheduleContextProvider'):
         service = DraftReportService()
         service.data_provider = AsyncMock()
+        service.db_service = AsyncMock()
+        service.db_service.get_draft_report.return_value = None
+        service.schedule_context = MagicMock(current=None)
         return service
 
 
@@ -18,59 +28,144 @@ def sample_totals_df():
     return pd.DataFrame({'team_id': [1, 2], 'team_name': ['Team Alpha', 'Team Beta']})
 
 
+def _report(payload: DraftReportPayload) -> DraftReport:
+    return DraftReport.model_validate_json(payload.body)
+
+
+def _context(team_names) -> ScheduleContext:
+    return ScheduleContext(
+        scoring_period_id=120, nba_avg_pace=58.4, nba_game_days_left=40,
+        slot_usage={}, team_names=team_names, refreshed_at=datetime.now(),
+    )
+
+
+def _set_espn(service, totals_df, picks, directory, **draft_flags):
+    service.data_provider.get_draft_detail_raw.return_value = {'draftDetail': {'picks': picks, **draft_flags}}
+    service.data_provider.get_players_directory.return_value = directory
+    service.data_provider.get_totals_df.return_value = totals_df
+
+
+_PICKS = [
+    {'overallPickNumber': 2, 'roundId': 1, 'teamId': 2, 'playerId': 201},
+    {'overallPickNumber': 1, 'roundId': 1, 'teamId': 1, 'playerId': 101},
+]
+_DIRECTORY = {101: 'Player A1', 201: 'Player B1'}
+
+
 class TestDraftReportService:
     @pytest.mark.asyncio
-    async def test_get_draft_report_joins_picks(self, draft_report_service, sample_totals_df):
-        draft_report_service.data_provider.get_draft_detail_raw.return_value = {
-            'draftDetail': {'picks': [
-                {'overallPickNumber': 2, 'roundId': 1, 'teamId': 2, 'playerId': 201},
-                {'overallPickNumber': 1, 'roundId': 1, 'teamId': 1, 'playerId': 101},
-            ]}
-        }
-        draft_report_service.data_provider.get_players_directory.return_value = {101: 'Player A1', 201: 'Player B1'}
-        draft_report_service.data_provider.get_totals_df.return_value = sample_totals_df
+    async def test_get_payload_joins_picks(self, draft_report_service, sample_totals_df):
+        _set_espn(draft_report_service, sample_totals_df, _PICKS, _DIRECTORY)
 
-        result = await draft_report_service.get_draft_report()
+        result = _report(await draft_report_service.get_payload())
 
         assert [p.pick for p in result.picks] == [1, 2]
         assert result.picks[0].player_name == 'Player A1'
         assert result.picks[0].team_name == 'Team Alpha'
 
     @pytest.mark.asyncio
-    async def test_get_draft_report_skips_unmatched_player(self, draft_report_service, sample_totals_df):
-        draft_report_service.data_provider.get_draft_detail_raw.return_value = {
-            'draftDetail': {'picks': [
-                {'overallPickNumber': 1, 'roundId': 1, 'teamId': 1, 'playerId': 101},
-                {'overallPickNumber': 2, 'roundId': 1, 'teamId': 2, 'playerId': 999},
-            ]}
-        }
-        draft_report_service.data_provider.get_players_directory.return_value = {101: 'Player A1'}
-        draft_report_service.data_provider.get_totals_df.return_value = sample_totals_df
+    async def test_get_payload_skips_unmatched_player(self, draft_report_service, sample_totals_df):
+        _set_espn(draft_report_service, sample_totals_df, [
+            {'overallPickNumber': 1, 'roundId': 1, 'teamId': 1, 'playerId': 101},
+            {'overallPickNumber': 2, 'roundId': 1, 'teamId': 2, 'playerId': 999},
+        ], {101: 'Player A1'})
 
-        result = await draft_report_service.get_draft_report()
+        result = _report(await draft_report_service.get_payload())
 
         assert len(result.picks) == 1
         assert result.picks[0].player_name == 'Player A1'
 
     @pytest.mark.asyncio
-    async def test_get_draft_report_unknown_team_falls_back(self, draft_report_service, sample_totals_df):
-        draft_report_service.data_provider.get_draft_detail_raw.return_value = {
-            'draftDetail': {'picks': [
-                {'overallPickNumber': 1, 'roundId': 1, 'teamId': 99, 'playerId': 101},
-            ]}
-        }
-        draft_report_service.data_provider.get_players_directory.return_value = {101: 'Player A1'}
-        draft_report_service.data_provider.get_totals_df.return_value = sample_totals_df
+    async def test_get_payload_unknown_team_falls_back(self, draft_report_service, sample_totals_df):
+        _set_espn(draft_report_service, sample_totals_df, [
+            {'overallPickNumber': 1, 'roundId': 1, 'teamId': 99, 'playerId': 101},
+        ], {101: 'Player A1'})
 
-        result = await draft_report_service.get_draft_report()
+        result = _report(await draft_report_service.get_payload())
 
         assert result.picks[0].team_name == 'Unknown Team'
 
     @pytest.mark.asyncio
-    async def test_get_draft_report_no_picks_raises(self, draft_report_service, sample_totals_df):
-        draft_report_service.data_provider.get_draft_detail_raw.return_value = {'draftDetail': {'picks': []}}
-        draft_report_service.data_provider.get_players_directory.return_value = {}
-        draft_report_service.data_provider.get_totals_df.return_value = sample_totals_df
+    async def test_get_payload_no_picks_raises(self, draft_report_service, sample_totals_df):
+        _set_espn(draft_report_service, sample_totals_df, [], {})
 
         with pytest.raises(ResourceNotFoundError):
-            await draft_report_service.get_draft_report()
+            await draft_report_service.get_payload()
+
+    @pytest.mark.asyncio
+    async def test_draft_in_progress_is_not_stored(self, draft_report_service, sample_totals_df):
+        _set_espn(draft_report_service, sample_totals_df, _PICKS, _DIRECTORY, drafted=False, inProgress=True)
+
+        payload = await draft_report_service.get_payload()
+
+        assert not payload.complete
+        draft_report_service.db_service.upsert_draft_report.assert_not_called()
+        await draft_report_service.get_payload()
+        assert draft_report_service.data_provider.get_draft_detail_raw.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_complete_draft_is_stored_and_served_from_memory(self, draft_report_service, sample_totals_df):
+        _set_espn(draft_report_service, sample_totals_df, _PICKS, _DIRECTORY, drafted=True, inProgress=False)
+
+        first = await draft_report_service.get_payload()
+        second = await draft_report_service.get_payload()
+
+        assert second is first
+        assert first.complete
+        draft_report_service.data_provider.get_draft_detail_raw.assert_awaited_once()
+        draft_report_service.db_service.get_draft_report.assert_awaited_once()
+        args = draft_report_service.db_service.upsert_draft_report.call_args.args
+        assert args[1:3] == (first.etag, first.body)
+        assert args[4] == {1: 'Team Alpha', 2: 'Team Beta'}
+        json.dumps(args[3])  # stored as JSONB
+
+    @pytest.mark.asyncio
+    async def test_stored_report_needs_no_espn_calls(self, draft_report_service):
+        stored = encode_draft_report(
+            [{'pick': 1, 'round': 1, 'team_id': 1, 'player_name': 'Player A1'}], {1: 'Team Alpha'}
+        )
+        draft_report_service.db_service.get_draft_report.return_value = {
+            'etag': stored.etag, 'body': stored.body, 'picks': stored.picks, 'team_names': stored.team_names,
+        }
+
+        payload = await draft_report_service.get_payload()
+
+        assert payload.etag == stored.etag
+        assert payload.body == stored.body
+        draft_report_service.data_provider.get_draft_detail_raw.assert_not_called()
+        draft_report_service.data_provider.get_players_directory.assert_not_called()
+        draft_report_service.db_service.upsert_draft_report.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_team_rename_reencodes_stored_report(self, draft_report_service):
+        draft_report_service._payload = encode_draft_report(
+            [{'pick': 1, 'round': 1, 'team_id': 1, 'player_name': 'Player A1'}], {1: 'Team Alpha'}
+        )
+        old_etag = draft_report_service._payload.etag
+        draft_report_service.schedule_context.current = _context({1: 'Alpha Dogs', 2: 'Team Beta'})
+
+        payload = await draft_report_service.get_payload()
+
+        assert payload.etag != old_etag
+        assert _report(payload).picks[0].team_name == 'Alpha Dogs'
+        draft_report_service.db_service.upsert_draft_report.assert_awaited_once()
+        draft_report_service.data_provider.get_draft_detail_raw.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_team_names_keep_etag(self, draft_report_service):
+        stored = encode_draft_report(
+            [{'pick': 1, 'round': 1, 'team_id': 1, 'player_name': 'Player A1'}], {1: 'Team Alpha'}
+        )
+        draft_report_service._payload = stored
+        draft_report_service.schedule_context.current = _context({1: 'Team Alpha', 2: 'Team Beta'})
+
+        assert await draft_report_service.get_payload() is stored
+        draft_report_service.db_service.upsert_draft_report.assert_not_called()
+
+
+def test_encode_draft_report_is_deterministic():
+    picks = [{'pick': 2, 'round': 1, 'team_id': 2, 'player_name': 'B'},
+             {'pick': 1, 'round': 1, 'team_id': 1, 'player_name': 'A'}]
+    first = encode_draft_report(picks, {1: 'Team Alpha', 2: 'Team Beta', 3: 'Unused'})
+    assert encode_draft_report(list(reversed(picks)), {1: 'Team Alpha', 2: 'Team Beta'}).etag == first.etag
+    assert first.team_names == {1: 'Team Alpha', 2: 'Team Beta'}
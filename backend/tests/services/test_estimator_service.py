@@ -0,0 +1,126 @@
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.models.estimator import EstimatorResults
+from app.services.estimator_service import EstimatorPayload, EstimatorService, build_payload
+
+
+def _records(as_of: date) -> dict:
+    stats = ("fg_pct", "ft_pct", "three_pm", "reb", "ast", "stl", "blk", "pts")
+    prediction = {
+        "team_id": 1, "team_name": "Alpha", "as_of_date": as_of, "projected_total_gp": 80.0,
+        "nba_avg_pace": 65.9,
+        **{f"estimated_final_{s}": 1.0 for s in stats},
+        **{f"variance_{s}": 0.1 for s in stats},
+    }
+    ranking = {
+        "team_id": 1, "team_name": "Alpha", "rank": 1, "total_expected_pts": 12.0,
+        "projected_total_gp": 80.0, **{f"expected_pts_{s}": 1.5 for s in stats},
+    }
+    return {
+        "predictions": [prediction],
+        "rankings": [ranking],
+        "rank_probabilities": [{"team_id": 1, "team_name": "Alpha", "rank": 1, "prob": 1.0}],
+    }
+
+
+@pytest.fixture
+def service():
+    EstimatorService._instance = None
+    EstimatorService._initialized = False
+    svc = EstimatorService()
+    svc.db_service = AsyncMock()
+    svc.db_service.get_estimator_payload_etag = AsyncMock(return_value=None)
+    svc.db_service.get_estimator_payload = AsyncMock(return_value=None)
+    svc.db_service.get_estimator_latest = AsyncMock(return_value={})
+    yield svc
+    EstimatorService._instance = None
+    EstimatorService._initialized = False
+
+
+def test_build_payload_encodes_response_once():
+    payload = build_payload(_records(date(2026, 1, 5)), elapsed_ms=12.5)
+    results = EstimatorResults.model_validate_json(payload.body)
+    assert results.as_of_date == "2026-01-05"
+    assert results.elapsed_ms == 12.5
+    assert len(results.rankings) == 1
+    assert payload.as_of_date == date(2026, 1, 5)
+    assert payload.etag.startswith('"') and payload.etag.endswith('"')
+    assert build_payload(_records(date(2026, 1, 5)), elapsed_ms=12.5).etag == payload.etag
+
+
+def test_build_payload_without_rankings_is_none():
+    assert build_payload({}) is None
+    assert build_payload({"rankings": []}) is None
+
+
+@pytest.mark.asyncio
+async def test_todays_payload_is_served_from_memory(service):
+    service._payload = build_payload(_records(date.today()))
+    assert await service.get_payload() is service._payload
+    service.db_service.get_estimator_payload_etag.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cold_start_loads_the_stored_blob(service):
+    stored = build_payload(_records(date.today()))
+    service.db_service.get_estimator_payload_etag.return_value = stored.etag
+    service.db_service.get_estimator_payload.return_value = {
+        "as_of_date": stored.as_of_date, "etag": stored.etag, "body": stored.body,
+    }
+
+    payload = await service.get_payload()
+
+    assert payload == EstimatorPayload(stored.as_of_date, stored.etag, stored.body)
+    service.db_service.get_estimator_latest.assert_not_called()
+    assert await service.get_payload() is payload  # today's: no further DB reads
+    assert service.db_service.get_estimator_payload.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_payload_only_probes_the_etag(service):
+    service._payload = build_payload(_records(date.today() - timedelta(days=1)))
+    service.db_service.get_estimator_payload_etag.return_value = service._payload.etag
+
+    assert await service.get_payload() is service._payload
+    service.db_service.get_estimator_payload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_missing_blob_is_built_from_tables_and_persisted(service):
+    service.db_service.get_estimator_latest.return_value = _records(date(2026, 1, 5))
+
+    payload = await service.get_payload()
+
+    assert payload.as_of_date == date(2026, 1, 5)
+    service.db_service.upsert_estimator_payload.assert_awaited_once_with(
+        payload.as_of_date, payload.etag, payload.body
+    )
+
+
+@pytest.mark.asyncio
+async def test_no_results_anywhere(service):
+    assert await service.get_payload() is None
+
+
+@pytest.mark.asyncio
+async def test_run_scenarios_reuses_todays_fits(service):
+    import numpy as np
+    from app.fantsy_estimator.scenario import Scenario, TeamFit
+
+    service._fits = [
+        TeamFit(team_id=t, team_name=f"T{t}", current_totals=np.full(10, 100.0 * t),
+                mean_per_game=np.ones(10), cov_per_game=np.eye(10) * 0.01,
+                games_played=100.0, mean_gp_per_period=5.0, projected_total_gp=500.0)
+        for t in (1, 2)
+    ]
+    service._fits_date = date.today()
+    service._load_inputs = AsyncMock(side_effect=AssertionError("should reuse fits"))
+
+    outcomes, seed = await service.run_scenarios([Scenario("noop")], num_runs=100)
+    again, _ = await service.run_scenarios([Scenario("noop")], num_runs=100, seed=seed)
+
+    assert [o.name for o in outcomes] == ["baseline", "noop"]
+    assert outcomes[1].ranking_df.equals(again[1].ranking_df)
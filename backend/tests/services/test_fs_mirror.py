@@ -0,0 +1,193 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.config import settings
+from app.services.db_pool import DBPoolManager
+from app.services.db_service import DBService
+from app.services.fs_mirror import PLAYER_COLUMNS, TEAM_COLUMNS, FSMirror
+
+SEASON = "2025-26"
+D1, D2, D3 = date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3)
+
+
+def _player(player_id, game_id, game_date, minutes, team_id=1, name=None, fgm=4.0, fga=8.0, season=SEASON):
+    row = dict(
+        player_id=player_id, game_id=game_id, season=season, game_date=game_date,
+        player_name=name or f"P{player_id}", team_id=team_id, matchup="A vs. B",
+        min=minutes, pts=10.0, reb=5.0, ast=3.0, stl=1.0, blk=0.0, fgm=fgm, fga=fga,
+        ftm=2.0, fta=4.0, fg3m=1.0, fg3a=3.0, tov=2.0,
+    )
+    return tuple(row[c] for c in PLAYER_COLUMNS)
+
+
+def _team(game_id, game_date, team_id=1):
+    row = dict(team_id=team_id, game_id=game_id, season=SEASON, game_date=game_date, fga=80.0, fta=20.0, tov=14.0)
+    return tuple(row[c] for c in TEAM_COLUMNS)
+
+
+@pytest.fixture
+def mirror():
+    m = FSMirror()
+    m.merge(
+        [
+            _player(1, "g1", D1, 30.0, name="Old Name"),
+            _player(1, "g2", D2, 20.0, name="New Name", fgm=0.0, fga=0.0),
+            _player(2, "g1", D1, 18.0),
+            _player(3, "g1", D1, 0.0),          # DNP
+            _player(4, "g3", D3, 25.0, team_id=2),  # no team row for g3
+        ],
+        [_team("g1", D1), _team("g2", D2)],
+    )
+    return m
+
+
+def test_aggregate_player_games_totals_latest_name_and_pcts(mirror):
+    df, start, end = mirror.aggregate_player_games(D1, D3, SEASON)
+
+    assert (start, end) == (D1, D3)
+    assert set(df["player_id"]) == {1, 2, 4}  # DNP-only player 3 excluded
+    p1 = df.set_index("player_id").loc[1]
+    assert p1["player_name"] == "New Name"
+    assert p1["gp"] == 2
+    assert p1["min"] == 50.0
+    assert p1["fg_pct"] == pytest.approx(4.0 / 8.0)
+
+
+def test_aggregate_player_games_player_filter_keeps_league_coverage(mirror):
+    df, start, end = mirror.aggregate_player_games(D1, D3, SEASON, [2])
+    assert list(df["player_id"]) == [2]
+    assert (start, end) == (D1, D3)
+
+    df, start, end = mirror.aggregate_player_games(D1, D3, SEASON, [99])
+    assert df.empty and (start, end) == (D1, D3)
+
+    df, start, end = mirror.aggregate_player_games(D1, D3, "2019-20")
+    assert df.empty and (start, end) == (None, None)
+
+
+def test_zero_attempts_give_zero_pct(mirror):
+    df = mirror.aggregate_shooting_by_player([SEASON], D2, D2)
+    assert df.loc[0, "fg_pct"] == 0.0
+    assert df.loc[0, "ft_pct"] == pytest.approx(0.5)
+
+
+def test_usage_components_join_team_totals_and_drop_rows_without_team(mirror):
+    df = mirror.get_usage_components(SEASON, D1, D3)
+
+    assert set(zip(df["player_id"], df["game_id"])) == {(1, "g1"), (1, "g2"), (2, "g1")}
+    g1 = df[df["game_id"] == "g1"]
+    assert set(g1["t_min"]) == {48.0}  # 30 + 18 + DNP 0
+    assert set(g1["t_fga"]) == {80.0}
+
+
+def test_game_log_is_date_ordered(mirror):
+    df = mirror.get_player_game_log(1, SEASON, D1, D3)
+    assert list(df["game_date"]) == [D1, D2]
+    assert list(df["p_min"]) == [30.0, 20.0]
+    assert mirror.get_player_game_log(4, SEASON, D1, D3).empty
+
+
+def test_merge_replaces_rows_from_high_water_on(mirror):
+    player_since, team_since = mirror.high_water()
+    assert (player_since, team_since) == (D3, D2)
+
+    mirror.merge(
+        [_player(4, "g3", D3, 25.0, team_id=2), _player(5, "g3", D3, 10.0, team_id=2)],
+        [_team("g2", D2), _team("g3", D3, team_id=2)],
+        player_since, team_since,
+    )
+
+    assert mirror.num_rows == (6, 3)
+    assert len(mirror.get_usage_components(SEASON, D3, D3)) == 2
+
+
+@pytest.fixture
+def db_service(mirror):
+    svc = object.__new__(DBService)
+    svc._pools = DBPoolManager()
+    svc._fs_mirror = mirror
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_db_service_reads_from_mirror_when_enabled(db_service, monkeypatch):
+    monkeypatch.setattr(settings, "fs_mirror_enabled", True)
+    get_pool = AsyncMock()
+    monkeypatch.setattr(db_service, "_get_pool", get_pool)
+
+    df = await db_service.get_player_game_log(1, SEASON, D1, D3)
+
+    assert len(df) == 2
+    get_pool.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("enabled,ready,raises", [(False, True, False), (True, False, False), (True, True, True)])
+async def test_db_service_falls_back_to_postgres(db_service, monkeypatch, enabled, ready, raises):
+    monkeypatch.setattr(settings, "fs_mirror_enabled", enabled)
+    if not ready:
+        db_service._fs_mirror.reset()
+    if raises:
+        monkeypatch.setattr(db_service._fs_mirror, "get_usage_components", MagicMock(side_effect=ValueError("boom")))
+    monkeypatch.setattr(db_service, "_get_pool", AsyncMock(return_value=None))
+
+    df = await db_service.get_usage_components(SEASON, D1, D3)
+
+    assert df.empty
+    db_service._get_pool.assert_awaited_once()
+
+
+def _refresh_conn(monkeypatch, db_service, fetches, counts):
+    conn = MagicMock()
+    conn.fetch = AsyncMock(side_effect=fetches)
+    conn.fetchrow = AsyncMock(side_effect=[{"players": p, "teams": t} for p, t in counts])
+    conn.transaction.return_value.__aenter__ = AsyncMock()
+    conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr(db_service, "_get_pool", AsyncMock(return_value=pool))
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_refresh_fs_mirror_reads_from_high_water(db_service, monkeypatch):
+    monkeypatch.setattr(settings, "fs_mirror_enabled", True)
+    conn = _refresh_conn(
+        monkeypatch, db_service, [[_player(6, "g4", date(2026, 1, 4), 12.0)], []], [(5, 1)],
+    )
+
+    assert await db_service.refresh_fs_mirror() is True
+
+    assert [c.args[1] for c in conn.fetch.call_args_list] == [D3, D2]
+    # Rows dated on/after each high-water mark were replaced by the fetched ones.
+    assert db_service._fs_mirror.num_rows == (5, 1)
+
+
+@pytest.mark.asyncio
+async def test_refresh_fs_mirror_reloads_when_counts_diverge(db_service, monkeypatch):
+    """Older rows deleted behind the high-water mark (e.g. a re-bootstrap from
+    another process): the merged mirror is too big, so it reloads in full."""
+    monkeypatch.setattr(settings, "fs_mirror_enabled", True)
+    full_players = [_player(1, "g1", D1, 30.0), _player(4, "g3", D3, 25.0, team_id=2)]
+    conn = _refresh_conn(
+        monkeypatch, db_service,
+        [[_player(4, "g3", D3, 25.0, team_id=2)], [_team("g2", D2)], full_players, [_team("g1", D1)]],
+        [(2, 1), (2, 1)],
+    )
+
+    assert await db_service.refresh_fs_mirror() is True
+
+    assert [c.args[1] for c in conn.fetch.call_args_list] == [D3, D2, None, None]
+    assert db_service._fs_mirror.num_rows == (2, 1)
+    assert db_service._fs_mirror.high_water() == (D3, D1)
+
+
+@pytest.mark.asyncio
+async def test_refresh_fs_mirror_disabled_is_noop(db_service, monkeypatch):
+    monkeypatch.setattr(settings, "fs_mirror_enabled", False)
+    monkeypatch.setattr(db_service, "_get_pool", AsyncMock())
+    assert await db_service.refresh_fs_mirror() is False
+    db_service._get_pool.assert_not_awaited()
@@ -0,0 +1,222 @@
+"""FSMirror vs Postgres: the same DBService reads against both engines.
+
+Needs a scratch Postgres in TEST_DATABASE_URL (skipped otherwise). Each test
+creates the pipeline tables in a throwaway schema, loads one synthetic season
+pair through DBService.insert_fs_rows, mirrors it with refresh_fs_mirror, and
+compares every analytical read row for row.
+"""
+
+import os
+import random
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+import asyncpg
+import pandas as pd
+import pytest
+import pytest_asyncio
+
+from app.config import settings
+from app.services.db_pool import DBPoolManager
+from app.services.db_service import DBService, _init_connection
+from app.services.fs_mirror import FSMirror
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="parity suite needs a scratch Postgres in TEST_DATABASE_URL"
+)
+
+MIGRATION = Path(__file__).resolve().parents[2] / "migrations" / "create_model_pipeline_tables.sql"
+
+PRIOR, CURRENT = "2024-25", "2025-26"
+PRIOR_DATES = [date(2024, 11, 1) + timedelta(days=i) for i in range(8)]
+CURRENT_DATES = [date(2026, 1, 1) + timedelta(days=i) for i in range(16)]
+TRADED, RENAMED, NO_TEAM_ROW_TEAM = 105, 101, 4
+
+
+def _schedule(days):
+    """Two games per day among four teams, rotating opponents."""
+    pairings = [((1, 2), (3, 4)), ((1, 3), (2, 4)), ((1, 4), (2, 3))]
+    for i, day in enumerate(days):
+        for home, away in pairings[i % 3]:
+            yield i, day, f"{day:%Y%m%d}-{home}-{away}", home, away
+
+
+def _dataset():
+    """(player_rows, team_rows) in insert_fs_rows column order, with the edge
+    cases the SQL has to get right: DNPs (min = 0), zero attempts, a trade
+    mid-season, a renamed player and a game missing one team's row."""
+    rng = random.Random(7)
+    players, teams = [], []
+    for season, days in ((PRIOR, PRIOR_DATES), (CURRENT, CURRENT_DATES)):
+        for i, day, game_id, home, away in _schedule(days):
+            for team_id in (home, away):
+                roster = [team_id * 100 + k for k in range(1, 9)]
+                if season == CURRENT and i >= 8:  # TRADED moves from team 1 to team 2
+                    roster = [p for p in roster if p != TRADED] + ([TRADED] if team_id == 2 else [])
+                totals = [0.0, 0.0, 0.0]
+                for player_id in roster:
+                    played = rng.random() > 0.15
+                    minutes = rng.choice([12.5, 18.0, 24.5, 30.0, 36.0]) if played else 0.0
+                    fga = float(rng.randint(0, 18)) if played else 0.0
+                    fgm = float(rng.randint(0, int(fga)))
+                    fg3a = float(rng.randint(0, int(fga)))
+                    fg3m = float(rng.randint(0, int(min(fg3a, fgm))))
+                    fta = float(rng.choice([0, 0, 2, 4, 6])) if played else 0.0
+                    ftm = float(rng.randint(0, int(fta)))
+                    tov = float(rng.randint(0, 4)) if played else 0.0
+                    name = f"Player {player_id}"
+                    if player_id == RENAMED and day >= CURRENT_DATES[5]:
+                        name = f"Player {player_id} Jr."
+                    pts = 2 * fgm + fg3m + ftm
+                    players.append((
+                        player_id, game_id, season, day, name, team_id, f"T{home} vs. T{away}", "G",
+                        minutes, pts, float(rng.randint(0, 10)), 0.0, 0.0, float(rng.randint(0, 8)),
+                        fg3m, fg3a, float(rng.randint(0, 3)), float(rng.randint(0, 2)), tov,
+                        fgm, fga, ftm, fta, 0.0, 0.0,
+                    ))
+                    totals = [totals[0] + fga, totals[1] + fta, totals[2] + tov]
+                if season == CURRENT and i == 3 and team_id == NO_TEAM_ROW_TEAM:
+                    continue
+                teams.append((
+                    team_id, game_id, season, day, f"Team {team_id}", f"T{home} vs. T{away}",
+                    100.0, 40.0, 20.0, 7.0, 5.0, 12.0, 0.45, totals[0], totals[1], totals[2],
+                ))
+    return players, teams
+
+
+def _with_search_path(url: str, schema: str) -> str:
+    # asyncpg passes unknown DSN query parameters through as server settings.
+    return f"{url}{'&' if '?' in url else '?'}search_path={schema}"
+
+
+@pytest_asyncio.fixture
+async def parity_db(monkeypatch):
+    schema = f"fs_parity_{uuid.uuid4().hex[:8]}"
+    admin = await asyncpg.connect(TEST_DATABASE_URL)
+    await admin.execute(f"CREATE SCHEMA {schema}")
+    dsn = _with_search_path(TEST_DATABASE_URL, schema)
+    conn = await asyncpg.connect(dsn)
+    await conn.execute(MIGRATION.read_text())
+    await conn.close()
+
+    monkeypatch.setattr(settings, "database_url", dsn)
+    monkeypatch.setattr(settings, "fs_mirror_enabled", True)
+    db = object.__new__(DBService)
+    db._pools = DBPoolManager(init=_init_connection)
+    db._fs_mirror = FSMirror()
+    try:
+        assert await db.insert_fs_rows(*_dataset())
+        assert await db.refresh_fs_mirror()
+        # Postgres answers with the mirror disabled; tests call the mirror directly.
+        monkeypatch.setattr(settings, "fs_mirror_enabled", False)
+        yield db
+    finally:
+        await db.close()
+        await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+        await admin.close()
+
+
+def _assert_same(pg: pd.DataFrame, mirror: pd.DataFrame, keys: list[str], expect_rows: bool) -> None:
+    assert pg.empty != expect_rows  # guard against a vacuous comparison
+    if pg.empty:
+        assert mirror.empty
+        return
+    assert list(mirror.columns) == list(pg.columns)
+    pg = pg.sort_values(keys).reset_index(drop=True)
+    mirror = mirror.sort_values(keys).reset_index(drop=True)
+    pd.testing.assert_frame_equal(mirror, pg, check_exact=False, rtol=1e-12)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start,end,player_ids,expect_rows", [
+    (CURRENT_DATES[0], CURRENT_DATES[-1], None, True),
+    (CURRENT_DATES[4], CURRENT_DATES[9], None, True),
+    (CURRENT_DATES[4], CURRENT_DATES[9], [TRADED, RENAMED, 999], True),
+    (CURRENT_DATES[4], CURRENT_DATES[9], [999], False),
+    (date(2025, 7, 1), date(2025, 7, 31), None, False),
+])
+async def test_aggregate_player_games_parity(parity_db, start, end, player_ids, expect_rows):
+    pg = await parity_db.aggregate_player_games(start, end, CURRENT, player_ids)
+    mirror = parity_db._fs_mirror.aggregate_player_games(start, end, CURRENT, player_ids)
+
+    _assert_same(pg[0], mirror[0], ["player_id"], expect_rows)
+    assert mirror[1:] == pg[1:]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seasons,start,end,expect_rows", [
+    ([CURRENT], None, None, True),
+    ([PRIOR, CURRENT], None, None, True),
+    ([CURRENT], CURRENT_DATES[2], CURRENT_DATES[6], True),
+    ([CURRENT], CURRENT_DATES[10], None, True),
+    (["2019-20"], None, None, False),
+])
+async def test_aggregate_shooting_by_player_parity(parity_db, seasons, start, end, expect_rows):
+    pg = await parity_db.aggregate_shooting_by_player(seasons, start, end)
+    mirror = parity_db._fs_mirror.aggregate_shooting_by_player(seasons, start, end)
+
+    _assert_same(pg, mirror, ["player_id"], expect_rows)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start,end,expect_rows", [
+    (CURRENT_DATES[0], CURRENT_DATES[-1], True),
+    (CURRENT_DATES[3], CURRENT_DATES[3], True),  # one team's row missing that day
+    (date(2025, 7, 1), date(2025, 7, 31), False),
+])
+async def test_get_usage_components_parity(parity_db, start, end, expect_rows):
+    pg = await parity_db.get_usage_components(CURRENT, start, end)
+    mirror = parity_db._fs_mirror.get_usage_components(CURRENT, start, end)
+
+    _assert_same(pg, mirror, ["player_id", "game_id"], expect_rows)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("player_id,expect_rows", [
+    (TRADED, True), (RENAMED, True), (NO_TEAM_ROW_TEAM * 100 + 1, True), (999, False),
+])
+async def test_get_player_game_log_parity(parity_db, player_id, expect_rows):
+    start, end = CURRENT_DATES[0], CURRENT_DATES[-1]
+    pg = await parity_db.get_player_game_log(player_id, CURRENT, start, end)
+    mirror = parity_db._fs_mirror.get_player_game_log(player_id, CURRENT, start, end)
+
+    assert pg.empty != expect_rows
+    if pg.empty:
+        assert mirror.empty
+        return
+    # Already ordered by game_date on both sides; compare without re-sorting.
+    pd.testing.assert_frame_equal(mirror, pg, check_exact=False, rtol=1e-12)
+
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_matches_full_load(parity_db, monkeypatch):
+    players, teams = _dataset()
+    last_day = CURRENT_DATES[-1] + timedelta(days=1)
+    extra_players = [(*p[:1], f"late-{p[1]}", p[2], last_day, *p[4:]) for p in players[-8:]]
+    extra_teams = [(*t[:1], f"late-{t[1]}", t[2], last_day, *t[4:]) for t in teams[-1:]]
+    assert await parity_db.insert_fs_rows(extra_players, extra_teams)
+
+    monkeypatch.setattr(settings, "fs_mirror_enabled", True)
+    assert await parity_db.refresh_fs_mirror()
+    incremental = parity_db._fs_mirror.num_rows
+    parity_db._fs_mirror.reset()
+    assert await parity_db.refresh_fs_mirror()
+
+    assert incremental == parity_db._fs_mirror.num_rows == (len(players) + 8, len(teams) + 1)
+
+
+@pytest.mark.asyncio
+async def test_refresh_reloads_after_rows_deleted_behind_high_water(parity_db, monkeypatch):
+    pool = await parity_db._get_pool()
+    async with pool.acquire() as conn:
+        await conn.execute("DELETE FROM fs_player_games WHERE season = $1", PRIOR)
+        expected = await conn.fetchval("SELECT COUNT(*) FROM fs_player_games")
+
+    monkeypatch.setattr(settings, "fs_mirror_enabled", True)
+    assert await parity_db.refresh_fs_mirror()
+
+    assert parity_db._fs_mirror.num_rows[0] == expected
+    assert parity_db._fs_mirror.aggregate_shooting_by_player([PRIOR]).empty
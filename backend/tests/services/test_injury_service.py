@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from zoneinfo import ZoneInfo
 
 import pytest
@@ -91,3 +91,145 @@ class TestGetCurrentPdfUrl:
         assert "2025-12-01" in url
         assert "Injury-Report_" in url
         assert "_02_30PM" in url
+
+
+def _pdf(pages: list[list[tuple[float, float, str]]], encoding: bytes = b"") -> bytes:
+    """Minimal landscape PDF: one Helvetica text run per (x, top, text)."""
+    objs = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica %s>>" % encoding]
+    kids = []
+    for runs in pages:
+        ops = "".join(f"BT /F1 8 Tf {x} {595 - top - 8} Td ({text}) Tj ET\n" for x, top, text in runs).encode()
+        objs.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(ops), ops))
+        objs.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 842 595] "
+                    b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objs))
+        kids.append(len(objs))
+    objs[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        " ".join(f"{k} 0 R" for k in kids).encode(), len(kids))
+
+    out, offsets = bytearray(b"%PDF-1.4\n"), []
+    for i, body in enumerate(objs, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objs) + 1, xref)
+    return bytes(out)
+
+
+def _row(top, player, status, reason, team="", date_="", time_="", matchup=""):
+    cells = [(20, date_), (120, time_), (200, matchup), (260, team),
+             (420, player), (580, status), (660, reason)]
+    return [(x, top, text) for x, text in cells if text]
+
+
+def _report(pts_status="Out", encoding=b""):
+    page1 = (_row(100, "James, LeBron", "Out", "Injury/Illness-LeftAnkle;Sprain",
+                  team="LosAngelesLakers", date_="10/19/2026", time_="07:30 (ET)", matchup="LAL@BOS")
+             + _row(120, "Davis, Anthony", "Questionable", "Injury/Illness-Back;Spasms")
+             + _row(140, "Tatum, Jayson", "Probable", "Injury/Illness-RightWrist;Soreness",
+                    team="BostonCeltics"))
+    page2 = (_row(100, "Curry, Stephen", pts_status, "Injury/Illness-LeftKnee;Contusion",
+                  time_="10:00 (ET)", matchup="GSW@PHX", team="GoldenStateWarriors")
+             + _row(120, "Booker, Devin", "Doubtful", "Injury/Illness-RightHamstring;Strain",
+                    team="PhoenixSuns"))
+    return _pdf([page1, page2], encoding)
+
+
+class TestInjuryReportParser:
+    def test_matches_full_parse(self):
+        pdf = _report()
+        report = inj.InjuryReportParser().parse(pdf)
+        assert report.records == inj.parse_injury_pdf(pdf)
+        assert [r.player for r in report.records] == [
+            "LeBron James", "Anthony Davis", "Jayson Tatum", "Stephen Curry", "Devin Booker"]
+        assert report.records[3].team == "Golden State Warriors"
+        assert report.pages == report.pages_extracted == 2
+
+    def test_identical_bytes_cost_only_a_hash(self):
+        parser = inj.InjuryReportParser()
+        first = parser.parse(_report())
+        parser.commit(first)
+        with patch("app.services.injury_service.pdfplumber.open", side_effect=AssertionError):
+            again = parser.parse(_report())
+        assert again.unchanged and again.changed_keys == set()
+        assert again.records == first.records
+
+    def test_only_changed_page_is_reextracted(self):
+        parser = inj.InjuryReportParser()
+        before = parser.parse(_report())
+        parser.commit(before)
+        after = parser.parse(_report(pts_status="Available"))
+        assert after.pages_extracted == 1
+        assert after.records == inj.parse_injury_pdf(_report(pts_status="Available"))
+
+        key = "Golden State Warriors|Stephen Curry"
+        assert after.changed_keys == {key}
+        old_store = {f"{r.team}|{r.player}": r for r in before.records}
+        assert inj.compute_diff(old_store, after.records, "t", keys=after.changed_keys) == \
+            inj.compute_diff(old_store, after.records, "t")
+
+    def test_font_change_with_same_content_stream_is_reextracted(self):
+        parser = inj.InjuryReportParser()
+        parser.commit(parser.parse(_report()))
+        # Same content streams; the shared font now decodes byte 76 ("L") as "M".
+        remapped = _report(encoding=b"/Encoding << /Type /Encoding /Differences [76 /M] >> ")
+        after = parser.parse(remapped)
+        assert after.pages_extracted == 2
+        assert after.records == inj.parse_injury_pdf(remapped)
+        assert "MeBron James" in {r.player for r in after.records}
+
+    def test_parse_without_commit_keeps_state(self):
+        parser = inj.InjuryReportParser()
+        parser.commit(parser.parse(_report()))
+        changed = _report(pts_status="Doubtful")
+        parser.parse(changed)
+        retry = parser.parse(changed)
+        assert not retry.unchanged
+        assert retry.changed_keys == {"Golden State Warriors|Stephen Curry"}
+
+
+class TestTryUpdatePersistence:
+    @pytest.mark.asyncio
+    async def test_whole_diff_written_in_one_batch(self, monkeypatch):
+        old = {
+            "LAL|Stays": _rec(player="Stays", status="Out"),
+            "LAL|Changes": _rec(player="Changes", status="Questionable"),
+            "LAL|Clears": _rec(player="Clears", status="Out"),
+            "LAL|Dropped": _rec(player="Dropped", status="Out"),
+        }
+        new = [
+            _rec(player="Stays", status="Out"),
+            _rec(player="Changes", status="Out"),
+            _rec(player="Clears", status="Available"),
+            _rec(player="Added", status="Doubtful"),
+            _rec(team="BOS", player="Celtic", status="Out"),
+        ]
+        monkeypatch.setattr(inj, "injury_store", dict(old))
+        monkeypatch.setattr(inj, "_report_parser", inj.InjuryReportParser())
+        monkeypatch.setattr(inj, "fetch_pdf_bytes", AsyncMock(return_value=b"%PDF"))
+        monkeypatch.setattr(inj._report_parser, "parse",
+                            lambda _: inj.ParsedReport(new, b"d", changed_keys=None))
+        broadcast = AsyncMock()
+        monkeypatch.setattr(inj, "broadcast_notifications", broadcast)
+        monkeypatch.setattr(inj, "broadcast_fetch_update", AsyncMock())
+        db = MagicMock()
+        db.get_injury_statuses_for_teams = AsyncMock(return_value=[
+            {"team": "BOS", "player": "Stale", "status": "Out"},
+            {"team": "BOS", "player": "Celtic", "status": "Out"},
+        ])
+        db.apply_injury_changes = AsyncMock(return_value=True)
+        monkeypatch.setattr(inj, "get_db_service", lambda: db)
+
+        assert await inj._try_update_injury_data()
+
+        db.apply_injury_changes.assert_awaited_once()
+        kwargs = db.apply_injury_changes.await_args.kwargs
+        assert sorted(r.player for r in kwargs["upserts"]) == ["Added", "Celtic", "Changes"]
+        assert sorted(kwargs["deletes"]) == [("BOS", "Stale"), ("LAL", "Clears"), ("LAL", "Dropped")]
+        notes = broadcast.await_args.args[0]
+        assert {(n.type, n.player) for n in notes} == {
+            ("status_change", "Changes"), ("status_change", "Clears"), ("added", "Added"),
+            ("added", "Celtic"), ("removed", "Dropped"), ("removed", "Stale"),
+        }
@@ -0,0 +1,135 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from app.exceptions import ResourceNotFoundError
+from app.services.league_history import COUNTING_COLS, LeagueHistory
+from app.services.ranking_service import RankingService
+
+
+def _row(d, team_id, k, name=None):
+    counts = {c: (i + 1) * k * team_id for i, c in enumerate(COUNTING_COLS)}
+    counts['fga'] = 0 if k == 0 else counts['fga']
+    return {'date': d, 'team_id': team_id, 'team_name': name or f"T{team_id}", **counts}
+
+
+D1, D2, D3, D4 = date(2025, 11, 1), date(2025, 11, 2), date(2025, 11, 5), date(2025, 11, 9)
+HISTORY = (
+    [_row(D1, t, 0) for t in (1, 2)]
+    + [_row(D2, t, 1) for t in (1, 2)]
+    + [_row(D3, t, 3) for t in (1, 2, 3)]               # team 3 joins late
+    + [_row(D4, 1, 6, name="Renamed"), _row(D4, 2, 7), _row(D4, 3, 8)]
+)
+
+
+def _db_range(start, end):
+    """What DBService.get_snapshots_for_date_range returns for HISTORY."""
+    ends = [d for d in sorted({r['date'] for r in HISTORY}) if d <= end]
+    starts = [d for d in sorted({r['date'] for r in HISTORY}) if d >= start]
+    if not ends:
+        return None, None, [], []
+    actual_end, actual_start = ends[-1], (starts[0] if starts else None)
+    rows = lambda d: [{k: v for k, v in r.items() if k != 'date'} for r in HISTORY if r['date'] == d]
+    return actual_end, actual_start, rows(actual_end), rows(actual_start) if actual_start else []
+
+
+@pytest.fixture
+def history():
+    h = LeagueHistory()
+    h.clear()
+    db = MagicMock()
+    db.get_snapshot_history = AsyncMock(return_value=HISTORY)
+    yield h, db
+    h.clear()
+
+
+@pytest.fixture
+def ranking_service():
+    with patch('app.services.ranking_service.DataProvider'), \
+            patch('app.services.ranking_service.ResponseBuilder'):
+        service = RankingService()
+        service.data_provider = MagicMock()
+        service.data_provider.db_service.get_snapshots_for_date_range = AsyncMock(side_effect=_db_range)
+        return service
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start,end", [
+    (date(2025, 10, 30), date(2025, 11, 10)),
+    (date(2025, 11, 2), date(2025, 11, 6)),
+    (date(2025, 11, 3), date(2025, 11, 9)),
+    (date(2025, 11, 6), date(2025, 11, 12)),
+    (date(2025, 11, 10), date(2025, 11, 12)),    # no start snapshot: season to date
+])
+async def test_range_delta_matches_db_path(history, ranking_service, start, end):
+    h, db = history
+    expected = await ranking_service._get_range_delta(start, end)
+    assert await h.load(db)
+    got = await ranking_service._get_range_delta(start, end)
+
+    assert got[:2] == expected[:2]
+    pd.testing.assert_frame_equal(
+        got[2].sort_values('team_id').reset_index(drop=True),
+        expected[2].sort_values('team_id').reset_index(drop=True),
+        check_dtype=False,
+    )
+    ranking_service.data_provider.db_service.get_snapshots_for_date_range.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_range_before_history_not_found(history, ranking_service):
+    h, db = history
+    await h.load(db)
+    with pytest.raises(ResourceNotFoundError):
+        await ranking_service._get_range_delta(date(2025, 10, 1), date(2025, 10, 20))
+
+
+@pytest.mark.asyncio
+async def test_empty_db_leaves_history_unloaded(history):
+    h, db = history
+    db.get_snapshot_history = AsyncMock(return_value=[])
+    assert not await h.load(db)
+    assert not h.loaded
+
+
+@pytest.mark.asyncio
+async def test_extend_adds_and_replaces_dates(history):
+    h, db = history
+    totals = pd.DataFrame({
+        'team_id': [1, 4], 'team_name': ['A', 'New'],
+        'GP': [10, 2], 'FGM': [50, 9], 'FGA': [100, 20], 'FTM': [5, 1], 'FTA': [10, 2],
+        '3PM': [7, 1], 'REB': [40, 8], 'AST': [30, 6], 'STL': [5, 1], 'BLK': [4, 1], 'PTS': [120, 20],
+    })
+    await h.extend(date(2025, 11, 12), totals)     # ignored until loaded
+    assert h.dates == []
+
+    await h.load(db)
+    await h.extend(date(2025, 11, 12), totals)
+    assert h.dates[-1] == date(2025, 11, 12) and list(h.team_ids) == [1, 2, 3, 4]
+
+    end, start, delta = h.range_delta(date(2025, 11, 6), date(2025, 11, 12))
+    assert (end, start) == (date(2025, 11, 12), D4)
+    assert delta['team_id'].tolist() == [1]                  # team 4 has no D4 snapshot
+    assert delta.loc[0, 'pts'] == 120 - _row(D4, 1, 6)['pts']
+
+    totals.loc[0, 'PTS'] = 130
+    await h.extend(date(2025, 11, 12), totals)
+    assert len(h.dates) == 5
+    assert h.range_delta(date(2025, 11, 13), date(2025, 11, 14))[2].set_index('team_id').loc[1, 'pts'] == 130
+
+
+@pytest.mark.asyncio
+async def test_catch_up_reloads_only_when_db_is_ahead(history):
+    h, db = history
+    await h.catch_up(D4, db)                      # not loaded: nothing to catch up
+    db.get_snapshot_history.assert_not_awaited()
+
+    await h.load(db)
+    await h.catch_up(D4, db)
+    assert db.get_snapshot_history.await_count == 1
+
+    db.get_snapshot_history = AsyncMock(return_value=HISTORY + [_row(date(2025, 11, 12), 1, 9)])
+    await h.catch_up(date(2025, 11, 12), db)
+    assert h.dates[-1] == date(2025, 11, 12)
@@ -2,7 +2,9 @@ import pytest
 import pytest_asyncio
 import pandas as pd
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
+from datetime import datetime
 from app.services.league_service import LeagueService
+from app.services.schedule_context import ScheduleContext
 from app.models import LeagueSummary, HeatmapData, LeagueShotsData, AverageStats, RankingStats
 from app.exceptions import ResourceNotFoundError
 
@@ -18,6 +20,11 @@ def league_service():
         service.data_provider.get_data_date = MagicMock(return_value=None)
         service.stats_calculator = mock_stats_calculator.return_value
         service.response_builder = mock_response_builder.return_value
+        service.schedule_context = AsyncMock()
+        service.schedule_context.get.return_value = ScheduleContext(
+            scoring_period_id=120, nba_avg_pace=58.4, nba_game_days_left=40,
+            slot_usage={}, team_names={}, refreshed_at=datetime.now(),
+        )
         return service
 
 
@@ -49,6 +56,9 @@ class TestLeagueService:
         assert result == expected_summary
         league_service.data_provider.get_averages_df.assert_called_once()
         league_service.response_builder.build_league_summary_response.assert_called_once()
+        kwargs = league_service.response_builder.build_league_summary_response.call_args.kwargs
+        assert kwargs['nba_avg_pace'] == 58.4
+        assert kwargs['nba_game_days_left'] == 40
     
     @pytest.mark.asyncio
     async def test_get_league_summary_data_provider_returns_none(self, league_service):
@@ -0,0 +1,92 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.live_projection_service import LiveProjectionService
+from app.services.nba_matchup_service import GameInfo
+from app.utils.name_matching import normalize_player_name
+from model_stats_inference.serving.errors import InsufficientHistoryError
+
+TARGETS = ['PTS', 'REB', 'AST', 'FG3M', 'STL', 'BLK', 'FGM', 'FGA', 'FTM', 'FTA']
+
+
+class FakeInference:
+    """predict_frame stand-in: one point per minute for every target, except
+    player 3, who has too little history."""
+
+    def __init__(self):
+        self.store = SimpleNamespace(player_vectors=pd.DataFrame({
+            'PLAYER_ID': [1, 2, 3],
+            'MIN_LAST5_ALL': [30.0, 20.0, 10.0],
+            'last_game_date': pd.to_datetime(['2025-11-02'] * 3),
+        }).set_index('PLAYER_ID', drop=False))
+        self.calls = []
+
+    def predict_frame(self, games):
+        self.calls.append(games.copy())
+        out = pd.DataFrame({t: games['minutes'].to_numpy(dtype=float) for t in TARGETS}, index=games.index)
+        errors = [InsufficientHistoryError(3, 2, 10) if pid == 3 else None for pid in games['player_id']]
+        out.loc[games['player_id'] == 3] = np.nan
+        return out, errors
+
+
+@pytest.fixture
+def service(monkeypatch):
+    svc = LiveProjectionService()
+    inference = FakeInference()
+    monkeypatch.setattr(svc, '_ensure_inference', AsyncMock(return_value=inference))
+    monkeypatch.setattr(svc, '_name_index', {
+        normalize_player_name(n): pid for n, pid in [('Alpha One', 1), ('Beta Two', 2), ('Gamma Three', 3)]
+    })
+    return svc, inference
+
+
+PLAYERS = pd.DataFrame({
+    'Name': ['Alpha One', 'Beta Two', 'Gamma Three', 'Nobody Known'],
+    'Pro Team': ['BOS', 'NYK', 'BOS', 'BOS'],
+    'team_id': [5, 5, 0, 6],
+    'fantasy_team_name': ['Fives', 'Fives', '', 'Sixes'],
+})
+SCHEDULE = {
+    date(2025, 11, 3): {'BOS': GameInfo('NYK', True), 'NYK': GameInfo('BOS', False)},
+    date(2025, 11, 4): {'BOS': GameInfo('MIA', False), 'MIA': GameInfo('BOS', True)},
+    date(2025, 11, 7): {'NYK': GameInfo('MIA', True), 'MIA': GameInfo('NYK', False)},
+}
+
+
+@pytest.mark.asyncio
+async def test_project_week_one_batched_predict(service):
+    svc, inference = service
+    result = await svc.project_week(PLAYERS, SCHEDULE)
+
+    assert len(inference.calls) == 1
+    games = inference.calls[0]
+    alpha = games[games['player_id'] == 1]
+    assert alpha['game_date'].dt.date.tolist() == [date(2025, 11, 3), date(2025, 11, 4)]
+    assert alpha['is_home'].tolist() == [True, False]
+    # First game: gap from the store's last game; later games: from the schedule.
+    assert np.isnan(alpha['rest_days'].iloc[0]) and alpha['rest_days'].iloc[1] == 1.0
+
+    players = {p['player_name']: p for p in result['players']}
+    assert set(players) == {'Alpha One', 'Beta Two', 'Gamma Three'}
+    assert players['Alpha One']['games'] == 2
+    assert players['Alpha One']['stats']['pts'] == 60.0
+    assert players['Alpha One']['stats']['fg_pct'] == 1.0
+    assert players['Beta Two']['stats']['pts'] == 40.0
+    assert players['Gamma Three']['status'] == 'red' and players['Gamma Three']['stats'] is None
+
+    (team,) = result['teams']
+    assert team['team_id'] == 5 and team['team_name'] == 'Fives'
+    assert team['games'] == 4 and team['players'] == 2
+    assert team['stats']['pts'] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_project_week_no_games(service):
+    svc, inference = service
+    assert await svc.project_week(PLAYERS, {}) == {'players': [], 'teams': []}
+    assert inference.calls == []
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.exceptions import InvalidParameterError
+from app.services.player_index import PlayerSortIndex, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def players_df():
+    return pd.DataFrame({
+        'Name': ['Cee', 'Ay', 'Bee', 'Dee', 'Ee', 'Eff'],
+        'Pro Team': ['LAL', 'BOS', 'LAL', 'GSW', 'BOS', 'NYK'],
+        'player_id': [30, 10, 20, 40, 50, 60],
+        'PTS': [20.0, 25.0, 20.0, np.nan, 15.0, 25.0],
+        'GP': [10, 12, 11, 0, 9, 12],
+    })
+
+
+def _walk(index, limit, **kwargs):
+    """All pages via cursors -> concatenated player ids."""
+    ids, cursor = [], None
+    while True:
+        page_df, cursor = index.page(limit, cursor=cursor, **kwargs)
+        ids.extend(page_df['player_id'].tolist())
+        if cursor is None:
+            return ids
+
+
+def test_natural_order_pages_by_offset(players_df):
+    index = PlayerSortIndex(players_df)
+
+    page_df, cursor = index.page(4, offset=0)
+    assert page_df['player_id'].tolist() == [30, 10, 20, 40]
+    assert cursor is not None
+    assert index.page(4, offset=4)[0]['player_id'].tolist() == [50, 60]
+    assert index.page(4, offset=4)[1] is None
+
+
+def test_numeric_sort_desc_ties_by_id_nan_last(players_df):
+    index = PlayerSortIndex(players_df)
+
+    page_df, _ = index.page(10, sort_by='pts', descending=True)
+
+    assert page_df['player_id'].tolist() == [10, 60, 20, 30, 50, 40]
+
+
+def test_numeric_sort_asc_nan_last(players_df):
+    page_df, _ = PlayerSortIndex(players_df).page(10, sort_by='pts', descending=False)
+    assert page_df['player_id'].tolist() == [50, 20, 30, 10, 60, 40]
+
+
+def test_text_sort(players_df):
+    index = PlayerSortIndex(players_df)
+    assert index.page(10, sort_by='player_name', descending=False)[0]['Name'].tolist() == [
+        'Ay', 'Bee', 'Cee', 'Dee', 'Ee', 'Eff'
+    ]
+    assert index.page(10, sort_by='pro_team', descending=True)[0]['player_id'].tolist() == [
+        60, 20, 30, 40, 10, 50
+    ]
+
+
+@pytest.mark.parametrize('sort_by,descending', [
+    (None, True), ('pts', True), ('pts', False), ('gp', True), ('player_name', False), ('pro_team', True),
+])
+@pytest.mark.parametrize('limit', [1, 2, 4])
+def test_cursor_walk_matches_single_page(players_df, sort_by, descending, limit):
+    index = PlayerSortIndex(players_df)
+    full = index.page(100, sort_by=sort_by, descending=descending)[0]['player_id'].tolist()
+
+    assert _walk(index, limit, sort_by=sort_by, descending=descending) == full
+
+
+def test_sort_order_is_computed_once_per_key(players_df):
+    index = PlayerSortIndex(players_df)
+    index.page(2, sort_by='pts')
+    first = index._sorted[('pts', True)]
+    index.page(2, offset=2, sort_by='pts')
+    assert index._sorted[('pts', True)] is first
+    index.page(2, sort_by='pts', descending=False)
+    assert len(index._sorted) == 2
+
+
+def test_cursor_survives_frame_rebuild(players_df):
+    """A cursor resumes after the last row it saw even if rows before it changed."""
+    _, cursor = PlayerSortIndex(players_df).page(2, sort_by='pts', descending=True)  # 10, 60
+    rebuilt = players_df[players_df['player_id'] != 10].reset_index(drop=True)
+
+    page_df, _ = PlayerSortIndex(rebuilt).page(2, sort_by='pts', descending=True, cursor=cursor)
+
+    assert page_df['player_id'].tolist() == [20, 30]
+
+
+def test_cursor_for_missing_text_value_seeks_between(players_df):
+    cursor = encode_cursor('player_name', False, 'Bz', 0)
+    page_df, _ = PlayerSortIndex(players_df).page(10, sort_by='player_name', descending=False, cursor=cursor)
+    assert page_df['Name'].tolist() == ['Cee', 'Dee', 'Ee', 'Eff']
+
+
+def test_invalid_sort_by_raises(players_df):
+    with pytest.raises(InvalidParameterError, match="Invalid sort_by"):
+        PlayerSortIndex(players_df).page(10, sort_by='season_rating')  # column absent
+    with pytest.raises(InvalidParameterError, match="Invalid sort_by"):
+        PlayerSortIndex(players_df).page(10, sort_by='bogus')
+
+
+def test_cursor_for_other_sort_raises(players_df):
+    _, cursor = PlayerSortIndex(players_df).page(2, sort_by='pts')
+    with pytest.raises(InvalidParameterError, match="does not match"):
+        PlayerSortIndex(players_df).page(2, sort_by='gp', cursor=cursor)
+
+
+@pytest.mark.parametrize('cursor', ['not-base64!!', encode_cursor('pts', True, 'abc', 1)[:-3], 'e30'])
+def test_malformed_cursor_raises(players_df, cursor):
+    with pytest.raises(InvalidParameterError):
+        PlayerSortIndex(players_df).page(2, sort_by='pts', cursor=cursor)
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor('pts', True, 20.5, 7)) == {'s': 'pts', 'd': True, 'v': 20.5, 'id': 7}
@@ -12,6 +12,7 @@ from app.services.player_service import (
     espn_season_string,
 )
 from app.models import PaginatedPlayers, Player, PlayerStats, StatTimePeriod
+from app.utils.name_matching import add_name_keys
 
 
 def _sample_player(name: str = "P1") -> Player:
@@ -123,6 +124,25 @@ class TestGetAllPlayers:
         assert len(page2.players) == 1
         assert page2.has_more is False
 
+    @pytest.mark.asyncio
+    async def test_sorted_cursor_pages_reuse_cached_index(self, player_service, sample_window_players_df):
+        player_service.data_provider.get_players_df = AsyncMock(return_value=sample_window_players_df)
+        player_service.response_builder.build_all_players_response.side_effect = (
+            lambda df: [_sample_player(n) for n in df['Name']]
+        )
+
+        first = await player_service.get_all_players(limit=2, sort_by='pts', descending=True)
+        second = await player_service.get_all_players(limit=2, sort_by='pts', descending=True, cursor=first.next_cursor)
+
+        assert [p.player_name for p in first.players] == ['Player Z', 'Player X']
+        assert [p.player_name for p in second.players] == ['Player Y']
+        assert first.has_more is True and second.has_more is False
+        assert second.next_cursor is None
+        assert second.total_count == 3
+        player_service.data_provider.get_players_df.assert_awaited_once()
+        index = player_service_module._windowed_players_cache[StatTimePeriod.SEASON]['index']
+        assert list(index._sorted) == [('pts', True)]
+
     @pytest.mark.asyncio
     async def test_none_df_raises(self, player_service):
         player_service.data_provider.get_players_df = AsyncMock(return_value=None)
@@ -292,6 +312,12 @@ class TestBuildWindowedPlayersDf:
             assert row['PTS'] == 0.0
             assert row['GP'] == 0
 
+    @pytest.mark.asyncio
+    async def test_name_key_columns_do_not_leak(self, sample_window_players_df):
+        keyed = add_name_keys(sample_window_players_df.copy())
+        merged, _, _ = await build_windowed_players_df(StatTimePeriod.LAST_7, keyed, self._db_service())
+        assert list(merged.columns) == list(sample_window_players_df.columns) + ['has_data']
+
     @pytest.mark.asyncio
     async def test_name_override_resolves_mismatch(self, sample_window_players_df):
         agg_df = pd.DataFrame([{
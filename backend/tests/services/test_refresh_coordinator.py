@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from app.services.refresh_coordinator import RefreshCoordinator
+
+
+def _gated_refresh():
+    gate = asyncio.Event()
+    calls = []
+
+    async def refresh(tag=None):
+        calls.append(tag)
+        await gate.wait()
+        return len(calls)
+
+    return refresh, gate, calls
+
+
+class TestRefreshCoordinator:
+    @pytest.mark.asyncio
+    async def test_concurrent_triggers_share_one_run(self):
+        refresh, gate, calls = _gated_refresh()
+        rc = RefreshCoordinator(refresh, min_interval=0)
+        tasks = [rc.trigger(i) for i in range(20)]
+        assert all(t is tasks[0] for t in tasks)
+        assert rc.in_flight
+        gate.set()
+        assert await tasks[0] == 1
+        assert calls == [0]
+        assert rc.runs == 1
+
+    @pytest.mark.asyncio
+    async def test_triggers_within_interval_are_dropped(self):
+        refresh, gate, calls = _gated_refresh()
+        gate.set()
+        rc = RefreshCoordinator(refresh, min_interval=60)
+        await rc.trigger()
+        assert rc.trigger() is None
+        assert calls == [None]
+
+        rc.min_interval = 0
+        await rc.trigger()
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_run_now_ignores_interval_but_joins_in_flight(self):
+        refresh, gate, calls = _gated_refresh()
+        rc = RefreshCoordinator(refresh, min_interval=60)
+        rc.trigger("bg")
+        waiter = asyncio.ensure_future(rc.run_now("late"))
+        await asyncio.sleep(0)
+        gate.set()
+        assert await waiter == 1
+        assert calls == ["bg"]
+
+        assert await rc.run_now("forced") == 2
+        assert calls == ["bg", "forced"]
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_completion_result(self):
+        refresh, gate, _ = _gated_refresh()
+        rc = RefreshCoordinator(refresh, min_interval=0)
+        assert await rc.wait() is None
+        rc.trigger()
+        waiters = [asyncio.ensure_future(rc.wait()) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        assert await asyncio.gather(*waiters) == [1, 1, 1]
+        assert rc.last_result == 1 and rc.last_completed is not None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_refresh(self):
+        refresh, gate, _ = _gated_refresh()
+        rc = RefreshCoordinator(refresh, min_interval=0)
+        task = rc.trigger()
+        waiter = asyncio.ensure_future(rc.wait())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        assert not task.cancelled()
+        gate.set()
+        assert await task == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_is_logged_and_releases_slot(self):
+        async def boom():
+            raise RuntimeError("espn down")
+
+        rc = RefreshCoordinator(boom, min_interval=0)
+        assert await rc.run_now() is None
+        assert not rc.in_flight
+        assert rc.trigger() is not None
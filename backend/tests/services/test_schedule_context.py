@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+
+from app.services.schedule_context import (
+    NBA_AVG_PACE_FALLBACK,
+    SLOT_NAMES,
+    ScheduleContext,
+    ScheduleContextProvider,
+)
+
+
+def _context(**overrides) -> ScheduleContext:
+    fields = dict(
+        scoring_period_id=120, nba_avg_pace=58.4, nba_game_days_left=40,
+        slot_usage={1: {'PG': 30, 'UTIL': 5}, 2: {}},
+        team_names={1: 'Team Alpha'}, refreshed_at=datetime.now(),
+    )
+    fields.update(overrides)
+    return ScheduleContext(**fields)
+
+
+@pytest.fixture
+def provider():
+    """Provider wired to fake ESPN/NBA sources; `period` is what DataProvider
+    last saw, so tests can move the scoring period."""
+    provider = ScheduleContextProvider()
+    state = {'period': 120}
+    data_provider = MagicMock()
+    data_provider.get_totals_df = AsyncMock(
+        return_value=pd.DataFrame({'team_id': [1, 2], 'team_name': ['Team Alpha', 'Team Beta']})
+    )
+    data_provider.get_slot_usage = AsyncMock(return_value={1: {'PG': 30}, 2: {'C': 12}})
+    data_provider.get_scoring_period_id = MagicMock(side_effect=lambda: state['period'])
+    nba_service = MagicMock()
+    nba_service.get_nba_average_pace = AsyncMock(return_value=58.4)
+    nba_service.get_nba_game_days_remaining = AsyncMock(return_value=40)
+    provider.data_provider = data_provider
+    provider.nba_service = nba_service
+    provider.state = state
+    return provider
+
+
+class TestScheduleContext:
+    def test_slot_pace_df_columns_and_values(self):
+        df = _context().slot_pace_df()
+
+        assert list(df.columns) == [
+            'team_id', 'team_name', *SLOT_NAMES, 'nba_game_days_remaining', 'nba_avg_pace'
+        ]
+        row = df.set_index('team_id').loc[1]
+        assert row['team_name'] == 'Team Alpha'
+        assert row['PG'] == 30 and row['UTIL'] == 5 and row['C'] == 0
+        assert row['nba_game_days_remaining'] == 40
+        assert df.set_index('team_id').loc[2, 'team_name'] == 'Team 2'
+
+    def test_resolved_pace_falls_back(self):
+        assert _context(nba_avg_pace=None).resolved_pace == NBA_AVG_PACE_FALLBACK
+        assert _context(nba_avg_pace=None).slot_pace_df()['nba_avg_pace'].iloc[0] == NBA_AVG_PACE_FALLBACK
+
+
+class TestScheduleContextProvider:
+    @pytest.mark.asyncio
+    async def test_get_reuses_context_within_scoring_period(self, provider):
+        first = await provider.get()
+        second = await provider.get()
+
+        assert second is first
+        assert first.scoring_period_id == 120
+        assert first.slot_usage == {1: {'PG': 30}, 2: {'C': 12}}
+        provider.nba_service.get_nba_average_pace.assert_awaited_once()
+        provider.data_provider.get_slot_usage.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_reads_refresh_once(self, provider):
+        contexts = await asyncio.gather(*(provider.get() for _ in range(10)))
+
+        assert all(c is contexts[0] for c in contexts)
+        provider.nba_service.get_nba_average_pace.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_new_scoring_period_refreshes(self, provider):
+        await provider.get()
+        provider.state['period'] = 121
+        provider.nba_service.get_nba_average_pace.return_value = 59.0
+
+        context = await provider.get()
+
+        assert context.scoring_period_id == 121
+        assert context.nba_avg_pace == 59.0
+
+    @pytest.mark.asyncio
+    async def test_stale_context_refreshes_without_new_period(self, provider):
+        provider._context = _context(refreshed_at=datetime.now() - timedelta(hours=7))
+
+        context = await provider.get()
+
+        assert context is provider.current
+        provider.data_provider.get_slot_usage.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_recomputes(self, provider):
+        first = await provider.get()
+        second = await provider.refresh(force=True)
+
+        assert second is not first
+        assert provider.nba_service.get_nba_average_pace.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_nba_failure_keeps_previous_numbers(self, provider):
+        await provider.get()
+        provider.nba_service.get_nba_average_pace.side_effect = Exception("boom")
+
+        context = await provider.refresh(force=True)
+
+        assert context.nba_avg_pace == 58.4
+        assert context.nba_game_days_left == 40
+
+    @pytest.mark.asyncio
+    async def test_espn_failure_keeps_previous_context(self, provider):
+        first = await provider.get()
+        provider.data_provider.get_totals_df.side_effect = Exception("ESPN down")
+
+        assert await provider.refresh(force=True) is first
+
+    @pytest.mark.asyncio
+    async def test_espn_failure_on_cold_start_is_not_cached(self, provider):
+        provider.data_provider.get_totals_df.side_effect = Exception("ESPN down")
+
+        context = await provider.get()
+
+        assert context.slot_usage == {}
+        assert context.nba_avg_pace == 58.4
+        assert provider.current is None
@@ -176,3 +176,17 @@ class TestSlotGamesEstimatorEdgeCases:
         expected = w1 * m1 + w2 * m2
 
         assert result['proj_PG'].iloc[0] == pytest.approx(expected, rel=1e-6)
+
+
+class TestAdjustProjection:
+    def test_slot_deltas_are_capped_per_slot(self):
+        projection = {s: 80.0 if s != 'UTIL' else 240.0 for s in SLOTS}
+        base = sum(projection.values())
+        assert SlotGamesEstimator.adjust_projection(projection, {}, 0.0) == pytest.approx(base)
+        assert SlotGamesEstimator.adjust_projection(projection, {'PG': 1.0}, 0.0) == pytest.approx(base + 1.0)
+        assert SlotGamesEstimator.adjust_projection(projection, {'PG': 10.0}, 0.0) == pytest.approx(base + 2.0)
+        assert SlotGamesEstimator.adjust_projection(projection, {'C': -100.0}, 0.0) == pytest.approx(base - 80.0)
+
+    def test_without_slot_projection_adjusts_fallback_total(self):
+        assert SlotGamesEstimator.adjust_projection(None, {'PG': 5.0, 'C': 5.0}, 600.0) == pytest.approx(610.0)
+        assert SlotGamesEstimator.adjust_projection(None, {'UTIL': 1000.0}, 600.0) == sum(SLOT_CAPS.values())
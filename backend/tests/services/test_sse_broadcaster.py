@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from app.models.injury_models import InjuryNotification
+from app.services import injury_service as inj
+from app.services.sse_broadcaster import PING_FRAME, SSEBroadcaster
+
+
+async def _take(stream, n):
+    return [await asyncio.wait_for(stream.__anext__(), timeout=1.0) for _ in range(n)]
+
+
+class TestSSEBroadcaster:
+    def test_encode_frame(self):
+        assert SSEBroadcaster.encode(3, '{"a": 1}') == b'id: 3\ndata: {"a": 1}\n\n'
+        assert SSEBroadcaster.encode(4, "x\ny", event="fetch_update") == (
+            b"id: 4\nevent: fetch_update\ndata: x\ndata: y\n\n"
+        )
+
+    def test_ring_is_bounded(self):
+        b = SSEBroadcaster(capacity=3, max_lag=3)
+        for i in range(5):
+            b.publish(str(i))
+        assert [i for i, _ in b.frames_after(0)] == [3, 4, 5]
+        assert [i for i, _ in b.frames_after(4)] == [5]
+        assert b.frames_after(5) == []
+
+    @pytest.mark.asyncio
+    async def test_clients_share_encoded_bytes(self):
+        b = SSEBroadcaster()
+        s1, s2 = b.stream(), b.stream()
+        t1 = asyncio.ensure_future(_take(s1, 2))
+        t2 = asyncio.ensure_future(_take(s2, 2))
+        await asyncio.sleep(0)
+        assert b.subscribers == 2
+        b.publish("one")
+        b.publish("two", event="fetch_update")
+        f1, f2 = await t1, await t2
+        assert f1 == [b"id: 1\ndata: one\n\n", b"id: 2\nevent: fetch_update\ndata: two\n\n"]
+        assert all(a is c for a, c in zip(f1, f2))
+        await s1.aclose()
+        await s2.aclose()
+        assert b.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_resume_from_last_event_id(self):
+        b = SSEBroadcaster()
+        for name in ("a", "b", "c"):
+            b.publish(name)
+        stream = b.stream(last_event_id=1)
+        assert await _take(stream, 2) == [b"id: 2\ndata: b\n\n", b"id: 3\ndata: c\n\n"]
+        await stream.aclose()
+
+        # Unknown (e.g. pre-restart) ids start from the live edge.
+        stream = b.stream(last_event_id=99)
+        task = asyncio.ensure_future(_take(stream, 1))
+        await asyncio.sleep(0)
+        b.publish("d")
+        assert await task == [b"id: 4\ndata: d\n\n"]
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_at_most_max_lag(self):
+        b = SSEBroadcaster(capacity=10, max_lag=2)
+        for i in range(6):
+            b.publish(str(i))
+        stream = b.stream(last_event_id=0)
+        assert [f.split(b"\n")[0] for f in await _take(stream, 2)] == [b"id: 5", b"id: 6"]
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_lagging_client_is_disconnected(self):
+        b = SSEBroadcaster(capacity=10, max_lag=2)
+        stream = b.stream()
+        task = asyncio.ensure_future(_take(stream, 1))
+        await asyncio.sleep(0)
+        b.publish("0")
+        await task
+        # The client stalls while four more events arrive.
+        for i in range(4):
+            b.publish(str(i + 1))
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+        assert b.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_ping(self):
+        b = SSEBroadcaster(ping_interval=0.01)
+        stream = b.stream()
+        assert await _take(stream, 1) == [PING_FRAME]
+        await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_injury_broadcasts_publish_once(monkeypatch):
+    events = SSEBroadcaster()
+    monkeypatch.setattr(inj, "injury_events", events)
+    monkeypatch.setattr(inj, "notification_history", [])
+    monkeypatch.setattr(inj, "last_report_time", None)
+    notif = InjuryNotification(
+        type="added", player="P", team="T", new_status="Out",
+        timestamp="2099-01-01T00:00:00+00:00",
+    )
+    await inj.broadcast_notifications([notif])
+    await inj.broadcast_fetch_update("2025-01-01T00:00:00Z")
+
+    frames = [f for _, f in events.frames_after(0)]
+    assert frames == [
+        f"id: 1\ndata: {notif.model_dump_json()}\n\n".encode(),
+        b'id: 2\nevent: fetch_update\ndata: {"report_time": "2025-01-01T00:00:00Z"}\n\n',
+    ]
+    assert inj.last_report_time == "2025-01-01T00:00:00Z"
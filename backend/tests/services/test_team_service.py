@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 
 import pytest
 import pytest_asyncio
@@ -8,6 +8,7 @@ from app.services.team_service import TeamService
 from app.models import Team, TeamDetail, TeamPlayers, Player, ShotChartStats, AverageStats, RankingStats, PlayerStats, StatTimePeriod
 from app.exceptions import InvalidParameterError, ResourceNotFoundError
 import app.services.player_service as player_service_module
+from app.services.schedule_context import ScheduleContext
 
 @pytest.fixture(autouse=True)
 def fixed_anchor_date(monkeypatch):
@@ -19,6 +20,15 @@ def fixed_anchor_date(monkeypatch):
         player_service_module, "get_season_anchor_date", AsyncMock(return_value=date(2026, 7, 10))
     )
 
+def _schedule_context_mock(slot_usage=None):
+    schedule_context = AsyncMock()
+    schedule_context.get.return_value = ScheduleContext(
+        scoring_period_id=120, nba_avg_pace=58.4, nba_game_days_left=40,
+        slot_usage=slot_usage or {}, team_names={}, refreshed_at=datetime.now(),
+    )
+    return schedule_context
+
+
 @pytest.fixture
 def team_service():
     """Create TeamService instance with mocked dependencies"""
@@ -30,7 +40,9 @@ def team_service():
         service.data_provider.db_service.aggregate_player_games = AsyncMock(
             return_value=(pd.DataFrame(), None, None)
         )
+        service.data_provider.db_service.get_season_player_names = AsyncMock(return_value=[])
         service.response_builder = mock_response_builder.return_value
+        service.schedule_context = _schedule_context_mock()
         return service
 
 
@@ -41,6 +53,7 @@ def team_service_players_df():
     """Sample players DataFrame specific to team service tests - 5 players with different structure"""
     return pd.DataFrame({
         'Name': ['Player A', 'Player B', 'Player C', 'Player D', 'Player E'],
+        'player_id': [1, 2, 3, 4, 5],
         'team_id': [1, 1, 2, 2, 3],
         'Pro Team': ['LAL', 'LAL', 'GSW', 'GSW', 'BOS'],
         'Positions': ['PG, SG', 'SF, PF', 'PG', 'SG, SF', 'SF, PF'],
@@ -75,7 +88,6 @@ class TestTeamService:
             sample_totals_df, sample_averages_df, sample_rankings_df
         )
         team_service.data_provider.get_players_df.return_value = team_service_players_df
-        team_service.data_provider.get_slot_usage.return_value = {}
         team_service.response_builder.build_players_list.return_value = []
         team_service.response_builder.build_team_detail_response.return_value = expected_team_detail
 
@@ -87,6 +99,28 @@ class TestTeamService:
             data_date=None, actual_start=None, actual_end=None,
         )
     
+    @pytest.mark.asyncio
+    async def test_get_team_detail_slot_usage_from_schedule_context(
+        self, team_service, sample_totals_df, sample_averages_df, sample_rankings_df, team_service_players_df,
+    ):
+        """Slot usage is read from the shared schedule context, not re-parsed
+        from ESPN per request."""
+        from unittest.mock import ANY
+        team_service.data_provider.get_all_dataframes.return_value = (
+            sample_totals_df, sample_averages_df, sample_rankings_df
+        )
+        team_service.data_provider.get_players_df.return_value = team_service_players_df
+        team_service.schedule_context = _schedule_context_mock({1: {'PG': 30, 'C': 12}})
+        team_service.response_builder.build_players_list.return_value = []
+
+        await team_service.get_team_detail(1)
+
+        team_service.data_provider.get_slot_usage.assert_not_called()
+        team_service.response_builder.build_team_detail_response.assert_called_once_with(
+            1, sample_totals_df, sample_averages_df, sample_rankings_df, [], ANY, {'PG': 30, 'C': 12},
+            data_date=None, actual_start=None, actual_end=None,
+        )
+
     @pytest.mark.asyncio
     async def test_get_team_detail_custom_without_dates_raises(self, team_service):
         """custom time_period requires start/end even though routes/teams.py
@@ -105,7 +139,6 @@ class TestTeamService:
             sample_totals_df, sample_averages_df, sample_rankings_df
         )
         team_service.data_provider.get_players_df.return_value = team_service_players_df
-        team_service.data_provider.get_slot_usage.return_value = {}
         agg_df = pd.DataFrame([{
             'player_id': 1, 'player_name': 'Player A', 'gp': 2,
             'pts': 50.0, 'reb': 10.0, 'ast': 6.0, 'stl': 2.0, 'blk': 1.0,
@@ -116,6 +149,9 @@ class TestTeamService:
         team_service.data_provider.db_service.aggregate_player_games = AsyncMock(
             return_value=(agg_df, date(2026, 1, 2), date(2026, 1, 9))
         )
+        team_service.data_provider.db_service.get_season_player_names = AsyncMock(
+            return_value=[{'player_id': 1, 'player_name': 'Player A'}]
+        )
 
         captured = {}
         def _capture_players_list(df):
@@ -132,6 +168,71 @@ class TestTeamService:
         assert row['GP'] == 2
         assert row['PTS'] == 50.0
 
+    @pytest.mark.asyncio
+    async def test_get_team_detail_aggregates_only_the_roster(
+        self, team_service, sample_totals_df, sample_averages_df, sample_rankings_df, team_service_players_df,
+    ):
+        """Cold cache: the window aggregation is scoped to the roster's NBA ids
+        (resolved by name -- ESPN athlete ids are a different id space) and only
+        the roster's rows reach the response builder."""
+        team_service.data_provider.get_all_dataframes.return_value = (
+            sample_totals_df, sample_averages_df, sample_rankings_df
+        )
+        team_service.data_provider.get_players_df.return_value = team_service_players_df
+        db = team_service.data_provider.db_service
+        # NBA ids deliberately overlap the ESPN ids of other players (3, 4).
+        db.get_season_player_names = AsyncMock(return_value=[
+            {'player_id': 4, 'player_name': 'Player A'},
+            {'player_id': 1628, 'player_name': 'Player C'},
+            {'player_id': 1629, 'player_name': 'Player D'},
+            {'player_id': 1630, 'player_name': 'Player D.'},  # stored under two spellings
+        ])
+        db.aggregate_player_games = AsyncMock(return_value=(pd.DataFrame([
+            {'player_id': 1628, 'player_name': 'Player C', 'gp': 2, 'pts': 40.0, 'reb': 1.0,
+             'ast': 1.0, 'stl': 1.0, 'blk': 1.0, 'fgm': 1.0, 'fga': 2.0, 'ftm': 1.0, 'fta': 2.0,
+             'three_pm': 1.0, 'min': 60.0, 'fg_pct': 0.5, 'ft_pct': 0.5},
+        ]), date(2026, 1, 1), date(2026, 1, 10)))
+        captured = {}
+        def _capture_players_list(df):
+            captured['df'] = df
+            return []
+        team_service.response_builder.build_players_list.side_effect = _capture_players_list
+
+        await team_service.get_team_detail(
+            2, time_period=StatTimePeriod.CUSTOM, start=date(2026, 1, 1), end=date(2026, 1, 10)
+        )
+
+        assert db.aggregate_player_games.call_args.kwargs['player_ids'] == [1628, 1629, 1630]
+        df = captured['df'].set_index('Name')
+        assert df.index.tolist() == ['Player C', 'Player D']
+        assert df.loc['Player C', 'GP'] == 2 and df.loc['Player C', 'PTS'] == 40.0
+        assert df.loc['Player D', 'GP'] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_team_detail_reuses_warm_league_cache(
+        self, team_service, sample_totals_df, sample_averages_df, sample_rankings_df, team_service_players_df,
+    ):
+        from datetime import datetime
+        team_service.data_provider.get_all_dataframes.return_value = (
+            sample_totals_df, sample_averages_df, sample_rankings_df
+        )
+        team_service.data_provider.get_players_df.return_value = team_service_players_df
+        player_service_module._windowed_players_cache[StatTimePeriod.SEASON] = {
+            'df': team_service_players_df, 'start': date(2025, 10, 22), 'end': date(2026, 1, 9),
+            'ts': datetime.now(),
+        }
+        captured = {}
+        def _capture_players_list(df):
+            captured['df'] = df
+            return []
+        team_service.response_builder.build_players_list.side_effect = _capture_players_list
+
+        await team_service.get_team_detail(1)
+
+        team_service.data_provider.db_service.aggregate_player_games.assert_not_called()
+        assert captured['df']['Name'].tolist() == ['Player A', 'Player B']
+        assert team_service.response_builder.build_team_detail_response.call_args.kwargs['actual_end'] == date(2026, 1, 9)
+
     @pytest.mark.asyncio
     async def test_get_team_detail_partial_none_data(self, team_service, sample_totals_df):
         """Test get_team_detail when only some dataframes are None"""
@@ -230,7 +331,7 @@ class TestTeamServiceResponseBuilding:
                 sample_totals_df, sample_averages_df, sample_rankings_df
             )
             service.data_provider.get_players_df.return_value = team_service_players_df
-            service.data_provider.get_slot_usage.return_value = {}
+            service.schedule_context = _schedule_context_mock()
             service.data_provider.get_data_date = MagicMock(return_value=None)
             service.data_provider.db_service.aggregate_player_games = AsyncMock(
                 return_value=(pd.DataFrame(), None, None)
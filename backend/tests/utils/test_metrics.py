@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.utils import metrics
+from app.utils.metrics import (
+    CACHE_REQUESTS,
+    DB_ACQUIRE_SECONDS,
+    DB_POOL_IN_USE,
+    DB_POOL_WAITING,
+    DB_QUERY_SECONDS,
+    HTTP_IN_FLIGHT,
+    HTTP_REQUEST_SECONDS,
+    HTTP_RESPONSE_BYTES,
+    REGISTRY,
+    Registry,
+    TimedPool,
+    record_cache,
+    record_query,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    REGISTRY.clear()
+    yield
+    REGISTRY.clear()
+
+
+def test_histogram_exposition_is_cumulative():
+    reg = Registry()
+    h = reg.histogram('work_seconds', 'Work.', ('kind',), buckets=(0.1, 1.0))
+    h.observe(0.05, kind='a')
+    h.observe(0.5, kind='a')
+    h.observe(5.0, kind='a')
+    text = reg.render()
+    assert '# TYPE work_seconds histogram' in text
+    assert 'work_seconds_bucket{kind="a",le="0.1"} 1' in text
+    assert 'work_seconds_bucket{kind="a",le="1"} 2' in text
+    assert 'work_seconds_bucket{kind="a",le="+Inf"} 3' in text
+    assert 'work_seconds_count{kind="a"} 3' in text
+    assert h.sum(kind='a') == pytest.approx(5.55)
+
+
+def test_label_values_are_escaped_and_checked():
+    reg = Registry()
+    c = reg.counter('hits_total', 'Hits.', ('path',))
+    c.inc(path='a"b\\c')
+    assert 'hits_total{path="a\\"b\\\\c"} 1' in reg.render()
+    with pytest.raises(ValueError):
+        c.inc(route='x')
+    with pytest.raises(ValueError):
+        reg.counter('hits_total', 'Again.')
+
+
+def test_record_cache_and_query():
+    record_cache('demo', hit=True)
+    record_cache('demo', hit=False)
+    record_cache('demo', hit=False)
+    assert CACHE_REQUESTS.value(cache='demo', result='hit') == 1
+    assert CACHE_REQUESTS.value(cache='demo', result='miss') == 2
+
+    record_query(SimpleNamespace(query='  SELECT 1', elapsed=0.02))
+    record_query(SimpleNamespace(query='VACUUM', elapsed=0.5))
+    assert DB_QUERY_SECONDS.count(statement='select') == 1
+    assert DB_QUERY_SECONDS.count(statement='other') == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_pool_records_acquire_and_releases():
+    conn = object()
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=conn)
+    pool.release = AsyncMock()
+    pool.close = AsyncMock()
+    timed = TimedPool(pool, lane='batch')
+
+    async with timed.acquire() as got:
+        assert got is conn
+        assert DB_POOL_IN_USE.value(lane='batch') == 1
+    pool.release.assert_awaited_once_with(conn)
+    assert DB_ACQUIRE_SECONDS.count(lane='batch') == 1
+    assert DB_POOL_IN_USE.value(lane='batch') == 0
+    assert DB_POOL_WAITING.value(lane='batch') == 0
+    await timed.close()
+    pool.close.assert_awaited_once()
+
+
+def test_middleware_labels_route_template(test_client):
+    test_client.get('/health')
+    test_client.get('/api/teams/999999')
+    test_client.get('/no/such/path')
+
+    assert HTTP_REQUEST_SECONDS.count(method='GET', route='/health', status='200') == 1
+    assert sum(
+        HTTP_REQUEST_SECONDS.count(method='GET', route='/api/teams/{team_id}', status=s)
+        for s in ('200', '404', '500')
+    ) == 1
+    assert HTTP_REQUEST_SECONDS.count(method='GET', route=metrics._UNMATCHED_ROUTE, status='404') == 1
+    assert HTTP_RESPONSE_BYTES.sum(method='GET', route='/health') > 0
+    assert HTTP_IN_FLIGHT.value(method='GET') == 0
+
+
+def test_metrics_endpoint(test_client):
+    test_client.get('/health')
+    response = test_client.get('/metrics')
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"} 1' in response.text
+    # /metrics itself is not instrumented
+    assert 'route="/metrics"' not in response.text
@@ -0,0 +1,60 @@
+import pandas as pd
+
+from app.utils import name_matching
+from app.utils.name_matching import (
+    JOIN_KEY_COL,
+    NAME_KEY_COL,
+    add_name_keys,
+    join_keys,
+    name_keys,
+    normalize_player_name,
+    resolve_join_key,
+)
+
+
+def test_normalize_strips_diacritics_and_punctuation():
+    assert normalize_player_name('Nikola Jokić') == normalize_player_name('Nikola Jokic') == 'nikolajokic'
+    assert normalize_player_name("De'Aaron Fox") == 'deaaronfox'
+
+
+def test_normalize_is_memoized():
+    normalize_player_name.cache_clear()
+    normalize_player_name('Luka Dončić')
+    normalize_player_name('Luka Dončić')
+    info = normalize_player_name.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_resolve_join_key_sees_override_changes(monkeypatch):
+    assert resolve_join_key('Nic Claxton') == 'nicclaxton'
+    monkeypatch.setitem(name_matching.NAME_OVERRIDES, 'nicclaxton', 'nicolasclaxton')
+    assert resolve_join_key('Nic Claxton') == 'nicolasclaxton'
+
+
+def test_add_name_keys_attaches_columns(monkeypatch):
+    monkeypatch.setitem(name_matching.NAME_OVERRIDES, 'nicclaxton', 'nicolasclaxton')
+    df = add_name_keys(pd.DataFrame({'Name': ['Nikola Jokić', 'Nic Claxton', 'Nikola Jokić', None]}))
+    assert df[NAME_KEY_COL].tolist() == ['nikolajokic', 'nicclaxton', 'nikolajokic', '']
+    assert JOIN_KEY_COL not in df.columns
+    assert join_keys(df).tolist() == ['nikolajokic', 'nicolasclaxton', 'nikolajokic', '']
+
+
+def test_join_keys_see_override_changes_after_keying(monkeypatch):
+    df = add_name_keys(pd.DataFrame({'Name': ['Nic Claxton']}))
+    assert join_keys(df).tolist() == ['nicclaxton']
+    monkeypatch.setitem(name_matching.NAME_OVERRIDES, 'nicclaxton', 'nicolasclaxton')
+    assert join_keys(df).tolist() == ['nicolasclaxton']
+
+
+def test_key_series_prefer_precomputed_columns():
+    raw = pd.DataFrame({'Name': ['Nikola Jokić']})
+    assert name_keys(raw).tolist() == join_keys(raw).tolist() == ['nikolajokic']
+
+    keyed = add_name_keys(raw.copy())
+    keyed[NAME_KEY_COL] = 'precomputed'
+    assert name_keys(keyed).tolist() == join_keys(keyed).tolist() == ['precomputed']
+
+
+def test_add_name_keys_without_name_column_is_noop():
+    df = pd.DataFrame({'team': ['BOS']})
+    assert list(add_name_keys(df).columns) == ['team']
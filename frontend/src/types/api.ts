@@ -162,6 +162,7 @@ export interface PaginatedPlayers {
   has_more: boolean;
   actual_start?: string;
   actual_end?: string;
+  next_cursor?: string | null;
 }
 
 export type ComparisonOperator = "eq" | "gt" | "lt" | "gte" | "lte";